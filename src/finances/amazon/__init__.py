@@ -18,32 +18,59 @@ Key Components:
 Current Performance: 94.7% match rate with simplified architecture
 """
 
-from .grouper import (
-    GroupingLevel,
-    group_orders,
-)
-from .loader import (
-    find_latest_amazon_export,
-    load_orders,
-)
-from .matcher import (
-    SimplifiedMatcher,
-)
-from .models import (
-    AmazonMatch,
-    AmazonMatchResult,
-    AmazonOrderItem,
-    AmazonOrderSummary,
-    MatchedOrderItem,
-    OrderGroup,
-)
-from .scorer import (
-    ConfidenceThresholds,
-    MatchScorer,
-    MatchType,
-)
-from .split_matcher import (
-    SplitPaymentMatcher,
+from typing import TYPE_CHECKING
+
+from ..core.lazy_imports import lazy_exports
+
+# Exports are imported from their submodules on first access (see core.lazy_imports)
+if TYPE_CHECKING:
+    from .grouper import (
+        GroupingLevel,
+        OrderGroupings,
+        group_all_levels,
+        group_orders,
+    )
+    from .loader import (
+        find_latest_amazon_export,
+        load_orders,
+    )
+    from .matcher import (
+        SimplifiedMatcher,
+    )
+    from .models import (
+        AmazonMatch,
+        AmazonMatchResult,
+        AmazonOrderItem,
+        AmazonOrderSummary,
+        MatchedOrderItem,
+        OrderGroup,
+    )
+    from .scorer import (
+        ConfidenceThresholds,
+        MatchScorer,
+        MatchType,
+    )
+    from .split_matcher import (
+        SplitPaymentMatcher,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".grouper": ["GroupingLevel", "OrderGroupings", "group_all_levels", "group_orders"],
+        ".loader": ["find_latest_amazon_export", "load_orders"],
+        ".matcher": ["SimplifiedMatcher"],
+        ".models": [
+            "AmazonMatch",
+            "AmazonMatchResult",
+            "AmazonOrderItem",
+            "AmazonOrderSummary",
+            "MatchedOrderItem",
+            "OrderGroup",
+        ],
+        ".scorer": ["ConfidenceThresholds", "MatchScorer", "MatchType"],
+        ".split_matcher": ["SplitPaymentMatcher"],
+    },
 )
 
 __all__ = [
@@ -57,9 +84,11 @@ __all__ = [
     "MatchType",
     "MatchedOrderItem",
     "OrderGroup",
+    "OrderGroupings",
     "SimplifiedMatcher",
     "SplitPaymentMatcher",
     "find_latest_amazon_export",
+    "group_all_levels",
     "group_orders",
     "load_orders",
 ]
@@ -171,7 +171,7 @@ class AmazonMatchResultsStore(DataStoreMixin):
         from finances.core.json_utils import write_json_with_defaults
 
         # Use write_json_with_defaults to handle pandas Timestamps from CSV parsing
-        write_json_with_defaults(output_file, data, default=str)
+        write_json_with_defaults(output_file, data, default=str, sidecar=True, record_key="matches")
         # Invalidate cache after write
         self._invalidate_cache()
 
@@ -191,11 +191,11 @@ class AmazonMatchResultsStore(DataStoreMixin):
         if not self.exists():
             return None
 
-        try:
-            data = self.load()
-            return len(data.get("matches", [])) if isinstance(data, dict) else None
-        except (FileNotFoundError, ValueError, KeyError, AttributeError):
+        files = self._get_files_cached(self.matches_dir, self._glob_pattern)
+        latest_file = self._get_latest_file(files)
+        if latest_file is None:
             return None
+        return self._count_records(latest_file, key="matches")
 
     def size_bytes(self) -> int | None:
         """Get size of most recent match file."""
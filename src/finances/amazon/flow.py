@@ -11,6 +11,7 @@ from typing import Any
 
 import click
 
+from ..core.config import get_config
 from ..core.flow import (
     FlowContext,
     FlowNode,
@@ -20,7 +21,7 @@ from ..core.flow import (
     OutputInfo,
 )
 from . import SimplifiedMatcher, load_orders
-from .unzipper import extract_amazon_zip_files
+from .unzipper import MANIFEST_PATH, extract_amazon_zip_files
 
 
 class AmazonOrderHistoryOutputInfo(OutputInfo):
@@ -45,6 +46,8 @@ class AmazonOrderHistoryOutputInfo(OutputInfo):
 class AmazonOrderHistoryRequestFlowNode(FlowNode):
     """Manual step prompting user to download Amazon order history."""
 
+    requires_user_interaction = True
+
     def __init__(self, data_dir: Path) -> None:
         super().__init__("amazon_order_history_request")
         self.data_dir = data_dir
@@ -110,12 +113,15 @@ class AmazonUnzipOutputInfo(OutputInfo):
         if not self.output_dir.exists():
             return []
 
+        from ..core.json_utils import count_lines, summary_record_count
+
         files = []
         for csv_file in self.output_dir.glob("**/Retail.OrderHistory.*.csv"):
             try:
-                lines = csv_file.read_text().strip().split("\n")
-                # Count data rows (exclude header)
-                row_count = max(0, len(lines) - 1)
+                # Data rows (excluding header) from the extraction sidecar, or counted by streaming
+                row_count = summary_record_count(csv_file)
+                if row_count is None:
+                    row_count = max(0, count_lines(csv_file) - 1)
                 files.append(OutputFile(path=csv_file, record_count=row_count))
             except Exception:
                 files.append(OutputFile(path=csv_file, record_count=0))
@@ -144,6 +150,13 @@ class AmazonUnzipFlowNode(FlowNode):
         """Return Amazon raw data output directory."""
         return self.data_dir / "amazon" / "raw"
 
+    def get_fingerprint_config(self) -> dict[str, Any]:
+        """Include the configured archive members to extract."""
+        return {
+            **super().get_fingerprint_config(),
+            "file_patterns": list(get_config().amazon.file_patterns),
+        }
+
     def get_data_summary(self, context: FlowContext) -> NodeDataSummary:
         """Get Amazon raw data summary."""
         return self.store.to_node_data_summary()
@@ -169,6 +182,11 @@ class AmazonUnzipFlowNode(FlowNode):
                 zip_files = list(raw_dir.glob("*.zip"))
                 all_outputs = csv_files + zip_files
 
+                # Keep the extraction manifest so later runs skip extracted ZIPs
+                manifest = raw_dir / MANIFEST_PATH
+                if manifest.exists():
+                    all_outputs.append(manifest)
+
                 return FlowResult(
                     success=True,
                     items_processed=result["files_processed"],
@@ -203,13 +221,13 @@ class AmazonMatchingOutputInfo(OutputInfo):
         if not self.output_dir.exists():
             return []
 
-        from ..core.json_utils import read_json
+        from ..core.json_utils import count_json_records
 
         files = []
         for json_file in self.output_dir.glob("*.json"):
             try:
-                data = read_json(json_file)
-                match_count = len(data.get("matches", []))
+                # Sidecar summary if present, otherwise a streaming count
+                match_count = count_json_records(json_file, key="matches")
                 files.append(OutputFile(path=json_file, record_count=match_count))
             except Exception:
                 files.append(OutputFile(path=json_file, record_count=0))
@@ -239,13 +257,23 @@ class AmazonMatchingFlowNode(FlowNode):
         """Return Amazon matching results output directory."""
         return self.data_dir / "amazon" / "transaction_matches"
 
+    def get_fingerprint_config(self) -> dict[str, Any]:
+        """Include the configured payee patterns and ship date match window."""
+        amazon_config = get_config().amazon
+        return {
+            **super().get_fingerprint_config(),
+            "payee_patterns": list(amazon_config.payee_patterns),
+            "match_days_before_ship": amazon_config.match_days_before_ship,
+            "match_days_after_ship": amazon_config.match_days_after_ship,
+        }
+
     def get_data_summary(self, context: FlowContext) -> NodeDataSummary:
         """Get Amazon matching results summary."""
         return self.match_store.to_node_data_summary()
 
     def execute(self, context: FlowContext) -> FlowResult:
         """Execute Amazon transaction matching."""
-        from ..ynab import filter_transactions_by_payee, load_transactions
+        from ..ynab import YnabCacheService
 
         try:
             # Initialize matcher
@@ -253,14 +281,15 @@ class AmazonMatchingFlowNode(FlowNode):
 
             # Load data using new domain model functions
             amazon_data_dir = self.data_dir / "amazon" / "raw"
-            ynab_cache_dir = self.data_dir / "ynab" / "cache"
+            ynab_cache = YnabCacheService.for_context(context, self.data_dir)
 
             # Load domain models
             orders_by_account = load_orders(amazon_data_dir)
-            all_transactions = load_transactions(ynab_cache_dir)
 
-            # Filter for Amazon transactions using domain model function
-            amazon_transactions = filter_transactions_by_payee(all_transactions, payee="Amazon")
+            # Amazon transactions by configured payee patterns; only matches become domain models
+            amazon_transactions = ynab_cache.domain_transaction_columns(
+                "amazon", fields=("id",)
+            ).to_transactions()
 
             if not amazon_transactions:
                 return FlowResult(
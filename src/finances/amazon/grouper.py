@@ -4,9 +4,13 @@ Unified Order Grouping Module
 
 Consolidates the three separate grouping functions into a single flexible system.
 Provides multiple levels of Amazon order grouping for transaction matching.
+
+All levels come from one grouping pass (see group_all_levels): items are sorted
+once by (order_id, ship_date) and each run of equal keys becomes a shipment,
+each run of equal order IDs an order. Totals are summed in integer cents.
 """
 
-from collections import defaultdict
+from dataclasses import dataclass, field
 from enum import Enum
 
 from ..core.money import Money
@@ -21,6 +25,29 @@ class GroupingLevel(Enum):
     DAILY_SHIPMENT = "daily_shipment"  # Group by order + ship date (ignore time)
 
 
+@dataclass
+class OrderGroupings:
+    """
+    OrderGroups for every grouping level, from a single pass over the items.
+
+    AmazonOrderItem keeps ship dates at day resolution, so the exact ship
+    datetime of the SHIPMENT level is the ship date and `shipments` and
+    `daily_shipments` hold the same item groups (labelled with their own
+    grouping_level).
+    """
+
+    orders: dict[str, OrderGroup] = field(default_factory=dict)
+    shipments: list[OrderGroup] = field(default_factory=list)
+    daily_shipments: list[OrderGroup] = field(default_factory=list)
+
+    def shipments_by_order(self) -> dict[str, list[OrderGroup]]:
+        """Shipment-level groups keyed by order ID, in ship date order."""
+        result: dict[str, list[OrderGroup]] = {}
+        for group in self.shipments:
+            result.setdefault(group.order_id, []).append(group)
+        return result
+
+
 def group_orders(
     orders: list[AmazonOrderItem], level: GroupingLevel = GroupingLevel.ORDER
 ) -> dict[str, OrderGroup] | list[OrderGroup]:
@@ -39,62 +66,103 @@ def group_orders(
         return {} if level == GroupingLevel.ORDER else []
 
     if level == GroupingLevel.ORDER:
-        return _group_by_order_id(orders)
+        return group_all_levels(orders).orders
     elif level == GroupingLevel.SHIPMENT:
-        return _group_by_shipment(orders)
+        return group_all_levels(orders).shipments
     elif level == GroupingLevel.DAILY_SHIPMENT:
-        return _group_by_daily_shipment(orders)
+        return group_all_levels(orders).daily_shipments
     else:
         raise ValueError(f"Unknown grouping level: {level}")
 
 
-def _group_by_order_id(orders: list[AmazonOrderItem]) -> dict[str, OrderGroup]:
-    """Group orders by Order ID and calculate totals using domain models."""
-    groups: dict[str, list[AmazonOrderItem]] = defaultdict(list)
-
-    # Group items by order_id
-    for item in orders:
-        groups[item.order_id].append(item)
-
-    # Create OrderGroup objects for each order
-    result: dict[str, OrderGroup] = {}
-    for order_id, items in groups.items():
-        # Convert to MatchedOrderItem objects
-        matched_items: list[MatchedOrderItem] = [MatchedOrderItem.from_order_item(item) for item in items]
-
-        # Calculate total
-        total = Money.from_cents(0)
-        for matched_item in matched_items:
-            total = total + matched_item.amount
+def group_all_levels(orders: list[AmazonOrderItem]) -> OrderGroupings:
+    """
+    Group items at the ORDER, SHIPMENT and DAILY_SHIPMENT levels in one pass.
 
-        # Collect unique ship dates (excluding None)
-        ship_dates_set = {item.ship_date for item in items if item.ship_date}
-        ship_dates = sorted(ship_dates_set, key=lambda d: d.to_iso_string())
+    Items are sorted once by (order_id, ship_date); ties keep input order, and
+    orders keep the order their IDs first appear in. Items without a ship date
+    form their own (undated) shipment ahead of the dated ones.
 
-        # All items should have same order date
-        order_date = items[0].order_date
+    Args:
+        orders: List of AmazonOrderItem domain models
 
-        result[order_id] = OrderGroup(
-            order_id=order_id,
-            items=matched_items,
-            total=total,
-            order_date=order_date,
-            ship_dates=ship_dates,
-            grouping_level="order",
+    Returns:
+        OrderGroupings with groups for all three levels. Order-level groups list
+        their items in input order, so item indices match the order's CSV rows.
+    """
+    groupings = OrderGroupings()
+    if not orders:
+        return groupings
+
+    first_seen: dict[str, int] = {}
+    sort_keys = [
+        (
+            first_seen.setdefault(item.order_id, len(first_seen)),
+            item.ship_date.date.toordinal() if item.ship_date else -1,
+            index,
         )
-
-    return result
-
-
-def _group_by_shipment(orders: list[AmazonOrderItem]) -> list[OrderGroup]:
-    """Group orders by Order ID + exact Ship Date combination."""
-    # TODO(#15): Implement shipment-level grouping with domain models
-    # See https://github.com/karlmdavis/justdavis-finances/issues/15
-    raise NotImplementedError("Shipment-level grouping not yet implemented with domain models")
-
-
-def _group_by_daily_shipment(orders: list[AmazonOrderItem]) -> list[OrderGroup]:
-    """Group orders by Order ID + Ship Date (date only, ignoring time)."""
-    # TODO(#15): Implement daily shipment-level grouping with domain models
-    # See https://github.com/karlmdavis/justdavis-finances/issues/15
-    raise NotImplementedError("Daily shipment-level grouping not yet implemented with domain models")
+        for index, item in enumerate(orders)
+    ]
+    ordered = sorted(range(len(orders)), key=sort_keys.__getitem__)
+
+    start = 0
+    while start < len(ordered):
+        rank = sort_keys[ordered[start]][0]
+        end = start
+        while end < len(ordered) and sort_keys[ordered[end]][0] == rank:
+            end += 1
+        _emit_order(orders, ordered[start:end], sort_keys, groupings)
+        start = end
+
+    return groupings
+
+
+def _emit_order(
+    orders: list[AmazonOrderItem],
+    indices: list[int],
+    sort_keys: list[tuple[int, int, int]],
+    groupings: OrderGroupings,
+) -> None:
+    """Append the groups for one order's run of sorted item indices."""
+    first = orders[min(indices)]
+    matched = {index: MatchedOrderItem.from_order_item(orders[index]) for index in indices}
+    order_cents = 0
+
+    start = 0
+    while start < len(indices):
+        ship_key = sort_keys[indices[start]][1]
+        end = start
+        cents = 0
+        while end < len(indices) and sort_keys[indices[end]][1] == ship_key:
+            cents += matched[indices[end]].amount.to_cents()
+            end += 1
+        order_cents += cents
+
+        ship_date = orders[indices[start]].ship_date
+        items = [matched[index] for index in indices[start:end]]
+        for level, target in (
+            (GroupingLevel.SHIPMENT, groupings.shipments),
+            (GroupingLevel.DAILY_SHIPMENT, groupings.daily_shipments),
+        ):
+            target.append(
+                OrderGroup(
+                    order_id=first.order_id,
+                    items=list(items),
+                    total=Money.from_cents(cents),
+                    order_date=first.order_date,
+                    ship_dates=[ship_date] if ship_date else [],
+                    grouping_level=level.value,
+                )
+            )
+        start = end
+
+    # Distinct ship dates come out of the sort already in order
+    ship_dates = [orders[index].ship_date for index in indices]
+    groupings.orders[first.order_id] = OrderGroup(
+        order_id=first.order_id,
+        items=[matched[index] for index in sorted(indices)],
+        total=Money.from_cents(order_cents),
+        order_date=first.order_date,
+        ship_dates=[d for i, d in enumerate(ship_dates) if d and (i == 0 or d != ship_dates[i - 1])],
+        grouping_level=GroupingLevel.ORDER.value,
+    )
@@ -17,6 +17,7 @@ from pathlib import Path
 import pandas as pd
 
 from ..core.config import get_config
+from ..core.tracing import traced
 from .models import AmazonOrderItem
 
 logger = logging.getLogger(__name__)
@@ -59,6 +60,7 @@ def find_latest_amazon_export(base_path: str | Path | None = None) -> Path | Non
     return latest_dir
 
 
+@traced("amazon.load_orders")
 def load_orders(
     data_dir: str | Path | None = None, accounts: tuple[str, ...] = ()
 ) -> dict[str, list[AmazonOrderItem]]:
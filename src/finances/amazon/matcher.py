@@ -10,44 +10,153 @@ Core matching engine that implements the 3-strategy system:
 All matches require penny-perfect amounts - no tolerance for differences.
 """
 
+import operator
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import date
 from typing import TYPE_CHECKING, Any
 
+from ..core.config import get_config
 from ..core.currency import format_cents
+from ..core.tracing import traced
 from ..ynab.models import YnabTransaction
-from .grouper import GroupingLevel, group_orders
+from ..ynab.payee_index import payee_matcher
+from .grouper import OrderGroupings, group_all_levels
 from .models import AmazonMatchResult, AmazonOrderItem, OrderGroup
 from .scorer import ConfidenceThresholds, MatchScorer, MatchType
-from .split_matcher import SplitPaymentMatcher
+from .split_matcher import SplitOrder, SplitPaymentMatcher
 
 if TYPE_CHECKING:
     from .models import AmazonMatch
 
 
+def _group_ordinals(group: OrderGroup) -> list[int]:
+    """Day ordinals a group shipped on (its order date if nothing has shipped)."""
+    if group.ship_dates:
+        return [d.date.toordinal() for d in group.ship_dates]
+    return [group.order_date.date.toordinal()]
+
+
+@dataclass
+class _AccountGroups:
+    """
+    An account's order groupings, indexed for candidate lookup.
+
+    Complete-match candidates are indexed by total cents. Orders are also kept
+    sorted by ship date (one entry per distinct date) so that the orders near
+    a transaction are found by bisection, and as SplitOrders for split matching.
+    """
+
+    orders: tuple[AmazonOrderItem, ...]  # Snapshot of the items grouped
+    groupings: OrderGroupings
+    by_amount: dict[int, list[OrderGroup]]
+    split_orders: dict[str, SplitOrder]
+    ship_ordinals: list[int]
+    orders_by_ship_date: list[OrderGroup]
+    order_rank: dict[str, int]
+
+    def orders_shipped_between(self, first: int, last: int) -> list[OrderGroup]:
+        """Orders with a ship date ordinal in [first, last], in grouping order."""
+        lo = bisect_left(self.ship_ordinals, first)
+        hi = bisect_right(self.ship_ordinals, last)
+        found = {group.order_id: group for group in self.orders_by_ship_date[lo:hi]}
+        return sorted(found.values(), key=lambda group: self.order_rank[group.order_id])
+
+    def is_for(self, orders: list[AmazonOrderItem]) -> bool:
+        """Whether these groupings were built from exactly these items, in this order."""
+        return len(self.orders) == len(orders) and all(map(operator.is_, self.orders, orders))
+
+    @classmethod
+    def build(cls, orders: list[AmazonOrderItem]) -> "_AccountGroups":
+        """Group the orders and index whole orders plus the shipments of multi-shipment orders."""
+        groupings = group_all_levels(orders)
+        shipments_by_order = groupings.shipments_by_order()
+        by_amount: dict[int, list[OrderGroup]] = {}
+        for order_id, order_group in groupings.orders.items():
+            by_amount.setdefault(order_group.total.to_cents(), []).append(order_group)
+            # A single shipment is the whole order; daily groups coincide with
+            # shipments at the ship-date resolution the order data has
+            shipments = shipments_by_order.get(order_id, [])
+            if len(shipments) > 1:
+                for shipment in shipments:
+                    by_amount.setdefault(shipment.total.to_cents(), []).append(shipment)
+
+        dated = sorted(
+            ((ordinal, group) for group in groupings.orders.values() for ordinal in _group_ordinals(group)),
+            key=lambda entry: entry[0],
+        )
+        return cls(
+            orders=tuple(orders),
+            groupings=groupings,
+            by_amount=by_amount,
+            split_orders={
+                order_id: SplitOrder.from_order_group(group) for order_id, group in groupings.orders.items()
+            },
+            ship_ordinals=[ordinal for ordinal, _ in dated],
+            orders_by_ship_date=[group for _, group in dated],
+            order_rank={order_id: rank for rank, order_id in enumerate(groupings.orders)},
+        )
+
+
 class SimplifiedMatcher:
     """
     Simplified Amazon transaction matcher with 3-strategy system.
     Focuses on exact matches only for reliability.
     """
 
-    def __init__(self, split_cache_file: str | None = None):
+    def __init__(
+        self,
+        split_cache_file: str | None = None,
+        payee_patterns: Sequence[str] | None = None,
+        match_window: tuple[int, int] | None = None,
+    ):
         """
         Initialize the matcher.
 
         Args:
             split_cache_file: Optional file path for persistent split payment tracking
+            payee_patterns: Amazon payee patterns (config.amazon.payee_patterns if None)
+            match_window: (days_before_ship, days_after_ship) a charge may post relative
+                to an order's ship date for the order to be a candidate
+                (config.amazon.match_days_before_ship/_after_ship if None)
         """
         self.split_matcher = SplitPaymentMatcher(split_cache_file)
+        if payee_patterns is None or match_window is None:
+            amazon_config = get_config().amazon
+            if payee_patterns is None:
+                payee_patterns = amazon_config.payee_patterns
+            if match_window is None:
+                match_window = (amazon_config.match_days_before_ship, amazon_config.match_days_after_ship)
+        self._is_amazon_payee = payee_matcher(payee_patterns)
+        self.days_before_ship, self.days_after_ship = match_window
+        # Groupings per account, rebuilt when the account's items change
+        self._account_groups: dict[str, _AccountGroups] = {}
 
     def is_amazon_transaction(self, payee_name: str) -> bool:
         """Check if payee name matches Amazon patterns."""
-        if not payee_name:
-            return False
+        return self._is_amazon_payee(payee_name)
 
-        patterns = ["amazon", "amzn"]
-        payee_lower = payee_name.lower()
-        return any(pattern in payee_lower for pattern in patterns)
+    def _groups_for(self, account_name: str, orders: list[AmazonOrderItem]) -> _AccountGroups:
+        """
+        Get the account's groupings, grouping its orders only when they changed.
 
+        The groupings are reused while the list holds the same item objects in
+        the same order (items are immutable); adding, removing, replacing or
+        reordering items regroups the account.
+        """
+        cached = self._account_groups.get(account_name)
+        if cached is None or not cached.is_for(orders):
+            cached = _AccountGroups.build(orders)
+            self._account_groups[account_name] = cached
+        return cached
+
+    def _ship_window(self, ynab_date: date) -> tuple[int, int]:
+        """First and last ship date ordinals of orders a charge on ynab_date may be for."""
+        ordinal = ynab_date.toordinal()
+        return ordinal - self.days_after_ship, ordinal + self.days_before_ship
+
+    @traced("amazon.match_transaction")
     def match_transaction(
         self,
         transaction: YnabTransaction,
@@ -115,42 +224,37 @@ class SimplifiedMatcher:
 
         matches: list[AmazonMatch] = []
 
-        # Group orders at ORDER level only (SHIPMENT/DAILY_SHIPMENT not yet implemented)
-        order_groups_result = group_orders(orders, GroupingLevel.ORDER)
-        # Type narrowing: ORDER level always returns dict[str, OrderGroup]
-        if not isinstance(order_groups_result, dict):
-            raise TypeError(f"ORDER level must return dict, got {type(order_groups_result)}")
-        order_groups: dict[str, OrderGroup] = order_groups_result
-
-        # order_groups is dict[str, OrderGroup] for ORDER level
-        for order_group in order_groups.values():
-            # Check for exact amount match
-            amazon_total = order_group.total.to_cents()
-            amount_diff = abs(ynab_amount - amazon_total)
-
-            if amount_diff == 0:  # Exact match only
-                # Calculate confidence
-                ship_dates = [d.date for d in order_group.ship_dates]
-
-                confidence = MatchScorer.calculate_confidence(
-                    ynab_amount=ynab_amount,
-                    amazon_total=amazon_total,
-                    ynab_date=ynab_date,
-                    amazon_ship_dates=ship_dates,
-                    match_type=MatchType.COMPLETE_ORDER,
-                    multi_day=len(ship_dates) > 1,
-                )
+        # Exact amount matches only: whole orders and individual shipments,
+        # shipped within the match window
+        first, last = self._ship_window(ynab_date)
+        candidates = [
+            group
+            for group in self._groups_for(account_name, orders).by_amount.get(ynab_amount, [])
+            if any(first <= ordinal <= last for ordinal in _group_ordinals(group))
+        ]
+        if not candidates:
+            return matches
+
+        # Score all candidates of this account at once
+        ship_dates = [[d.date for d in group.ship_dates] for group in candidates]
+        confidences = MatchScorer.score_batch(
+            amount_diffs=[0] * len(candidates),
+            date_diffs=MatchScorer.min_date_diffs(ynab_date, ship_dates, MatchType.COMPLETE_ORDER),
+            match_type=MatchType.COMPLETE_ORDER,
+            multi_day=[len(dates) > 1 for dates in ship_dates],
+        )
 
-                if ConfidenceThresholds.meets_threshold(confidence, MatchType.COMPLETE_ORDER):
-                    # Pass OrderGroup domain model directly (no dict conversion needed)
-                    match_result = MatchScorer.create_match_result(
-                        ynab_tx={"amount": ynab_amount, "date": ynab_date},
-                        amazon_orders=[order_group],
-                        match_method=f"complete_{order_group.grouping_level}",
-                        confidence=confidence,
-                        account=account_name,
-                    )
-                    matches.append(match_result)
+        for order_group, confidence in zip(candidates, confidences.tolist(), strict=True):
+            if ConfidenceThresholds.meets_threshold(confidence, MatchType.COMPLETE_ORDER):
+                # Pass OrderGroup domain model directly (no dict conversion needed)
+                match_result = MatchScorer.create_match_result(
+                    ynab_tx={"amount": ynab_amount, "date": ynab_date},
+                    amazon_orders=[order_group],
+                    match_method=f"complete_{order_group.grouping_level}",
+                    confidence=confidence,
+                    account=account_name,
+                )
+                matches.append(match_result)
 
         return matches
 
@@ -167,22 +271,13 @@ class SimplifiedMatcher:
 
         matches: list[AmazonMatch] = []
 
-        # Group by complete orders to find candidates for split payments
-        order_groups_result = group_orders(orders, GroupingLevel.ORDER)
-        # Type narrowing: ORDER level always returns dict[str, OrderGroup]
-        if not isinstance(order_groups_result, dict):
-            raise TypeError(f"ORDER level must return dict, got {type(order_groups_result)}")
-        order_groups: dict[str, OrderGroup] = order_groups_result
-
-        # order_groups is dict[str, OrderGroup] for ORDER level
-        for order_group in order_groups.values():
-            # Convert OrderGroup to dict for split_matcher
-            order_dict = order_group.to_dict()
-
-            # Try split payment matching
+        # Only orders shipped within the match window are searched for item subsets
+        first, last = self._ship_window(ynab_date)
+        groups = self._groups_for(account_name, orders)
+        for order_group in groups.orders_shipped_between(first, last):
             split_match = self.split_matcher.match_split_payment(
                 ynab_tx={"amount": ynab_amount, "date": transaction.date.to_iso_string()},
-                order_data=order_dict,
+                order_data=groups.split_orders[order_group.order_id],
                 account_name=account_name,
             )
 
@@ -16,13 +16,14 @@ if TYPE_CHECKING:
     from ..ynab.models import YnabTransaction
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AmazonOrderItem:
     """
     Single line item from Amazon Order History CSV.
 
     Represents one row from the Retail.OrderHistory CSV export.
     Each row is a single item within an order (orders can have multiple items).
+    Immutable, so that groupings built from items stay valid while they are reused.
     """
 
     # Core identifiers
@@ -70,7 +71,7 @@ class AmazonOrderItem:
             order_date = FinancialDate.from_string(order_date_val)
         elif order_date_val is not None:
             # Assume it's already a datetime/date object
-            order_date = FinancialDate(date=order_date_val)
+            order_date = FinancialDate.from_date(order_date_val)
         else:
             raise ValueError("Order Date is required but was None")
 
@@ -83,7 +84,7 @@ class AmazonOrderItem:
         elif isinstance(ship_date_val, str):
             ship_date = FinancialDate.from_string(ship_date_val)
         else:
-            ship_date = FinancialDate(date=ship_date_val)
+            ship_date = FinancialDate.from_date(ship_date_val)
 
         # Parse monetary values
         unit_price_cents = safe_currency_to_cents(row.get("Unit Price", 0))
@@ -194,7 +195,7 @@ class AmazonOrderSummary:
         return [item.product_name for item in self.items]
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchedOrderItem:
     """
     Match-layer domain model for items used in split generation.
@@ -256,7 +257,7 @@ class OrderGroup:
     total: Money
     order_date: FinancialDate
     ship_dates: list[FinancialDate]
-    grouping_level: str  # "order" or "shipment"
+    grouping_level: str  # "order", "shipment" or "daily_shipment"
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "OrderGroup":
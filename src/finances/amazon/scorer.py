@@ -4,12 +4,23 @@ Unified Match Scoring System
 
 Consolidates confidence calculation logic into a single, consistent system.
 Provides match scoring for Amazon transaction matching with precise calculations.
+
+Each match type has a ScoringTable of piecewise factors (amount accuracy,
+date alignment, match type adjustment). MatchScorer.score_batch() applies a
+table with NumPy to arrays of amount and date differences, so all candidates
+of a transaction (or of a whole run) are scored in one call; the scalar
+calculate_confidence() is a one-element batch.
 """
 
-from datetime import date
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+import numpy.typing as npt
+
 if TYPE_CHECKING:
     from .models import AmazonMatch, OrderGroup
 
@@ -21,9 +32,228 @@ class MatchType(Enum):
     SPLIT_PAYMENT = "split_payment"
 
 
+@dataclass(frozen=True)
+class ScoringTable:
+    """
+    Piecewise confidence factors for one match type.
+
+    Factors are whole percentages (as in the original integer arithmetic);
+    each step applies up to and including its bound.
+    """
+
+    # Amount accuracy: steps by absolute difference in cents
+    amount_bounds: tuple[int, ...]
+    amount_percents: tuple[int, ...]
+    # Beyond the last amount step: 1 - min(cap, diff / amount) as a percentage, or 0 if None
+    amount_penalty_cap_percent: int | None
+
+    # Date alignment: steps by days between the transaction and the nearest ship date,
+    # separately for exact amounts (within exact_amount_cents) and the rest
+    date_bounds: tuple[int, ...]
+    date_percents_exact: tuple[int, ...]
+    date_percents_inexact: tuple[int, ...]
+    # Beyond the last date step: max(floor, start - step * extra days)
+    late_start_percent: int
+    late_step_percent: int
+    late_floor_percent: int
+    exact_amount_cents: int
+
+    # Days apart assumed when a candidate has no ship dates, or only missing/unparseable ones
+    missing_date_diff: int
+    unusable_date_diff: int
+
+    # Match type adjustment (multi-day applies to orders shipped on several days)
+    adjustment: float
+    multi_day_adjustment: float
+
+
+SCORING_TABLES = {
+    MatchType.COMPLETE_ORDER: ScoringTable(
+        amount_bounds=(0,),
+        amount_percents=(100,),
+        amount_penalty_cap_percent=None,  # Exact matches only
+        date_bounds=(0, 1, 2, 3, 5, 7),
+        date_percents_exact=(100, 98, 95, 90, 85, 80),
+        date_percents_inexact=(100, 98, 90, 85, 75, 65),
+        late_start_percent=80,
+        late_step_percent=10,  # Steep penalty for dates too far apart
+        late_floor_percent=30,
+        exact_amount_cents=100,
+        missing_date_diff=7,
+        unusable_date_diff=7,
+        adjustment=1.0,
+        multi_day_adjustment=1.05,  # Multi-day orders are more complex but reliable when matched
+    ),
+    MatchType.SPLIT_PAYMENT: ScoringTable(
+        amount_bounds=(0, 100),
+        amount_percents=(100, 95),
+        amount_penalty_cap_percent=30,  # 70% minimum
+        date_bounds=(0, 2, 5),
+        date_percents_exact=(100, 95, 85),
+        date_percents_inexact=(100, 95, 85),
+        late_start_percent=75,
+        late_step_percent=0,
+        late_floor_percent=75,
+        exact_amount_cents=100,
+        missing_date_diff=3,
+        unusable_date_diff=7,
+        adjustment=0.95,  # Split payments get slight penalty for being more complex
+        multi_day_adjustment=0.95,
+    ),
+}
+
+
+def _piecewise_percent(
+    values: npt.NDArray[np.int64],
+    bounds: tuple[int, ...],
+    percents: tuple[int, ...],
+    beyond: npt.NDArray[np.int64],
+) -> npt.NDArray[np.int64]:
+    """Percent of the first step whose bound is >= value, or `beyond` past the last step."""
+    steps = np.searchsorted(np.asarray(bounds), values, side="left")
+    table = np.asarray((*percents, 0), dtype=np.int64)
+    return np.where(steps < len(bounds), table[np.minimum(steps, len(bounds))], beyond)
+
+
+def _ship_ordinal(value: Any) -> int | None:
+    """Day ordinal of a ship date (date, datetime, FinancialDate, Timestamp or ISO string), None if unusable."""
+    try:
+        if isinstance(value, str):
+            return date.fromisoformat(value[:10]).toordinal()
+        if isinstance(value, datetime):  # Includes pandas Timestamp (NaT fails below)
+            value = value.date()
+        elif not isinstance(value, date):
+            value = value.date  # FinancialDate
+        return int(value.toordinal())
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _round_cents(values: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """
+    Round to 2 decimals exactly as Python's round() does.
+
+    np.round scales by 100 first, which can land a product such as
+    0.9 * 1.05 (0.9450000000000001) on a tie and round it the other way; the
+    few values that close to a tie are rounded individually.
+    """
+    scaled = values * 100
+    rounded = np.round(values, 2)
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    for i in np.flatnonzero(near_tie):
+        rounded[i] = round(float(values[i]), 2)
+    return rounded
+
+
 class MatchScorer:
     """Unified match scoring system"""
 
+    @staticmethod
+    def score_batch(
+        amount_diffs: npt.ArrayLike,
+        date_diffs: npt.ArrayLike,
+        match_type: MatchType,
+        ynab_amounts: npt.ArrayLike | None = None,
+        multi_day: npt.ArrayLike | None = None,
+    ) -> npt.NDArray[np.float64]:
+        """
+        Score many candidates at once.
+
+        All arrays are aligned element-wise and may mix candidates of many
+        transactions.
+
+        Args:
+            amount_diffs: Amount differences in cents (sign ignored)
+            date_diffs: Days between each transaction and its candidate's nearest ship date
+                (see min_date_diffs)
+            match_type: Type of match being scored (selects the ScoringTable)
+            ynab_amounts: Transaction amounts in cents (positive); needed for proportional
+                amount penalties (split payments)
+            multi_day: Whether each candidate shipped on more than one day
+
+        Returns:
+            Confidence scores between 0.0 and 1.0, rounded to 2 decimals
+
+        Raises:
+            ValueError: If the match type penalizes amounts proportionally and ynab_amounts is missing
+        """
+        table = SCORING_TABLES[match_type]
+        amount_diff = np.abs(np.asarray(amount_diffs, dtype=np.int64))
+        date_diff = np.abs(np.asarray(date_diffs, dtype=np.int64))
+
+        # Amount accuracy
+        if table.amount_penalty_cap_percent is None:
+            amount_beyond = np.zeros_like(amount_diff)
+        else:
+            if ynab_amounts is None:
+                raise ValueError(f"ynab_amounts is required to score {match_type.value} matches")
+            amounts = np.asarray(ynab_amounts, dtype=np.int64)
+            penalty = (amount_diff * 100) // np.maximum(amounts, 1)
+            amount_beyond = 100 - np.minimum(table.amount_penalty_cap_percent, penalty)
+        amount_percent = _piecewise_percent(
+            amount_diff, table.amount_bounds, table.amount_percents, amount_beyond
+        )
+
+        # Date alignment
+        late = np.maximum(
+            table.late_floor_percent,
+            table.late_start_percent - (date_diff - table.date_bounds[-1]) * table.late_step_percent,
+        )
+        date_percent = np.where(
+            amount_diff <= table.exact_amount_cents,
+            _piecewise_percent(date_diff, table.date_bounds, table.date_percents_exact, late),
+            _piecewise_percent(date_diff, table.date_bounds, table.date_percents_inexact, late),
+        )
+
+        # Match type adjustment
+        if multi_day is None:
+            adjustment: Any = table.adjustment
+        else:
+            adjustment = np.where(
+                np.asarray(multi_day, dtype=bool), table.multi_day_adjustment, table.adjustment
+            )
+
+        confidence = np.clip(1.0 * (amount_percent / 100) * (date_percent / 100) * adjustment, 0.0, 1.0)
+        return _round_cents(confidence)
+
+    @staticmethod
+    def min_date_diffs(
+        ynab_date: date, ship_dates: Sequence[Sequence[Any]], match_type: MatchType
+    ) -> npt.NDArray[np.int64]:
+        """
+        Days between a transaction and each candidate's nearest ship date.
+
+        Args:
+            ynab_date: YNAB transaction date
+            ship_dates: Ship dates of each candidate (dates, FinancialDates, datetimes or ISO strings)
+            match_type: Match type whose table gives the defaults for candidates without
+                ship dates (missing_date_diff) or with only unusable ones (unusable_date_diff)
+
+        Returns:
+            Array of day differences, one per candidate
+        """
+        ordinals: list[int] = []
+        offsets = np.zeros(len(ship_dates) + 1, dtype=np.int64)
+        for i, candidate_dates in enumerate(ship_dates):
+            for value in candidate_dates:
+                ordinal = _ship_ordinal(value)
+                if ordinal is not None:
+                    ordinals.append(ordinal)
+            offsets[i + 1] = len(ordinals)
+
+        table = SCORING_TABLES[match_type]
+        diffs = np.array(
+            [table.unusable_date_diff if dates else table.missing_date_diff for dates in ship_dates],
+            dtype=np.int64,
+        )
+        if ordinals:
+            distances = np.abs(np.asarray(ordinals, dtype=np.int64) - ynab_date.toordinal())
+            has_dates = offsets[1:] > offsets[:-1]
+            # reduceat needs in-range starts; candidates without dates keep the default
+            starts = np.minimum(offsets[:-1], len(ordinals) - 1)
+            diffs[has_dates] = np.minimum.reduceat(distances, starts)[has_dates]
+        return diffs
+
     @staticmethod
     def calculate_confidence(
         ynab_amount: int,
@@ -36,111 +266,27 @@ class MatchScorer:
         """
         Calculate match confidence score (0.0 to 1.0).
 
+        Scores a single candidate with score_batch().
+
         Args:
             ynab_amount: YNAB transaction amount in cents (positive)
             amazon_total: Amazon order/group total in cents
             ynab_date: YNAB transaction date
             amazon_ship_dates: List of ship dates for the Amazon order/group
             match_type: Type of match being scored
-            **kwargs: Additional parameters for specific match types
+            **kwargs: Additional parameters for specific match types (multi_day)
 
         Returns:
             Confidence score between 0.0 and 1.0
         """
-        # Base confidence
-        confidence = 1.0
-
-        # Amount accuracy scoring
-        amount_diff = abs(ynab_amount - amazon_total)
-        confidence *= MatchScorer._score_amount_accuracy(amount_diff, ynab_amount, match_type)
-
-        # Date alignment scoring
-        min_date_diff = MatchScorer._get_min_date_diff(ynab_date, amazon_ship_dates)
-        confidence *= MatchScorer._score_date_alignment(min_date_diff, amount_diff, match_type)
-
-        # Match type specific adjustments
-        confidence *= MatchScorer._apply_match_type_adjustments(match_type, **kwargs)
-
-        # Apply confidence floor and ceiling
-        confidence = max(0.0, min(1.0, confidence))
-
-        return round(confidence, 2)
-
-    @staticmethod
-    def _score_amount_accuracy(amount_diff: int, ynab_amount: int, match_type: MatchType) -> float:
-        """Score based on amount accuracy - exact matches only"""
-        if amount_diff == 0:
-            return 1.0
-        else:
-            # No match allowed for any non-zero amount difference
-            return 0.0
-
-    @staticmethod
-    def _get_min_date_diff(ynab_date: date, amazon_ship_dates: list) -> int:
-        """Get minimum date difference in days"""
-        if not amazon_ship_dates:
-            return 7  # Default penalty for missing dates
-
-        date_diffs = []
-        for ship_date in amazon_ship_dates:
-            # Handle various date formats
-            try:
-                if hasattr(ship_date, "date"):
-                    ship_date = ship_date.date()
-                elif isinstance(ship_date, str):
-                    from datetime import datetime
-
-                    ship_date = datetime.strptime(ship_date, "%Y-%m-%d").date()
-
-                date_diffs.append(abs((ynab_date - ship_date).days))
-            except (ValueError, TypeError, AttributeError):
-                # Skip malformed dates - fall back to minimum from valid dates or default penalty
-                continue
-
-        return min(date_diffs) if date_diffs else 7
-
-    @staticmethod
-    def _score_date_alignment(date_diff: int, amount_diff: int, match_type: MatchType) -> float:
-        """Score based on date alignment"""
-        # Exact amounts get more lenient date scoring
-        is_exact_amount = amount_diff <= 100
-
-        if date_diff == 0:
-            return 1.0
-        elif date_diff == 1:
-            return 0.98
-        elif date_diff == 2:
-            return 0.95 if is_exact_amount else 0.90
-        elif date_diff <= 3:
-            return 0.90 if is_exact_amount else 0.85
-        elif date_diff <= 5:
-            return 0.85 if is_exact_amount else 0.75
-        elif date_diff <= 7:
-            return 0.80 if is_exact_amount else 0.65
-        else:
-            # Steep penalty for dates too far apart
-            # Use integer arithmetic to avoid floating point: 0.8 - (date_diff - 7) * 0.1
-            penalty_basis = 80 - (date_diff - 7) * 10  # Scale by 100 to avoid decimals
-            penalty_result = max(30, penalty_basis)  # 30 = 0.3 * 100
-            return penalty_result / 100  # Convert back for compatibility
-
-    @staticmethod
-    def _apply_match_type_adjustments(match_type: MatchType, **kwargs: Any) -> float:
-        """Apply match type specific confidence adjustments"""
-        if match_type == MatchType.COMPLETE_ORDER:
-            # Complete orders get slight boost for being simpler/more reliable
-            multi_day = kwargs.get("multi_day", False)
-            if multi_day:
-                return 1.05  # Multi-day orders are more complex but reliable when matched
-            else:
-                return 1.0
-
-        elif match_type == MatchType.SPLIT_PAYMENT:
-            # Split payments get slight penalty for being more complex
-            return 0.95
-
-        # This line is unreachable but mypy doesn't recognize the else after elif
-        return 1.0  # type: ignore[unreachable]
+        scores = MatchScorer.score_batch(
+            [ynab_amount - amazon_total],
+            MatchScorer.min_date_diffs(ynab_date, [amazon_ship_dates], match_type),
+            match_type,
+            ynab_amounts=[ynab_amount],
+            multi_day=[kwargs.get("multi_day", False)],
+        )
+        return float(scores[0])
 
     @staticmethod
     def create_match_result(
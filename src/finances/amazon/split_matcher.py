@@ -8,19 +8,143 @@ Tracks which items have been matched to prevent double-counting.
 
 import logging
 import os
-from collections import defaultdict
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import date, datetime
 from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 
+from ..core.dates import FinancialDate
 from ..core.json_utils import read_json, write_json_with_defaults
+from .models import MatchedOrderItem
+from .scorer import SCORING_TABLES, MatchScorer, MatchType
 
 if TYPE_CHECKING:
-    from .models import AmazonMatch
+    from .models import AmazonMatch, OrderGroup
 
 logger = logging.getLogger(__name__)
 
+# Orders with at most this many unmatched items get a table of every subset sum
+# (2^n entries); larger ones are searched per transaction
+MAX_SUBSET_TABLE_ITEMS = 12
+
+# Orders with more unmatched items than this are only matched as a whole remainder
+MAX_SUBSET_SEARCH_ITEMS = 20
+
+
+@dataclass(frozen=True, slots=True)
+class SplitOrder:
+    """
+    Typed view of one order for split matching, built once per order.
+
+    Item amounts are kept as cents and ship dates as day ordinals so that
+    probing an order for a transaction needs no conversion or parsing.
+    """
+
+    order_id: str
+    items: tuple[MatchedOrderItem, ...]
+    cents: tuple[int, ...]
+    order_date: FinancialDate
+    ship_dates: tuple[FinancialDate, ...]
+    ship_ordinals: tuple[int, ...]
+    # The order listed ship dates, but none were usable (scored as further apart than none listed)
+    ship_dates_unusable: bool = False
+
+    @classmethod
+    def from_order_group(cls, group: "OrderGroup") -> "SplitOrder":
+        """Create from an order-level OrderGroup."""
+        return cls(
+            order_id=group.order_id,
+            items=tuple(group.items),
+            cents=tuple(item.amount.to_cents() for item in group.items),
+            order_date=group.order_date,
+            ship_dates=tuple(group.ship_dates),
+            ship_ordinals=tuple(d.date.toordinal() for d in group.ship_dates),
+        )
+
+    @classmethod
+    def from_dict(cls, order_data: dict[str, Any]) -> "SplitOrder":
+        """
+        Create from order data as produced by OrderGroup.to_dict().
+
+        Ship and order dates may also be datetimes, pandas Timestamps or ISO
+        timestamps; missing or unparseable ship dates are skipped (an order
+        left with none is marked ship_dates_unusable), and a missing order
+        date falls back to today.
+        """
+        items = tuple(MatchedOrderItem.from_dict(item) for item in order_data.get("items", []))
+
+        raw_ship_dates = order_data.get("ship_dates", [])
+        ship_dates: list[FinancialDate] = []
+        for ship_date in raw_ship_dates:
+            if pd.isna(ship_date):
+                continue
+            if hasattr(ship_date, "date"):
+                ship_dates.append(FinancialDate.from_date(ship_date))
+            elif isinstance(ship_date, str):
+                try:
+                    ship_dates.append(FinancialDate.from_string(ship_date))
+                except (ValueError, TypeError):
+                    continue
+
+        # Order date might be datetime, pandas Timestamp, or string
+        order_date_raw = order_data.get("order_date")
+        if hasattr(order_date_raw, "date"):
+            order_date = FinancialDate.from_date(order_date_raw)  # type: ignore[arg-type]
+        elif isinstance(order_date_raw, str):
+            # String - extract just the date part (handle "YYYY-MM-DDTHH:MM:SS" format)
+            order_date = FinancialDate.from_string(order_date_raw.split("T")[0])
+        else:
+            order_date = FinancialDate.today()
+
+        return cls(
+            order_id=order_data["order_id"],
+            items=items,
+            cents=tuple(item.amount.to_cents() for item in items),
+            order_date=order_date,
+            ship_dates=tuple(ship_dates),
+            ship_ordinals=tuple(d.date.toordinal() for d in ship_dates),
+            ship_dates_unusable=len(raw_ship_dates) > 0 and not ship_dates,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _SubsetTable:
+    """
+    First matching item combination per amount, for one order's unmatched items.
+
+    Combinations are those find_item_combinations() would return first: a
+    single item (largest first), else the first subset in include-first
+    search order over the items sorted by amount, largest first.
+    """
+
+    singles: dict[int, int]
+    sums: dict[int, list[int]] | None  # None when the order is searched per amount
+
+    @classmethod
+    def build(cls, cents: tuple[int, ...], indices: list[int]) -> "_SubsetTable":
+        """Tabulate the unmatched items `indices` of an order with item amounts `cents`."""
+        ordered = sorted(indices, key=lambda i: cents[i], reverse=True)
+        singles: dict[int, int] = {}
+        for i in ordered:
+            singles.setdefault(cents[i], i)
+
+        # Enumerating every subset is only equivalent to the pruned search for positive amounts
+        if len(ordered) > MAX_SUBSET_TABLE_ITEMS or any(cents[i] <= 0 for i in ordered):
+            return cls(singles=singles, sums=None)
+
+        sums: dict[int, list[int]] = {}
+
+        def visit(start: int, total: int, chosen: list[int]) -> None:
+            for position in range(start, len(ordered)):
+                index = ordered[position]
+                combination = [*chosen, index]
+                sums.setdefault(total + cents[index], combination)
+                visit(position + 1, total + cents[index], combination)
+
+        visit(0, 0, [])
+        return cls(singles=singles, sums=sums)
+
 
 class SplitPaymentMatcher:
     """
@@ -39,9 +163,9 @@ class SplitPaymentMatcher:
                        If None (default), uses in-memory storage only.
         """
         self.cache_file = cache_file
-        self.matched_items: defaultdict[str, set[int]] = defaultdict(
-            set
-        )  # {order_id: set of matched item indices}
+        self.matched_masks: dict[str, int] = {}  # {order_id: bitmask of matched item indices}
+        # {order_id: (matched mask the table was built for, table)}
+        self._subset_tables: dict[str, tuple[int, _SubsetTable]] = {}
         self.transaction_matches: dict[str, dict[str, Any]] = {}  # {transaction_id: match_details}
 
         # Only load cache if file is specified AND exists
@@ -55,10 +179,12 @@ class SplitPaymentMatcher:
 
         try:
             data = read_json(self.cache_file)
-            # Convert lists back to sets
-            self.matched_items = defaultdict(
-                set, {order_id: set(items) for order_id, items in data.get("matched_items", {}).items()}
-            )
+            # Convert index lists back to bitmasks
+            self.matched_masks = {
+                order_id: sum(1 << i for i in set(items))
+                for order_id, items in data.get("matched_items", {}).items()
+            }
+            self._subset_tables.clear()
             self.transaction_matches = data.get("transaction_matches", {})
         except (FileNotFoundError, ValueError, KeyError) as e:
             logger.warning("Could not load cache from %s: %s", self.cache_file, e)
@@ -71,7 +197,7 @@ class SplitPaymentMatcher:
         try:
             data = {
                 "matched_items": {
-                    order_id: list(items)  # Convert sets to lists for JSON
+                    order_id: sorted(items)  # Convert sets to lists for JSON
                     for order_id, items in self.matched_items.items()
                 },
                 "transaction_matches": self.transaction_matches,
@@ -82,6 +208,14 @@ class SplitPaymentMatcher:
         except (OSError, ValueError) as e:
             logger.warning("Could not save cache to %s: %s", self.cache_file, e)
 
+    @property
+    def matched_items(self) -> dict[str, set[int]]:
+        """Matched item indices per order (a snapshot of the bitmasks)."""
+        return {
+            order_id: {i for i in range(mask.bit_length()) if mask >> i & 1}
+            for order_id, mask in self.matched_masks.items()
+        }
+
     def get_unmatched_items(self, order_id: str, order_data: dict) -> tuple[list[dict], int]:
         """
         Get items from an order that haven't been matched yet.
@@ -93,12 +227,12 @@ class SplitPaymentMatcher:
         Returns:
             Tuple of (unmatched_items, total_amount_in_cents)
         """
-        matched_indices = self.matched_items.get(order_id, set())
+        mask = self.matched_masks.get(order_id, 0)
         unmatched_items = []
         total_amount = 0
 
         for i, item in enumerate(order_data.get("items", [])):
-            if i not in matched_indices:
+            if not mask >> i & 1:
                 unmatched_items.append({"index": i, **item})
                 total_amount += item.get("amount", 0)
 
@@ -130,7 +264,7 @@ class SplitPaymentMatcher:
                 results.append([item["index"]])
 
         # If no single item matches, try combinations
-        if not results and len(items) <= 20:  # Limit complexity for large orders
+        if not results and len(items) <= MAX_SUBSET_SEARCH_ITEMS:  # Limit complexity for large orders
             # Use dynamic programming for subset sum problem
             results.extend(self._find_subset_sum(sorted_items, target_amount, tolerance))
 
@@ -191,156 +325,65 @@ class SplitPaymentMatcher:
 
         return unique_results
 
-    def match_split_payment(self, ynab_tx: dict, order_data: dict, account_name: str) -> "AmazonMatch | None":
+    def match_split_payment(
+        self, ynab_tx: dict, order_data: "SplitOrder | dict", account_name: str
+    ) -> "AmazonMatch | None":
         """
         Attempt to match a YNAB transaction to part of an order.
 
         Args:
             ynab_tx: YNAB transaction data
-            order_data: Complete order data with all items
+            order_data: Complete order with all items, as a SplitOrder or OrderGroup.to_dict() data
             account_name: Amazon account name
 
         Returns:
             Match result or None if no match found
         """
-        order_id = order_data["order_id"]
+        order = order_data if isinstance(order_data, SplitOrder) else SplitOrder.from_dict(order_data)
         ynab_amount = abs(ynab_tx["amount"])  # Amount in cents
 
         # Get unmatched items from the order
-        unmatched_items, unmatched_total = self.get_unmatched_items(order_id, order_data)
-
-        if not unmatched_items:
+        mask = self.matched_masks.get(order.order_id, 0)
+        unmatched = [i for i in range(len(order.cents)) if not mask >> i & 1]
+        if not unmatched:
             return None  # All items already matched
 
-        # Find combinations of items that match the transaction amount
-        item_combinations = self.find_item_combinations(unmatched_items, ynab_amount)
-
-        if not item_combinations:
-            # No exact match - try matching if transaction amount equals remaining total
-            if abs(unmatched_total - ynab_amount) <= 0:  # Exact match only
-                # This transaction might cover all remaining items
-                item_combination = [item["index"] for item in unmatched_items]
-                item_combinations = [item_combination]
-            else:
+        # Find the first combination of items that matches the transaction amount
+        best_combination = self._first_combination(order, mask, unmatched, ynab_amount)
+        if best_combination is None:
+            # No exact match - this transaction might cover all remaining items
+            if sum(order.cents[i] for i in unmatched) != ynab_amount:
                 return None
+            best_combination = unmatched
 
-        # Use the first valid combination (could be enhanced with scoring)
-        best_combination = item_combinations[0]
-
-        # Create the match result
-        matched_items_data = []
-        matched_total = 0
-
-        for item_index in best_combination:
-            # Find the item data
-            for item in unmatched_items:
-                if item["index"] == item_index:
-                    matched_items_data.append({k: v for k, v in item.items() if k != "index"})
-                    matched_total += item["amount"]
-                    break
-
-        # Calculate confidence based on amount match and date alignment
-        ynab_date = datetime.strptime(ynab_tx["date"], "%Y-%m-%d").date()
-
-        # Use ship dates for date matching
-        ship_dates = order_data.get("ship_dates", [])
-        if ship_dates:
-            # Find closest ship date
-            date_diffs = []
-            for ship_date in ship_dates:
-                # Skip NaT (Not a Time) values
-                if pd.isna(ship_date):
-                    continue
-
-                if hasattr(ship_date, "date"):
-                    ship_date = ship_date.date()
-                elif isinstance(ship_date, str):
-                    try:
-                        ship_date = datetime.strptime(ship_date, "%Y-%m-%d").date()
-                    except (ValueError, TypeError):
-                        # Skip malformed date strings - continue to next ship date
-                        continue
+        matched_total = sum(order.cents[i] for i in best_combination)
 
-                try:
-                    date_diffs.append(abs((ynab_date - ship_date).days))
-                except (TypeError, AttributeError):
-                    # Skip date calculation errors - continue to next ship date
-                    continue
-
-            min_date_diff = min(date_diffs) if date_diffs else 7
+        # Confidence from the split-payment scoring table (scorer.SCORING_TABLES)
+        ynab_ordinal = date.fromisoformat(ynab_tx["date"]).toordinal()
+        table = SCORING_TABLES[MatchType.SPLIT_PAYMENT]
+        if order.ship_ordinals:
+            date_diff = min(abs(ordinal - ynab_ordinal) for ordinal in order.ship_ordinals)
+        elif order.ship_dates_unusable:
+            date_diff = table.unusable_date_diff
         else:
-            min_date_diff = 3  # Default if no ship dates
-
-        # Calculate confidence
-        amount_diff = abs(matched_total - ynab_amount)
-        confidence = 1.0
-
-        # Amount accuracy penalty
-        if amount_diff == 0:
-            confidence *= 1.0
-        elif amount_diff <= 100:  # Within $1.00
-            confidence *= 0.95
-        else:
-            # Use integer arithmetic for penalty calculation
-            penalty_percent = min(30, (amount_diff * 100) // ynab_amount)  # Max 30% penalty
-            # Convert penalty to basis points to avoid floating point
-            penalty_basis_points = penalty_percent * 100  # 30% = 3000 basis points
-            confidence_basis_points = max(7000, 10000 - penalty_basis_points)  # 70% minimum
-            confidence *= confidence_basis_points / 10000  # Convert back for compatibility
-
-        # Date alignment penalty
-        if min_date_diff == 0:
-            confidence *= 1.0
-        elif min_date_diff <= 2:
-            confidence *= 0.95
-        elif min_date_diff <= 5:
-            confidence *= 0.85
-        else:
-            confidence *= 0.75
-
-        # Split payment indicator - slightly reduce confidence for splits
-        confidence *= 0.95
+            date_diff = table.missing_date_diff
+        confidence = MatchScorer.score_batch(
+            amount_diffs=[matched_total - ynab_amount],
+            date_diffs=[date_diff],
+            match_type=MatchType.SPLIT_PAYMENT,
+            ynab_amounts=[ynab_amount],
+        )[0]
 
-        from ..core.dates import FinancialDate
         from ..core.money import Money
-        from .models import AmazonMatch, MatchedOrderItem, OrderGroup
-
-        # Convert matched items data to MatchedOrderItem domain models
-        matched_items_models = [MatchedOrderItem.from_dict(item) for item in matched_items_data]
-
-        # Parse ship dates to FinancialDate objects
-        ship_dates_parsed = []
-        for ship_date in order_data.get("ship_dates", []):
-            if pd.isna(ship_date):
-                continue
-            if hasattr(ship_date, "date"):
-                ship_dates_parsed.append(FinancialDate(date=ship_date.date()))
-            elif isinstance(ship_date, str):
-                try:
-                    ship_dates_parsed.append(FinancialDate.from_string(ship_date))
-                except (ValueError, TypeError):
-                    continue
-
-        # Parse order_date robustly (might be datetime, pandas Timestamp, or string)
-        order_date_raw = order_data.get("order_date")
-        if hasattr(order_date_raw, "date"):
-            # pandas Timestamp or datetime object
-            order_date_parsed = FinancialDate(date=order_date_raw.date())  # type: ignore[union-attr]
-        elif isinstance(order_date_raw, str):
-            # String - extract just the date part (handle "YYYY-MM-DDTHH:MM:SS" format)
-            date_str = order_date_raw.split("T")[0] if "T" in order_date_raw else order_date_raw
-            order_date_parsed = FinancialDate.from_string(date_str)
-        else:
-            # Fallback to today if order_date is missing or invalid
-            order_date_parsed = FinancialDate.today()
+        from .models import AmazonMatch, OrderGroup
 
         # Create OrderGroup domain model for split payment match
         order_group = OrderGroup(
-            order_id=order_id,
-            items=matched_items_models,
+            order_id=order.order_id,
+            items=[order.items[i] for i in best_combination],
             total=Money.from_cents(matched_total),
-            order_date=order_date_parsed,
-            ship_dates=ship_dates_parsed,
+            order_date=order.order_date,
+            ship_dates=list(order.ship_dates),
             grouping_level="order",
         )
 
@@ -348,12 +391,35 @@ class SplitPaymentMatcher:
             account=account_name,
             amazon_orders=[order_group],
             match_method="split_payment",
-            confidence=round(confidence, 2),
+            confidence=float(confidence),
             total_match_amount=Money.from_cents(matched_total),
             unmatched_amount=Money.from_cents(ynab_amount - matched_total),
             matched_item_indices=best_combination,
         )
 
+    def _first_combination(
+        self, order: SplitOrder, mask: int, unmatched: list[int], target: int
+    ) -> list[int] | None:
+        """First item combination of the order's unmatched items summing to target, if any."""
+        cached = self._subset_tables.get(order.order_id)
+        if cached is None or cached[0] != mask:
+            cached = (mask, _SubsetTable.build(order.cents, unmatched))
+            self._subset_tables[order.order_id] = cached
+        table = cached[1]
+
+        if target in table.singles:
+            return [table.singles[target]]
+        if table.sums is not None:
+            return table.sums.get(target)
+
+        if len(unmatched) > MAX_SUBSET_SEARCH_ITEMS:
+            return None
+        items = [{"index": i, "amount": order.cents[i]} for i in unmatched]
+        combinations = self._find_subset_sum(
+            sorted(items, key=lambda x: x["amount"], reverse=True), target, 0
+        )
+        return combinations[0] if combinations else None
+
     def record_match(self, transaction_id: str, order_id: str, item_indices: list[int]) -> None:
         """
         Record that certain items from an order have been matched.
@@ -364,7 +430,9 @@ class SplitPaymentMatcher:
             item_indices: List of item indices that were matched
         """
         # Update matched items
-        self.matched_items[order_id].update(item_indices)
+        self.matched_masks[order_id] = self.matched_masks.get(order_id, 0) | sum(
+            1 << i for i in set(item_indices)
+        )
 
         # Record transaction match
         self.transaction_matches[transaction_id] = {
@@ -3,16 +3,33 @@
 Amazon Order History Unzipper
 
 Extracts Amazon order history ZIP files to structured data directories.
+
+Batch extraction is resumable: a manifest under the raw data directory maps
+each ZIP's SHA-256 to its output directory and records every member once it
+has been written and its CRC verified. ZIPs already extracted are skipped, and
+an interrupted extraction continues with the members it had not finished.
 """
 
+import hashlib
 import logging
+import os
+import shutil
+import threading
 import zipfile
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path
+from fnmatch import fnmatch
+from pathlib import Path, PurePosixPath
 from typing import Any
 
+from ..core.json_utils import read_json, write_file_summary, write_json
+
 logger = logging.getLogger(__name__)
 
+# Manifest of batch extractions, relative to the raw data directory
+MANIFEST_PATH = Path(".meta") / "unzip_manifest.json"
+
 
 class AmazonUnzipper:
     """
@@ -22,15 +39,31 @@ class AmazonUnzipper:
     structure suitable for downstream processing.
     """
 
-    def __init__(self, raw_data_dir: Path):
+    def __init__(
+        self,
+        raw_data_dir: Path,
+        member_patterns: Sequence[str] | None = None,
+        max_workers: int | None = None,
+    ):
         """
         Initialize unzipper.
 
         Args:
             raw_data_dir: Base directory for raw Amazon data storage
+            member_patterns: File name patterns of the ZIP members batch extraction
+                writes (config.amazon.file_patterns if None)
+            max_workers: ZIPs extracted concurrently by batch extraction (default: CPU count, at most 4)
         """
         self.raw_data_dir = raw_data_dir
         self.raw_data_dir.mkdir(parents=True, exist_ok=True)
+        if member_patterns is None:
+            from ..core.config import get_config
+
+            member_patterns = get_config().amazon.file_patterns
+        self.member_patterns = list(member_patterns)
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.manifest_path = self.raw_data_dir / MANIFEST_PATH
+        self._manifest_lock = threading.Lock()
 
     def scan_for_zip_files(self, download_dir: Path) -> list[Path]:
         """
@@ -65,35 +98,9 @@ class AmazonUnzipper:
         if not zip_path.exists():
             raise FileNotFoundError(f"ZIP file not found: {zip_path}")
 
-        # Determine account name from filename if not provided
         if account_name is None:
-            # Try to extract account name from filename patterns
-            # Common patterns: "amazon_orders_karl.zip", "orders_erica_2024.zip"
-            stem = zip_path.stem.lower()
-            if "karl" in stem:
-                account_name = "karl"
-            elif "erica" in stem:
-                account_name = "erica"
-            else:
-                account_name = "unknown"
-
-        # Generate output directory name with timestamp and account
-        timestamp = datetime.now().strftime("%Y-%m-%d")
-        output_dir_name = f"{timestamp}_{account_name}_amazon_data"
-        output_dir = self.raw_data_dir / output_dir_name
-
-        # Check if directory already exists
-        if output_dir.exists():
-            logger.warning(f"Output directory already exists: {output_dir}")
-            # Add sequence number to avoid conflicts
-            counter = 1
-            while output_dir.exists():
-                output_dir_name = f"{timestamp}_{account_name}_amazon_data_{counter:03d}"
-                output_dir = self.raw_data_dir / output_dir_name
-                counter += 1
-
-        # Create output directory
-        output_dir.mkdir(parents=True, exist_ok=True)
+            account_name = self._detect_account_name(zip_path)
+        output_dir = self._new_output_dir(account_name)
 
         try:
             with zipfile.ZipFile(zip_path, "r") as zip_ref:
@@ -106,6 +113,10 @@ class AmazonUnzipper:
 
                 # Categorize extracted files
                 csv_files = [f for f in file_list if f.endswith(".csv")]
+
+                # Sidecar summaries (row count, size, hash) for status displays
+                for csv_file in csv_files:
+                    write_file_summary(output_dir / csv_file, header_lines=1)
                 json_files = [f for f in file_list if f.endswith(".json")]
                 other_files = [f for f in file_list if not (f.endswith(".csv") or f.endswith(".json"))]
 
@@ -136,9 +147,205 @@ class AmazonUnzipper:
             logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
+    @staticmethod
+    def _detect_account_name(zip_path: Path) -> str:
+        """Guess the account name from the ZIP file name."""
+        # Common patterns: "amazon_orders_karl.zip", "orders_erica_2024.zip"
+        stem = zip_path.stem.lower()
+        if "karl" in stem:
+            return "karl"
+        elif "erica" in stem:
+            return "erica"
+        return "unknown"
+
+    def _new_output_dir(self, account_name: str) -> Path:
+        """Create a new dated output directory for an account."""
+        # Generate output directory name with timestamp and account
+        timestamp = datetime.now().strftime("%Y-%m-%d")
+        output_dir_name = f"{timestamp}_{account_name}_amazon_data"
+        output_dir = self.raw_data_dir / output_dir_name
+
+        # Check if directory already exists
+        if output_dir.exists():
+            logger.warning(f"Output directory already exists: {output_dir}")
+            # Add sequence number to avoid conflicts
+            counter = 1
+            while output_dir.exists():
+                output_dir_name = f"{timestamp}_{account_name}_amazon_data_{counter:03d}"
+                output_dir = self.raw_data_dir / output_dir_name
+                counter += 1
+
+        # Create output directory
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return output_dir
+
+    def load_manifest(self) -> dict[str, dict[str, Any]]:
+        """
+        Load the batch extraction manifest.
+
+        Returns:
+            Dictionary of {zip SHA-256: extraction entry} (empty if there is no readable manifest)
+        """
+        try:
+            manifest = read_json(self.manifest_path)
+        except (OSError, ValueError) as e:
+            if self.manifest_path.exists():
+                logger.warning(f"Ignoring unreadable unzip manifest {self.manifest_path}: {e}")
+            return {}
+        return manifest.get("zips", {}) if isinstance(manifest, dict) else {}
+
+    def _save_manifest(self, manifest: dict[str, dict[str, Any]]) -> None:
+        """Write the manifest (callers hold the manifest lock)."""
+        write_json(self.manifest_path, {"zips": manifest})
+
+    @staticmethod
+    def _sha256(zip_path: Path) -> str:
+        """SHA-256 of a ZIP file, read in chunks."""
+        digest = hashlib.sha256()
+        with open(zip_path, "rb") as f:
+            while chunk := f.read(1 << 20):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _is_wanted_member(self, info: zipfile.ZipInfo) -> bool:
+        """Whether batch extraction writes a ZIP member (matched on its file name)."""
+        name = PurePosixPath(info.filename).name
+        return not info.is_dir() and any(fnmatch(name, pattern) for pattern in self.member_patterns)
+
+    def extract_order_history(
+        self, zip_path: Path, zip_hash: str, manifest: dict[str, dict[str, Any]]
+    ) -> dict[str, Any]:
+        """
+        Extract the order history members of a ZIP, resuming a previous attempt.
+
+        Members are streamed to disk one at a time; reading a member to its end
+        verifies its CRC. Each verified member is recorded in the manifest, and
+        members recorded with the same CRC whose files are still in place are
+        not extracted again.
+
+        Args:
+            zip_path: Path to ZIP file
+            zip_hash: SHA-256 of the ZIP file (its manifest key)
+            manifest: Manifest loaded by the caller, updated in place and saved
+
+        Returns:
+            Dictionary with extraction results and metadata
+
+        Raises:
+            FileNotFoundError: If the ZIP file does not exist
+            ValueError: If the ZIP file is invalid, a member fails its CRC check,
+                or a member name points outside the output directory
+        """
+        if not zip_path.exists():
+            raise FileNotFoundError(f"ZIP file not found: {zip_path}")
+
+        try:
+            with zipfile.ZipFile(zip_path, "r") as zip_ref:
+                members = [info for info in zip_ref.infolist() if self._is_wanted_member(info)]
+
+                with self._manifest_lock:
+                    entry = manifest.get(zip_hash)
+                    resumed = entry is not None and (self.raw_data_dir / entry["output_directory"]).is_dir()
+                    if entry is None or not resumed:
+                        account_name = self._detect_account_name(zip_path)
+                        entry = {
+                            "zip_file": zip_path.name,
+                            "account_name": account_name,
+                            "output_directory": self._new_output_dir(account_name).name,
+                            "members": {},
+                            "complete": False,
+                        }
+                        manifest[zip_hash] = entry
+                        self._save_manifest(manifest)
+                output_dir = self.raw_data_dir / entry["output_directory"]
+
+                extracted = []
+                for info in members:
+                    target = self._member_target(output_dir, info.filename)
+                    recorded = entry["members"].get(info.filename)
+                    if (
+                        recorded is not None
+                        and recorded["crc"] == info.CRC
+                        and target.exists()
+                        and target.stat().st_size == recorded["size"]
+                    ):
+                        continue
+
+                    # Stream to a partial file; the CRC is checked when the member is fully read
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    partial = target.with_name(f".{target.name}.part")
+                    try:
+                        with zip_ref.open(info) as source, open(partial, "wb") as dest:
+                            shutil.copyfileobj(source, dest, 1 << 20)
+                        os.replace(partial, target)
+                    except BaseException:
+                        partial.unlink(missing_ok=True)
+                        raise
+                    write_file_summary(target, header_lines=1)
+                    extracted.append(info.filename)
+
+                    with self._manifest_lock:
+                        entry["members"][info.filename] = {"crc": info.CRC, "size": info.file_size}
+                        self._save_manifest(manifest)
+
+                with self._manifest_lock:
+                    entry["complete"] = True
+                    entry["timestamp"] = datetime.now().isoformat()
+                    self._save_manifest(manifest)
+
+        except zipfile.BadZipFile as e:
+            error_msg = f"Invalid ZIP file: {zip_path} - {e}"
+            logger.error(error_msg)
+            raise ValueError(error_msg) from e
+
+        logger.info(
+            f"Extracted {len(extracted)} of {len(members)} order history files from {zip_path.name} "
+            f"to: {output_dir}"
+        )
+        return {
+            "success": True,
+            "zip_file": str(zip_path),
+            "zip_sha256": zip_hash,
+            "output_directory": str(output_dir),
+            "account_name": entry["account_name"],
+            "files_extracted": len(extracted),
+            "csv_files": [info.filename for info in members],
+            "json_files": [],
+            "other_files": [],
+            "resumed": resumed,
+            "timestamp": datetime.now().isoformat(),
+        }
+
+    @staticmethod
+    def _member_target(output_dir: Path, member_name: str) -> Path:
+        """Output path of a ZIP member, refusing names that escape the output directory."""
+        parts = PurePosixPath(member_name.replace("\\", "/")).parts
+        if not parts or parts[0] == "/" or ".." in parts or ":" in parts[0]:
+            raise ValueError(f"Unsafe ZIP member name: {member_name}")
+        return output_dir.joinpath(*parts)
+
+    def _is_extracted(self, entry: dict[str, Any]) -> bool:
+        """Whether a manifest entry is complete and its output directory and members are still in place."""
+        output_dir = self.raw_data_dir / entry["output_directory"]
+        if not entry.get("complete") or not output_dir.is_dir():
+            return False
+        for name, recorded in entry["members"].items():
+            try:
+                if self._member_target(output_dir, name).stat().st_size != recorded["size"]:
+                    return False
+            except (OSError, ValueError):
+                return False
+        return True
+
     def batch_extract(self, download_dir: Path) -> dict[str, Any]:
         """
-        Extract all ZIP files found in download directory.
+        Extract the order history of all ZIP files found in download directory.
+
+        ZIPs are identified by content hash: those the manifest records as
+        completely extracted, with their output still in place, are skipped;
+        partially extracted ones (or ones whose output was removed or changed)
+        are resumed or extracted again, concurrently with the rest (see
+        extract_order_history()).
 
         Args:
             download_dir: Directory containing ZIP files
@@ -158,26 +365,49 @@ class AmazonUnzipper:
 
         extractions = []
         errors = []
+        skipped = []
+
+        def record_error(zip_path: Path, e: Exception) -> None:
+            errors.append(
+                {"zip_file": str(zip_path), "error": str(e), "timestamp": datetime.now().isoformat()}
+            )
+            logger.error(f"Failed to extract {zip_path}: {e}")
+
+        manifest = self.load_manifest()
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(zip_files))) as executor:
+            hashes = dict(zip(zip_files, executor.map(self._sha256, zip_files), strict=True))
+
+            # Each distinct ZIP is extracted once, however many copies were downloaded
+            pending: dict[str, Path] = {}
+            for zip_path, zip_hash in hashes.items():
+                entry = manifest.get(zip_hash)
+                if entry is not None and self._is_extracted(entry):
+                    skipped.append({"zip_file": str(zip_path), "output_directory": entry["output_directory"]})
+                elif zip_hash in pending:
+                    skipped.append({"zip_file": str(zip_path), "duplicate_of": str(pending[zip_hash])})
+                else:
+                    pending[zip_hash] = zip_path
+
+            futures = {
+                zip_path: executor.submit(self.extract_order_history, zip_path, zip_hash, manifest)
+                for zip_hash, zip_path in pending.items()
+            }
+            for zip_path, future in futures.items():
+                try:
+                    extractions.append(future.result())
+                except Exception as e:
+                    record_error(zip_path, e)
 
-        for zip_path in zip_files:
-            try:
-                extraction_result = self.extract_zip_file(zip_path)
-                extractions.append(extraction_result)
-
-            except Exception as e:
-                error_info = {
-                    "zip_file": str(zip_path),
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat(),
-                }
-                errors.append(error_info)
-                logger.error(f"Failed to extract {zip_path}: {e}")
+        if skipped:
+            logger.info(f"Skipped {len(skipped)} ZIP files already extracted")
 
         result = {
             "success": len(errors) == 0,
             "files_processed": len(extractions),
             "files_failed": len(errors),
+            "files_skipped": len(skipped),
             "extractions": extractions,
+            "skipped": skipped,
             "errors": errors,
         }
 
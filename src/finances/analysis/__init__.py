@@ -17,9 +17,29 @@ Features:
 - Comprehensive dashboard generation
 """
 
-from .cash_flow import CashFlowAnalyzer, CashFlowConfig
+from typing import TYPE_CHECKING
+
+from ..core.lazy_imports import lazy_exports
+
+# Exports are imported from their submodules on first access (see core.lazy_imports)
+if TYPE_CHECKING:
+    from .batch import CashFlowScenario, CashFlowScenarioResult, load_scenarios, run_cash_flow_scenarios
+    from .cash_flow import CashFlowAnalyzer, CashFlowConfig, CashFlowData
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".batch": ["CashFlowScenario", "CashFlowScenarioResult", "load_scenarios", "run_cash_flow_scenarios"],
+        ".cash_flow": ["CashFlowAnalyzer", "CashFlowConfig", "CashFlowData"],
+    },
+)
 
 __all__ = [
     "CashFlowAnalyzer",
     "CashFlowConfig",
+    "CashFlowData",
+    "CashFlowScenario",
+    "CashFlowScenarioResult",
+    "load_scenarios",
+    "run_cash_flow_scenarios",
 ]
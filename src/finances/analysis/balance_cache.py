@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Daily Balance Cache
+
+Persists the cash flow daily (date x account) balance table, its derived
+series, and a digest of the transactions it was built from, so the next
+analysis run can recompute only the days affected by new or changed
+transactions.
+
+Stored as a compressed NumPy archive (.npz): one array per column, no
+pickled objects.
+"""
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+
+# Derived daily series persisted alongside the balances
+DERIVED_COLUMNS = ["MA_7", "MA_30", "MA_90", "Daily_Change"]
+MONTHLY_COLUMNS = ["Mean_Balance", "Min_Balance", "Max_Balance", "End_Balance", "Net_Change"]
+
+
+@dataclass
+class DailyBalanceCache:
+    """Persisted state of one cash flow analysis run."""
+
+    start_date: str
+    accounts: list[str]
+    ma_windows: tuple[int, int, int]
+    current_balances: np.ndarray  # int64 milliunits, one per account
+    transactions: pd.DataFrame  # Id, Date, Account, Amount (milliunits)
+    balances: pd.DataFrame  # int64 milliunits, Date index x accounts
+    derived: pd.DataFrame  # DERIVED_COLUMNS, same index as balances
+    monthly: pd.DataFrame  # MONTHLY_COLUMNS, month-end index
+
+    def save(self, cache_file: Path) -> None:
+        """
+        Write the cache to a compressed .npz file (atomically replaced).
+
+        Args:
+            cache_file: Destination path
+        """
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        arrays: dict[str, Any] = {
+            "format_version": np.array(CACHE_FORMAT_VERSION),
+            "start_date": np.array(self.start_date),
+            "accounts": np.array(self.accounts, dtype=str),
+            "ma_windows": np.array(self.ma_windows, dtype=np.int64),
+            "current_balances": self.current_balances.astype(np.int64),
+            "tx_id": self.transactions["Id"].to_numpy(dtype=str),
+            "tx_date": self.transactions["Date"].to_numpy(),
+            "tx_account": self.transactions["Account"].to_numpy(dtype=str),
+            "tx_amount": self.transactions["Amount"].to_numpy(dtype=np.int64),
+            "dates": self.balances.index.to_numpy(),
+            "balances": self.balances.to_numpy(dtype=np.int64),
+            "derived": self.derived[DERIVED_COLUMNS].to_numpy(dtype=np.float64),
+            "months": self.monthly.index.to_numpy(),
+            "monthly": self.monthly[MONTHLY_COLUMNS].to_numpy(dtype=np.float64),
+        }
+        tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+        with open(tmp_file, "wb") as f:
+            np.savez_compressed(f, **arrays)
+        tmp_file.replace(cache_file)
+
+    @classmethod
+    def load(cls, cache_file: Path) -> "DailyBalanceCache | None":
+        """
+        Load a cache file.
+
+        Args:
+            cache_file: Path written by save()
+
+        Returns:
+            DailyBalanceCache, or None if missing, unreadable or from another format version
+        """
+        if not cache_file.exists():
+            return None
+        try:
+            with np.load(cache_file, allow_pickle=False) as data:
+                if int(data["format_version"]) != CACHE_FORMAT_VERSION:
+                    return None
+                accounts = [str(a) for a in data["accounts"]]
+                dates = pd.DatetimeIndex(data["dates"], name="Date")
+                months = pd.DatetimeIndex(data["months"], name="Date")
+                return cls(
+                    start_date=str(data["start_date"]),
+                    accounts=accounts,
+                    ma_windows=tuple(int(w) for w in data["ma_windows"]),  # type: ignore[arg-type]
+                    current_balances=data["current_balances"],
+                    transactions=pd.DataFrame(
+                        {
+                            "Id": data["tx_id"].astype(object),
+                            "Date": data["tx_date"],
+                            "Account": data["tx_account"].astype(object),
+                            "Amount": data["tx_amount"],
+                        }
+                    ),
+                    balances=pd.DataFrame(data["balances"], index=dates, columns=accounts),
+                    derived=pd.DataFrame(data["derived"], index=dates, columns=DERIVED_COLUMNS),
+                    monthly=pd.DataFrame(data["monthly"], index=months, columns=MONTHLY_COLUMNS),
+                )
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable cash flow balance cache {cache_file}: {e}")
+            return None
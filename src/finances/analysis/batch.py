@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Cash Flow Scenario Batches
+
+Runs the same cash flow analysis over several account sets and start dates
+(e.g. household vs. individual, last year vs. all time) against a single
+parse of the YNAB cache, one report per scenario.
+"""
+
+import logging
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Any
+
+from ..core.json_utils import read_json, write_json
+from .cash_flow import CashFlowAnalyzer, CashFlowConfig, CashFlowData
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CashFlowScenario:
+    """A named cash flow analysis configuration."""
+
+    name: str
+    config: CashFlowConfig
+
+    @property
+    def slug(self) -> str:
+        """Filesystem-safe scenario name used for its output directory."""
+        return re.sub(r"[^a-z0-9]+", "-", self.name.lower()).strip("-") or "scenario"
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CashFlowScenario":
+        """
+        Create a scenario from a dictionary of CashFlowConfig fields plus "name".
+
+        Args:
+            data: Scenario definition, e.g. {"name": "household", "cash_accounts": [...], "start_date": "..."}
+
+        Returns:
+            CashFlowScenario
+
+        Raises:
+            ValueError: If the name or required config fields are missing, or a field is unknown
+        """
+        config_fields = {f.name for f in fields(CashFlowConfig)}
+        options = {key: value for key, value in data.items() if key != "name"}
+        unknown = set(options) - config_fields
+        if unknown:
+            raise ValueError(f"Unknown cash flow scenario fields: {', '.join(sorted(unknown))}")
+        if not data.get("name"):
+            raise ValueError("Cash flow scenario is missing a name")
+        if "cash_accounts" not in options or "start_date" not in options:
+            raise ValueError(f"Cash flow scenario {data['name']!r} needs cash_accounts and start_date")
+
+        if "figure_size" in options:
+            options["figure_size"] = tuple(options["figure_size"])
+        return cls(name=data["name"], config=CashFlowConfig(**options))
+
+
+@dataclass
+class CashFlowScenarioResult:
+    """Outcome of one scenario in a batch."""
+
+    name: str
+    success: bool
+    dashboard_file: Path | None = None
+    summary_file: Path | None = None
+    summary: dict[str, Any] = field(default_factory=dict)
+    error_message: str | None = None
+
+
+def load_scenarios(scenarios_file: Path) -> list[CashFlowScenario]:
+    """
+    Load scenario definitions from a JSON file.
+
+    The file holds a list of scenario objects, or {"scenarios": [...]}.
+
+    Args:
+        scenarios_file: Path to the JSON file
+
+    Returns:
+        List of scenarios in file order
+
+    Raises:
+        ValueError: If the file is malformed or scenario names are not unique
+    """
+    data = read_json(scenarios_file)
+    if isinstance(data, dict):
+        data = data.get("scenarios")
+    if not isinstance(data, list):
+        raise ValueError(f"Expected a list of scenarios in {scenarios_file}")
+
+    scenarios = [CashFlowScenario.from_dict(item) for item in data]
+    slugs = [scenario.slug for scenario in scenarios]
+    if len(set(slugs)) != len(slugs):
+        raise ValueError(f"Cash flow scenario names must be unique in {scenarios_file}")
+    return scenarios
+
+
+# Shared YNAB data for pool workers, set once per worker process by _init_worker()
+_worker_data: CashFlowData | None = None
+
+
+def _init_worker(data: CashFlowData) -> None:
+    """Process pool initializer: receive the shared YNAB data once per worker."""
+    global _worker_data
+    _worker_data = data
+
+
+def _run_scenario(
+    scenario: CashFlowScenario, output_dir: Path, data: CashFlowData | None = None
+) -> CashFlowScenarioResult:
+    """Analyze one scenario and write its dashboard and summary report."""
+    data = data if data is not None else _worker_data
+    if data is None:
+        raise RuntimeError("Cash flow worker started without YNAB data")
+
+    try:
+        analyzer = CashFlowAnalyzer(scenario.config)
+        analyzer.load_from(data)
+        scenario_dir = output_dir / scenario.slug
+        dashboard_file = analyzer.generate_dashboard(scenario_dir)
+        summary = {"scenario": scenario.name, **analyzer.get_summary_statistics()}
+        summary_file = scenario_dir / "summary.json"
+        write_json(summary_file, summary)
+        return CashFlowScenarioResult(
+            name=scenario.name,
+            success=True,
+            dashboard_file=dashboard_file,
+            summary_file=summary_file,
+            summary=summary,
+        )
+    except ValueError as e:
+        logger.warning(f"Cash flow scenario {scenario.name!r} failed: {e}")
+        return CashFlowScenarioResult(name=scenario.name, success=False, error_message=str(e))
+
+
+def run_cash_flow_scenarios(
+    scenarios: list[CashFlowScenario],
+    output_dir: Path,
+    data: CashFlowData | None = None,
+    ynab_cache_dir: Path | None = None,
+    max_workers: int = 1,
+) -> list[CashFlowScenarioResult]:
+    """
+    Run several cash flow scenarios against one load of the YNAB cache.
+
+    Args:
+        scenarios: Scenarios to evaluate
+        output_dir: Base directory; each scenario writes to output_dir/<slug>
+        data: Already-loaded YNAB data (loaded from ynab_cache_dir if None)
+        ynab_cache_dir: YNAB cache directory (default: from config)
+        max_workers: Evaluate scenarios in a process pool when greater than 1
+
+    Returns:
+        One result per scenario, in input order
+    """
+    if data is None:
+        data = CashFlowData.from_ynab_cache(ynab_cache_dir)
+
+    if max_workers > 1 and len(scenarios) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(scenarios)), initializer=_init_worker, initargs=(data,)
+        ) as executor:
+            futures = [executor.submit(_run_scenario, scenario, output_dir) for scenario in scenarios]
+            return [future.result() for future in futures]
+
+    return [_run_scenario(scenario, output_dir, data) for scenario in scenarios]
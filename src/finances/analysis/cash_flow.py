@@ -6,22 +6,65 @@ Professional cash flow analysis with trend detection, statistical modeling,
 and comprehensive dashboard generation.
 """
 
-import matplotlib
-import pandas as pd
-
-matplotlib.use("Agg")  # Use non-interactive backend
-from collections import defaultdict
+import hashlib
+import json
+import logging
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import matplotlib.pyplot as plt
 import numpy as np
-from scipy import stats
+import pandas as pd
 
 from ..core.config import get_config
-from ..ynab.loader import load_accounts, load_transactions
+from ..core.json_utils import read_json, write_json
+from ..ynab.loader import TransactionColumns, load_accounts, load_transaction_columns
+from ..ynab.models import YnabAccount
+from .balance_cache import DERIVED_COLUMNS, DailyBalanceCache
+
+logger = logging.getLogger(__name__)
+
+
+def _new_figure(figsize: tuple[float, float]) -> Any:
+    """
+    Create a figure drawing on the Agg canvas.
+
+    matplotlib is imported here rather than at module level: it is only needed
+    when rendering, and importing it costs more than the analysis itself. The
+    Agg canvas is used directly (no pyplot), so no GUI backend is ever imported.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _thousands_formatter() -> Any:
+    """Axis tick formatter showing dollar amounts in thousands ($12k)."""
+    from matplotlib.ticker import FuncFormatter
+
+    return FuncFormatter(lambda x, p: f"${x/1000:.0f}k")
+
+
+# Dashboard panels in grid order (name -> drawing method)
+DASHBOARD_PANELS = {
+    "main_trend": "_create_main_trend_panel",
+    "monthly_flow": "_create_monthly_flow_panel",
+    "volatility": "_create_volatility_panel",
+    "velocity": "_create_velocity_panel",
+    "composition": "_create_composition_panel",
+    "statistics": "_create_statistics_panel",
+}
+
+# Records the input hash and image file of each rendered dashboard/panel
+RENDER_MANIFEST_FILENAME = ".render_manifest.json"
+
+# Transaction columns the analysis reads from the YNAB cache
+CASH_FLOW_TRANSACTION_FIELDS = ("id", "date_ordinal", "amount", "account_name", "deleted")
 
 
 @dataclass
@@ -57,6 +100,61 @@ class CashFlowConfig:
         )
 
 
+@dataclass
+class CashFlowData:
+    """YNAB accounts and transactions in columnar form, shared by cash flow analyzers."""
+
+    accounts: pd.DataFrame  # Name, Balance (milliunits), Closed
+    transactions: pd.DataFrame  # Id, Date, Account, Amount (milliunits), Deleted
+
+    @classmethod
+    def from_ynab_cache(cls, ynab_cache_dir: Path | None = None) -> "CashFlowData":
+        """
+        Load and parse the YNAB cache once.
+
+        Args:
+            ynab_cache_dir: YNAB cache directory (default: from config)
+
+        Returns:
+            CashFlowData with one row per account and per transaction
+        """
+        return cls.from_ynab(
+            load_accounts(ynab_cache_dir),
+            load_transaction_columns(ynab_cache_dir, fields=CASH_FLOW_TRANSACTION_FIELDS),
+        )
+
+    @classmethod
+    def from_ynab(cls, accounts: list[YnabAccount], transactions: TransactionColumns) -> "CashFlowData":
+        """
+        Build from already-loaded YNAB accounts and transaction columns.
+
+        Args:
+            accounts: YNAB accounts
+            transactions: Transaction columns including CASH_FLOW_TRANSACTION_FIELDS
+
+        Returns:
+            CashFlowData with one row per account and per transaction
+        """
+        return cls(
+            accounts=pd.DataFrame(
+                {
+                    "Name": [a.name for a in accounts],
+                    "Balance": np.fromiter((a.balance.to_milliunits() for a in accounts), dtype=np.int64),
+                    "Closed": np.fromiter((a.closed for a in accounts), dtype=bool),
+                }
+            ),
+            transactions=pd.DataFrame(
+                {
+                    "Id": transactions["id"],
+                    "Date": pd.to_datetime(transactions.dates).as_unit("ns"),
+                    "Account": transactions["account_name"],
+                    "Amount": transactions["amount"],
+                    "Deleted": transactions["deleted"],
+                }
+            ),
+        )
+
+
 class CashFlowAnalyzer:
     """
     Professional cash flow analyzer with advanced statistical modeling.
@@ -76,87 +174,271 @@ class CashFlowAnalyzer:
         self.monthly_df: pd.DataFrame | None = None
         self.trend_stats: dict | None = None
 
-    def load_data(self, ynab_cache_dir: Path | None = None) -> None:
-        """Load YNAB data from cache directory."""
-        # Load typed domain models via shared loaders
-        accounts = load_accounts(ynab_cache_dir)
-        transactions = load_transactions(ynab_cache_dir)
+    def load_data(self, ynab_cache_dir: Path | None = None, balance_cache_file: Path | None = None) -> None:
+        """
+        Load YNAB data from cache directory.
+
+        Args:
+            ynab_cache_dir: YNAB cache directory (default: from config)
+            balance_cache_file: Optional persisted daily balance table. When given, only the
+                days affected by transactions added, removed or changed since the last run
+                are recomputed, and the updated table is saved back.
+        """
+        self.load_from(CashFlowData.from_ynab_cache(ynab_cache_dir), balance_cache_file)
+
+    def load_from(self, data: CashFlowData, balance_cache_file: Path | None = None) -> None:
+        """
+        Load this analyzer's accounts and date range from already-loaded YNAB data.
+
+        Lets several analyzers (scenarios) share one parse of the YNAB cache.
 
+        Args:
+            data: Columnar YNAB accounts and transactions
+            balance_cache_file: Optional persisted daily balance table (see load_data())
+        """
         # Filter accounts: by configured name, excluding closed accounts.
         # Note: on_budget is NOT filtered here — credit cards tracked as off-budget in YNAB
         # still carry real debt and must be included in the net balance calculation.
-        cash_account_models = [a for a in accounts if a.name in self.config.cash_accounts and not a.closed]
+        cash_accounts = data.accounts[
+            data.accounts["Name"].isin(self.config.cash_accounts) & ~data.accounts["Closed"]
+        ]
 
-        # Get current balances (convert milliunits → dollars at the pandas DataFrame boundary)
-        current_balances = {a.name: a.balance.to_milliunits() / 1000 for a in cash_account_models}
+        # Current balances in integer milliunits (converted to dollars at the DataFrame boundary)
+        current_balances = dict(zip(cash_accounts["Name"], cash_accounts["Balance"].astype(int), strict=True))
 
         # Filter transactions: by included account name, start date, and exclude deleted.
         # Use current_balances keys (not self.config.cash_accounts) so that closed accounts
         # — already excluded from current_balances — don't have their historical transactions
         # included in the backwards walk starting from a $0 anchor.
-        cash_transactions = [
-            t
-            for t in transactions
-            if t.account_name in current_balances and str(t.date) >= self.config.start_date and not t.deleted
-        ]
-        cash_transactions.sort(key=lambda x: str(x.date))
-
-        if not cash_transactions:
+        transactions = data.transactions
+        tx_frame = transactions.loc[
+            transactions["Account"].isin(list(current_balances))
+            & (transactions["Date"] >= pd.Timestamp(self.config.start_date))
+            & ~transactions["Deleted"],
+            ["Id", "Date", "Account", "Amount"],
+        ].reset_index(drop=True)
+
+        if tx_frame.empty:
             raise ValueError(f"No transactions found for cash accounts after {self.config.start_date}")
 
-        # Calculate daily balances by working backwards from current balances
-        daily_balances: defaultdict[str, defaultdict[str, float]] = defaultdict(lambda: defaultdict(float))
-        end_date = max(str(t.date) for t in cash_transactions)
-
-        # Start with current balances
-        for account, balance in current_balances.items():
-            daily_balances[end_date][account] = balance
-
-        # Work backwards through transactions
-        for transaction in reversed(cash_transactions):
-            tx_date = str(transaction.date)
-            tx_account = transaction.account_name
-            tx_amount = transaction.amount.to_milliunits() / 1000  # Convert to dollars at pandas boundary
-
-            # Initialize this date with balances from future date if needed
-            if tx_date not in daily_balances:
-                future_dates = [d for d in daily_balances if d > tx_date]
-                if future_dates:
-                    next_date = min(future_dates)
-                    for acc in current_balances:
-                        daily_balances[tx_date][acc] = daily_balances[next_date][acc]
-
-            # Subtract transaction amount (working backwards)
-            daily_balances[tx_date][tx_account] -= tx_amount
-
-        # Create complete time series
-        all_dates = sorted(daily_balances.keys())
-        date_range = pd.date_range(start=all_dates[0], end=all_dates[-1], freq="D")
-
-        complete_balances = {}
-        last_balances: dict[str, float] = dict.fromkeys(current_balances, 0.0)
-
-        for date_str in date_range.strftime("%Y-%m-%d"):
-            if date_str in daily_balances:
-                for acct_name in current_balances:
-                    if acct_name in daily_balances[date_str]:
-                        last_balances[acct_name] = float(daily_balances[date_str][acct_name])
-            complete_balances[date_str] = last_balances.copy()
-
-        # Convert to DataFrame
-        df_data = []
-        for date_key, acct_balances in sorted(complete_balances.items()):
-            total = sum(acct_balances.values())
-            df_data.append({"Date": pd.to_datetime(date_key), "Total": total, **acct_balances})
-
-        self.df = pd.DataFrame(df_data)
-        self.df.set_index("Date", inplace=True)
-
-        # Calculate derived metrics
-        self._calculate_moving_averages()
-        self._calculate_monthly_aggregates()
+        account_names = list(current_balances)
+        balance_vector = np.asarray(list(current_balances.values()), dtype=np.int64)
+        end_date = tx_frame["Date"].max()
+
+        cache = DailyBalanceCache.load(balance_cache_file) if balance_cache_file is not None else None
+        recompute_from = (
+            self._find_recompute_start(cache, account_names, balance_vector, tx_frame) if cache else None
+        )
+
+        if cache is None or recompute_from is None:
+            date_range = pd.date_range(start=tx_frame["Date"].min(), end=end_date, freq="D")
+            balances = self._reconstruct_balances(balance_vector, tx_frame, account_names, date_range)
+            self.df = self._to_dollar_frame(balances)
+            self._calculate_moving_averages()
+            self._calculate_monthly_aggregates()
+        elif recompute_from > end_date:
+            logger.info("Cash flow balance cache is current; reusing cached series")
+            balances = cache.balances
+            self.df = self._to_dollar_frame(balances)
+            for column in DERIVED_COLUMNS:
+                self.df[column] = cache.derived[column].to_numpy()
+            self.monthly_df = cache.monthly
+        else:
+            logger.info(f"Recomputing cash flow balances from {recompute_from.date()}")
+            balances = self._update_from(cache, balance_vector, tx_frame, recompute_from)
+
         self._calculate_trend_statistics()
 
+        if balance_cache_file is not None and self.df is not None and self.monthly_df is not None:
+            DailyBalanceCache(
+                start_date=self.config.start_date,
+                accounts=account_names,
+                ma_windows=self._ma_windows(),
+                current_balances=balance_vector,
+                transactions=tx_frame,
+                balances=balances,
+                derived=self.df[DERIVED_COLUMNS],
+                monthly=self.monthly_df,
+            ).save(balance_cache_file)
+
+    def _ma_windows(self) -> tuple[int, int, int]:
+        """Moving average windows (short, medium, long) in days."""
+        return (self.config.short_ma_window, self.config.medium_ma_window, self.config.long_ma_window)
+
+    @staticmethod
+    def _reconstruct_balances(
+        current_balances: np.ndarray,
+        tx_frame: pd.DataFrame,
+        accounts: list[str],
+        dates: pd.DatetimeIndex,
+        opening_balances: np.ndarray | None = None,
+    ) -> pd.DataFrame:
+        """
+        Reconstruct daily balances by working backwards from current balances.
+
+        A transaction date's balance is the current balance minus every transaction
+        on or after that date. Days without transactions carry forward the balance
+        of the previous transaction date.
+
+        Args:
+            current_balances: Current balance per account in milliunits (accounts order)
+            tx_frame: Non-empty transactions (Date, Account, Amount), all on or after dates[0]
+            accounts: Account column order
+            dates: Daily range to produce
+            opening_balances: Balances carried into dates[0] if it has no transactions
+
+        Returns:
+            DataFrame of int64 milliunit balances indexed by dates, one column per account
+        """
+        # (date x account) matrix of net daily amounts, for dates that have transactions
+        daily_amounts = tx_frame.pivot_table(
+            index="Date", columns="Account", values="Amount", aggfunc="sum", fill_value=0
+        ).reindex(columns=accounts, fill_value=0)
+
+        # Reverse cumulative sum: total of all transactions on or after each date
+        amounts_from_date = daily_amounts.iloc[::-1].cumsum().iloc[::-1]
+        balances = pd.DataFrame(
+            current_balances - amounts_from_date.to_numpy(),
+            index=daily_amounts.index,
+            columns=accounts,
+        )
+
+        # Forward-fill over the full daily range
+        balances = balances.reindex(dates, method="ffill")
+        if opening_balances is not None:
+            balances = balances.fillna(dict(zip(accounts, opening_balances, strict=True)))
+        return balances.astype(np.int64)
+
+    @staticmethod
+    def _to_dollar_frame(balances: pd.DataFrame) -> pd.DataFrame:
+        """Convert milliunit balances to the analysis frame: Total plus one column per account (dollars)."""
+        df = pd.DataFrame(index=pd.DatetimeIndex(balances.index.to_numpy(), name="Date").as_unit("ns"))
+        df["Total"] = balances.sum(axis=1).to_numpy() / 1000
+        for account in balances.columns:
+            df[account] = balances[account].to_numpy() / 1000
+        return df
+
+    def _find_recompute_start(
+        self,
+        cache: DailyBalanceCache,
+        accounts: list[str],
+        current_balances: np.ndarray,
+        tx_frame: pd.DataFrame,
+    ) -> pd.Timestamp | None:
+        """
+        Find the first date whose balance may differ from the cached table.
+
+        Transactions are compared with the cached run by id: any added, removed or
+        modified transaction affects its old and new dates and every day after.
+
+        Args:
+            cache: Cached table from a previous run
+            accounts: Account column order
+            current_balances: Current balance per account in milliunits
+            tx_frame: Current transactions (Id, Date, Account, Amount)
+
+        Returns:
+            First date to recompute (after the cached end date if nothing changed),
+            or None if the table must be rebuilt in full
+        """
+        if (
+            cache.start_date != self.config.start_date
+            or cache.accounts != accounts
+            or cache.ma_windows != self._ma_windows()
+            or not tx_frame["Id"].is_unique
+        ):
+            return None
+
+        cached_dates = cache.balances.index
+        if tx_frame["Date"].max() < cached_dates[-1]:
+            return None
+
+        # Earlier balances are unchanged only if the current balances moved by exactly
+        # the net amount of the changed transactions
+        old_net = cache.transactions.groupby("Account")["Amount"].sum().reindex(accounts, fill_value=0)
+        new_net = tx_frame.groupby("Account")["Amount"].sum().reindex(accounts, fill_value=0)
+        if not np.array_equal(
+            current_balances - cache.current_balances, new_net.to_numpy() - old_net.to_numpy()
+        ):
+            return None
+
+        merged = cache.transactions.merge(
+            tx_frame, on="Id", how="outer", suffixes=("_old", "_new"), indicator=True
+        )
+        changed = merged[
+            (merged["_merge"] != "both")
+            | (merged["Date_old"] != merged["Date_new"])
+            | (merged["Account_old"] != merged["Account_new"])
+            | (merged["Amount_old"] != merged["Amount_new"])
+        ]
+
+        recompute_from = cached_dates[-1] + pd.Timedelta(days=1)
+        if not changed.empty:
+            recompute_from = min(recompute_from, pd.concat([changed["Date_old"], changed["Date_new"]]).min())
+        if recompute_from <= cached_dates[0]:
+            return None
+        return recompute_from
+
+    def _update_from(
+        self,
+        cache: DailyBalanceCache,
+        current_balances: np.ndarray,
+        tx_frame: pd.DataFrame,
+        recompute_from: pd.Timestamp,
+    ) -> pd.DataFrame:
+        """
+        Recompute balances, moving averages and monthly aggregates from a date onward.
+
+        Rows before recompute_from are taken from the cache; rolling windows and the
+        monthly resample are only re-evaluated over the affected tail.
+
+        Args:
+            cache: Cached table from a previous run
+            current_balances: Current balance per account in milliunits
+            tx_frame: Current transactions (Id, Date, Account, Amount)
+            recompute_from: First date to recompute (after the first cached date)
+
+        Returns:
+            Updated int64 milliunit balance table
+        """
+        head = cache.balances.loc[cache.balances.index < recompute_from]
+        tail_dates = pd.date_range(start=recompute_from, end=tx_frame["Date"].max(), freq="D")
+        tail = self._reconstruct_balances(
+            current_balances,
+            tx_frame[tx_frame["Date"] >= recompute_from],
+            cache.accounts,
+            tail_dates,
+            opening_balances=head.iloc[-1].to_numpy(),
+        )
+        balances = pd.concat([head, tail])
+        self.df = self._to_dollar_frame(balances)
+        total = self.df["Total"]
+        n_head = len(head)
+
+        # A rolling mean at row i only reads rows i-window+1..i
+        for column, window in zip(("MA_7", "MA_30", "MA_90"), self._ma_windows(), strict=True):
+            window_start = max(0, n_head - window + 1)
+            recomputed = total.iloc[window_start:].rolling(window=window, min_periods=1).mean()
+            self.df[column] = np.concatenate(
+                [cache.derived[column].to_numpy()[:n_head], recomputed.to_numpy()[n_head - window_start :]]
+            )
+        self.df["Daily_Change"] = np.concatenate(
+            [
+                cache.derived["Daily_Change"].to_numpy()[:n_head],
+                total.iloc[n_head - 1 :].diff().to_numpy()[1:],
+            ]
+        )
+
+        # Re-aggregate from the start of the first affected month
+        month_start = recompute_from.to_period("M").to_timestamp()
+        self.monthly_df = pd.concat(
+            [
+                cache.monthly.loc[cache.monthly.index < month_start],
+                self._monthly_aggregates(self.df.loc[month_start:]),
+            ]
+        )
+        return balances
+
     def _calculate_moving_averages(self) -> None:
         """Calculate multiple moving averages for trend smoothing."""
         if self.df is None:
@@ -174,10 +456,14 @@ class CashFlowAnalyzer:
         if self.df is None:
             raise RuntimeError("Data not loaded. Call load_data() first.")
 
-        self.monthly_df = self.df.resample("ME").agg(
-            {"Total": ["mean", "min", "max", "last"], "Daily_Change": "sum"}
-        )
-        self.monthly_df.columns = ["Mean_Balance", "Min_Balance", "Max_Balance", "End_Balance", "Net_Change"]
+        self.monthly_df = self._monthly_aggregates(self.df)
+
+    @staticmethod
+    def _monthly_aggregates(df: pd.DataFrame) -> pd.DataFrame:
+        """Resample daily Total and Daily_Change into month-end summary statistics."""
+        monthly_df = df.resample("ME").agg({"Total": ["mean", "min", "max", "last"], "Daily_Change": "sum"})
+        monthly_df.columns = ["Mean_Balance", "Min_Balance", "Max_Balance", "End_Balance", "Net_Change"]
+        return monthly_df
 
     def _calculate_trend_statistics(self) -> None:
         """Calculate trend line and statistical measures."""
@@ -192,6 +478,8 @@ class CashFlowAnalyzer:
             # Not enough data for regression - use default values
             slope = intercept = r_value = p_value = std_err = 0.0
         else:
+            from scipy import stats
+
             slope, intercept, r_value, p_value, std_err = stats.linregress(x, y)
 
         self.trend_stats = {
@@ -206,54 +494,165 @@ class CashFlowAnalyzer:
             "yearly_trend": slope * 365,
         }
 
-    def generate_dashboard(self, output_dir: Path | None = None) -> Path:
+    def compute_render_hash(self) -> str:
         """
-        Generate comprehensive 6-panel cash flow dashboard.
+        Hash every input the dashboard and panels are drawn from.
+
+        Covers the daily and monthly series, trend statistics, rendering
+        configuration and this module's source (so layout edits re-render).
 
         Returns:
-            Path to generated dashboard image.
+            SHA-256 hex digest
         """
         if self.df is None or self.monthly_df is None or self.trend_stats is None:
             raise RuntimeError("Data not loaded or processed. Call load_data() first.")
 
-        if output_dir is None:
-            config = get_config()
-            output_dir = config.data_dir / "cash_flow" / "charts"
+        digest = hashlib.sha256(Path(__file__).read_bytes())
+        digest.update(pd.util.hash_pandas_object(self.df, index=True).to_numpy().tobytes())
+        digest.update(pd.util.hash_pandas_object(self.monthly_df, index=True).to_numpy().tobytes())
+        render_inputs = {
+            "trend": {key: float(value) for key, value in self.trend_stats.items() if key != "trend_line"},
+            "cash_accounts": self.config.cash_accounts,
+            "start_date": self.config.start_date,
+            "figure_size": list(self.config.figure_size),
+            "dpi": self.config.dpi,
+        }
+        digest.update(json.dumps(render_inputs, sort_keys=True).encode())
+        return digest.hexdigest()
 
-        output_dir.mkdir(parents=True, exist_ok=True)
+    def generate_dashboard(
+        self, output_dir: Path | None = None, formats: list[str] | None = None, max_workers: int = 1
+    ) -> Path:
+        """
+        Generate comprehensive 6-panel cash flow dashboard.
 
-        # Create figure with 6 panels
-        plt.figure(figsize=self.config.figure_size)
+        Rendering is skipped when the input hash matches the previous run's and
+        its image still exists; the previous image is returned instead.
 
-        # Panel 1: Main plot with moving averages
-        self._create_main_trend_panel(plt.subplot(3, 2, 1))
+        Args:
+            output_dir: Directory for dashboard images (default: data_dir/cash_flow/charts)
+            formats: Image formats to write (default: config.output_format)
+            max_workers: Render formats in a process pool when greater than 1
 
-        # Panel 2: Monthly net cash flow bar chart
-        self._create_monthly_flow_panel(plt.subplot(3, 2, 2))
+        Returns:
+            Path to generated dashboard image (first format).
+        """
+        if output_dir is None:
+            config = get_config()
+            output_dir = config.data_dir / "cash_flow" / "charts"
 
-        # Panel 3: Monthly volatility range
-        self._create_volatility_panel(plt.subplot(3, 2, 3))
+        # Generate timestamped filename
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        jobs = {
+            f"dashboard.{fmt}": output_dir / f"{timestamp}_cash_flow_dashboard.{fmt}"
+            for fmt in formats or [self.config.output_format]
+        }
+        return next(iter(self._render_jobs(output_dir, jobs, max_workers).values()))
+
+    def generate_panels(
+        self,
+        output_dir: Path | None = None,
+        panels: list[str] | None = None,
+        formats: list[str] | None = None,
+        max_workers: int = 1,
+    ) -> dict[str, Path]:
+        """
+        Render dashboard panels as individual images.
 
-        # Panel 4: Cash flow velocity
-        self._create_velocity_panel(plt.subplot(3, 2, 4))
+        Args:
+            output_dir: Directory for panel images (default: data_dir/cash_flow/charts)
+            panels: Panel names from DASHBOARD_PANELS (default: all)
+            formats: Image formats to write (default: config.output_format)
+            max_workers: Render panels in a process pool when greater than 1
 
-        # Panel 5: Account composition
-        self._create_composition_panel(plt.subplot(3, 2, 5))
+        Returns:
+            Dictionary mapping "<panel>.<format>" to image path
+        """
+        if output_dir is None:
+            config = get_config()
+            output_dir = config.data_dir / "cash_flow" / "charts"
 
-        # Panel 6: Statistical summary
-        self._create_statistics_panel(plt.subplot(3, 2, 6))
+        unknown = set(panels or []) - set(DASHBOARD_PANELS)
+        if unknown:
+            raise ValueError(f"Unknown dashboard panels: {', '.join(sorted(unknown))}")
 
-        plt.suptitle("Comprehensive Cash Flow Analysis Dashboard", fontsize=14, fontweight="bold", y=0.98)
-        plt.tight_layout()
+        jobs = {
+            f"{panel}.{fmt}": output_dir / "panels" / f"cash_flow_{panel}.{fmt}"
+            for panel in panels or list(DASHBOARD_PANELS)
+            for fmt in formats or [self.config.output_format]
+        }
+        return self._render_jobs(output_dir, jobs, max_workers)
 
-        # Generate timestamped filename
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        output_file = output_dir / f"{timestamp}_cash_flow_dashboard.{self.config.output_format}"
+    def _render_jobs(self, output_dir: Path, jobs: dict[str, Path], max_workers: int) -> dict[str, Path]:
+        """
+        Render images whose inputs changed since they were last written.
 
-        plt.savefig(output_file, dpi=self.config.dpi, bbox_inches="tight")
-        plt.close()
+        Args:
+            output_dir: Directory holding the render manifest
+            jobs: Mapping of "<panel or dashboard>.<format>" to the path for a new render
+            max_workers: Process pool size; 1 renders in this process
 
-        return output_file
+        Returns:
+            Mapping of job key to image path (reused or newly rendered)
+        """
+        input_hash = self.compute_render_hash()
+        manifest_file = output_dir / RENDER_MANIFEST_FILENAME
+        manifest = read_json(manifest_file) if manifest_file.exists() else {}
+        if manifest.get("input_hash") != input_hash:
+            manifest = {"input_hash": input_hash, "images": {}}
+
+        results: dict[str, Path] = {}
+        pending: dict[str, Path] = {}
+        for key, output_file in jobs.items():
+            previous = manifest["images"].get(key)
+            if previous and (output_dir / previous).exists():
+                results[key] = output_dir / previous
+            else:
+                pending[key] = output_file
+
+        if pending:
+            logger.info(f"Rendering {len(pending)} cash flow image(s), reusing {len(results)}")
+            for output_file in pending.values():
+                output_file.parent.mkdir(parents=True, exist_ok=True)
+            if max_workers > 1 and len(pending) > 1:
+                with ProcessPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+                    futures = [
+                        executor.submit(_render_image, self, key.rsplit(".", 1)[0], path)
+                        for key, path in pending.items()
+                    ]
+                    for future in futures:
+                        future.result()
+            else:
+                for key, path in pending.items():
+                    _render_image(self, key.rsplit(".", 1)[0], path)
+
+            results.update(pending)
+            for key, path in pending.items():
+                manifest["images"][key] = path.relative_to(output_dir).as_posix()
+            write_json(manifest_file, manifest)
+
+        return {key: results[key] for key in jobs}
+
+    def _render_dashboard(self, output_file: Path) -> None:
+        """Draw all panels into one figure and save it."""
+        fig = _new_figure(self.config.figure_size)
+
+        for position, method_name in enumerate(DASHBOARD_PANELS.values(), start=1):
+            getattr(self, method_name)(fig.add_subplot(3, 2, position))
+
+        fig.suptitle("Comprehensive Cash Flow Analysis Dashboard", fontsize=14, fontweight="bold", y=0.98)
+        fig.tight_layout()
+        fig.savefig(output_file, dpi=self.config.dpi, bbox_inches="tight")
+
+    def _render_panel(self, panel: str, output_file: Path) -> None:
+        """Draw a single panel into its own figure and save it."""
+        width, height = self.config.figure_size
+        fig = _new_figure((width / 2, height / 3))
+
+        getattr(self, DASHBOARD_PANELS[panel])(fig.add_subplot(1, 1, 1))
+
+        fig.tight_layout()
+        fig.savefig(output_file, dpi=self.config.dpi, bbox_inches="tight")
 
     def _create_main_trend_panel(self, ax: Any) -> None:
         """Create main trend panel with moving averages."""
@@ -275,7 +674,7 @@ class CashFlowAnalyzer:
         ax.set_ylabel("Balance ($)", fontsize=10)
         ax.legend(loc="best", fontsize=8)
         ax.grid(True, alpha=0.3)
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f"${x/1000:.0f}k"))
+        ax.yaxis.set_major_formatter(_thousands_formatter())
 
     def _create_monthly_flow_panel(self, ax: Any) -> None:
         """Create monthly cash flow bar chart."""
@@ -298,7 +697,7 @@ class CashFlowAnalyzer:
         ax.set_ylabel("Net Change ($)", fontsize=10)
         ax.legend(loc="best", fontsize=8)
         ax.grid(True, alpha=0.3, axis="y")
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f"${x/1000:.0f}k"))
+        ax.yaxis.set_major_formatter(_thousands_formatter())
 
     def _create_volatility_panel(self, ax: Any) -> None:
         """Create monthly volatility range panel."""
@@ -332,7 +731,7 @@ class CashFlowAnalyzer:
         ax.set_ylabel("Balance ($)", fontsize=10)
         ax.legend(loc="best", fontsize=8)
         ax.grid(True, alpha=0.3)
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f"${x/1000:.0f}k"))
+        ax.yaxis.set_major_formatter(_thousands_formatter())
 
     def _create_velocity_panel(self, ax: Any) -> None:
         """Create cash flow velocity panel."""
@@ -365,7 +764,7 @@ class CashFlowAnalyzer:
         ax.set_ylabel("30-Day Change ($)", fontsize=10)
         ax.legend(loc="best", fontsize=8)
         ax.grid(True, alpha=0.3)
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f"${x/1000:.0f}k"))
+        ax.yaxis.set_major_formatter(_thousands_formatter())
 
     def _create_composition_panel(self, ax: Any) -> None:
         """Create account composition panel."""
@@ -401,7 +800,7 @@ class CashFlowAnalyzer:
         ax.set_ylabel("Balance ($)", fontsize=10)
         ax.legend(loc="best", fontsize=8)
         ax.grid(True, alpha=0.3)
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f"${x/1000:.0f}k"))
+        ax.yaxis.set_major_formatter(_thousands_formatter())
 
     def _create_statistics_panel(self, ax: Any) -> None:
         """Create statistical summary panel."""
@@ -495,3 +894,11 @@ VOLATILITY METRICS:
             "data_start_date": self.config.start_date,
             "analysis_date": datetime.now().isoformat(),
         }
+
+
+def _render_image(analyzer: CashFlowAnalyzer, name: str, output_file: Path) -> None:
+    """Render the dashboard or one named panel (module-level so process pools can pickle it)."""
+    if name == "dashboard":
+        analyzer._render_dashboard(output_file)
+    else:
+        analyzer._render_panel(name, output_file)
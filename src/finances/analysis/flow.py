@@ -60,7 +60,13 @@ class CashFlowAnalysisFlowNode(FlowNode):
 
     def execute(self, context: FlowContext) -> FlowResult:
         """Execute cash flow analysis and generate dashboard."""
-        from ..analysis.cash_flow import CashFlowAnalyzer
+        from ..analysis.cash_flow import (
+            CASH_FLOW_TRANSACTION_FIELDS,
+            RENDER_MANIFEST_FILENAME,
+            CashFlowAnalyzer,
+            CashFlowData,
+        )
+        from ..ynab import YnabCacheService
 
         try:
             # Initialize analyzer
@@ -70,8 +76,14 @@ class CashFlowAnalysisFlowNode(FlowNode):
 
             analyzer = CashFlowAnalyzer()
 
-            # Load data
-            analyzer.load_data(ynab_cache_dir)
+            # Load data from the run's shared YNAB cache
+            ynab_cache = YnabCacheService(ynab_cache_dir, context.file_cache)
+            data = CashFlowData.from_ynab(
+                ynab_cache.accounts(), ynab_cache.transaction_columns(fields=CASH_FLOW_TRANSACTION_FIELDS)
+            )
+            analyzer.load_from(
+                data, balance_cache_file=self.data_dir / "cash_flow" / "cache" / "daily_balances.npz"
+            )
 
             # Generate dashboard (returns single Path, not list)
             dashboard_file = analyzer.generate_dashboard(output_dir)
@@ -89,10 +101,16 @@ class CashFlowAnalysisFlowNode(FlowNode):
             click.echo("\n💡 Tip: Cmd+click the path to open in default app")
             click.echo("=" * 60)
 
+            # The render manifest is kept so unchanged data reuses the dashboard next run
+            outputs = [dashboard_file]
+            manifest_file = output_dir / RENDER_MANIFEST_FILENAME
+            if manifest_file.exists():
+                outputs.append(manifest_file)
+
             return FlowResult(
                 success=True,
                 items_processed=1,
-                outputs=[dashboard_file],
+                outputs=outputs,
                 metadata={
                     "charts_generated": 1,
                     "output_dir": str(output_dir),
@@ -35,28 +35,51 @@ Receipt Processing Features:
 - Financial precision with currency handling
 """
 
-from .email_fetcher import (
-    AppleEmailFetcher,
-    AppleReceiptEmail,
-    EmailConfig,
-)
-from .loader import (
-    filter_receipts_by_date_range,
-    find_latest_apple_export,
-    get_apple_receipt_summary,
-    load_apple_receipts,
-    parse_apple_date,
-    receipts_to_dataframe,
-)
-from .matcher import (
-    AppleMatcher,
-    MatchStrategy,
-    generate_match_summary,
-)
-from .parser import (
-    AppleReceiptParser,
-    ParsedItem,
-    ParsedReceipt,
+from typing import TYPE_CHECKING
+
+from ..core.lazy_imports import lazy_exports
+
+# Exports are imported from their submodules on first access (see core.lazy_imports)
+if TYPE_CHECKING:
+    from .email_fetcher import (
+        AppleEmailFetcher,
+        AppleReceiptEmail,
+        EmailConfig,
+    )
+    from .loader import (
+        filter_receipts_by_date_range,
+        find_latest_apple_export,
+        get_apple_receipt_summary,
+        load_apple_receipts,
+        parse_apple_date,
+        receipts_to_dataframe,
+    )
+    from .matcher import (
+        AppleMatcher,
+        MatchStrategy,
+        generate_match_summary,
+    )
+    from .parser import (
+        AppleReceiptParser,
+        ParsedItem,
+        ParsedReceipt,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".email_fetcher": ["AppleEmailFetcher", "AppleReceiptEmail", "EmailConfig"],
+        ".loader": [
+            "filter_receipts_by_date_range",
+            "find_latest_apple_export",
+            "get_apple_receipt_summary",
+            "load_apple_receipts",
+            "parse_apple_date",
+            "receipts_to_dataframe",
+        ],
+        ".matcher": ["AppleMatcher", "MatchStrategy", "generate_match_summary"],
+        ".parser": ["AppleReceiptParser", "ParsedItem", "ParsedReceipt"],
+    },
 )
 
 __all__ = [
@@ -10,7 +10,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from finances.core.datastore_mixin import DataStoreMixin
-from finances.core.json_utils import read_json, write_json
+from finances.core.json_utils import batched_writes, read_json, write_json
 
 if TYPE_CHECKING:
     from finances.core.flow import NodeDataSummary
@@ -170,11 +170,12 @@ class AppleReceiptStore(DataStoreMixin):
         """
         self.exports_dir.mkdir(parents=True, exist_ok=True)
 
-        for receipt in data:
-            # Use order_id or receipt_id as filename
-            filename = receipt.get("order_id") or receipt.get("id") or "unknown"
-            output_file = self.exports_dir / f"{filename}.json"
-            write_json(output_file, receipt)
+        with batched_writes():
+            for receipt in data:
+                # Use order_id or receipt_id as filename
+                filename = receipt.get("order_id") or receipt.get("id") or "unknown"
+                output_file = self.exports_dir / f"{filename}.json"
+                write_json(output_file, receipt)
 
     def last_modified(self) -> datetime | None:
         """Get timestamp of most recent receipt file."""
@@ -283,7 +284,7 @@ class AppleMatchResultsStore(DataStoreMixin):
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         output_file = self.matches_dir / f"{timestamp}_apple_matching_results.json"
 
-        write_json(output_file, data)
+        write_json(output_file, data, sidecar=True, record_key="matches")
 
     def last_modified(self) -> datetime | None:
         """Get timestamp of most recent match file."""
@@ -305,11 +306,8 @@ class AppleMatchResultsStore(DataStoreMixin):
         if not self.exists():
             return None
 
-        try:
-            data = self.load()
-            return len(data.get("matches", [])) if isinstance(data, dict) else None
-        except (FileNotFoundError, ValueError, KeyError, AttributeError):
-            return None
+        latest_file = max(self.matches_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        return self._count_records(latest_file, key="matches")
 
     def size_bytes(self) -> int | None:
         """Get size of most recent match file."""
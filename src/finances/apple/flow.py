@@ -8,7 +8,9 @@ Flow node implementations for Apple receipt processing and transaction matching.
 import logging
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
+from ..core.config import get_config
 from ..core.flow import FlowContext, FlowNode, FlowResult, NodeDataSummary, OutputFile, OutputInfo
 
 logger = logging.getLogger(__name__)
@@ -148,7 +150,7 @@ class AppleReceiptParsingFlowNode(FlowNode):
 
     def execute(self, context: FlowContext) -> FlowResult:
         """Parse Apple receipt emails."""
-        from ..core.json_utils import write_json
+        from ..core.json_utils import batched_writes, write_json
         from .parser import AppleReceiptParser
 
         emails_dir = self.data_dir / "apple" / "emails"
@@ -189,34 +191,36 @@ class AppleReceiptParsingFlowNode(FlowNode):
         skipped_count = 0
         output_files = []
 
-        for html_file in new_html_files:
-            # Read HTML content
-            html_content = html_file.read_text(encoding="utf-8")
-
-            # Parse using receipt_id from filename
-            receipt_id = html_file.stem
-            parsed_receipt = parser.parse_html_content(html_content, receipt_id)
-            receipt_dict = parsed_receipt.to_dict()
-
-            # Always use unique receipt_id (email hash) as filename to prevent collisions
-            # order_id is stored inside the JSON and may not be unique
-            output_filename = receipt_id
-
-            # Skip receipts that have no useful data (no order_id, date, or total)
-            if (
-                not receipt_dict.get("order_id")
-                and not receipt_dict.get("receipt_date")
-                and not receipt_dict.get("total")
-            ):
-                logger.debug(f"Skipping {html_file.name}: no order_id, date, or total found")
-                skipped_count += 1
-                continue
-
-            # Write parsed receipt as JSON
-            output_file = exports_dir / f"{output_filename}.json"
-            write_json(output_file, receipt_dict)
-            output_files.append(output_file)
-            parsed_count += 1
+        # Receipts are flushed to disk together once parsing is done
+        with batched_writes():
+            for html_file in new_html_files:
+                # Read HTML content
+                html_content = html_file.read_text(encoding="utf-8")
+
+                # Parse using receipt_id from filename
+                receipt_id = html_file.stem
+                parsed_receipt = parser.parse_html_content(html_content, receipt_id)
+                receipt_dict = parsed_receipt.to_dict()
+
+                # Always use unique receipt_id (email hash) as filename to prevent collisions
+                # order_id is stored inside the JSON and may not be unique
+                output_filename = receipt_id
+
+                # Skip receipts that have no useful data (no order_id, date, or total)
+                if (
+                    not receipt_dict.get("order_id")
+                    and not receipt_dict.get("receipt_date")
+                    and not receipt_dict.get("total")
+                ):
+                    logger.debug(f"Skipping {html_file.name}: no order_id, date, or total found")
+                    skipped_count += 1
+                    continue
+
+                # Write parsed receipt as JSON
+                output_file = exports_dir / f"{output_filename}.json"
+                write_json(output_file, receipt_dict)
+                output_files.append(output_file)
+                parsed_count += 1
 
         logger.info(
             f"Parsing complete: {parsed_count} written, {skipped_count} skipped (no data), {failed_count} failed"
@@ -256,12 +260,12 @@ class AppleMatchingOutputInfo(OutputInfo):
         if not self.output_dir.exists():
             return []
 
-        from ..core.json_utils import read_json
+        from ..core.json_utils import count_json_records
 
         files = []
         for json_file in self.output_dir.glob("*.json"):
-            data = read_json(json_file)
-            match_count = len(data.get("matches", []))
+            # Sidecar summary if present, otherwise a streaming count
+            match_count = count_json_records(json_file, key="matches")
             files.append(OutputFile(path=json_file, record_count=match_count))
 
         return files
@@ -289,6 +293,13 @@ class AppleMatchingFlowNode(FlowNode):
         """Return Apple matching results output directory."""
         return self.data_dir / "apple" / "transaction_matches"
 
+    def get_fingerprint_config(self) -> dict[str, Any]:
+        """Include the configured payee patterns."""
+        return {
+            **super().get_fingerprint_config(),
+            "payee_patterns": list(get_config().apple.payee_patterns),
+        }
+
     def get_data_summary(self, context: FlowContext) -> NodeDataSummary:
         """Get Apple matching results summary."""
         return self.match_store.to_node_data_summary()
@@ -296,16 +307,13 @@ class AppleMatchingFlowNode(FlowNode):
     def execute(self, context: FlowContext) -> FlowResult:
         """Execute Apple transaction matching."""
 
-        from ..ynab import filter_transactions_by_payee, load_transactions
+        from ..ynab import YnabCacheService
         from .loader import load_apple_receipts
         from .matcher import AppleMatcher
 
-        # Load YNAB transactions using domain model function
-        ynab_cache_dir = self.data_dir / "ynab" / "cache"
-        all_transactions_models = load_transactions(ynab_cache_dir)
-
-        # Filter for Apple transactions using domain model function
-        apple_transactions = filter_transactions_by_payee(all_transactions_models, payee="Apple")
+        # Load YNAB transactions from the run's shared cache; only Apple matches become domain models
+        ynab_cache = YnabCacheService.for_context(context, self.data_dir)
+        apple_transactions = ynab_cache.domain_transaction_columns("apple", fields=("id",)).to_transactions()
 
         if not apple_transactions:
             return FlowResult(
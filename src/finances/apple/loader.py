@@ -6,7 +6,6 @@ Loads and processes Apple receipts from the export JSON files.
 Provides data normalization and filtering functionality.
 """
 
-import json
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -15,6 +14,7 @@ from typing import Any
 import pandas as pd
 
 from ..core.config import get_config
+from ..core.json_utils import read_json_as
 from .parser import ParsedReceipt
 
 logger = logging.getLogger(__name__)
@@ -90,14 +90,8 @@ def load_apple_receipts(export_path: str | None = None) -> list[ParsedReceipt]:
     if not json_files:
         raise FileNotFoundError(f"No Apple receipt JSON files found in {export_dir}")
 
-    receipts_data = []
-    for json_file in json_files:
-        with open(json_file) as f:
-            receipt_dict = json.load(f)
-            receipts_data.append(receipt_dict)
-
-    # Convert dicts to domain models
-    receipts = [ParsedReceipt.from_dict(receipt_dict) for receipt_dict in receipts_data]
+    # Decode and convert to domain models in one pass
+    receipts = [read_json_as(json_file, ParsedReceipt.from_dict) for json_file in json_files]
 
     logger.info("Loaded %d Apple receipts from %s", len(receipts), export_dir)
     return receipts
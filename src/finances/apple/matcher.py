@@ -14,6 +14,7 @@ from typing import TYPE_CHECKING, Any
 from ..core.currency import format_cents
 from ..core.models import MatchResult, Receipt, ReceiptItem, Transaction
 from ..core.money import Money
+from ..core.tracing import traced
 from ..ynab.models import YnabTransaction
 
 if TYPE_CHECKING:
@@ -42,6 +43,7 @@ class AppleMatcher:
         """
         self.date_window_days = date_window_days
 
+    @traced("apple.match_transaction")
     def match_single_transaction(
         self, transaction: YnabTransaction, apple_receipts: list["ParsedReceipt"]
     ) -> MatchResult:
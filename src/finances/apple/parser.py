@@ -16,6 +16,7 @@ from bs4 import BeautifulSoup, Tag
 
 from ..core.dates import FinancialDate
 from ..core.money import Money
+from ..core.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +48,7 @@ SMALL_CONTAINER_MAX_CHARS = 80
 VALUE_MAX_CHARS = 80
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedItem:
     """Represents a single purchased item from an Apple receipt."""
 
@@ -216,6 +217,7 @@ class AppleReceiptParser:
 
         return receipt
 
+    @traced("apple.parse_html_content")
     def parse_html_content(self, html_content: str, receipt_id: str = "unknown") -> ParsedReceipt:
         """
         Parse HTML content directly without file system access.
@@ -331,7 +333,7 @@ class AppleReceiptParser:
                     from datetime import datetime
 
                     date_obj = datetime.strptime(date_text, "%b %d, %Y")
-                    receipt.receipt_date = FinancialDate(date=date_obj.date())
+                    receipt.receipt_date = FinancialDate.from_date(date_obj)
                 except (ValueError, TypeError):
                     logger.warning(f"Could not parse date: {date_text}")
 
@@ -345,13 +347,13 @@ class AppleReceiptParser:
                 # Try parsing with full month name
                 try:
                     date_obj = datetime.strptime(text, "%B %d, %Y")
-                    receipt.receipt_date = FinancialDate(date=date_obj.date())
+                    receipt.receipt_date = FinancialDate.from_date(date_obj)
                     break
                 except (ValueError, TypeError):
                     # Also try abbreviated month
                     try:
                         date_obj = datetime.strptime(text, "%b %d, %Y")
-                        receipt.receipt_date = FinancialDate(date=date_obj.date())
+                        receipt.receipt_date = FinancialDate.from_date(date_obj)
                         break
                     except (ValueError, TypeError):
                         continue
@@ -735,7 +737,7 @@ class AppleReceiptParser:
                 from datetime import datetime
 
                 date_obj = datetime.strptime(text, "%B %d, %Y")
-                return FinancialDate(date=date_obj.date())
+                return FinancialDate.from_date(date_obj)
             except ValueError:
                 continue
 
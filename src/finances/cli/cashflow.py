@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Cash Flow CLI - Multi-Scenario Cash Flow Analysis
+
+Runs the cash flow analysis for one or more scenarios (account sets and start
+dates) against a single load of the YNAB cache.
+"""
+
+from pathlib import Path
+
+import click
+
+from ..core.config import get_config
+
+
+@click.command()
+@click.option(
+    "--scenarios",
+    "scenarios_file",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="JSON file listing scenarios (name, cash_accounts, start_date, ...)",
+)
+@click.option(
+    "--output-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Base directory for reports (default: data_dir/cash_flow/scenarios)",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of scenarios to evaluate in parallel",
+)
+def cashflow(scenarios_file: Path | None, output_dir: Path | None, workers: int) -> None:
+    """
+    Run cash flow analysis for one or more scenarios.
+
+    Loads the YNAB cache once and writes a dashboard and summary.json for
+    each scenario under <output-dir>/<scenario>/.
+
+    Example scenarios file:
+
+      [{"name": "household", "cash_accounts": ["Chase Checking"], "start_date": "2024-05-01"}]
+    """
+    # Deferred: the analysis stack (pandas, matplotlib, scipy) is only needed when this command runs
+    from ..analysis.batch import CashFlowScenario, load_scenarios, run_cash_flow_scenarios
+    from ..analysis.cash_flow import CashFlowConfig
+
+    config = get_config()
+    output_dir = output_dir or config.data_dir / "cash_flow" / "scenarios"
+
+    try:
+        scenarios = (
+            load_scenarios(scenarios_file)
+            if scenarios_file
+            else [CashFlowScenario(name="default", config=CashFlowConfig.default())]
+        )
+    except ValueError as e:
+        raise click.ClickException(str(e)) from e
+
+    try:
+        results = run_cash_flow_scenarios(
+            scenarios, output_dir, ynab_cache_dir=config.data_dir / "ynab" / "cache", max_workers=workers
+        )
+    except FileNotFoundError as e:
+        raise click.ClickException(str(e)) from e
+
+    for result in results:
+        if result.success:
+            click.echo(f"✓ {result.name}: {result.dashboard_file}")
+            click.echo(
+                f"    balance ${result.summary['current_balance']:,.0f}, "
+                f"trend ${result.summary['monthly_trend']:,.0f}/month"
+            )
+        else:
+            click.echo(f"✗ {result.name}: {result.error_message}")
+
+    failed = sum(1 for result in results if not result.success)
+    if failed:
+        raise click.ClickException(f"{failed} of {len(results)} scenario(s) failed")
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Developer CLI - Tools for Developing and Load Testing
+
+Commands for working on the finances system itself rather than on real
+financial data.
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import click
+
+from ..core.config import get_config
+
+
+@click.group()
+def dev() -> None:
+    """Developer tools (synthetic data for load testing)."""
+
+
+@dev.command("generate-dataset")
+@click.option("--years", type=click.IntRange(min=1), default=3, show_default=True, help="Years of history")
+@click.option(
+    "--accounts",
+    type=click.IntRange(min=1),
+    default=3,
+    show_default=True,
+    help="Number of YNAB budget accounts",
+)
+@click.option(
+    "--scale",
+    type=click.FloatRange(min=0, min_open=True),
+    default=1.0,
+    show_default=True,
+    help="Volume multiplier (1 is one household's activity; may be fractional)",
+)
+@click.option("--seed", type=int, default=0, show_default=True, help="Random seed (same seed, same data)")
+@click.option(
+    "--end-date",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    default="2024-12-31",
+    show_default=True,
+    help="Last day of generated activity",
+)
+@click.option(
+    "--output-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Data directory to write (default: the configured data directory)",
+)
+@click.option("--force", is_flag=True, help="Write into a non-empty output directory")
+def generate_dataset(
+    years: int,
+    accounts: int,
+    scale: float,
+    seed: int,
+    end_date: datetime,
+    output_dir: Path | None,
+    force: bool,
+) -> None:
+    """
+    Generate a synthetic data/ tree for load testing the whole flow.
+
+    Writes the YNAB cache (with split, transfer and deleted transactions),
+    Amazon order history CSVs and ZIPs for two accounts, and Apple receipt
+    emails in both HTML formats. Every Amazon shipment and Apple receipt has
+    a matching YNAB charge. Output is streamed, so large --scale values only
+    cost disk space and time.
+
+    Example:
+
+      finances dev generate-dataset --years 5 --accounts 4 --scale 50 --output-dir /tmp/load-data
+    """
+    from ..dev import DatasetSpec, generate_dataset
+
+    output_dir = output_dir or get_config().data_dir
+    if output_dir.exists() and any(output_dir.iterdir()) and not force:
+        raise click.ClickException(
+            f"{output_dir} is not empty; use --force to write into it (existing files may be overwritten)"
+        )
+
+    spec = DatasetSpec(years=years, accounts=accounts, scale=scale, seed=seed, end_date=end_date.date())
+    click.echo(f"Generating {spec.start_date} to {spec.end_date} at {scale:g}x into {output_dir}")
+    with click.progressbar(length=spec.days, label="Generating") as bar:
+        summary = generate_dataset(output_dir, spec, progress=bar.update)
+
+    click.echo(
+        f"✓ {summary.transactions:,} YNAB transactions ({summary.split_transactions:,} split, "
+        f"{summary.transfers:,} transfers, {summary.deleted_transactions:,} deleted)"
+    )
+    click.echo(f"✓ {summary.amazon_orders:,} Amazon orders ({summary.amazon_items:,} items)")
+    click.echo(f"✓ {summary.apple_receipts:,} Apple receipts")
+    click.echo(f"✓ {summary.files:,} files, {summary.bytes_written / 1e6:,.1f} MB")
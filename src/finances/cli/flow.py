@@ -15,11 +15,9 @@ from typing import TYPE_CHECKING
 import click
 
 from ..core.config import get_config
-from ..core.flow import FlowContext, FlowResult, flow_registry
-from ..core.flow_engine import FlowExecutionEngine
 
 if TYPE_CHECKING:
-    from ..core.flow import FlowResult
+    from ..core.flow import FlowContext, FlowResult
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +28,8 @@ def setup_flow_nodes() -> None:
 
     Discovers and registers FlowNode instances from domain modules.
     """
+    from ..core.flow import FlowResult, flow_registry
+
     config = get_config()
 
     # Import FlowNode classes from domain modules
@@ -86,23 +86,75 @@ def setup_flow_nodes() -> None:
 
 
 @click.command()
-def flow() -> None:
+@click.option(
+    "--auto",
+    is_flag=True,
+    help="Run unattended: execute only nodes affected by detected changes, without prompts",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Re-run nodes even when their inputs are unchanged since the last successful run",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Record a timeline of nodes, phases and hot functions as Chrome trace-event JSON",
+)
+@click.option(
+    "--profile-pstats",
+    is_flag=True,
+    help="Also write a cProfile (.pstats) dump for each executed node (implies --profile)",
+)
+def flow(auto: bool, force: bool, profile: bool, profile_pstats: bool) -> None:
     """
     Execute the Financial Flow System.
 
     Guides you through each data update step with interactive prompts.
     Each node will display its current data summary and ask if you want to update.
 
-    Example:
+    With --auto, runs the change detectors and executes only the affected nodes
+    without prompting, skipping manual steps. Suitable for cron/systemd timers.
+
+    Derived nodes whose inputs, code and configuration are unchanged since their
+    last successful run reuse that result; pass --force to re-run them anyway.
+
+    Examples:
+
+      finances flow              # Execute the flow with interactive prompts
+
+      finances flow --auto       # Unattended, change-driven run
 
-      finances flow    # Execute the flow with interactive prompts
+      finances flow --profile    # Also write a trace under cache/flow/profiles/
     """
+    # Flow machinery is imported here so that other commands (--help, version) start fast
+    from ..core.change_detection import create_change_detectors
+    from ..core.flow_engine import FlowExecutionEngine
+    from ..core.flow_state import FlowStateStore
+    from ..core.metrics import RUN_METRICS_FILENAME
+    from ..core.tracing import start_tracing, stop_tracing
+
     # Setup flow nodes
     setup_flow_nodes()
 
+    # Shared detector state; committed per node only after it succeeds
+    data_dir = get_config().data_dir
+    state_store = FlowStateStore.for_data_dir(data_dir)
+
+    profile_dir = None
+    if profile or profile_pstats:
+        profile_dir = data_dir / "cache" / "flow" / "profiles" / datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        start_tracing()
+
     try:
         # Initialize execution engine
-        engine = FlowExecutionEngine()
+        engine = FlowExecutionEngine(
+            change_detectors=create_change_detectors(data_dir, state_store),
+            metrics_log=data_dir / "cache" / "flow" / RUN_METRICS_FILENAME,
+            profile_dir=profile_dir if profile_pstats else None,
+            memo_store=state_store,
+            force_rerun=force,
+        )
 
         # Validate flow
         validation_errors = engine.validate_flow()
@@ -112,12 +164,17 @@ def flow() -> None:
                 click.echo(f"  • {error}")
             raise click.ClickException("Cannot execute invalid flow")
 
-        # Execute flow with interactive prompts
         click.echo("\n🚀 Starting flow execution...")
-        click.echo("You will be prompted for each step.\n")
         start_time = datetime.now()
 
-        engine.execute_flow()
+        if auto:
+            # Execute only the changed subgraph, no prompts
+            click.echo("Running unattended; only nodes with detected changes will execute.\n")
+            engine.execute_flow_auto()
+        else:
+            # Execute flow with interactive prompts
+            click.echo("You will be prompted for each step.\n")
+            engine.execute_flow()
 
         end_time = datetime.now()
         total_time = (end_time - start_time).total_seconds()
@@ -135,6 +192,13 @@ def flow() -> None:
         click.echo(traceback.format_exc(), err=True)
         raise click.ClickException(str(e)) from e
 
+    finally:
+        state_store.close()
+        tracer = stop_tracing()
+        if tracer is not None and profile_dir is not None:
+            trace_file = tracer.write_chrome_trace(profile_dir / "trace.json")
+            click.echo(f"\n📈 Profile trace written to {trace_file}")
+
 
 if __name__ == "__main__":
     flow()
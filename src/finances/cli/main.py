@@ -84,11 +84,19 @@ def config(ctx: click.Context) -> None:
 
 
 # Import flow command
+from .cashflow import cashflow  # noqa: E402
+from .dev import dev  # noqa: E402
 from .flow import flow  # noqa: E402
 
 # Register flow command (the unified interface for all operations)
 main.add_command(flow)
 
+# Register cash flow scenario reports
+main.add_command(cashflow)
+
+# Register developer tools
+main.add_command(dev)
+
 
 if __name__ == "__main__":
     main()
@@ -4,15 +4,20 @@ Change Detection System
 
 Provides intelligent change detection for all Financial Flow System nodes
 to determine when execution is required based on upstream data changes.
+
+Detector state lives in a shared FlowStateStore. Checks only stage new state;
+the flow engine commits it once the node's FlowResult succeeds.
 """
 
 import logging
+from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from .flow import FlowContext
-from .json_utils import read_json, write_json_with_defaults
+from .flow_state import FlowStateStore
+from .json_utils import read_json
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -20,48 +25,63 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class ChangeDetector:
+class ChangeDetector(ABC):
     """
-    Base class for node-specific change detection.
+    Abstract base class for node-specific change detection.
 
     Provides common utilities and interface for detecting when a flow node
     needs to execute based on upstream data changes.
     """
 
-    def __init__(self, data_dir: Path):
+    def __init__(self, data_dir: Path, state_store: FlowStateStore | None = None):
         """
         Initialize change detector.
 
         Args:
             data_dir: Base data directory for the system
+            state_store: Shared state store (defaults to a private store at the
+                standard location under data_dir/cache/flow)
         """
         self.data_dir = data_dir
         self.cache_dir = data_dir / "cache" / "flow"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.state_store = state_store or FlowStateStore.for_data_dir(data_dir)
 
-    def get_cache_file(self, node_name: str) -> Path:
-        """Get cache file path for a specific node."""
-        return self.cache_dir / f"{node_name}_last_check.json"
+    @abstractmethod
+    def check_changes(self, context: FlowContext) -> tuple[bool, list[str]]:
+        """
+        Check whether the node needs to execute.
 
-    def load_last_check_state(self, node_name: str) -> dict[str, Any]:
-        """Load the last check state for a node."""
-        cache_file = self.get_cache_file(node_name)
-        if cache_file.exists():
-            try:
-                result: dict[str, Any] = read_json(cache_file)
-                return result
-            except Exception as e:
-                logger.warning(f"Failed to load cache for {node_name}: {e}")
+        Args:
+            context: Flow execution context
+
+        Returns:
+            Tuple of (has_changes, change_reasons)
+        """
+        pass
 
-        return {}
+    def load_last_check_state(self, node_name: str) -> dict[str, Any]:
+        """Load the last check state for a node (staged state takes precedence)."""
+        try:
+            return self.state_store.get(node_name)
+        except Exception as e:
+            logger.warning(f"Failed to load state for {node_name}: {e}")
+            return {}
 
     def save_last_check_state(self, node_name: str, state: dict[str, Any]) -> None:
-        """Save the last check state for a node."""
-        cache_file = self.get_cache_file(node_name)
+        """Stage the check state for a node; persisted by commit_check_state()."""
+        self.state_store.stage(node_name, state)
+
+    def commit_check_state(self, node_name: str) -> None:
+        """Persist staged state for a node after it executed successfully."""
         try:
-            write_json_with_defaults(cache_file, state)
+            self.state_store.commit(node_name)
         except Exception as e:
-            logger.warning(f"Failed to save cache for {node_name}: {e}")
+            logger.warning(f"Failed to commit state for {node_name}: {e}")
+
+    def discard_check_state(self, node_name: str) -> None:
+        """Drop staged state for a node that was skipped or failed."""
+        self.state_store.discard(node_name)
 
     def get_file_modification_times(self, directory: Path, pattern: str = "*") -> dict[str, float]:
         """Get modification times for files in a directory."""
@@ -94,6 +114,33 @@ class ChangeDetector:
 class YnabSyncChangeDetector(ChangeDetector):
     """Change detection for YNAB sync operations."""
 
+    def read_server_knowledge(self) -> dict[str, Any]:
+        """Read the server_knowledge recorded in the YNAB cache files."""
+        ynab_cache_dir = self.data_dir / "ynab" / "cache"
+        knowledge: dict[str, Any] = {}
+        for name in ("accounts", "categories"):
+            cache_file = ynab_cache_dir / f"{name}.json"
+            if cache_file.exists():
+                knowledge[f"{name}_server_knowledge"] = read_json(cache_file).get("server_knowledge")
+        return knowledge
+
+    def commit_check_state(self, node_name: str) -> None:
+        """
+        Persist staged state with the server_knowledge of the synced cache.
+
+        The check runs before ynab_sync rewrites the cache, so the staged
+        server_knowledge is refreshed from the post-sync files; otherwise the
+        next check would report the sync's own update as a change.
+        """
+        if self.state_store.has_pending(node_name):
+            try:
+                state = self.load_last_check_state(node_name)
+                state.update(self.read_server_knowledge())
+                self.save_last_check_state(node_name, state)
+            except Exception as e:
+                logger.warning(f"Failed to refresh YNAB server_knowledge for {node_name}: {e}")
+        super().commit_check_state(node_name)
+
     def check_changes(self, context: FlowContext) -> tuple[bool, list[str]]:
         """
         Check if YNAB sync needs to run based on server_knowledge changes.
@@ -361,35 +408,43 @@ class RetirementUpdateChangeDetector(ChangeDetector):
         current_time = datetime.now()
         last_update_time = last_state.get("last_update_time")
 
+        new_state = {"last_update_time": current_time.isoformat()}
+
         if last_update_time:
             last_update = datetime.fromisoformat(last_update_time)
             # Check if it's been more than 30 days
             if current_time - last_update > timedelta(days=30):
+                self.save_last_check_state(node_name, new_state)
                 return True, ["Monthly retirement update cycle reached"]
             else:
                 days_remaining = 30 - (current_time - last_update).days
                 return False, [f"Next update in {days_remaining} days"]
         else:
+            self.save_last_check_state(node_name, new_state)
             return True, ["No previous retirement update recorded"]
 
 
-def create_change_detectors(data_dir: Path) -> dict[str, ChangeDetector]:
+def create_change_detectors(
+    data_dir: Path, state_store: FlowStateStore | None = None
+) -> dict[str, ChangeDetector]:
     """
     Create and configure all change detectors for the flow system.
 
     Args:
         data_dir: Base data directory
+        state_store: Shared state store (created at the standard location if omitted)
 
     Returns:
         Dictionary mapping node names to their change detectors
     """
+    store = state_store or FlowStateStore.for_data_dir(data_dir)
     return {
-        "ynab_sync": YnabSyncChangeDetector(data_dir),
-        "amazon_unzip": AmazonUnzipChangeDetector(data_dir),
-        "amazon_matching": AmazonMatchingChangeDetector(data_dir),
-        "apple_email_fetch": AppleEmailChangeDetector(data_dir),
-        "apple_matching": AppleMatchingChangeDetector(data_dir),
-        "retirement_update": RetirementUpdateChangeDetector(data_dir),
+        "ynab_sync": YnabSyncChangeDetector(data_dir, store),
+        "amazon_unzip": AmazonUnzipChangeDetector(data_dir, store),
+        "amazon_matching": AmazonMatchingChangeDetector(data_dir, store),
+        "apple_email_fetch": AppleEmailChangeDetector(data_dir, store),
+        "apple_matching": AppleMatchingChangeDetector(data_dir, store),
+        "retirement_update": RetirementUpdateChangeDetector(data_dir, store),
     }
 
 
@@ -407,6 +462,6 @@ def get_change_detector_function(
     """
 
     def change_detector_func(context: FlowContext) -> tuple[bool, list[str]]:
-        return detector.check_changes(context)  # type: ignore[no-any-return, attr-defined]
+        return detector.check_changes(context)
 
     return change_detector_func
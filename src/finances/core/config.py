@@ -100,6 +100,11 @@ class AmazonConfig:
     data_dir: Path
     account_names: list = field(default_factory=lambda: ["karl", "erica"])
     file_patterns: list = field(default_factory=lambda: ["Retail.OrderHistory.*.csv"])
+    payee_patterns: list = field(default_factory=lambda: ["amazon", "amzn"])
+    # Matching only considers orders shipped from this many days after a charge
+    # to this many days before it
+    match_days_before_ship: int = 3
+    match_days_after_ship: int = 30
 
 
 @dataclass
@@ -108,6 +113,7 @@ class AppleConfig:
 
     data_dir: Path
     receipt_cache_days: int = 90
+    payee_patterns: list = field(default_factory=lambda: ["apple"])
 
 
 @dataclass
@@ -191,11 +197,15 @@ class Config:
         amazon = AmazonConfig(
             data_dir=data_dir / "amazon",
             account_names=_parse_list(os.getenv("AMAZON_ACCOUNTS", "karl,erica")),
+            payee_patterns=_parse_list(os.getenv("AMAZON_PAYEE_PATTERNS", "amazon,amzn")),
+            match_days_before_ship=int(os.getenv("AMAZON_MATCH_DAYS_BEFORE_SHIP", "3")),
+            match_days_after_ship=int(os.getenv("AMAZON_MATCH_DAYS_AFTER_SHIP", "30")),
         )
 
         apple = AppleConfig(
             data_dir=data_dir / "apple",
             receipt_cache_days=int(os.getenv("APPLE_CACHE_DAYS", "90")),
+            payee_patterns=_parse_list(os.getenv("APPLE_PAYEE_PATTERNS", "apple")),
         )
 
         analysis = AnalysisConfig(
@@ -253,6 +263,8 @@ class Config:
                 errors.append("Email IMAP port must be 1-65535")
             if self.apple.receipt_cache_days < 0:
                 errors.append("Apple receipt cache days must be non-negative")
+            if self.amazon.match_days_before_ship < 0 or self.amazon.match_days_after_ship < 0:
+                errors.append("Amazon match window days must be non-negative")
         except (ValueError, TypeError) as e:
             errors.append(f"Invalid numeric configuration: {e}")
 
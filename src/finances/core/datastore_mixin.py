@@ -23,6 +23,7 @@ class DataStoreMixin:
     - Cached file listing to reduce redundant glob operations
     - Common metadata methods (age_days, to_node_data_summary)
     - File stat aggregation helpers
+    - Record counts from sidecar summaries (see core.json_utils)
 
     Subclasses must implement:
     - exists() -> bool
@@ -91,6 +92,27 @@ class DataStoreMixin:
             return None
         return max(files, key=lambda p: p.stat().st_mtime)
 
+    def _count_records(self, file: Path, key: str | None = None) -> int | None:
+        """
+        Count records of a JSON file without loading it.
+
+        Uses the file's sidecar summary when it is current, and streams the
+        file otherwise.
+
+        Args:
+            file: JSON data file
+            key: Key of the record array in a top-level object (top-level array if None)
+
+        Returns:
+            Number of records, or None if the file is missing or malformed
+        """
+        from finances.core.json_utils import count_json_records
+
+        try:
+            return count_json_records(file, key)
+        except (OSError, ValueError):
+            return None
+
     def _get_total_size(self, files: list[Path]) -> int:
         """
         Get total size of all files.
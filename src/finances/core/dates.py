@@ -4,13 +4,22 @@ FinancialDate Primitive Type
 
 Immutable date wrapper with consistent formatting for financial operations.
 Provides standardized date handling across YNAB, Amazon, and Apple data sources.
+
+Data sources repeat the same few thousand dates across hundreds of thousands
+of records, so from_string() and from_date() return interned instances: each
+distinct date is parsed and allocated once per process.
 """
 
+import datetime as dt
 from dataclasses import dataclass
 from datetime import date, datetime
+from functools import lru_cache
+
+# Distinct dates kept interned (about 40 years of days)
+INTERN_CACHE_SIZE = 16384
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FinancialDate:
     """Immutable financial date wrapper with consistent formatting."""
 
@@ -30,11 +39,22 @@ class FinancialDate:
         Returns:
             FinancialDate object
         """
-        # Handle ISO8601 timestamps (extract date portion before 'T')
-        if "T" in date_str and date_format == "%Y-%m-%d":
-            date_str = date_str.split("T")[0]
+        return _parse_interned(date_str, date_format)
+
+    @classmethod
+    def from_date(cls, value: dt.date) -> "FinancialDate":
+        """
+        Get the interned FinancialDate for a date.
+
+        Args:
+            value: Date (datetimes, including pandas Timestamps, are truncated to their date)
 
-        return cls(date=datetime.strptime(date_str, date_format).date())
+        Returns:
+            Shared FinancialDate object for that date
+        """
+        if isinstance(value, datetime):
+            value = value.date()
+        return _intern(value)
 
     @classmethod
     def from_timestamp(cls, timestamp: float) -> "FinancialDate":
@@ -105,3 +125,17 @@ class FinancialDate:
     def __repr__(self) -> str:
         """Repr format."""
         return f"FinancialDate(date={self.date!r})"
+
+
+@lru_cache(maxsize=INTERN_CACHE_SIZE)
+def _intern(value: date) -> FinancialDate:
+    return FinancialDate(date=value)
+
+
+@lru_cache(maxsize=INTERN_CACHE_SIZE)
+def _parse_interned(date_str: str, date_format: str) -> FinancialDate:
+    # Handle ISO8601 timestamps (extract date portion before 'T')
+    if "T" in date_str and date_format == "%Y-%m-%d":
+        date_str = date_str.split("T")[0]
+
+    return _intern(datetime.strptime(date_str, date_format).date())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Per-Run File Load Cache
+
+Memoizes parsed data files for the duration of one flow run, so several nodes
+reading the same cache file (e.g. YNAB transactions.json) parse it once.
+
+Entries are keyed by file path and view name, and validated against the
+file's mtime and size on every lookup: a rewritten file is reloaded.
+"""
+
+import logging
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class FileLoadCache:
+    """
+    In-process cache of values parsed from files.
+
+    Cached values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._entries: dict[tuple[Path, str], tuple[tuple[int, int], Any]] = {}
+        self.hits = 0
+        self.loads = 0
+
+    @staticmethod
+    def _signature(path: Path) -> tuple[int, int] | None:
+        """File modification time (ns) and size, or None if the file is missing."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def get(self, path: Path, view: str, load: Callable[[], T]) -> T:
+        """
+        Get a parsed view of a file, loading it if absent or stale.
+
+        Args:
+            path: File the view is derived from
+            view: Name of the view (one file may back several, e.g. raw records and models)
+            load: Function producing the view from the current file contents
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        key = (path.resolve(), view)
+        signature = self._signature(path)
+        entry = self._entries.get(key)
+        if entry is not None and signature is not None and entry[0] == signature:
+            self.hits += 1
+            return entry[1]  # type: ignore[no-any-return]
+
+        value = load()
+        self.loads += 1
+        if signature is not None:
+            self._entries[key] = (signature, value)
+        else:
+            self._entries.pop(key, None)
+        return value
+
+    def invalidate(self, path: Path | None = None) -> int:
+        """
+        Drop cached views.
+
+        Args:
+            path: File or directory whose views to drop (all entries if None)
+
+        Returns:
+            Number of entries dropped
+        """
+        if path is None:
+            dropped = len(self._entries)
+            self._entries.clear()
+            return dropped
+
+        root = path.resolve()
+        stale = [key for key in self._entries if key[0] == root or root in key[0].parents]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            logger.debug(f"Invalidated {len(stale)} cached file view(s) under {root}")
+        return len(stale)
@@ -15,6 +15,9 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from .file_cache import FileLoadCache
+from .metrics import ResourceUsage
+
 logger = logging.getLogger(__name__)
 
 
@@ -72,6 +75,8 @@ class FlowContext:
     start_time: datetime
     archive_manifest: dict[str, Path] = field(default_factory=dict)
     execution_history: list["NodeExecution"] = field(default_factory=list)
+    # Parsed input files shared by nodes for this run (invalidated when a node rewrites them)
+    file_cache: FileLoadCache = field(default_factory=FileLoadCache)
 
 
 @dataclass
@@ -85,6 +90,8 @@ class NodeExecution:
     result: FlowResult | None = None
     changes_detected: bool = False
     change_reasons: list[str] = field(default_factory=list)
+    metrics: ResourceUsage | None = None
+    phase_metrics: dict[str, ResourceUsage] = field(default_factory=dict)
 
 
 @dataclass
@@ -142,6 +149,9 @@ class FlowNode(ABC):
     dependency management.
     """
 
+    # Manual steps and nodes that prompt for input; unattended runs skip them.
+    requires_user_interaction: bool = False
+
     def __init__(self, name: str):
         """
         Initialize flow node.
@@ -193,6 +203,22 @@ class FlowNode(ABC):
         """
         pass
 
+    def get_fingerprint_config(self) -> dict[str, Any]:
+        """
+        Get configuration that affects this node's outputs, for input fingerprinting.
+
+        Defaults to the node's simple-valued attributes (paths, numbers, strings,
+        flags). Override if outputs depend on other settings.
+
+        Returns:
+            JSON-serializable configuration dictionary
+        """
+        return {
+            key: str(value) if isinstance(value, Path) else value
+            for key, value in sorted(vars(self).items())
+            if not key.startswith("_") and isinstance(value, str | int | float | bool | Path)
+        }
+
     def get_display_name(self) -> str:
         """Get human-readable display name for this node."""
         return self.name.replace("_", " ").title()
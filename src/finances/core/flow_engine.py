@@ -6,14 +6,19 @@ Provides dependency resolution, change detection, and orchestrated execution
 of the Financial Flow System.
 """
 
+import cProfile
 import logging
 import shutil
 import sys
+import time
 from collections import defaultdict, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from .change_detection import ChangeDetector
 from .flow import (
     FlowContext,
     FlowNode,
@@ -23,6 +28,11 @@ from .flow import (
     NodeStatus,
     flow_registry,
 )
+from .flow_state import FlowStateStore
+from .json_utils import summary_path
+from .memoization import compute_input_fingerprint, flow_result_from_dict, flow_result_to_dict
+from .metrics import ResourceUsage, append_run_metrics, measure_resources
+from .tracing import record_span, span, traced
 
 logger = logging.getLogger(__name__)
 
@@ -235,15 +245,80 @@ class FlowExecutionEngine:
     and coordinated execution of all flow nodes.
     """
 
-    def __init__(self, registry: FlowNodeRegistry | None = None):
+    def __init__(
+        self,
+        registry: FlowNodeRegistry | None = None,
+        change_detectors: dict[str, ChangeDetector] | None = None,
+        metrics_log: Path | None = None,
+        profile_dir: Path | None = None,
+        memo_store: FlowStateStore | None = None,
+        force_rerun: bool = False,
+    ):
         """
         Initialize flow execution engine.
 
         Args:
             registry: FlowNodeRegistry to use (defaults to global registry)
+            change_detectors: Optional mapping of node names to change detectors
+            metrics_log: Optional JSONL file that each run's metrics are appended to
+            profile_dir: Optional directory for per-node cProfile (.pstats) dumps
+            memo_store: Optional store for memoized node results; enables skipping
+                nodes whose input fingerprint is unchanged
+            force_rerun: Execute nodes even when a memoized result matches
         """
         self.registry = registry or flow_registry
         self.dependency_graph = DependencyGraph(self.registry)
+        self.change_detectors = change_detectors or {}
+        self.metrics_log = metrics_log
+        self.profile_dir = profile_dir
+        self.memo_store = memo_store
+        self.force_rerun = force_rerun
+        self._output_hashes: dict[Path, str] = {}
+
+    def load_change_detection_state(self) -> None:
+        """Load committed detector state for all nodes (one query per shared state store)."""
+        stores = {id(d.state_store): d.state_store for d in self.change_detectors.values()}
+        for store in stores.values():
+            try:
+                store.load_all()
+            except Exception as e:
+                logger.warning(f"Failed to load change detection state from {store.db_path}: {e}")
+
+    def check_node_changes(self, node_name: str, context: FlowContext) -> tuple[bool, list[str]] | None:
+        """
+        Run the change detector for a node, staging its new state.
+
+        Args:
+            node_name: Name of the node to check
+            context: Flow execution context
+
+        Returns:
+            Tuple of (has_changes, change_reasons), or None if the node has no detector
+        """
+        detector = self.change_detectors.get(node_name)
+        if detector is None:
+            return None
+        try:
+            return detector.check_changes(context)
+        except Exception as e:
+            logger.warning(f"Change detection failed for {node_name}: {e}")
+            return True, [f"Error in change detection: {e}"]
+
+    def finalize_change_state(self, node_name: str, success: bool) -> None:
+        """
+        Commit staged detector state if the node succeeded, otherwise discard it.
+
+        Args:
+            node_name: Name of the node
+            success: Whether the node's FlowResult succeeded
+        """
+        detector = self.change_detectors.get(node_name)
+        if detector is None:
+            return
+        if success:
+            detector.commit_check_state(node_name)
+        else:
+            detector.discard_check_state(node_name)
 
     def validate_flow(self) -> list[str]:
         """
@@ -254,6 +329,7 @@ class FlowExecutionEngine:
         """
         return self.dependency_graph.validate()
 
+    @traced("flow.compute_directory_hash")
     def compute_directory_hash(self, directory: Path) -> str:
         """
         Compute SHA-256 hash of all files in directory using CLI tool.
@@ -449,7 +525,10 @@ class FlowExecutionEngine:
             logger.info(f"Executing node: {node_name}")
 
             # Execute the node
-            result = node.execute(context)
+            with self.measure_phase(execution, "execute") as usage:
+                result = self.run_node(node, context)
+            if result.execution_time_seconds is None:
+                result.execution_time_seconds = usage.wall_seconds
             execution.result = result
 
             if result.success:
@@ -466,9 +545,159 @@ class FlowExecutionEngine:
 
         finally:
             execution.end_time = datetime.now()
+            execution.metrics = self.total_node_metrics(execution)
+            self.finalize_change_state(node_name, execution.status == NodeStatus.COMPLETED)
 
         return execution
 
+    @contextmanager
+    def measure_phase(self, execution: NodeExecution, phase: str) -> Iterator[ResourceUsage]:
+        """
+        Measure one phase of a node execution and trace it as a span.
+
+        Args:
+            execution: Node execution record the phase metrics are stored on
+            phase: Phase name (e.g. "execute")
+        """
+        with span(phase, category="phase", node=execution.node_name), measure_resources() as usage:
+            execution.phase_metrics[phase] = usage
+            yield usage
+
+    def get_output_hash(self, output_dir: Path) -> str:
+        """Hash a node output directory, reusing hashes computed earlier in this run."""
+        if output_dir not in self._output_hashes:
+            self._output_hashes[output_dir] = self.compute_directory_hash(output_dir)
+        return self._output_hashes[output_dir]
+
+    def is_memoizable(self, node: FlowNode) -> bool:
+        """
+        Check whether a node's result can be memoized by input fingerprint.
+
+        Only derived nodes qualify: they must have dependencies, persistent
+        output, and every dependency must have a persistent output directory.
+        Source nodes (e.g. API syncs) and interactive nodes always run.
+        """
+        if self.memo_store is None or node.requires_user_interaction or not node.dependencies:
+            return False
+        if node.get_output_dir() is None:
+            return False
+        for dep_name in node.dependencies:
+            dep_node = self.registry.get_node(dep_name)
+            if dep_node is None or dep_node.get_output_dir() is None:
+                return False
+        return True
+
+    def compute_node_fingerprint(self, node: FlowNode) -> str:
+        """
+        Compute a node's input fingerprint from its upstream outputs, code and config.
+
+        Args:
+            node: Flow node
+
+        Returns:
+            Fingerprint hex digest
+        """
+        upstream_hashes = {}
+        for dep_name in sorted(node.dependencies):
+            dep_node = self.registry.get_node(dep_name)
+            dep_dir = dep_node.get_output_dir() if dep_node else None
+            upstream_hashes[dep_name] = self.get_output_hash(dep_dir) if dep_dir else ""
+        return compute_input_fingerprint(node, upstream_hashes)
+
+    def load_memoized_result(self, node: FlowNode, fingerprint: str) -> FlowResult | None:
+        """
+        Get a node's memoized result if its fingerprint and outputs are unchanged.
+
+        Args:
+            node: Flow node
+            fingerprint: Current input fingerprint
+
+        Returns:
+            Cached FlowResult, or None if the node must execute
+        """
+        if self.memo_store is None:
+            return None
+        memo = self.memo_store.get_memo(node.name)
+        if memo is None or memo["fingerprint"] != fingerprint:
+            return None
+        output_dir = node.get_output_dir()
+        if output_dir is None or self.get_output_hash(output_dir) != memo["output_hash"]:
+            return None
+
+        result = flow_result_from_dict(memo["result"])
+        result.metadata["memoized"] = True
+        return result
+
+    def run_node(self, node: FlowNode, context: FlowContext) -> FlowResult:
+        """
+        Execute a node, dumping a cProfile of the call when profile_dir is set.
+
+        Cached file views under the node's output directory are dropped afterwards.
+
+        Args:
+            node: Node to execute
+            context: Flow execution context
+
+        Returns:
+            The node's FlowResult
+        """
+        try:
+            if self.profile_dir is None:
+                return node.execute(context)
+
+            profiler = cProfile.Profile()
+            try:
+                result: FlowResult = profiler.runcall(node.execute, context)
+                return result
+            finally:
+                self.profile_dir.mkdir(parents=True, exist_ok=True)
+                profiler.dump_stats(self.profile_dir / f"{node.name}.pstats")
+        finally:
+            # Files the node may have rewritten must be re-read by later nodes
+            output_dir = node.get_output_dir()
+            if output_dir is not None:
+                context.file_cache.invalidate(output_dir)
+
+    @staticmethod
+    def total_node_metrics(execution: NodeExecution) -> ResourceUsage:
+        """Sum the per-phase resource usage of a node execution."""
+        return sum(execution.phase_metrics.values(), ResourceUsage())
+
+    def record_run_metrics(
+        self, context: FlowContext, executions: dict[str, NodeExecution], run_status: str
+    ) -> None:
+        """
+        Append this run's per-node and per-phase metrics to the metrics log.
+
+        Args:
+            context: Flow execution context
+            executions: Node executions recorded during the run
+            run_status: Overall run outcome ("completed" or "failed")
+        """
+        if self.metrics_log is None:
+            return
+
+        nodes = {}
+        for node_name, execution in executions.items():
+            if execution.status == NodeStatus.SKIPPED and not execution.phase_metrics:
+                continue
+            nodes[node_name] = {
+                "status": execution.status.value,
+                "items_processed": execution.result.items_processed if execution.result else 0,
+                "total": execution.metrics.to_dict() if execution.metrics else None,
+                "phases": {phase: usage.to_dict() for phase, usage in execution.phase_metrics.items()},
+            }
+
+        append_run_metrics(
+            self.metrics_log,
+            {
+                "run_start": context.start_time.isoformat(),
+                "run_end": datetime.now().isoformat(),
+                "status": run_status,
+                "nodes": nodes,
+            },
+        )
+
     def topological_sort_nodes(self) -> list[str]:
         """
         Sort all nodes by dependencies with alphabetical tie-breaking.
@@ -479,19 +708,14 @@ class FlowExecutionEngine:
         all_nodes = set(self.registry.get_all_nodes().keys())
         return self.dependency_graph.topological_sort(all_nodes)
 
-    def execute_flow(self) -> dict[str, Any]:
+    def prepare_flow_context(self) -> FlowContext:
         """
-        Execute the complete flow with sequential prompt-validate-execute pattern.
+        Validate the flow and create the context for a new run.
 
-        For each node in topological order:
-        1. Display status and prompt user
-        2. Validate dependencies have usable data
-        3. Archive existing data (if any)
-        4. Execute node
-        5. Archive new data if changed
+        Exits the process if the flow is invalid.
 
         Returns:
-            Dictionary with execution summary and results
+            Fresh FlowContext for the run
         """
         # Validate flow before execution
         validation_errors = self.validate_flow()
@@ -503,12 +727,36 @@ class FlowExecutionEngine:
 
         # Create flow context
         context = FlowContext(start_time=datetime.now())
+        self._output_hashes.clear()
+
+        # Batch-load change detection state for all nodes up front
+        self.load_change_detection_state()
+
+        return context
+
+    def execute_flow(self) -> dict[str, Any]:
+        """
+        Execute the complete flow with sequential prompt-validate-execute pattern.
+
+        For each node in topological order:
+        1. Display status and prompt user
+        2. Validate dependencies have usable data
+        3. Archive existing data (if any)
+        4. Execute node
+        5. Archive new data if changed
+
+        Returns:
+            Dictionary with execution summary and results
+        """
+        context = self.prepare_flow_context()
 
         # Get nodes in topological order with alphabetical tie-breaking
         sorted_nodes = self.topological_sort_nodes()
 
         executed_nodes = []
         skipped_nodes = []
+        cached_nodes: list[str] = []
+        executions: dict[str, NodeExecution] = {}
 
         # Sequential execution loop
         for node_name in sorted_nodes:
@@ -517,6 +765,10 @@ class FlowExecutionEngine:
                 print(f"\nERROR: Node '{node_name}' not found in registry")
                 sys.exit(1)
 
+            execution = NodeExecution(node_name=node_name, status=NodeStatus.PENDING)
+            executions[node_name] = execution
+            context.execution_history.append(execution)
+
             # Get output info for status display
             output_info = node.get_output_info()
             files = output_info.get_output_files()
@@ -540,9 +792,18 @@ class FlowExecutionEngine:
             # Display and prompt
             print(f"\n[{node_name}]")
             print(f"  Status: {status}")
+            change_check = None
+            if node_name in self.change_detectors:
+                with self.measure_phase(execution, "change_detection"):
+                    change_check = self.check_node_changes(node_name, context)
+            if change_check is not None:
+                execution.changes_detected, execution.change_reasons = change_check
+                print(f"  Changes: {'; '.join(execution.change_reasons)}")
             response = input("  Run this node? [y/N] ")
 
             if response.lower() != "y":
+                self.finalize_change_state(node_name, success=False)
+                execution.status = NodeStatus.SKIPPED
                 skipped_nodes.append(node_name)
                 continue
 
@@ -561,112 +822,333 @@ class FlowExecutionEngine:
                     print(f"  Run the flow again and say 'yes' to '{dep_name}'")
                     sys.exit(1)
 
-            # Get output directory (returns None if node has no persistent output)
-            output_dir = node.get_output_dir()
+            if self.run_node_with_archiving(node, execution, context, executions):
+                executed_nodes.append(node_name)
+            else:
+                cached_nodes.append(node_name)
+
+        self.print_execution_summary(executed_nodes, skipped_nodes, executions, cached_nodes)
+        self.record_run_metrics(context, executions, "completed")
+
+        return {
+            "executed_nodes": executed_nodes,
+            "skipped_nodes": skipped_nodes,
+            "cached_nodes": cached_nodes,
+            "total_nodes": len(sorted_nodes),
+            "executions": executions,
+        }
+
+    def execute_flow_auto(self) -> dict[str, Any]:
+        """
+        Execute only the nodes affected by detected changes, without prompting.
+
+        1. Run every change detector to find nodes whose inputs changed
+           (except for nodes requiring user interaction, which never run here)
+        2. Expand to the changed subgraph (changed nodes plus all dependents)
+        3. Execute that subgraph in topological order, skipping nodes that
+           require user interaction or whose dependencies have no usable data
 
-            # Archive existing data (if exists)
-            pre_hash = None
+        Intended for cron/systemd timers: does no work when nothing changed.
+
+        Returns:
+            Dictionary with execution summary and results
+        """
+        context = self.prepare_flow_context()
+
+        executions: dict[str, NodeExecution] = {}
+        changed_nodes: set[str] = set()
+
+        # Detect changes across all nodes that have detectors. Interactive nodes are
+        # left out: they are always skipped, so their staged state is never committed
+        # and their detectors would report a change on every run.
+        for node_name in sorted(self.change_detectors):
+            node = self.registry.get_node(node_name)
+            if node is None or node.requires_user_interaction:
+                continue
+            execution = NodeExecution(node_name=node_name, status=NodeStatus.PENDING)
+            executions[node_name] = execution
+            with self.measure_phase(execution, "change_detection"):
+                change_check = self.check_node_changes(node_name, context)
+            if change_check is None:
+                continue
+            execution.changes_detected, execution.change_reasons = change_check
+            if execution.changes_detected:
+                changed_nodes.add(node_name)
+                print(f"[{node_name}] {'; '.join(execution.change_reasons)}")
+
+        if not changed_nodes:
+            print("No changes detected; nothing to do.")
+            return {
+                "executed_nodes": [],
+                "skipped_nodes": [],
+                "cached_nodes": [],
+                "total_nodes": 0,
+                "executions": executions,
+                "changed_nodes": [],
+            }
+
+        nodes_to_execute = self.dependency_graph.find_changed_subgraph(changed_nodes)
+        sorted_nodes = self.dependency_graph.topological_sort(nodes_to_execute)
+
+        executed_nodes: list[str] = []
+        skipped_nodes: list[str] = []
+        cached_nodes: list[str] = []
+
+        for node_name in sorted_nodes:
+            node = self.registry.get_node(node_name)
+            if not node:
+                print(f"\nERROR: Node '{node_name}' not found in registry")
+                sys.exit(1)
+
+            execution = executions.setdefault(
+                node_name, NodeExecution(node_name=node_name, status=NodeStatus.PENDING)
+            )
+            context.execution_history.append(execution)
+            print(f"\n[{node_name}]")
+
+            skip_reason = None
+            if node.requires_user_interaction:
+                skip_reason = "requires user interaction"
+            else:
+                not_ready = [
+                    dep_name
+                    for dep_name in sorted(node.dependencies)
+                    if not (dep_node := self.registry.get_node(dep_name))
+                    or not dep_node.get_output_info().is_data_ready()
+                ]
+                if not_ready:
+                    skip_reason = f"no usable data from {', '.join(not_ready)}"
+
+            if skip_reason:
+                print(f"  Skipped: {skip_reason}")
+                self.finalize_change_state(node_name, success=False)
+                execution.status = NodeStatus.SKIPPED
+                skipped_nodes.append(node_name)
+                continue
+
+            # Re-check after upstream nodes ran so the committed state reflects the inputs used
+            if node.dependencies & set(executed_nodes):
+                with self.measure_phase(execution, "change_recheck"):
+                    self.check_node_changes(node_name, context)
+
+            if self.run_node_with_archiving(node, execution, context, executions):
+                executed_nodes.append(node_name)
+            else:
+                cached_nodes.append(node_name)
+
+        self.print_execution_summary(executed_nodes, skipped_nodes, executions, cached_nodes)
+        self.record_run_metrics(context, executions, "completed")
+
+        return {
+            "executed_nodes": executed_nodes,
+            "skipped_nodes": skipped_nodes,
+            "cached_nodes": cached_nodes,
+            "total_nodes": len(sorted_nodes),
+            "executions": executions,
+            "changed_nodes": sorted(changed_nodes),
+        }
+
+    def run_node_with_archiving(
+        self,
+        node: FlowNode,
+        execution: NodeExecution,
+        context: FlowContext,
+        executions: dict[str, NodeExecution],
+    ) -> bool:
+        """
+        Archive, execute, re-archive and clean up a single node whose dependencies are ready.
+
+        If the node's input fingerprint matches its last successful run and its
+        outputs are intact, the memoized result is reused instead (unless
+        force_rerun is set). Exits the process (after recording run metrics) if
+        the node fails.
+
+        Args:
+            node: Node to execute
+            execution: Execution record for this node (updated in place)
+            context: Flow execution context
+            executions: All execution records for this run (for metrics on failure)
+
+        Returns:
+            True if the node executed, False if a memoized result was reused
+        """
+        node_name = node.name
+
+        # Get output directory (returns None if node has no persistent output)
+        output_dir = node.get_output_dir()
+
+        execution.status = NodeStatus.RUNNING
+        execution.start_time = datetime.now()
+        node_start_ns = time.perf_counter_ns()
+
+        # Reuse the last result if inputs, code and config are unchanged
+        fingerprint = None
+        if self.is_memoizable(node):
+            with self.measure_phase(execution, "fingerprint"):
+                fingerprint = self.compute_node_fingerprint(node)
+                cached_result = None if self.force_rerun else self.load_memoized_result(node, fingerprint)
+            if cached_result is not None:
+                execution.result = cached_result
+                execution.status = NodeStatus.COMPLETED
+                execution.end_time = datetime.now()
+                execution.metrics = self.total_node_metrics(execution)
+                record_span(node_name, "node", node_start_ns, time.perf_counter_ns(), status="cached")
+                self.finalize_change_state(node_name, success=True)
+                print("  ✓ Inputs unchanged since last successful run; reusing cached result")
+                return False
+
+        # Archive existing data (if exists)
+        pre_hash = None
+        with self.measure_phase(execution, "pre_archive"):
             if output_dir and output_dir.exists() and any(output_dir.iterdir()):
                 pre_hash = self.compute_directory_hash(output_dir)
                 self.archive_existing_data(node, output_dir, context)
 
-            # Execute node
-            result = node.execute(context)
-
-            if not result.success:
-                print("\nERROR: Node execution failed")
-                print(f"  Node: {node_name}")
-                print(f"  Error: {result.error_message}")
-                sys.exit(1)
+        # Execute node
+        with self.measure_phase(execution, "execute") as usage:
+            result = self.run_node(node, context)
+        if result.execution_time_seconds is None:
+            result.execution_time_seconds = usage.wall_seconds
+        execution.result = result
 
-            executed_nodes.append(node_name)
+        if not result.success:
+            self.finalize_change_state(node_name, success=False)
+            execution.status = NodeStatus.FAILED
+            execution.end_time = datetime.now()
+            execution.metrics = self.total_node_metrics(execution)
+            record_span(node_name, "node", node_start_ns, time.perf_counter_ns(), status="failed")
+            self.record_run_metrics(context, executions, "failed")
+            print("\nERROR: Node execution failed")
+            print(f"  Node: {node_name}")
+            print(f"  Error: {result.error_message}")
+            sys.exit(1)
 
-            # Archive new data if changed and cleanup old files
+        # Archive new data if changed
+        archived_files: list[Path] = []
+        with self.measure_phase(execution, "post_archive"):
             if output_dir and output_dir.exists():
                 post_hash = self.compute_directory_hash(output_dir)
                 if post_hash != pre_hash:
                     archived_files = self.archive_new_data(node, output_dir, context)
 
-                    # Delete archived files except newly created ones
-                    new_files = {f.resolve() for f in (result.outputs or [])}
-                    deleted_count = 0
-                    deleted_dirs = set()
-                    for file_path in archived_files:
-                        if file_path.resolve() not in new_files:
-                            try:
-                                parent_dir = file_path.parent
-                                file_path.unlink()
-                                deleted_count += 1
-                                # Track parent directory for empty directory cleanup
-                                if parent_dir != output_dir:
-                                    deleted_dirs.add(parent_dir)
-                            except Exception as e:
-                                print(f"\nWARNING: Failed to delete old file {file_path.name}: {e}")
-
-                    # Clean up empty directories (prevent accumulation of directory shells)
-                    empty_dirs_deleted = 0
-                    for dir_path in sorted(deleted_dirs, reverse=True):  # Delete deepest first
+        # Cleanup old files that were archived but not re-created by this run
+        with self.measure_phase(execution, "cleanup"):
+            if output_dir and archived_files:
+                # Delete archived files except newly created ones
+                new_files = {f.resolve() for f in (result.outputs or [])}
+                # Keep the sidecar summaries of kept outputs
+                new_files |= {summary_path(f).resolve() for f in (result.outputs or [])}
+                deleted_count = 0
+                deleted_dirs = set()
+                for file_path in archived_files:
+                    if file_path.resolve() not in new_files:
                         try:
-                            # Only delete if completely empty and not archive
-                            if (
-                                dir_path.exists()
-                                and not any(dir_path.iterdir())
-                                and "archive" not in dir_path.parts
-                            ):
-                                dir_path.rmdir()
-                                empty_dirs_deleted += 1
-                        except Exception:  # noqa: S110
-                            # Silently skip if we can't delete (not critical)
-                            pass
-
-                    if deleted_count > 0:
-                        cleanup_msg = f"  Cleaned up {deleted_count} old file(s)"
-                        if empty_dirs_deleted > 0:
-                            cleanup_msg += f" and {empty_dirs_deleted} empty dir(s)"
-                        cleanup_msg += f" (archived in {output_dir.name}/archive/)"
-                        print(cleanup_msg)
-
-            # Display updated status after cleanup (ALWAYS, even if no data)
-            updated_output_info = node.get_output_info()
-            updated_files = updated_output_info.get_output_files()
-            if updated_files:
-                file_count = len(updated_files)
-                total_records = sum(f.record_count for f in updated_files)
+                            parent_dir = file_path.parent
+                            file_path.unlink()
+                            deleted_count += 1
+                            # Track parent directory for empty directory cleanup
+                            if parent_dir != output_dir:
+                                deleted_dirs.add(parent_dir)
+                        except Exception as e:
+                            print(f"\nWARNING: Failed to delete old file {file_path.name}: {e}")
+
+                # Clean up empty directories (prevent accumulation of directory shells)
+                empty_dirs_deleted = 0
+                for dir_path in sorted(deleted_dirs, reverse=True):  # Delete deepest first
+                    try:
+                        # Only delete if completely empty and not archive
+                        if (
+                            dir_path.exists()
+                            and not any(dir_path.iterdir())
+                            and "archive" not in dir_path.parts
+                        ):
+                            dir_path.rmdir()
+                            empty_dirs_deleted += 1
+                    except Exception:  # noqa: S110
+                        # Silently skip if we can't delete (not critical)
+                        pass
+
+                if deleted_count > 0:
+                    cleanup_msg = f"  Cleaned up {deleted_count} old file(s)"
+                    if empty_dirs_deleted > 0:
+                        cleanup_msg += f" and {empty_dirs_deleted} empty dir(s)"
+                    cleanup_msg += f" (archived in {output_dir.name}/archive/)"
+                    print(cleanup_msg)
+
+        execution.status = NodeStatus.COMPLETED
+        execution.end_time = datetime.now()
+        execution.metrics = self.total_node_metrics(execution)
+        record_span(node_name, "node", node_start_ns, time.perf_counter_ns(), status="completed")
+
+        # Node succeeded and its outputs are archived: persist detector state
+        self.finalize_change_state(node_name, success=True)
+
+        # Record the result under the fingerprint it ran with
+        if output_dir is not None:
+            self._output_hashes.pop(output_dir, None)
+            if fingerprint is not None and self.memo_store is not None:
                 try:
-                    latest_file = max(updated_files, key=lambda f: f.path.stat().st_mtime)
-                    age_days = (
-                        datetime.now() - datetime.fromtimestamp(latest_file.path.stat().st_mtime)
-                    ).days
-                    updated_status = (
-                        f"{file_count} files with {total_records} total records, {age_days} days old"
+                    self.memo_store.put_memo(
+                        node_name, fingerprint, self.get_output_hash(output_dir), flow_result_to_dict(result)
                     )
-                except (FileNotFoundError, OSError):
-                    updated_status = f"{file_count} files with {total_records} total records (age unknown)"
-            else:
-                updated_status = "No data"
-            print(f"\n✓ Updated status: {updated_status}")
-
-        # Print execution summary
+                except Exception as e:
+                    logger.warning(f"Failed to memoize result for {node_name}: {e}")
+
+        # Display updated status after cleanup (ALWAYS, even if no data)
+        updated_output_info = node.get_output_info()
+        updated_files = updated_output_info.get_output_files()
+        if updated_files:
+            file_count = len(updated_files)
+            total_records = sum(f.record_count for f in updated_files)
+            try:
+                latest_file = max(updated_files, key=lambda f: f.path.stat().st_mtime)
+                age_days = (
+                    datetime.now() - datetime.fromtimestamp(latest_file.path.stat().st_mtime)
+                ).days
+                updated_status = (
+                    f"{file_count} files with {total_records} total records, {age_days} days old"
+                )
+            except (FileNotFoundError, OSError):
+                updated_status = f"{file_count} files with {total_records} total records (age unknown)"
+        else:
+            updated_status = "No data"
+        print(f"\n✓ Updated status: {updated_status}")
+
+        return True
+
+    def print_execution_summary(
+        self,
+        executed_nodes: list[str],
+        skipped_nodes: list[str],
+        executions: dict[str, NodeExecution],
+        cached_nodes: list[str] | None = None,
+    ) -> None:
+        """Print the end-of-run summary with per-node resource usage."""
         print("\n" + "=" * 60)
         print("EXECUTION SUMMARY")
         print("=" * 60)
         print(f"Executed: {len(executed_nodes)} nodes")
         print(f"Skipped:  {len(skipped_nodes)} nodes")
+        if cached_nodes:
+            print(f"Cached:   {len(cached_nodes)} nodes (inputs unchanged)")
         if executed_nodes:
             print("\nExecuted nodes:")
             for node_name in executed_nodes:
                 print(f"  - {node_name}")
+                node_metrics = executions[node_name].metrics
+                if node_metrics:
+                    print(f"      total: {node_metrics.format()}")
+                for phase, usage in executions[node_name].phase_metrics.items():
+                    print(f"      {phase}: {usage.format()}")
+        if cached_nodes:
+            print("\nCached nodes:")
+            for node_name in cached_nodes:
+                print(f"  - {node_name}")
         if skipped_nodes:
             print("\nSkipped nodes:")
             for node_name in skipped_nodes:
                 print(f"  - {node_name}")
 
-        return {
-            "executed_nodes": executed_nodes,
-            "skipped_nodes": skipped_nodes,
-            "total_nodes": len(sorted_nodes),
-        }
-
     def get_execution_summary(self, executions: dict[str, NodeExecution]) -> dict[str, Any]:
         """
         Generate summary statistics for a flow execution.
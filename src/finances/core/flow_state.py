@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Flow State Store
+
+Journaled persistence for change-detection state shared by all flow nodes,
+plus memoized node results keyed by input fingerprint.
+
+Replaces the per-node `cache/flow/<node>_last_check.json` files with a single
+SQLite database (WAL journal mode). Detector state is staged in memory while a
+node is being considered and only committed once the node's FlowResult
+succeeds, so a crashed or aborted run never marks data as processed.
+"""
+
+import json
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+STATE_DB_FILENAME = "state.db"
+LEGACY_STATE_SUFFIX = "_last_check.json"
+
+
+class FlowStateStore:
+    """
+    Transactional key/value store for per-node change-detection state.
+
+    State moves through two layers:
+    - committed: durable rows in SQLite, loaded for all nodes in one query
+    - pending: staged in memory by change detectors, visible to reads from
+      this store but not persisted until commit() is called for the node
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize state store.
+
+        Args:
+            db_path: Path to the SQLite database file (created if missing)
+        """
+        self.db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+        self._committed: dict[str, dict[str, Any]] | None = None
+        self._pending: dict[str, dict[str, Any]] = {}
+
+    @classmethod
+    def for_data_dir(cls, data_dir: Path) -> "FlowStateStore":
+        """Create the store at its standard location under data_dir/cache/flow."""
+        return cls(data_dir / "cache" / "flow" / STATE_DB_FILENAME)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database connection and ensure the schema exists."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS node_state (
+                        node_name TEXT PRIMARY KEY,
+                        state TEXT NOT NULL,
+                        updated_at TEXT NOT NULL
+                    )
+                    """
+                )
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS node_memo (
+                        node_name TEXT PRIMARY KEY,
+                        fingerprint TEXT NOT NULL,
+                        output_hash TEXT NOT NULL,
+                        result TEXT NOT NULL,
+                        updated_at TEXT NOT NULL
+                    )
+                    """
+                )
+            self._conn = conn
+            self._import_legacy_state()
+        return self._conn
+
+    def _import_legacy_state(self) -> None:
+        """Import per-node JSON state files left by earlier versions (first open only)."""
+        if self._conn is None:
+            return
+
+        (row_count,) = self._conn.execute("SELECT COUNT(*) FROM node_state").fetchone()
+        if row_count:
+            return
+
+        rows = []
+        for legacy_file in sorted(self.db_path.parent.glob(f"*{LEGACY_STATE_SUFFIX}")):
+            node_name = legacy_file.name.removesuffix(LEGACY_STATE_SUFFIX)
+            try:
+                state = json.loads(legacy_file.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                # PERF203: try-except in loop necessary for robust legacy file import
+                logger.warning(f"Skipping unreadable legacy state file {legacy_file.name}: {e}")
+                continue
+            if isinstance(state, dict):
+                rows.append((node_name, json.dumps(state, default=str), datetime.now().isoformat()))
+
+        if rows:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO node_state (node_name, state, updated_at) VALUES (?, ?, ?)",
+                    rows,
+                )
+            logger.info(f"Imported {len(rows)} legacy change-detection state file(s) into {self.db_path}")
+
+    def load_all(self) -> dict[str, dict[str, Any]]:
+        """
+        Load committed state for every node with a single query.
+
+        Subsequent get() calls are served from this snapshot.
+
+        Returns:
+            Dictionary mapping node names to their committed state
+        """
+        conn = self._connect()
+        committed: dict[str, dict[str, Any]] = {}
+        for node_name, state_json in conn.execute("SELECT node_name, state FROM node_state"):
+            try:
+                committed[node_name] = json.loads(state_json)
+            except ValueError as e:
+                # PERF203: try-except in loop necessary for robust row decoding
+                logger.warning(f"Ignoring corrupt state for {node_name}: {e}")
+        self._committed = committed
+        return dict(committed)
+
+    def get(self, node_name: str) -> dict[str, Any]:
+        """
+        Get current state for a node.
+
+        Returns pending (staged) state if present, otherwise committed state.
+
+        Args:
+            node_name: Flow node name
+
+        Returns:
+            State dictionary (empty if no state recorded)
+        """
+        if node_name in self._pending:
+            return dict(self._pending[node_name])
+        committed = self._committed if self._committed is not None else self.load_all()
+        return dict(committed.get(node_name, {}))
+
+    def stage(self, node_name: str, state: dict[str, Any]) -> None:
+        """
+        Stage new state for a node without persisting it.
+
+        Args:
+            node_name: Flow node name
+            state: State dictionary to commit once the node succeeds
+        """
+        self._pending[node_name] = dict(state)
+
+    def has_pending(self, node_name: str) -> bool:
+        """Check whether a node has staged, uncommitted state."""
+        return node_name in self._pending
+
+    def commit(self, node_name: str) -> bool:
+        """
+        Durably persist the staged state for a node.
+
+        Args:
+            node_name: Flow node name
+
+        Returns:
+            True if state was committed, False if nothing was staged
+        """
+        state = self._pending.pop(node_name, None)
+        if state is None:
+            return False
+
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                """
+                INSERT INTO node_state (node_name, state, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT(node_name) DO UPDATE SET state = excluded.state, updated_at = excluded.updated_at
+                """,
+                (node_name, json.dumps(state, default=str), datetime.now().isoformat()),
+            )
+
+        if self._committed is not None:
+            self._committed[node_name] = state
+        return True
+
+    def discard(self, node_name: str) -> None:
+        """Drop staged state for a node (node skipped or failed)."""
+        self._pending.pop(node_name, None)
+
+    def get_memo(self, node_name: str) -> dict[str, Any] | None:
+        """
+        Get the memoized result of a node's last successful run.
+
+        Args:
+            node_name: Flow node name
+
+        Returns:
+            Dictionary with fingerprint, output_hash and result, or None if absent
+        """
+        row = (
+            self._connect()
+            .execute("SELECT fingerprint, output_hash, result FROM node_memo WHERE node_name = ?", (node_name,))
+            .fetchone()
+        )
+        if row is None:
+            return None
+        fingerprint, output_hash, result_json = row
+        try:
+            return {"fingerprint": fingerprint, "output_hash": output_hash, "result": json.loads(result_json)}
+        except ValueError as e:
+            logger.warning(f"Ignoring corrupt memo for {node_name}: {e}")
+            return None
+
+    def put_memo(self, node_name: str, fingerprint: str, output_hash: str, result: dict[str, Any]) -> None:
+        """
+        Record the result of a successful node run under its input fingerprint.
+
+        Args:
+            node_name: Flow node name
+            fingerprint: Input fingerprint the node ran with
+            output_hash: Hash of the node's output directory after the run
+            result: Serialized FlowResult
+        """
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                """
+                INSERT INTO node_memo (node_name, fingerprint, output_hash, result, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(node_name) DO UPDATE SET
+                    fingerprint = excluded.fingerprint,
+                    output_hash = excluded.output_hash,
+                    result = excluded.result,
+                    updated_at = excluded.updated_at
+                """,
+                (node_name, fingerprint, output_hash, json.dumps(result, default=str), datetime.now().isoformat()),
+            )
+
+    def close(self) -> None:
+        """Close the database connection. Pending state is discarded."""
+        self._pending.clear()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
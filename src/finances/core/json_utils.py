@@ -5,28 +5,260 @@ JSON Utilities Module
 Provides centralized JSON reading and writing functions with consistent formatting.
 All JSON files in the codebase should use these utilities to ensure pretty-printing
 and consistent formatting for better debugging and searchability.
+
+Files are written atomically (temporary file in the same directory, then
+os.replace), so an interrupted write never leaves a truncated file behind.
+How much is flushed to disk is set by FsyncPolicy (FINANCES_FSYNC: none, file
+or file+dir; default file). Code writing many files can use batched_writes()
+to defer the flushes to one pass at the end.
+
+Large files can be inspected without parsing them whole: iter_json_array()
+streams the elements of a top-level (or keyed) array, and writers can emit a
+small sidecar summary (record count, size, SHA-256) under .meta/ next to the
+file, which count_json_records() reads instead of the file itself.
+
+When orjson is installed (`pip install finances[fast]`), it is used for encoding
+and decoding; output is formatted the same way as with the stdlib json module.
+Set FINANCES_JSON_BACKEND=stdlib to force the stdlib implementation. Large,
+machine-only files can be written in compact (non-indented) form.
 """
 
+import gc
+import hashlib
+import importlib
 import json
+import os
+import secrets
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, TypeVar
+
+T = TypeVar("T")
+
+# Documents above this size are decoded with the cyclic garbage collector paused:
+# decoding allocates only acyclic containers, which would otherwise trigger
+# repeated, fruitless collections (a large share of load time for YNAB caches)
+_GC_PAUSE_THRESHOLD_BYTES = 1 << 20
+
+
+def _load_orjson() -> Any:
+    """Import orjson unless unavailable or disabled through FINANCES_JSON_BACKEND."""
+    if os.getenv("FINANCES_JSON_BACKEND", "").lower() == "stdlib":
+        return None
+    try:
+        return importlib.import_module("orjson")
+    except ImportError:
+        return None
+
+
+_orjson: Any = _load_orjson()
+
+
+class FsyncPolicy(Enum):
+    """How far written files are flushed to disk before a write returns."""
+
+    NONE = "none"  # Atomic replace only; survives crashes of this process, not power loss
+    FILE = "file"  # Also fsync the file contents before the rename
+    FILE_AND_DIR = "file+dir"  # Also fsync the directory so the rename itself is durable
+
+
+def default_fsync_policy() -> FsyncPolicy:
+    """
+    Fsync policy from the FINANCES_FSYNC environment variable (default: file).
+
+    Raises:
+        ValueError: If FINANCES_FSYNC is not a valid policy
+    """
+    return FsyncPolicy(os.getenv("FINANCES_FSYNC", FsyncPolicy.FILE.value).lower())
+
+
+@dataclass
+class WriteBatch:
+    """Files written inside batched_writes(), flushed together when the batch ends."""
+
+    fsync: FsyncPolicy
+    files: list[Path] = field(default_factory=list)
+
+    def commit(self) -> None:
+        """Flush all files written so far, then each of their directories once."""
+        if self.fsync != FsyncPolicy.NONE:
+            for file in self.files:
+                _fsync_path(file)
+            if self.fsync == FsyncPolicy.FILE_AND_DIR:
+                for directory in dict.fromkeys(file.parent for file in self.files):
+                    _fsync_path(directory)
+        self.files.clear()
+
+
+_active_batch: ContextVar[WriteBatch | None] = ContextVar("json_write_batch", default=None)
+
+
+@contextmanager
+def batched_writes(fsync: FsyncPolicy | None = None) -> Iterator[WriteBatch]:
+    """
+    Defer fsyncs of JSON writes to the end of a block.
+
+    Each write is still atomic and immediately visible; only the flushing to
+    disk is deferred (until then, a power loss may lose recent files). Files
+    written before an exception are flushed as well.
+
+    Args:
+        fsync: Policy applied at the end (default_fsync_policy() if None)
+
+    Yields:
+        The batch collecting written files
+    """
+    batch = WriteBatch(fsync=fsync if fsync is not None else default_fsync_policy())
+    token = _active_batch.set(batch)
+    try:
+        yield batch
+    finally:
+        _active_batch.reset(token)
+        batch.commit()
+
+
+def _fsync_path(path: Path) -> None:
+    """Flush a file or directory to disk."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_atomic(filepath: Path, content: bytes, fsync: FsyncPolicy | None) -> None:
+    """
+    Replace a file's contents atomically.
+
+    Args:
+        filepath: Target file (parent directories are created)
+        content: Bytes to write
+        fsync: Flush policy (default_fsync_policy() if None; deferred inside batched_writes())
+    """
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    batch = _active_batch.get()
+    if fsync is None:
+        fsync = batch.fsync if batch is not None else default_fsync_policy()
+
+    # Same directory, so os.replace never crosses filesystems; 0o666 honours the umask
+    tmp_path = filepath.with_name(f".{filepath.name}.{secrets.token_hex(4)}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+            if fsync != FsyncPolicy.NONE and batch is None:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    if batch is not None:
+        batch.files.append(filepath)
+    elif fsync == FsyncPolicy.FILE_AND_DIR:
+        _fsync_path(filepath.parent)
+
 
+def json_backend() -> str:
+    """Name of the JSON implementation in use ("orjson" or "stdlib")."""
+    return "orjson" if _orjson is not None else "stdlib"
 
-def write_json(filepath: str | Path, data: Any, ensure_ascii: bool = False, sort_keys: bool = False) -> None:
+
+def _dumps_bytes(
+    data: Any,
+    compact: bool = False,
+    ensure_ascii: bool = False,
+    sort_keys: bool = False,
+    default: Any = None,
+) -> bytes:
+    """
+    Encode data as UTF-8 JSON bytes.
+
+    orjson is used unless ASCII escaping is requested or it rejects the data
+    (e.g. integers beyond 64 bits); the stdlib encoder then produces the output.
+    NaN and infinite floats are written as null by orjson.
+    """
+    if _orjson is not None and not ensure_ascii:
+        option = (
+            _orjson.OPT_NON_STR_KEYS | _orjson.OPT_PASSTHROUGH_DATACLASS | _orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        if not compact:
+            option |= _orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= _orjson.OPT_SORT_KEYS
+        try:
+            return _orjson.dumps(data, default=default, option=option)  # type: ignore[no-any-return]
+        except TypeError:
+            pass
+
+    if compact:
+        text = json.dumps(
+            data, separators=(",", ":"), ensure_ascii=ensure_ascii, sort_keys=sort_keys, default=default
+        )
+    else:
+        text = json.dumps(data, indent=2, ensure_ascii=ensure_ascii, sort_keys=sort_keys, default=default)
+    return text.encode("utf-8")
+
+
+@contextmanager
+def _gc_paused(size: int) -> Iterator[None]:
+    """Pause the garbage collector while decoding a large document."""
+    if size < _GC_PAUSE_THRESHOLD_BYTES or not gc.isenabled():
+        yield
+        return
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+def _loads(content: bytes) -> Any:
+    """Decode JSON bytes (stdlib fallback for input orjson rejects, e.g. NaN literals)."""
+    with _gc_paused(len(content)):
+        if _orjson is not None:
+            try:
+                return _orjson.loads(content)
+            except _orjson.JSONDecodeError:
+                pass
+        return json.loads(content)
+
+
+def write_json(
+    filepath: str | Path,
+    data: Any,
+    ensure_ascii: bool = False,
+    sort_keys: bool = False,
+    compact: bool = False,
+    fsync: FsyncPolicy | None = None,
+    sidecar: bool = False,
+    record_key: str | None = None,
+) -> None:
     """
     Write data to a JSON file with standard pretty-printing.
 
+    The file is replaced atomically: readers see either the old or the new contents.
+
     Args:
         filepath: Path to the JSON file
         data: Data to write to the file
         ensure_ascii: If True, escape non-ASCII characters (default: False)
         sort_keys: If True, sort dictionary keys (default: False)
+        compact: If True, write without indentation or spaces (for large machine-only files)
+        fsync: Flush policy (default: FINANCES_FSYNC, or the enclosing batched_writes())
+        sidecar: If True, also write a summary sidecar (see write_json_summary())
+        record_key: Key of the record array counted in the sidecar (top-level data if None)
     """
     filepath = Path(filepath)
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=ensure_ascii, sort_keys=sort_keys)
+    content = _dumps_bytes(data, compact=compact, ensure_ascii=ensure_ascii, sort_keys=sort_keys)
+    _write_atomic(filepath, content, fsync)
+    if sidecar:
+        write_json_summary(filepath, content, _record_count(data, record_key), record_key)
 
 
 def read_json(filepath: str | Path) -> Any:
@@ -39,8 +271,57 @@ def read_json(filepath: str | Path) -> Any:
     Returns:
         The parsed JSON data
     """
-    with open(filepath, encoding="utf-8") as f:
-        return json.load(f)
+    with open(filepath, "rb") as f:
+        return _loads(f.read())
+
+
+def parse_json(content: str | bytes) -> Any:
+    """
+    Parse a JSON document held in memory (e.g. command output).
+
+    Args:
+        content: JSON text or UTF-8 bytes
+
+    Returns:
+        The parsed JSON data
+    """
+    return _loads(content.encode("utf-8") if isinstance(content, str) else content)
+
+
+def read_json_as(filepath: str | Path, from_dict: Callable[[dict[str, Any]], T]) -> T:  # noqa: UP047
+    """
+    Read a JSON object and hydrate it into a domain model.
+
+    Args:
+        filepath: Path to the JSON file
+        from_dict: Model constructor (e.g. ParsedReceipt.from_dict)
+
+    Returns:
+        The domain model
+    """
+    return from_dict(read_json(filepath))
+
+
+def read_json_models(  # noqa: UP047
+    filepath: str | Path,
+    from_dict: Callable[[dict[str, Any]], T],
+    key: str | None = None,
+) -> list[T]:
+    """
+    Read a JSON array of objects and hydrate each into a domain model.
+
+    Args:
+        filepath: Path to the JSON file
+        from_dict: Model constructor (e.g. YnabTransaction.from_dict)
+        key: Key of the array if the file holds an object wrapping it (e.g. "accounts")
+
+    Returns:
+        List of domain models, in file order
+    """
+    data = read_json(filepath)
+    if key is not None and isinstance(data, dict):
+        data = data.get(key, [])
+    return [from_dict(item) for item in data]
 
 
 def format_json(data: Any, ensure_ascii: bool = False, sort_keys: bool = False, default: Any = None) -> str:
@@ -56,22 +337,313 @@ def format_json(data: Any, ensure_ascii: bool = False, sort_keys: bool = False,
     Returns:
         Pretty-printed JSON string
     """
-    if default is not None:
-        return json.dumps(data, indent=2, ensure_ascii=ensure_ascii, sort_keys=sort_keys, default=default)
-    return json.dumps(data, indent=2, ensure_ascii=ensure_ascii, sort_keys=sort_keys)
+    return _dumps_bytes(data, ensure_ascii=ensure_ascii, sort_keys=sort_keys, default=default).decode("utf-8")
 
 
-def write_json_with_defaults(filepath: str | Path, data: Any, default: Any = str) -> None:
+def write_json_with_defaults(
+    filepath: str | Path,
+    data: Any,
+    default: Any = str,
+    compact: bool = False,
+    fsync: FsyncPolicy | None = None,
+    sidecar: bool = False,
+    record_key: str | None = None,
+) -> None:
     """
     Write data to a JSON file with a custom default serializer for non-JSON types.
 
+    The file is replaced atomically, as with write_json().
+
     Args:
         filepath: Path to the JSON file
         data: Data to write to the file
         default: Function to serialize non-JSON types (default: str)
+        compact: If True, write without indentation or spaces (for large machine-only files)
+        fsync: Flush policy (default: FINANCES_FSYNC, or the enclosing batched_writes())
+        sidecar: If True, also write a summary sidecar (see write_json_summary())
+        record_key: Key of the record array counted in the sidecar (top-level data if None)
     """
     filepath = Path(filepath)
-    filepath.parent.mkdir(parents=True, exist_ok=True)
+    content = _dumps_bytes(data, compact=compact, default=default)
+    _write_atomic(filepath, content, fsync)
+    if sidecar:
+        write_json_summary(filepath, content, _record_count(data, record_key), record_key)
+
+
+@dataclass
+class JsonSummary:
+    """Sidecar summary of a data file, valid while the file's size and mtime match."""
+
+    record_count: int | None
+    size_bytes: int
+    sha256: str
+    mtime_ns: int
+    record_key: str | None = None
+
+
+def summary_path(filepath: str | Path) -> Path:
+    """Location of a file's sidecar summary (<dir>/.meta/<name>.meta.json)."""
+    filepath = Path(filepath)
+    return filepath.parent / ".meta" / f"{filepath.name}.meta.json"
+
+
+def _record_count(data: Any, record_key: str | None) -> int | None:
+    """Records in data: len() of the keyed or top-level array, 1 for a single object."""
+    if record_key is not None:
+        data = data.get(record_key, []) if isinstance(data, dict) else None
+    if isinstance(data, list):
+        return len(data)
+    return 1 if isinstance(data, dict) else None
+
+
+def write_json_summary(
+    filepath: str | Path, content: bytes, record_count: int | None, record_key: str | None = None
+) -> JsonSummary:
+    """
+    Write the sidecar summary of a file that was just written.
+
+    Sidecars are derived data: they are written without fsync, and readers
+    fall back to the file itself when a sidecar is missing or stale.
+
+    Args:
+        filepath: Data file (already written with content)
+        content: Exact bytes of the data file
+        record_count: Number of records in the file
+        record_key: Key of the counted record array, if any
+
+    Returns:
+        The summary written
+    """
+    filepath = Path(filepath)
+    summary = JsonSummary(
+        record_count=record_count,
+        size_bytes=len(content),
+        sha256=hashlib.sha256(content).hexdigest(),
+        mtime_ns=filepath.stat().st_mtime_ns,
+        record_key=record_key,
+    )
+    content = _dumps_bytes(asdict(summary), compact=True)
+    _write_atomic(summary_path(filepath), content, FsyncPolicy.NONE)
+    return summary
+
+
+def _scan_file(filepath: Path) -> tuple[int, int, str]:
+    """Line count, size and SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    lines = size = 0
+    last = b"\n"
+    with open(filepath, "rb") as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+            lines += chunk.count(b"\n")
+            size += len(chunk)
+            last = chunk[-1:]
+    if last != b"\n":
+        lines += 1
+    return lines, size, digest.hexdigest()
+
+
+def count_lines(filepath: str | Path) -> int:
+    """
+    Count the lines of a text file without loading it.
+
+    Args:
+        filepath: Path to the file
+
+    Returns:
+        Number of lines (a final line without newline counts)
+    """
+    return _scan_file(Path(filepath))[0]
+
+
+def write_file_summary(
+    filepath: str | Path, record_count: int | None = None, header_lines: int = 0
+) -> JsonSummary:
+    """
+    Write the sidecar summary of an existing file of any format (e.g. an extracted CSV).
+
+    Args:
+        filepath: Data file
+        record_count: Number of records (counted as lines minus header_lines if None)
+        header_lines: Lines before the first record when counting lines
+
+    Returns:
+        The summary written
+    """
+    filepath = Path(filepath)
+    lines, size, sha256 = _scan_file(filepath)
+    summary = JsonSummary(
+        record_count=record_count if record_count is not None else max(0, lines - header_lines),
+        size_bytes=size,
+        sha256=sha256,
+        mtime_ns=filepath.stat().st_mtime_ns,
+    )
+    _write_atomic(summary_path(filepath), _dumps_bytes(asdict(summary), compact=True), FsyncPolicy.NONE)
+    return summary
+
+
+def summary_record_count(filepath: str | Path, key: str | None = None) -> int | None:
+    """
+    Record count from a file's sidecar summary only.
+
+    Args:
+        filepath: Data file
+        key: Record array key the count must have been taken from
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False, default=default)
+    Returns:
+        The count, or None without a current sidecar for that key
+    """
+    summary = read_json_summary(filepath)
+    if summary is None or summary.record_key != key:
+        return None
+    return summary.record_count
+
+
+def read_json_summary(filepath: str | Path) -> JsonSummary | None:
+    """
+    Read a file's sidecar summary.
+
+    Args:
+        filepath: Data file
+
+    Returns:
+        The summary, or None if there is none or the file changed since it was written
+    """
+    filepath = Path(filepath)
+    try:
+        stat = filepath.stat()
+        summary = JsonSummary(**read_json(summary_path(filepath)))
+    except (OSError, ValueError, TypeError):
+        return None
+    if summary.size_bytes != stat.st_size or summary.mtime_ns != stat.st_mtime_ns:
+        return None
+    return summary
+
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_NUMBER_DELIMITERS = _WHITESPACE + ",]}"
+
+
+class _JsonStream:
+    """Incremental reader over a text stream, decoding one value at a time."""
+
+    def __init__(self, f: IO[str], chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Drop consumed input and read more; reads double while a value stays incomplete."""
+        if self.eof:
+            return False
+        data = self.f.read(max(self.chunk_size, len(self.buf) - self.pos))
+        if not data:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos :] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ("" at end of input)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume the given structural character."""
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self.buf, self.pos)
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete value."""
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A number cut off by the end of the buffer ("12" of "123", "-0" of "-0.5")
+            # decodes as a shorter number; only accept it once a delimiter follows
+            if (
+                isinstance(obj, int | float)
+                and (end == len(self.buf) or self.buf[end] not in _NUMBER_DELIMITERS)
+                and self.fill()
+            ):
+                continue
+            self.pos = end
+            return obj
+
+
+def iter_json_array(filepath: str | Path, key: str | None = None, chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """
+    Iterate over the elements of a JSON array without parsing the whole file.
+
+    Only one element is decoded at a time (other members of the enclosing
+    object are decoded while skipping over them).
+
+    Args:
+        filepath: Path to the JSON file
+        key: Key of the array in a top-level object (the top level is the array if None)
+        chunk_size: Characters read at a time
+
+    Yields:
+        Each array element, in file order (nothing if the key is absent)
+
+    Raises:
+        json.JSONDecodeError: If the file is malformed or the value is not an array
+    """
+    with open(filepath, encoding="utf-8") as f:
+        stream = _JsonStream(f, chunk_size)
+        if key is not None:
+            stream.expect("{")
+            while True:
+                if stream.peek() == "}":
+                    return
+                member = stream.value()
+                stream.expect(":")
+                if member == key:
+                    break
+                stream.value()
+                if stream.peek() != "}":
+                    stream.expect(",")
+
+        stream.expect("[")
+        if stream.peek() == "]":
+            return
+        while True:
+            yield stream.value()
+            if stream.peek() != ",":
+                stream.expect("]")
+                return
+            stream.pos += 1
+
+
+def count_json_records(filepath: str | Path, key: str | None = None) -> int:
+    """
+    Count the records of a JSON file, from its sidecar summary when available.
+
+    Args:
+        filepath: Path to the JSON file
+        key: Key of the record array in a top-level object (top-level array if None)
+
+    Returns:
+        Number of array elements
+
+    Raises:
+        json.JSONDecodeError: If there is no usable sidecar and the file is malformed
+    """
+    count = summary_record_count(filepath, key)
+    if count is not None:
+        return count
+    return sum(1 for _ in iter_json_array(filepath, key))
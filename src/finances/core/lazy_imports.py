@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Lazy Package Exports
+
+Domain packages re-export their public API from submodules, several of which
+import pandas, numpy, matplotlib or scipy. Importing those eagerly from the
+package __init__ made every `finances` command (even `--help`) pay for the
+whole scientific stack.
+
+lazy_exports() builds PEP 562 module __getattr__/__dir__ functions instead:
+a re-exported name is imported from its submodule on first access, then
+stored on the package so later lookups are plain attribute reads.
+"""
+
+import importlib
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, Iterable[str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build module __getattr__ and __dir__ functions for lazily re-exported names.
+
+    Args:
+        package: Package name (the package's __name__)
+        exports: Dict mapping relative submodule name (e.g. ".loader") to the names it provides
+
+    Returns:
+        Tuple of (__getattr__, __dir__) to assign at package level
+
+    Example:
+        __getattr__, __dir__ = lazy_exports(__name__, {".loader": ["load_orders"]})
+    """
+    module_by_name = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        module = module_by_name.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | module_by_name.keys())
+
+    return __getattr__, __dir__
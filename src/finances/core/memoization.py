@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Node Output Memoization
+
+Input fingerprints for flow nodes, so the engine can skip re-running a node
+whose inputs, code and configuration are unchanged since its last successful
+run (similar to a build system).
+
+A node's fingerprint combines:
+- hashes of each dependency's output directory
+- a hash of the finances package source (its "code version")
+- the node's fingerprint configuration (FlowNode.get_fingerprint_config())
+"""
+
+import hashlib
+import json
+import logging
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from .. import __version__
+from .flow import FlowNode, FlowResult
+
+logger = logging.getLogger(__name__)
+
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent
+
+
+@cache
+def _package_source_hash(package_dir: Path) -> str:
+    """Hash all Python source files under a package directory, recursively."""
+    digest = hashlib.sha256(__version__.encode())
+    for source_file in sorted(package_dir.rglob("*.py")):
+        digest.update(source_file.relative_to(package_dir).as_posix().encode())
+        digest.update(source_file.read_bytes())
+    return digest.hexdigest()
+
+
+def compute_code_version(node: FlowNode) -> str:
+    """
+    Compute a code version for a node from the finances package source.
+
+    Nodes depend on shared code (core/, ynab/loader.py, ...) as well as their
+    own package, so any edit to a module of the finances package produces a
+    new version for every node.
+
+    Args:
+        node: Flow node
+
+    Returns:
+        SHA-256 hex digest
+    """
+    return _package_source_hash(PACKAGE_DIR)
+
+
+def compute_input_fingerprint(node: FlowNode, upstream_hashes: dict[str, str]) -> str:
+    """
+    Compute the input fingerprint for a node.
+
+    Args:
+        node: Flow node
+        upstream_hashes: Output directory hash for each dependency
+
+    Returns:
+        SHA-256 hex digest identifying the node's inputs
+    """
+    payload = {
+        "node": node.name,
+        "code_version": compute_code_version(node),
+        "config": node.get_fingerprint_config(),
+        "upstream": upstream_hashes,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def flow_result_to_dict(result: FlowResult) -> dict[str, Any]:
+    """Serialize a FlowResult for the memo store."""
+    return {
+        "success": result.success,
+        "items_processed": result.items_processed,
+        "new_items": result.new_items,
+        "updated_items": result.updated_items,
+        "outputs": [str(path) for path in result.outputs],
+        "requires_review": result.requires_review,
+        "review_instructions": result.review_instructions,
+        "execution_time_seconds": result.execution_time_seconds,
+        "metadata": result.metadata,
+        "error_message": result.error_message,
+    }
+
+
+def flow_result_from_dict(data: dict[str, Any]) -> FlowResult:
+    """Deserialize a FlowResult from the memo store."""
+    return FlowResult(
+        success=data["success"],
+        items_processed=data.get("items_processed", 0),
+        new_items=data.get("new_items", 0),
+        updated_items=data.get("updated_items", 0),
+        outputs=[Path(path) for path in data.get("outputs", [])],
+        requires_review=data.get("requires_review", False),
+        review_instructions=data.get("review_instructions"),
+        execution_time_seconds=data.get("execution_time_seconds"),
+        metadata=dict(data.get("metadata", {})),
+        error_message=data.get("error_message"),
+    )
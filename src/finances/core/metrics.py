@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Execution Metrics
+
+Lightweight wall/CPU/memory/I/O measurement for flow node execution phases,
+plus an append-only JSONL log for tracking performance across runs.
+
+Memory uses the process peak RSS high-water mark from `resource`, so the
+recorded value is how much the peak grew during the measured block. I/O byte
+counts come from /proc/self/io on Linux and fall back to block counts from
+`resource` elsewhere.
+"""
+
+import json
+import logging
+import resource
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+PROC_IO_PATH = Path("/proc/self/io")
+RUN_METRICS_FILENAME = "run_metrics.jsonl"
+
+
+@dataclass
+class ResourceUsage:
+    """Resources consumed by a measured block of work."""
+
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_rss_delta_bytes: int = 0
+    read_bytes: int = 0
+    write_bytes: int = 0
+
+    def __add__(self, other: "ResourceUsage") -> "ResourceUsage":
+        return ResourceUsage(
+            wall_seconds=self.wall_seconds + other.wall_seconds,
+            cpu_seconds=self.cpu_seconds + other.cpu_seconds,
+            peak_rss_delta_bytes=self.peak_rss_delta_bytes + other.peak_rss_delta_bytes,
+            read_bytes=self.read_bytes + other.read_bytes,
+            write_bytes=self.write_bytes + other.write_bytes,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return asdict(self)
+
+    def format(self) -> str:
+        """Format as a compact human-readable string."""
+        return (
+            f"{self.wall_seconds:.2f}s wall, {self.cpu_seconds:.2f}s cpu, "
+            f"+{_format_bytes(self.peak_rss_delta_bytes)} peak RSS, "
+            f"{_format_bytes(self.read_bytes)} read, {_format_bytes(self.write_bytes)} written"
+        )
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    wall: float
+    cpu: float
+    max_rss_bytes: int
+    read_bytes: int
+    write_bytes: int
+
+
+def _format_bytes(num_bytes: int) -> str:
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB"):
+        if abs(size) < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
+
+
+def _read_io_counters() -> tuple[int, int]:
+    """Return (read_bytes, write_bytes) for this process."""
+    try:
+        counters = {}
+        for line in PROC_IO_PATH.read_text().splitlines():
+            key, _, value = line.partition(":")
+            counters[key.strip()] = int(value)
+        return counters.get("read_bytes", 0), counters.get("write_bytes", 0)
+    except (OSError, ValueError):
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return usage.ru_inblock * 512, usage.ru_oublock * 512
+
+
+def _take_snapshot() -> _Snapshot:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is kilobytes on Linux, bytes on macOS
+    max_rss_bytes = max_rss if sys.platform == "darwin" else max_rss * 1024
+    read_bytes, write_bytes = _read_io_counters()
+    return _Snapshot(
+        wall=time.perf_counter(),
+        cpu=time.process_time(),
+        max_rss_bytes=max_rss_bytes,
+        read_bytes=read_bytes,
+        write_bytes=write_bytes,
+    )
+
+
+@contextmanager
+def measure_resources() -> Iterator[ResourceUsage]:
+    """
+    Measure resources used by the enclosed block.
+
+    The yielded ResourceUsage is filled in when the block exits (including
+    on exceptions).
+
+    Example:
+        with measure_resources() as usage:
+            do_work()
+        print(usage.wall_seconds)
+    """
+    usage = ResourceUsage()
+    start = _take_snapshot()
+    try:
+        yield usage
+    finally:
+        end = _take_snapshot()
+        usage.wall_seconds = end.wall - start.wall
+        usage.cpu_seconds = end.cpu - start.cpu
+        usage.peak_rss_delta_bytes = max(0, end.max_rss_bytes - start.max_rss_bytes)
+        usage.read_bytes = max(0, end.read_bytes - start.read_bytes)
+        usage.write_bytes = max(0, end.write_bytes - start.write_bytes)
+
+
+def append_run_metrics(log_path: Path, record: dict[str, Any]) -> None:
+    """
+    Append one run record as a JSON line to the run-metrics log.
+
+    Failures are logged and swallowed; metrics must never break a flow run.
+
+    Args:
+        log_path: Path to the JSONL log file
+        record: JSON-serializable run record
+    """
+    try:
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, default=str) + "\n")
+    except OSError as e:
+        logger.warning(f"Failed to append run metrics to {log_path}: {e}")
@@ -4,6 +4,10 @@ Money Primitive Type
 
 Immutable currency value wrapper that uses integer cents internally.
 Prevents floating-point errors and provides type-safe currency operations.
+
+Money is slotted: a run creates hundreds of thousands of them (one or more per
+transaction, item and receipt, plus every intermediate sum), and without
+slots each one carries its own attribute dict.
 """
 
 from dataclasses import dataclass
@@ -15,7 +19,7 @@ from .currency import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Money:
     """
     Immutable money value in cents (USD).
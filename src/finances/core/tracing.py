@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Tracing Spans
+
+Lightweight hierarchical timing spans for profiling flow runs.
+
+Spans are no-ops unless a Tracer has been started with start_tracing(), so
+hot functions can be instrumented permanently. Recorded spans are exported
+as Chrome trace-event JSON, which loads in chrome://tracing, Perfetto and
+speedscope.
+"""
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Tracer:
+    """Collects completed spans as Chrome trace events."""
+
+    def __init__(self) -> None:
+        """Initialize an empty tracer anchored at the current time."""
+        self._origin_ns = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        self.events: list[dict[str, Any]] = []
+
+    def record(self, name: str, category: str, start_ns: int, end_ns: int, args: dict[str, Any]) -> None:
+        """
+        Record one completed span.
+
+        Args:
+            name: Span name
+            category: Span category (e.g. "node", "phase", "function")
+            start_ns: perf_counter_ns() at span start
+            end_ns: perf_counter_ns() at span end
+            args: Extra attributes shown in the trace viewer
+        """
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start_ns - self._origin_ns) / 1000,
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+
+    def write_chrome_trace(self, output_file: Path) -> Path:
+        """
+        Write recorded spans as Chrome trace-event JSON.
+
+        Args:
+            output_file: Destination file path
+
+        Returns:
+            Path to the written file
+        """
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            events = sorted(self.events, key=lambda e: e["ts"])
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, default=str)
+        return output_file
+
+
+_active_tracer: Tracer | None = None
+
+
+def start_tracing() -> Tracer:
+    """Start recording spans process-wide and return the active tracer."""
+    global _active_tracer
+    _active_tracer = Tracer()
+    return _active_tracer
+
+
+def stop_tracing() -> Tracer | None:
+    """Stop recording spans and return the tracer that was active (if any)."""
+    global _active_tracer
+    tracer, _active_tracer = _active_tracer, None
+    return tracer
+
+
+def is_tracing() -> bool:
+    """Check whether spans are currently being recorded."""
+    return _active_tracer is not None
+
+
+def record_span(name: str, category: str, start_ns: int, end_ns: int, **args: Any) -> None:
+    """
+    Record an already-timed span when tracing is active.
+
+    Useful when a span's extent does not map onto a single `with` block.
+
+    Args:
+        name: Span name
+        category: Span category
+        start_ns: perf_counter_ns() at span start
+        end_ns: perf_counter_ns() at span end
+        **args: Extra attributes attached to the span
+    """
+    tracer = _active_tracer
+    if tracer is not None:
+        tracer.record(name, category, start_ns, end_ns, args)
+
+
+@contextmanager
+def span(name: str, category: str = "function", **args: Any) -> Iterator[None]:
+    """
+    Record the enclosed block as a span when tracing is active.
+
+    Args:
+        name: Span name
+        category: Span category
+        **args: Extra attributes attached to the span
+    """
+    tracer = _active_tracer
+    if tracer is None:
+        yield
+        return
+
+    start_ns = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        tracer.record(name, category, start_ns, time.perf_counter_ns(), args)
+
+
+def traced(name: str | None = None, category: str = "function") -> Callable[[F], F]:
+    """
+    Decorate a function so each call is recorded as a span when tracing is active.
+
+    Args:
+        name: Span name (defaults to the function's qualified name)
+        category: Span category
+    """
+
+    def decorator(func: F) -> F:
+        span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            tracer = _active_tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            start_ns = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                tracer.record(span_name, category, start_ns, time.perf_counter_ns(), {})
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
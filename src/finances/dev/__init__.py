@@ -0,0 +1,15 @@
+"""
+Developer Tools Package
+
+Tooling for developing and load testing the finances system, used by the
+`finances dev` commands:
+
+- generate_dataset: Write a complete, cross-referenced synthetic data/ tree
+  (YNAB cache, Amazon order history, Apple receipt emails) at any volume
+
+Nothing here touches real financial data.
+"""
+
+from .dataset import DatasetSpec, DatasetSummary, generate_dataset
+
+__all__ = ["DatasetSpec", "DatasetSummary", "generate_dataset"]
@@ -0,0 +1,672 @@
+#!/usr/bin/env python3
+"""
+Synthetic Dataset Generator
+
+Writes a complete data/ tree for load testing the whole flow:
+
+- ynab/cache/{accounts,categories,transactions}.json, including split,
+  transfer and deleted transactions
+- amazon/raw/amazon_orders_<account>.zip for each Amazon account, plus its
+  extracted <date>_<account>_amazon_data/ Retail.OrderHistory CSV
+- apple/emails/*-formatted-simple.html receipts in both the table (2020-era)
+  and modern (2025+) formats, each with its raw .eml
+
+Every Amazon shipment and Apple receipt is charged by a YNAB transaction on
+the same day or a few days later, so the matchers find real matches.
+
+Output is streamed: days are generated in order, records are written as soon
+as they exist, and only charges due in the next few days are held in memory,
+so memory use stays flat for gigabyte-scale datasets. The same spec (seed
+included) always produces byte-identical data files.
+"""
+
+import csv
+import hashlib
+import heapq
+import html
+import json
+import random
+import shutil
+import zipfile
+from collections.abc import Callable
+from contextlib import ExitStack
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import IO, Any
+
+from ..core.currency import cents_to_dollars_str
+from ..core.json_utils import write_file_summary
+
+# Daily volume at scale 1; scale multiplies every rate
+TRANSACTIONS_PER_ACCOUNT_PER_DAY = 1.3
+AMAZON_ORDERS_PER_ACCOUNT_PER_DAY = 0.2
+APPLE_RECEIPTS_PER_DAY = 0.2
+
+# Share of everyday transactions that are transfers, splits or deleted
+TRANSFER_RATE = 0.02
+SPLIT_RATE = 0.05
+DELETED_RATE = 0.01
+
+# Share of multi-item Amazon orders shipped (and charged) as two shipments
+MULTI_SHIPMENT_RATE = 0.15
+
+# Share of Apple receipts in the modern (2025+) format; the rest use the table format
+MODERN_RECEIPT_RATE = 0.5
+
+TAX_PERCENT = 8
+
+AMAZON_ACCOUNTS = ("karl", "erica")
+AMAZON_PAYEES = ("Amazon.com", "AMZN Mktp US")
+APPLE_PAYEE = "Apple.com/bill"
+APPLE_ID = "family@example.com"
+
+ACCOUNT_TYPES = (("checking", "Checking"), ("creditCard", "Credit Card"), ("savings", "Savings"))
+CLEARED_STATES = ("cleared", "cleared", "reconciled", "uncleared")
+
+PAYEES = (
+    "Generic Grocery Store",
+    "Test Gas Station",
+    "Sample Coffee Shop",
+    "Mock Restaurant",
+    "Example Pharmacy",
+    "Demo Hardware Store",
+    "Sample Utility Co",
+)
+SPLIT_PAYEES = ("Warehouse Club", "Example Superstore")
+
+CATEGORY_GROUPS = {
+    "Everyday": ("Groceries", "Dining Out", "Household", "Transportation"),
+    "Home": ("Home Improvement", "Utilities", "Furnishings"),
+    "Fun": ("Entertainment", "Hobbies", "Subscriptions"),
+    "Health": ("Healthcare", "Pharmacy"),
+}
+
+AMAZON_PRODUCTS = (
+    "Wireless Mouse",
+    "USB-C Cable 6ft - 2 Pack",
+    "Phone Case",
+    "Book: Example Title",
+    "Kitchen Gadget",
+    "Office Supplies Bundle",
+    "Electronics Accessory",
+    "Paper Towels, 12 Rolls",
+    "Dog Treats",
+    "LED Light Bulbs, 4 Pack",
+)
+AMAZON_ITEMS_PER_ORDER = (1, 1, 1, 2, 2, 3, 5)
+AMAZON_QUANTITIES = (1, 1, 1, 2)
+
+# (title, cost in cents, subscription)
+APPLE_PRODUCTS = (
+    ("Test App Pro", 999, False),
+    ("Example Game", 499, False),
+    ("Mock Photo Editor", 2999, False),
+    ("Sample Cloud Storage", 299, True),
+    ("Demo Music (Monthly)", 1099, True),
+    ("Example Weather", 1499, True),
+    ("Sample Fitness+", 999, True),
+)
+APPLE_ITEMS_PER_RECEIPT = (1, 1, 1, 2, 3)
+
+# Columns of the real Retail.OrderHistory export
+AMAZON_ORDER_HISTORY_FIELDS = (
+    "Website",
+    "Order ID",
+    "Order Date",
+    "Purchase Order Number",
+    "Currency",
+    "Unit Price",
+    "Unit Price Tax",
+    "Shipping Charge",
+    "Total Discounts",
+    "Total Owed",
+    "Shipment Item Subtotal",
+    "Shipment Item Subtotal Tax",
+    "ASIN",
+    "Product Condition",
+    "Quantity",
+    "Payment Instrument Type",
+    "Order Status",
+    "Shipment Status",
+    "Ship Date",
+    "Shipping Option",
+    "Shipping Address",
+    "Billing Address",
+    "Carrier Name & Tracking Number",
+    "Product Name",
+    "Gift Message",
+    "Gift Sender Name",
+    "Gift Recipient Contact Details",
+    "Item Serial Number",
+)
+AMAZON_CSV_NAME = "Retail.OrderHistory.1/Retail.OrderHistory.1.csv"
+AMAZON_ADDRESS = "Synthetic Household 1 Example St Springfield IL 62701 United States"
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """
+    What generate_dataset() writes.
+
+    Volume is proportional to years * scale (and to accounts, for everyday
+    YNAB transactions); scale may be fractional.
+    """
+
+    years: int = 3
+    accounts: int = 3  # YNAB budget accounts
+    scale: float = 1.0
+    seed: int = 0
+    end_date: date = date(2024, 12, 31)
+
+    @property
+    def start_date(self) -> date:
+        """First day of generated activity."""
+        return self.end_date - timedelta(days=365 * self.years - 1)
+
+    @property
+    def days(self) -> int:
+        """Number of days of generated activity."""
+        return (self.end_date - self.start_date).days + 1
+
+
+@dataclass
+class DatasetSummary:
+    """What generate_dataset() wrote."""
+
+    transactions: int = 0
+    split_transactions: int = 0
+    transfers: int = 0  # Pairs of linked transactions
+    deleted_transactions: int = 0
+    amazon_orders: int = 0
+    amazon_items: int = 0
+    apple_receipts: int = 0
+    files: int = 0
+    bytes_written: int = 0
+
+
+def generate_dataset(
+    data_dir: Path, spec: DatasetSpec, progress: Callable[[int], None] | None = None
+) -> DatasetSummary:
+    """
+    Write a synthetic data/ tree.
+
+    Args:
+        data_dir: Data directory to populate (existing files of the same names are overwritten)
+        spec: What to generate
+        progress: Called with 1 after each generated day (e.g. a progress bar's update)
+
+    Returns:
+        DatasetSummary of the records and files written
+
+    Raises:
+        ValueError: If years, accounts or scale is not positive
+    """
+    if spec.years < 1 or spec.accounts < 1 or spec.scale <= 0:
+        raise ValueError(f"years, accounts and scale must be positive: {spec}")
+    return _DatasetWriter(data_dir, spec).write(progress)
+
+
+class _DatasetWriter:
+    """Generates one dataset day by day, writing records as they are produced."""
+
+    def __init__(self, data_dir: Path, spec: DatasetSpec):
+        self.data_dir = data_dir
+        self.spec = spec
+        self.rng = random.Random(spec.seed)  # noqa: S311  (synthetic data)
+        self.summary = DatasetSummary()
+
+        self.accounts = self._accounts()
+        self.card_accounts = [a for a in self.accounts if a["type"] == "creditCard"] or self.accounts
+        self.category_groups = self._category_groups()
+        self.categories = [c for group in self.category_groups for c in group["categories"]]
+
+        # Charges not yet due: (date, sequence, transaction) so the output stays in date order
+        self.pending: list[tuple[str, int, dict[str, Any]]] = []
+        self.transaction_count = 0
+        self.transactions_out: IO[bytes]
+        self.order_writers: dict[str, Any] = {}
+
+    def write(self, progress: Callable[[int], None] | None) -> DatasetSummary:
+        """Generate every day of the spec and write all files."""
+        cache_dir = self.data_dir / "ynab" / "cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._write_text(
+            cache_dir / "accounts.json",
+            json.dumps({"accounts": self.accounts, "server_knowledge": 1}, indent=2),
+        )
+        self._write_text(
+            cache_dir / "categories.json",
+            json.dumps({"category_groups": self.category_groups, "server_knowledge": 1}, indent=2),
+        )
+        (self.data_dir / "apple" / "emails").mkdir(parents=True, exist_ok=True)
+
+        transactions_file = cache_dir / "transactions.json"
+        csv_files = {
+            account: self.data_dir
+            / "amazon"
+            / "raw"
+            / f"{self.spec.end_date.isoformat()}_{account}_amazon_data"
+            / AMAZON_CSV_NAME
+            for account in AMAZON_ACCOUNTS
+        }
+        with ExitStack() as stack:
+            self.transactions_out = stack.enter_context(open(transactions_file, "wb", buffering=1 << 20))
+            self.transactions_out.write(b"[")
+            for account, csv_file in csv_files.items():
+                csv_file.parent.mkdir(parents=True, exist_ok=True)
+                f = stack.enter_context(open(csv_file, "w", newline="", encoding="utf-8", buffering=1 << 20))
+                self.order_writers[account] = csv.writer(f, quoting=csv.QUOTE_ALL)
+                self.order_writers[account].writerow(AMAZON_ORDER_HISTORY_FIELDS)
+
+            for offset in range(self.spec.days):
+                day = self.spec.start_date + timedelta(days=offset)
+                self._everyday_transactions(day)
+                for index, account in enumerate(AMAZON_ACCOUNTS):
+                    for _ in range(self._count(AMAZON_ORDERS_PER_ACCOUNT_PER_DAY)):
+                        self._amazon_order(day, account, index)
+                for _ in range(self._count(APPLE_RECEIPTS_PER_DAY)):
+                    self._apple_receipt(day)
+                self._flush_charges(day.isoformat())
+                if progress is not None:
+                    progress(1)
+
+            # Charges for the last days' orders land just after the end date
+            self._flush_charges(None)
+            self.transactions_out.write(b"]\n")
+
+        self._finish_file(transactions_file, self.summary.transactions)
+        for account, csv_file in csv_files.items():
+            self._finish_file(csv_file, None, header_lines=1)
+            self._write_order_history_zip(account, csv_file)
+        return self.summary
+
+    # YNAB budget structure
+
+    def _accounts(self) -> list[dict[str, Any]]:
+        """Budget accounts, cycling through checking, credit card and savings."""
+        accounts = []
+        for number in range(1, self.spec.accounts + 1):
+            account_type, label = ACCOUNT_TYPES[(number - 1) % len(ACCOUNT_TYPES)]
+            balance = self.rng.randint(100_000, 5_000_000)
+            accounts.append(
+                {
+                    "id": f"account-{number:03d}",
+                    "name": f"{label} {number}",
+                    "type": account_type,
+                    "on_budget": True,
+                    "closed": False,
+                    "balance": balance,
+                    "cleared_balance": balance,
+                    "uncleared_balance": 0,
+                    "transfer_payee_id": f"payee-transfer-{number:03d}",
+                    "deleted": False,
+                }
+            )
+        return accounts
+
+    def _category_groups(self) -> list[dict[str, Any]]:
+        """Category groups with their categories."""
+        groups = []
+        for group_number, (group_name, names) in enumerate(CATEGORY_GROUPS.items(), 1):
+            group_id = f"group-{group_number:03d}"
+            categories = [
+                {
+                    "id": f"category-{group_number:03d}-{number:02d}",
+                    "category_group_id": group_id,
+                    "category_group_name": group_name,
+                    "name": name,
+                    "hidden": False,
+                    "deleted": False,
+                    "budgeted": self.rng.randint(50_000, 500_000),
+                    "activity": -self.rng.randint(50_000, 500_000),
+                    "balance": self.rng.randint(0, 100_000),
+                }
+                for number, name in enumerate(names, 1)
+            ]
+            groups.append(
+                {
+                    "id": group_id,
+                    "name": group_name,
+                    "hidden": False,
+                    "deleted": False,
+                    "categories": categories,
+                }
+            )
+        return groups
+
+    # Record generation
+
+    def _count(self, rate: float) -> int:
+        """Events today for a daily rate at the spec's scale (fractions become probabilities)."""
+        expected = rate * self.spec.scale
+        count = int(expected)
+        if self.rng.random() < expected - count:
+            count += 1
+        return count
+
+    def _transaction(
+        self,
+        day: date,
+        account: dict[str, Any],
+        amount_cents: int,
+        payee: str | None,
+        category: dict[str, Any] | None,
+        **fields: Any,
+    ) -> dict[str, Any]:
+        """A transaction dict as in the YNAB API (amount in milliunits)."""
+        self.transaction_count += 1
+        transaction = {
+            "id": f"tx-{self.transaction_count:010d}",
+            "date": day.isoformat(),
+            "amount": amount_cents * 10,
+            "memo": None,
+            "cleared": self.rng.choice(CLEARED_STATES),
+            "approved": True,
+            "account_id": account["id"],
+            "account_name": account["name"],
+            "payee_name": payee,
+            "category_id": category["id"] if category else None,
+            "category_name": category["name"] if category else None,
+            "transfer_account_id": None,
+            "transfer_transaction_id": None,
+            "deleted": False,
+            "subtransactions": [],
+        }
+        transaction.update(fields)
+        return transaction
+
+    def _everyday_transactions(self, day: date) -> None:
+        """Purchases, transfers and splits in each budget account."""
+        rng = self.rng
+        for account in self.accounts:
+            for _ in range(self._count(TRANSACTIONS_PER_ACCOUNT_PER_DAY)):
+                roll = rng.random()
+                if roll < TRANSFER_RATE and len(self.accounts) > 1:
+                    self._transfer(day, account)
+                elif roll < TRANSFER_RATE + SPLIT_RATE:
+                    self._split(day, account)
+                else:
+                    deleted = rng.random() < DELETED_RATE
+                    self.summary.deleted_transactions += deleted
+                    self._emit(
+                        self._transaction(
+                            day,
+                            account,
+                            -rng.randint(100, 15_000),
+                            rng.choice(PAYEES),
+                            rng.choice(self.categories),
+                            deleted=deleted,
+                        )
+                    )
+
+    def _transfer(self, day: date, account: dict[str, Any]) -> None:
+        """A linked pair of transactions moving money between two accounts."""
+        other = self.rng.choice([a for a in self.accounts if a is not account])
+        amount = self.rng.randint(10_000, 500_000)
+        outflow = self._transaction(
+            day, account, -amount, f"Transfer : {other['name']}", None, transfer_account_id=other["id"]
+        )
+        inflow = self._transaction(
+            day, other, amount, f"Transfer : {account['name']}", None, transfer_account_id=account["id"]
+        )
+        outflow["transfer_transaction_id"] = inflow["id"]
+        inflow["transfer_transaction_id"] = outflow["id"]
+        self._emit(outflow)
+        self._emit(inflow)
+        self.summary.transfers += 1
+
+    def _split(self, day: date, account: dict[str, Any]) -> None:
+        """A purchase split across several categories."""
+        amounts = [-self.rng.randint(500, 8_000) for _ in range(self.rng.randint(2, 4))]
+        transaction = self._transaction(
+            day, account, sum(amounts), self.rng.choice(SPLIT_PAYEES), None, category_name="Split"
+        )
+        for number, amount in enumerate(amounts):
+            category = self.rng.choice(self.categories)
+            transaction["subtransactions"].append(
+                {
+                    "id": f"{transaction['id']}-{number}",
+                    "transaction_id": transaction["id"],
+                    "amount": amount * 10,
+                    "memo": None,
+                    "payee_id": None,
+                    "payee_name": None,
+                    "category_id": category["id"],
+                    "category_name": category["name"],
+                    "transfer_account_id": None,
+                    "transfer_transaction_id": None,
+                    "deleted": False,
+                }
+            )
+        self._emit(transaction)
+        self.summary.split_transactions += 1
+
+    def _amazon_order(self, day: date, account: str, account_index: int) -> None:
+        """Order history rows for one order, and the card charge for each shipment."""
+        rng = self.rng
+        self.summary.amazon_orders += 1
+        order_id = f"{111 + account_index}-{self.summary.amazon_orders:07d}-{rng.randrange(10**7):07d}"
+        order_time = (
+            f"{day.isoformat()}T{rng.randrange(24):02d}:{rng.randrange(60):02d}:{rng.randrange(60):02d}Z"
+        )
+        items = [
+            (rng.choice(AMAZON_PRODUCTS), rng.choice(AMAZON_QUANTITIES), rng.randint(299, 8_999))
+            for _ in range(rng.choice(AMAZON_ITEMS_PER_ORDER))
+        ]
+        if len(items) > 1 and rng.random() < MULTI_SHIPMENT_RATE:
+            cut = rng.randint(1, len(items) - 1)
+            shipments = [items[:cut], items[cut:]]
+        else:
+            shipments = [items]
+
+        writer = self.order_writers[account]
+        for shipment in shipments:
+            ship_day = day + timedelta(days=rng.randint(0, 3))
+            ship_time = f"{ship_day.isoformat()}T{rng.randrange(24):02d}:{rng.randrange(60):02d}:00Z"
+            tracking = f"AMZN_US(TBA{rng.randrange(10**12):012d})"
+            shipment_cents = 0
+            for product, quantity, unit_cents in shipment:
+                subtotal = unit_cents * quantity
+                tax = subtotal * TAX_PERCENT // 100
+                shipment_cents += subtotal + tax
+                writer.writerow(
+                    (
+                        "Amazon.com",
+                        order_id,
+                        order_time,
+                        "Not Applicable",
+                        "USD",
+                        cents_to_dollars_str(unit_cents),
+                        cents_to_dollars_str(unit_cents * TAX_PERCENT // 100),
+                        "0",
+                        "0",
+                        cents_to_dollars_str(subtotal + tax),
+                        cents_to_dollars_str(subtotal),
+                        cents_to_dollars_str(tax),
+                        f"B0{rng.randrange(10**8):08d}",
+                        "New",
+                        quantity,
+                        "Visa - 1234",
+                        "Closed",
+                        "Shipped",
+                        ship_time,
+                        "standard",
+                        AMAZON_ADDRESS,
+                        AMAZON_ADDRESS,
+                        tracking,
+                        product,
+                        "Not Available",
+                        "Not Available",
+                        "Not Available",
+                        "Not Available",
+                    )
+                )
+                self.summary.amazon_items += 1
+            self._charge(
+                ship_day + timedelta(days=rng.randint(0, 2)), -shipment_cents, rng.choice(AMAZON_PAYEES)
+            )
+
+    def _apple_receipt(self, day: date) -> None:
+        """An Apple receipt email (HTML and .eml), and its card charge."""
+        rng = self.rng
+        self.summary.apple_receipts += 1
+        order_id = f"MS{self.summary.apple_receipts:08X}"
+        document_number = f"{rng.randrange(10**12):012d}"
+        items = rng.sample(APPLE_PRODUCTS, rng.choice(APPLE_ITEMS_PER_RECEIPT))
+        subtotal = sum(cost for _, cost, _ in items)
+        tax = subtotal * TAX_PERCENT // 100
+        total = subtotal + tax
+        sent = f"{rng.randrange(24):02d}{rng.randrange(60):02d}{rng.randrange(60):02d}"
+
+        receipt = _ReceiptFields(day, order_id, document_number, items, subtotal, tax, total)
+        content = (
+            _modern_receipt_html(receipt)
+            if rng.random() < MODERN_RECEIPT_RATE
+            else _table_receipt_html(receipt)
+        )
+
+        message_hash = hashlib.sha256(order_id.encode()).hexdigest()[:8]
+        base_name = f"{day:%Y%m%d}_{sent}_Your_receipt_from_Apple._{message_hash}"
+        emails_dir = self.data_dir / "apple" / "emails"
+        self._write_text(emails_dir / f"{base_name}-formatted-simple.html", content)
+        self._write_text(
+            emails_dir / f"{base_name}.eml",
+            f"From: Apple <no_reply@email.apple.com>\nTo: {APPLE_ID}\nSubject: Your receipt from Apple.\n"
+            f"Date: {day:%a, %d %b %Y} {sent[:2]}:{sent[2:4]}:{sent[4:]} +0000\n"
+            f"Message-ID: <{message_hash}.{order_id}@email.apple.com>\n"
+            f"Content-Type: text/html; charset=utf-8\n\n{content}",
+        )
+
+        self._charge(day + timedelta(days=rng.randint(0, 1)), -total, APPLE_PAYEE)
+
+    def _charge(self, day: date, amount_cents: int, payee: str) -> None:
+        """Queue an uncategorized card charge for its (possibly later) date."""
+        account = self.rng.choice(self.card_accounts)
+        transaction = self._transaction(day, account, amount_cents, payee, None)
+        heapq.heappush(self.pending, (transaction["date"], self.transaction_count, transaction))
+
+    # Output
+
+    def _flush_charges(self, through: str | None) -> None:
+        """Write queued charges dated on or before `through` (all of them if None)."""
+        while self.pending and (through is None or self.pending[0][0] <= through):
+            self._emit(heapq.heappop(self.pending)[2])
+
+    def _emit(self, transaction: dict[str, Any]) -> None:
+        """Append a transaction to the streamed transactions.json array."""
+        if self.summary.transactions:
+            self.transactions_out.write(b",")
+        self.transactions_out.write(json.dumps(transaction, separators=(",", ":")).encode())
+        self.summary.transactions += 1
+
+    def _write_text(self, path: Path, content: str) -> None:
+        """Write a whole small file."""
+        data = content.encode()
+        path.write_bytes(data)
+        self.summary.files += 1
+        self.summary.bytes_written += len(data)
+
+    def _finish_file(self, path: Path, record_count: int | None, header_lines: int = 0) -> None:
+        """Account for a streamed file and write its sidecar summary (as the flow's writers do)."""
+        summary = write_file_summary(path, record_count, header_lines=header_lines)
+        self.summary.files += 1
+        self.summary.bytes_written += summary.size_bytes
+
+    def _write_order_history_zip(self, account: str, csv_file: Path) -> None:
+        """Package an account's order history as the ZIP Amazon's data request delivers."""
+        zip_file = self.data_dir / "amazon" / "raw" / f"amazon_orders_{account}.zip"
+        # Fixed timestamps keep the archive byte-identical across runs
+        timestamp = (self.spec.end_date.year, self.spec.end_date.month, self.spec.end_date.day, 0, 0, 0)
+        metadata = {
+            "report_type": "order_history",
+            "account_name": account,
+            "export_date": self.spec.end_date.isoformat(),
+            "format_version": "2024",
+        }
+        with zipfile.ZipFile(zip_file, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+            info = zipfile.ZipInfo(AMAZON_CSV_NAME, timestamp)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with open(csv_file, "rb") as src, archive.open(info, "w", force_zip64=True) as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+            archive.writestr(
+                zipfile.ZipInfo("metadata.json", timestamp), json.dumps(metadata, indent=2) + "\n"
+            )
+        self.summary.files += 1
+        self.summary.bytes_written += zip_file.stat().st_size
+
+
+@dataclass
+class _ReceiptFields:
+    """Values rendered into an Apple receipt email."""
+
+    day: date
+    order_id: str
+    document_number: str
+    items: list[tuple[str, int, bool]]
+    subtotal: int
+    tax: int
+    total: int
+
+
+def _dollars(cents: int) -> str:
+    """Cents as a receipt amount ("$12.34")."""
+    return f"${cents_to_dollars_str(cents)}"
+
+
+def _renewal_note(receipt: _ReceiptFields, subscription: bool) -> str:
+    """Renewal line shown under subscription items (empty for purchases)."""
+    renews = receipt.day + timedelta(days=30)
+    return f"Renews {renews:%B} {renews.day}, {renews.year}" if subscription else ""
+
+
+def _table_receipt_html(receipt: _ReceiptFields) -> str:
+    """Receipt in the table format (.aapl-* classes, uppercase labels)."""
+    rows = "".join(
+        f'<tr><td class="item-cell"><span class="title">{html.escape(title)}</span><br/>'
+        f'<span class="renewal">{_renewal_note(receipt, subscription)}</span></td>'
+        f'<td class="price-cell"><span>{_dollars(cost)}</span></td></tr>\n'
+        for title, cost, subscription in receipt.items
+    )
+    return (
+        '<html lang="en-US"><head><title>Apple Receipt</title></head><body>\n'
+        '<table class="aapl-desktop-tbl">\n'
+        f"<tr><td><span>APPLE ID</span><br/>{APPLE_ID}</td>"
+        "<td><span>BILLED TO</span><br/>Visa .... 1234</td></tr>\n"
+        f"<tr><td><span>DATE</span><br/><span>{receipt.day:%b %d, %Y}</span></td></tr>\n"
+        f"<tr><td><span>ORDER ID</span><br/><span>{receipt.order_id}</span></td>"
+        f"<td><span>DOCUMENT NO.</span><br/><span>{receipt.document_number}</span></td></tr>\n"
+        "</table>\n"
+        f'<table class="aapl-desktop-tbl">\n{rows}</table>\n'
+        '<table class="aapl-desktop-tbl">\n'
+        f"<tr><td>Subtotal</td><td></td><td>{_dollars(receipt.subtotal)}</td></tr>\n"
+        f"<tr><td>Tax</td><td></td><td>{_dollars(receipt.tax)}</td></tr>\n"
+        f"<tr><td>TOTAL</td><td></td><td>{_dollars(receipt.total)}</td></tr>\n"
+        "</table>\n</body></html>\n"
+    )
+
+
+def _modern_receipt_html(receipt: _ReceiptFields) -> str:
+    """Receipt in the modern format (CSS-in-JS .custom-* classes, label/value paragraphs)."""
+    rows = "".join(
+        f'<tr class="subscription-lockup"><td><p class="custom-gzadzy">{html.escape(title)}</p>'
+        f'<p class="custom-wogfc8">{_renewal_note(receipt, subscription)}</p></td>'
+        f'<td><p class="custom-137u684">{_dollars(cost)}</p></td></tr>\n'
+        for title, cost, subscription in receipt.items
+    )
+    return (
+        '<html lang="en-US"><head><title>Your receipt from Apple.</title></head><body>\n'
+        '<div class="custom-1k0q3kp">\n'
+        '<p class="custom-1lrbu2k">Receipt</p>\n'
+        f'<p class="custom-18w16cf">{receipt.day:%B} {receipt.day.day}, {receipt.day.year}</p>\n'
+        f'<div><p class="custom-f41j3e">Apple Account:</p><p class="custom-zresjj">{APPLE_ID}</p></div>\n'
+        f'<div><p class="custom-f41j3e">Order ID:</p><p class="custom-zresjj">{receipt.order_id}</p></div>\n'
+        f'<div><p class="custom-f41j3e">Document:</p><p class="custom-zresjj">{receipt.document_number}</p></div>\n'
+        f"<table>\n{rows}</table>\n"
+        '<div class="custom-1s7arqf payment-information">\n'
+        '<div class="custom-vp2c9c subtotal-group">'
+        f"<p>Subtotal</p><div><p>{_dollars(receipt.subtotal)}</p></div>"
+        f"<p>Tax</p><div><p>{_dollars(receipt.tax)}</p></div></div>\n"
+        f"<hr/><p>Visa .... 1234</p><div><p>{_dollars(receipt.total)}</p></div>\n"
+        "</div>\n</div>\n</body></html>\n"
+    )
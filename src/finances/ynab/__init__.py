@@ -25,48 +25,103 @@ Safety Features:
 - Manual review workflow for complex cases
 """
 
-from .loader import (
-    filter_transactions_by_payee,
-    load_accounts,
-    load_categories,
-    load_category_groups,
-    load_transactions,
-)
-from .models import (
-    SplitEditBatch,
-    TransactionSplitEdit,
-    YnabAccount,
-    YnabCategory,
-    YnabCategoryGroup,
-    YnabSplit,
-    YnabSubtransaction,
-    YnabTransaction,
-)
-from .retirement import (
-    RetirementAccount,
-    YnabRetirementService,
-    discover_retirement_accounts,
-    generate_retirement_edits,
-)
-from .split_calculator import (
-    SplitCalculationError,
-    calculate_amazon_splits,
-    calculate_apple_splits,
-    calculate_generic_splits,
-    create_split_summary,
-    sort_splits_for_stability,
-    validate_split_calculation,
+from typing import TYPE_CHECKING
+
+from ..core.lazy_imports import lazy_exports
+
+# Exports are imported from their submodules on first access (see core.lazy_imports)
+if TYPE_CHECKING:
+    from .cache_service import YnabCacheService
+    from .loader import (
+        TransactionColumns,
+        filter_transactions_by_payee,
+        load_accounts,
+        load_categories,
+        load_category_groups,
+        load_transaction_columns,
+        load_transactions,
+    )
+    from .models import (
+        SplitEditBatch,
+        TransactionSplitEdit,
+        YnabAccount,
+        YnabCategory,
+        YnabCategoryGroup,
+        YnabSplit,
+        YnabSubtransaction,
+        YnabTransaction,
+    )
+    from .payee_index import PayeeIndex
+    from .retirement import (
+        RetirementAccount,
+        YnabRetirementService,
+        discover_retirement_accounts,
+        generate_retirement_edits,
+    )
+    from .split_calculator import (
+        SplitCalculationError,
+        calculate_amazon_splits,
+        calculate_apple_splits,
+        calculate_generic_splits,
+        create_split_summary,
+        sort_splits_for_stability,
+        validate_split_calculation,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".cache_service": ["YnabCacheService"],
+        ".loader": [
+            "TransactionColumns",
+            "filter_transactions_by_payee",
+            "load_accounts",
+            "load_categories",
+            "load_category_groups",
+            "load_transaction_columns",
+            "load_transactions",
+        ],
+        ".models": [
+            "SplitEditBatch",
+            "TransactionSplitEdit",
+            "YnabAccount",
+            "YnabCategory",
+            "YnabCategoryGroup",
+            "YnabSplit",
+            "YnabSubtransaction",
+            "YnabTransaction",
+        ],
+        ".payee_index": ["PayeeIndex"],
+        ".retirement": [
+            "RetirementAccount",
+            "YnabRetirementService",
+            "discover_retirement_accounts",
+            "generate_retirement_edits",
+        ],
+        ".split_calculator": [
+            "SplitCalculationError",
+            "calculate_amazon_splits",
+            "calculate_apple_splits",
+            "calculate_generic_splits",
+            "create_split_summary",
+            "sort_splits_for_stability",
+            "validate_split_calculation",
+        ],
+    },
 )
 
 __all__ = [
+    "PayeeIndex",
     # Retirement management
     "RetirementAccount",
     # Split calculation
     "SplitCalculationError",
     # Domain models
     "SplitEditBatch",
+    "TransactionColumns",
     "TransactionSplitEdit",
     "YnabAccount",
+    "YnabCacheService",
     "YnabCategory",
     "YnabCategoryGroup",
     "YnabRetirementService",
@@ -84,6 +139,7 @@ __all__ = [
     "load_accounts",
     "load_categories",
     "load_category_groups",
+    "load_transaction_columns",
     "load_transactions",
     "sort_splits_for_stability",
     "validate_split_calculation",
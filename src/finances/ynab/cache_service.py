@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+YNAB Cache Service
+
+Memoized access to the local YNAB cache for all flow nodes in one run.
+
+Each cache file is read and parsed at most once per run (keyed by path plus
+mtime/size through the FlowContext's FileLoadCache); domain models and
+columnar views are derived from the same parsed records. Because ynab_sync
+writes into the YNAB cache directory, the engine drops these entries when
+it runs, and changed files are reloaded on the next lookup anyway.
+"""
+
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+from ..core.file_cache import FileLoadCache
+from ..core.flow import FlowContext
+from .loader import (
+    DEFAULT_TRANSACTION_COLUMNS,
+    TransactionColumns,
+    build_transaction_columns,
+    load_accounts,
+    read_transaction_records,
+)
+from .models import YnabAccount, YnabTransaction
+from .payee_index import PayeeIndex, configured_payee_patterns
+
+
+class YnabCacheService:
+    """
+    Shared, read-only view of the YNAB cache directory.
+
+    Returned models and columns are shared with other nodes and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        file_cache: FileLoadCache | None = None,
+        payee_patterns: Mapping[str, Sequence[str]] | None = None,
+    ):
+        """
+        Initialize cache service.
+
+        Args:
+            cache_dir: YNAB cache directory (data_dir/ynab/cache)
+            file_cache: Shared file cache (a private one is created if None)
+            payee_patterns: Payee patterns per domain (configured patterns if None)
+        """
+        self.cache_dir = cache_dir
+        self.file_cache = file_cache if file_cache is not None else FileLoadCache()
+        self._payee_patterns = payee_patterns
+
+    @classmethod
+    def for_context(cls, context: FlowContext, data_dir: Path) -> "YnabCacheService":
+        """Create a service backed by the flow run's shared file cache."""
+        return cls(data_dir / "ynab" / "cache", context.file_cache)
+
+    def transaction_records(self) -> list[dict[str, Any]]:
+        """Raw transaction dicts from transactions.json."""
+        return self.file_cache.get(
+            self.cache_dir / "transactions.json",
+            "records",
+            lambda: read_transaction_records(self.cache_dir),
+        )
+
+    def transactions(self) -> list[YnabTransaction]:
+        """All transactions as domain models."""
+        models = self.file_cache.get(
+            self.cache_dir / "transactions.json",
+            "models",
+            lambda: [YnabTransaction.from_dict(record) for record in self.transaction_records()],
+        )
+        return list(models)
+
+    def transaction_columns(
+        self, fields: tuple[str, ...] = DEFAULT_TRANSACTION_COLUMNS, **filters: Any
+    ) -> TransactionColumns:
+        """
+        Selected transaction fields as columns (see load_transaction_columns()).
+
+        Args:
+            fields: Column names from TRANSACTION_COLUMN_FIELDS
+            **filters: payee, start_date, end_date and include_deleted filters
+
+        Returns:
+            TransactionColumns built from the shared parsed records
+        """
+        return build_transaction_columns(self.transaction_records(), fields, **filters)
+
+    def payee_index(self) -> PayeeIndex:
+        """Index of transactions by payee, with the domain payee patterns resolved."""
+        if self._payee_patterns is None:
+            self._payee_patterns = configured_payee_patterns()
+        patterns = {domain: tuple(p) for domain, p in sorted(self._payee_patterns.items())}
+        return self.file_cache.get(
+            self.cache_dir / "transactions.json",
+            f"payee_index:{patterns!r}",
+            lambda: PayeeIndex.from_records(self.transaction_records(), patterns),
+        )
+
+    def domain_transaction_columns(
+        self, domain: str, fields: tuple[str, ...] = DEFAULT_TRANSACTION_COLUMNS
+    ) -> TransactionColumns:
+        """
+        Selected fields of one domain's transactions (e.g. "amazon"), found by payee.
+
+        Args:
+            domain: Domain with configured payee patterns
+            fields: Column names from TRANSACTION_COLUMN_FIELDS
+
+        Returns:
+            TransactionColumns for the domain's transactions, in file order
+
+        Raises:
+            KeyError: If no payee patterns are configured for the domain
+        """
+        records = self.transaction_records()
+        positions = self.payee_index().positions_for_domain(domain)
+        return build_transaction_columns([records[p] for p in positions], fields)
+
+    def accounts(self) -> list[YnabAccount]:
+        """All accounts as domain models."""
+        models = self.file_cache.get(
+            self.cache_dir / "accounts.json", "models", lambda: load_accounts(self.cache_dir)
+        )
+        return list(models)
@@ -10,7 +10,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from finances.core.datastore_mixin import DataStoreMixin
-from finances.core.json_utils import read_json, write_json
+from finances.core.json_utils import read_json, read_json_summary, write_json
 
 if TYPE_CHECKING:
     from finances.core.flow import NodeDataSummary
@@ -77,13 +77,20 @@ class YnabCacheStore(DataStoreMixin):
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         if "transactions" in data:
-            write_json(self.transactions_file, data["transactions"])
+            write_json(self.transactions_file, data["transactions"], compact=True, sidecar=True)
 
         if "accounts" in data:
-            write_json(self.cache_dir / "accounts.json", data["accounts"])
+            write_json(
+                self.cache_dir / "accounts.json", data["accounts"], sidecar=True, record_key="accounts"
+            )
 
         if "categories" in data:
-            write_json(self.cache_dir / "categories.json", data["categories"])
+            write_json(
+                self.cache_dir / "categories.json",
+                data["categories"],
+                sidecar=True,
+                record_key="category_groups",
+            )
 
     def last_modified(self) -> datetime | None:
         """Get timestamp of transactions cache file."""
@@ -103,11 +110,7 @@ class YnabCacheStore(DataStoreMixin):
         if not self.exists():
             return None
 
-        try:
-            data = read_json(self.transactions_file)
-            return len(data) if isinstance(data, list) else 0
-        except Exception:
-            return 0
+        return self._count_records(self.transactions_file) or 0
 
     def size_bytes(self) -> int | None:
         """Get total size of cache files."""
@@ -204,7 +207,8 @@ class YnabEditsStore(DataStoreMixin):
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         output_file = self.edits_dir / f"{timestamp}_transaction_edits.json"
 
-        write_json(output_file, data)
+        record_key = "edits" if "edits" in data else "updates" if "updates" in data else None
+        write_json(output_file, data, sidecar=True, record_key=record_key)
 
     def last_modified(self) -> datetime | None:
         """Get timestamp of most recent edit file."""
@@ -226,6 +230,12 @@ class YnabEditsStore(DataStoreMixin):
         if not self.exists():
             return None
 
+        # Sidecar summary of the most recent file, if current
+        latest_file = max(self.edits_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        summary = read_json_summary(latest_file)
+        if summary is not None and summary.record_key in ("edits", "updates"):
+            return summary.record_count
+
         try:
             data = self.load()
             # Check multiple possible structures
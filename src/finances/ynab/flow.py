@@ -41,30 +41,24 @@ class YnabSyncOutputInfo(OutputInfo):
         if not self.cache_dir.exists():
             return []
 
-        from ..core.json_utils import read_json
+        from ..core.json_utils import count_json_records
 
         files = []
 
-        # transactions.json - direct array
-        transactions_file = self.cache_dir / "transactions.json"
-        if transactions_file.exists() and transactions_file.stat().st_size > 0:
-            data = read_json(transactions_file)
-            count = len(data) if isinstance(data, list) else 0
-            files.append(OutputFile(path=transactions_file, record_count=count))
-
-        # accounts.json - nested in "accounts" key
-        accounts_file = self.cache_dir / "accounts.json"
-        if accounts_file.exists() and accounts_file.stat().st_size > 0:
-            data = read_json(accounts_file)
-            count = len(data.get("accounts", [])) if isinstance(data, dict) else 0
-            files.append(OutputFile(path=accounts_file, record_count=count))
-
-        # categories.json - nested in "category_groups" key
-        categories_file = self.cache_dir / "categories.json"
-        if categories_file.exists() and categories_file.stat().st_size > 0:
-            data = read_json(categories_file)
-            count = len(data.get("category_groups", [])) if isinstance(data, dict) else 0
-            files.append(OutputFile(path=categories_file, record_count=count))
+        # transactions.json - direct array; accounts.json and categories.json - nested under a key.
+        # Counts come from the sidecar summaries written by the sync, or a streaming count.
+        for name, key in (
+            ("transactions.json", None),
+            ("accounts.json", "accounts"),
+            ("categories.json", "category_groups"),
+        ):
+            cache_file = self.cache_dir / name
+            if cache_file.exists() and cache_file.stat().st_size > 0:
+                try:
+                    count = count_json_records(cache_file, key)
+                except ValueError:
+                    count = 0
+                files.append(OutputFile(path=cache_file, record_count=count))
 
         return files
 
@@ -95,7 +89,7 @@ class YnabSyncFlowNode(FlowNode):
 
     def execute(self, context: FlowContext) -> FlowResult:
         """Execute YNAB sync using external ynab CLI tool."""
-        from ..core.json_utils import write_json
+        from ..core.json_utils import parse_json, write_json
 
         try:
             cache_dir = self.data_dir / "ynab" / "cache"
@@ -113,8 +107,8 @@ class YnabSyncFlowNode(FlowNode):
                 text=True,
                 check=True,
             )
-            accounts_data = json.loads(result.stdout)
-            write_json(cache_dir / "accounts.json", accounts_data)
+            accounts_data = parse_json(result.stdout)
+            write_json(cache_dir / "accounts.json", accounts_data, sidecar=True, record_key="accounts")
             items_synced += len(accounts_data.get("accounts", []))
 
             # Sync categories
@@ -124,8 +118,10 @@ class YnabSyncFlowNode(FlowNode):
                 text=True,
                 check=True,
             )
-            categories_data = json.loads(result.stdout)
-            write_json(cache_dir / "categories.json", categories_data)
+            categories_data = parse_json(result.stdout)
+            write_json(
+                cache_dir / "categories.json", categories_data, sidecar=True, record_key="category_groups"
+            )
             if isinstance(categories_data, dict):
                 items_synced += len(categories_data.get("category_groups", []))
 
@@ -136,8 +132,8 @@ class YnabSyncFlowNode(FlowNode):
                 text=True,
                 check=True,
             )
-            transactions_data = json.loads(result.stdout)
-            write_json(cache_dir / "transactions.json", transactions_data)
+            transactions_data = parse_json(result.stdout)
+            write_json(cache_dir / "transactions.json", transactions_data, compact=True, sidecar=True)
             if isinstance(transactions_data, list):
                 items_synced += len(transactions_data)
 
@@ -215,28 +211,42 @@ class YnabSyncFlowNode(FlowNode):
 class RetirementUpdateOutputInfo(OutputInfo):
     """Output information for retirement update node."""
 
+    # Edit files are written as *_retirement_edits.yaml (JSON content); older runs used .json
+    EDIT_FILE_PATTERNS = ("*retirement*.yaml", "*retirement*.json")
+
     def __init__(self, edits_dir: Path):
         self.edits_dir = edits_dir
 
+    def _edit_files(self) -> list[Path]:
+        """Retirement edit files in the edits directory."""
+        return sorted(path for pattern in self.EDIT_FILE_PATTERNS for path in self.edits_dir.glob(pattern))
+
     def is_data_ready(self) -> bool:
         """Ready if at least 1 retirement edit file exists."""
         if not self.edits_dir.exists():
             return False
-        return len(list(self.edits_dir.glob("*retirement*.json"))) >= 1
+        return len(self._edit_files()) >= 1
 
     def get_output_files(self) -> list[OutputFile]:
         """Return all retirement edit files with counts."""
         if not self.edits_dir.exists():
             return []
 
-        from ..core.json_utils import read_json
+        from ..core.json_utils import read_json, summary_record_count
 
         files = []
-        for edit_file in self.edits_dir.glob("*retirement*.json"):
+        for edit_file in self._edit_files():
+            summary_count = summary_record_count(edit_file, "mutations")
+            if summary_count is not None:
+                files.append(OutputFile(path=edit_file, record_count=summary_count))
+                continue
+
             data = read_json(edit_file)
-            # Handle both array and dict with "edits" key
+            # Handle both array and dict with "mutations" (or legacy "edits") key
             if isinstance(data, list):
                 count = len(data)
+            elif isinstance(data, dict) and "mutations" in data:
+                count = len(data["mutations"])
             elif isinstance(data, dict) and "edits" in data:
                 count = len(data["edits"])
             else:
@@ -249,6 +259,8 @@ class RetirementUpdateOutputInfo(OutputInfo):
 class RetirementUpdateFlowNode(FlowNode):
     """Update retirement account balances (manual step)."""
 
+    requires_user_interaction = True
+
     def __init__(self, data_dir: Path):
         super().__init__("retirement_update")
         self.data_dir = data_dir
@@ -269,10 +281,12 @@ class RetirementUpdateFlowNode(FlowNode):
 
     def get_data_summary(self, context: FlowContext) -> NodeDataSummary:
         """Get retirement accounts summary."""
-        from . import discover_retirement_accounts
+        from . import YnabCacheService, discover_retirement_accounts
 
         try:
-            accounts = discover_retirement_accounts(self.data_dir)
+            accounts = discover_retirement_accounts(
+                self.data_dir, YnabCacheService.for_context(context, self.data_dir)
+            )
 
             if not accounts:
                 return NodeDataSummary(
@@ -320,10 +334,11 @@ class RetirementUpdateFlowNode(FlowNode):
         import click
 
         from ..core.currency import format_cents
-        from . import discover_retirement_accounts, generate_retirement_edits
+        from . import YnabCacheService, discover_retirement_accounts, generate_retirement_edits
 
+        ynab_cache = YnabCacheService.for_context(context, self.data_dir)
         try:
-            accounts = discover_retirement_accounts(self.data_dir)
+            accounts = discover_retirement_accounts(self.data_dir, ynab_cache)
 
             if not accounts:
                 return FlowResult(
@@ -367,7 +382,7 @@ class RetirementUpdateFlowNode(FlowNode):
                 )
 
             # Generate edits file
-            edits_file = generate_retirement_edits(self.data_dir, balance_updates)
+            edits_file = generate_retirement_edits(self.data_dir, balance_updates, ynab_cache)
 
             if edits_file:
                 return FlowResult(
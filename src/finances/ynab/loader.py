@@ -7,18 +7,28 @@ from local JSON files.
 
 Functions:
 - load_transactions: Load transactions as domain models
+- load_transaction_columns: Load selected transaction fields as NumPy columns
+- read_transaction_records: Read raw transaction dicts
 - load_accounts: Load accounts as domain models
 - load_categories: Load categories as domain models
 - load_category_groups: Load category groups as domain models
 - filter_transactions_by_payee: Filter transactions by payee
 """
 
-import json
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass, field
+from datetime import date
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+import pandas as pd
+
 from ..core.config import get_config
+from ..core.dates import FinancialDate
+from ..core.json_utils import read_json
 from .models import YnabAccount, YnabCategory, YnabCategoryGroup, YnabTransaction
+from .payee_index import payee_matcher
 
 
 def load_transactions(cache_dir: str | Path | None = None) -> list[YnabTransaction]:
@@ -32,6 +42,24 @@ def load_transactions(cache_dir: str | Path | None = None) -> list[YnabTransacti
     Returns:
         List of YnabTransaction domain models
 
+    Raises:
+        FileNotFoundError: If cache directory or transactions file not found
+    """
+    # Convert dicts to domain models
+    return [YnabTransaction.from_dict(tx) for tx in read_transaction_records(cache_dir)]
+
+
+def read_transaction_records(cache_dir: str | Path | None = None) -> list[dict[str, Any]]:
+    """
+    Read raw transaction dicts from transactions.json (array or object format).
+
+    Args:
+        cache_dir: Directory containing cached YNAB data.
+                   If None, uses config.data_dir/ynab/cache
+
+    Returns:
+        List of transaction dicts as stored by the YNAB API
+
     Raises:
         FileNotFoundError: If cache directory or transactions file not found
     """
@@ -46,8 +74,7 @@ def load_transactions(cache_dir: str | Path | None = None) -> list[YnabTransacti
     if not transactions_file.exists():
         raise FileNotFoundError(f"YNAB transactions cache not found: {transactions_file}")
 
-    with open(transactions_file) as f:
-        data: Any = json.load(f)
+    data: Any = read_json(transactions_file)
 
     # Handle both array format and object format
     if isinstance(data, dict):
@@ -57,8 +84,193 @@ def load_transactions(cache_dir: str | Path | None = None) -> list[YnabTransacti
     else:
         transactions_list = []
 
-    # Convert dicts to domain models
-    return [YnabTransaction.from_dict(tx) for tx in transactions_list]
+    return transactions_list
+
+
+def _date_ordinal(record: dict[str, Any]) -> int:
+    """Proleptic Gregorian ordinal of a transaction's date (ISO date or timestamp)."""
+    return date.fromisoformat(record["date"][:10]).toordinal()
+
+
+# Column name -> (dtype, extractor from a raw transaction dict)
+TRANSACTION_COLUMN_FIELDS: dict[str, tuple[Any, Callable[[dict[str, Any]], Any]]] = {
+    "id": (object, lambda r: r["id"]),
+    "date_ordinal": (np.int64, _date_ordinal),
+    "amount": (np.int64, lambda r: r["amount"]),  # milliunits
+    "account_id": (object, lambda r: r["account_id"]),
+    "account_name": (object, lambda r: r["account_name"].replace("\xa0", " ")),
+    "payee_name": (object, lambda r: r.get("payee_name")),
+    "category_name": (object, lambda r: r.get("category_name")),
+    "memo": (object, lambda r: r.get("memo")),
+    "cleared": (object, lambda r: r.get("cleared", "uncleared")),
+    "deleted": (bool, lambda r: r.get("deleted", False)),
+    "is_split": (bool, lambda r: bool(r.get("subtransactions"))),
+}
+
+DEFAULT_TRANSACTION_COLUMNS = ("id", "date_ordinal", "amount", "account_name", "payee_name", "deleted")
+
+# Offset from proleptic Gregorian ordinals to days since the Unix epoch
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+@dataclass
+class TransactionColumns:
+    """
+    Selected YNAB transaction fields as NumPy columns.
+
+    Rows keep their raw API dicts so full YnabTransaction domain models can be
+    built lazily for just the rows a consumer needs.
+    """
+
+    columns: dict[str, np.ndarray]
+    records: list[dict[str, Any]] = field(repr=False)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    @property
+    def dates(self) -> np.ndarray:
+        """Transaction dates as datetime64[D] (requires the date_ordinal column)."""
+        return (self.columns["date_ordinal"] - _EPOCH_ORDINAL).astype("datetime64[D]")
+
+    def select(self, mask: np.ndarray) -> "TransactionColumns":
+        """
+        Select a subset of rows.
+
+        Args:
+            mask: Boolean mask or integer index array over rows
+
+        Returns:
+            New TransactionColumns with the selected rows
+        """
+        indices = np.arange(len(self))[mask]
+        return TransactionColumns(
+            columns={name: values[indices] for name, values in self.columns.items()},
+            records=[self.records[i] for i in indices],
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """Columns as a pandas DataFrame."""
+        return pd.DataFrame(self.columns)
+
+    def transaction(self, index: int) -> YnabTransaction:
+        """Materialize one row as a YnabTransaction."""
+        return YnabTransaction.from_dict(self.records[index])
+
+    def to_transactions(self) -> list[YnabTransaction]:
+        """Materialize every row as YnabTransaction domain models."""
+        return [YnabTransaction.from_dict(record) for record in self.records]
+
+    def iter_transactions(self) -> Iterator[YnabTransaction]:
+        """Lazily materialize rows one at a time."""
+        return (YnabTransaction.from_dict(record) for record in self.records)
+
+
+def _iso_date(value: FinancialDate | date | str) -> str:
+    """Normalize a date bound to an ISO string for comparison against raw records."""
+    if isinstance(value, FinancialDate):
+        return value.to_iso_string()
+    if isinstance(value, date):
+        return value.isoformat()
+    return value[:10]
+
+
+def load_transaction_columns(
+    cache_dir: str | Path | None = None,
+    fields: Sequence[str] = DEFAULT_TRANSACTION_COLUMNS,
+    payee: str | Sequence[str] | None = None,
+    start_date: FinancialDate | date | str | None = None,
+    end_date: FinancialDate | date | str | None = None,
+    include_deleted: bool = True,
+) -> TransactionColumns:
+    """
+    Load selected YNAB transaction fields as columns, filtering while scanning.
+
+    Filters are applied to the raw records before any column is built, so
+    rejected rows never have dates parsed or domain models created.
+
+    Args:
+        cache_dir: Directory containing cached YNAB data.
+                   If None, uses config.data_dir/ynab/cache
+        fields: Column names from TRANSACTION_COLUMN_FIELDS
+        payee: Payee name pattern(s) (case-insensitive substring match, any pattern)
+        start_date: Earliest transaction date to include (inclusive)
+        end_date: Latest transaction date to include (inclusive)
+        include_deleted: Whether to keep transactions flagged as deleted
+
+    Returns:
+        TransactionColumns for the matching transactions, in file order
+
+    Raises:
+        FileNotFoundError: If cache directory or transactions file not found
+        ValueError: If an unknown field is requested
+    """
+    return build_transaction_columns(
+        read_transaction_records(cache_dir),
+        fields,
+        payee=payee,
+        start_date=start_date,
+        end_date=end_date,
+        include_deleted=include_deleted,
+    )
+
+
+def build_transaction_columns(
+    records: list[dict[str, Any]],
+    fields: Sequence[str] = DEFAULT_TRANSACTION_COLUMNS,
+    payee: str | Sequence[str] | None = None,
+    start_date: FinancialDate | date | str | None = None,
+    end_date: FinancialDate | date | str | None = None,
+    include_deleted: bool = True,
+) -> TransactionColumns:
+    """
+    Build transaction columns from raw records already read from transactions.json.
+
+    Args:
+        records: Raw transaction dicts (not modified)
+        fields: Column names from TRANSACTION_COLUMN_FIELDS
+        payee: Payee name pattern(s) (case-insensitive substring match, any pattern)
+        start_date: Earliest transaction date to include (inclusive)
+        end_date: Latest transaction date to include (inclusive)
+        include_deleted: Whether to keep transactions flagged as deleted
+
+    Returns:
+        TransactionColumns for the matching transactions, in record order
+
+    Raises:
+        ValueError: If an unknown field is requested
+    """
+    unknown = [name for name in fields if name not in TRANSACTION_COLUMN_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown transaction column(s): {', '.join(unknown)}")
+
+    # Predicate pushdown on raw dicts (ISO date strings compare chronologically)
+    if not include_deleted:
+        records = [r for r in records if not r.get("deleted", False)]
+    if start_date is not None:
+        start = _iso_date(start_date)
+        records = [r for r in records if r["date"][:10] >= start]
+    if end_date is not None:
+        end = _iso_date(end_date)
+        records = [r for r in records if r["date"][:10] <= end]
+    if payee:
+        matches = payee_matcher(payee)
+        records = [r for r in records if matches(r.get("payee_name"))]
+
+    columns: dict[str, np.ndarray] = {}
+    for name in fields:
+        dtype, extract = TRANSACTION_COLUMN_FIELDS[name]
+        if dtype is object:
+            values = np.empty(len(records), dtype=object)
+            values[:] = [extract(r) for r in records]
+            columns[name] = values
+        else:
+            columns[name] = np.fromiter((extract(r) for r in records), dtype=dtype, count=len(records))
+
+    return TransactionColumns(columns=columns, records=records)
 
 
 def load_accounts(cache_dir: str | Path | None = None) -> list[YnabAccount]:
@@ -86,8 +298,7 @@ def load_accounts(cache_dir: str | Path | None = None) -> list[YnabAccount]:
     if not accounts_file.exists():
         raise FileNotFoundError(f"YNAB accounts cache not found: {accounts_file}")
 
-    with open(accounts_file) as f:
-        data: Any = json.load(f)
+    data: Any = read_json(accounts_file)
 
     # Handle object format with "accounts" key
     if isinstance(data, dict) and "accounts" in data:
@@ -126,8 +337,7 @@ def load_category_groups(cache_dir: str | Path | None = None) -> list[YnabCatego
     if not categories_file.exists():
         raise FileNotFoundError(f"YNAB categories cache not found: {categories_file}")
 
-    with open(categories_file) as f:
-        data: Any = json.load(f)
+    data: Any = read_json(categories_file)
 
     # Handle object format with "category_groups" key
     if isinstance(data, dict) and "category_groups" in data:
@@ -168,8 +378,7 @@ def load_categories(cache_dir: str | Path | None = None) -> list[YnabCategory]:
     if not categories_file.exists():
         raise FileNotFoundError(f"YNAB categories cache not found: {categories_file}")
 
-    with open(categories_file) as f:
-        data: Any = json.load(f)
+    data: Any = read_json(categories_file)
 
     # Handle object format with "category_groups" key
     if isinstance(data, dict) and "category_groups" in data:
@@ -193,14 +402,16 @@ def load_categories(cache_dir: str | Path | None = None) -> list[YnabCategory]:
 
 def filter_transactions_by_payee(
     transactions: list[YnabTransaction],
-    payee: str | None = None,
+    payee: str | Sequence[str] | None = None,
 ) -> list[YnabTransaction]:
     """
     Filter transactions by payee name.
 
+    For repeated filtering of the same load, build a PayeeIndex instead.
+
     Args:
         transactions: List of YnabTransaction domain models
-        payee: Payee name pattern (case-insensitive substring match)
+        payee: Payee name pattern(s) (case-insensitive substring match, any pattern)
 
     Returns:
         Filtered list of transactions
@@ -208,5 +419,5 @@ def filter_transactions_by_payee(
     if not payee:
         return transactions
 
-    payee_lower = payee.lower()
-    return [tx for tx in transactions if tx.payee_name and payee_lower in tx.payee_name.lower()]
+    matches = payee_matcher(payee)
+    return [tx for tx in transactions if matches(tx.payee_name)]
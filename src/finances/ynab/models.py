@@ -6,6 +6,7 @@ Type-safe models representing YNAB API data structures.
 These models are true to the YNAB API format and use Money/FinancialDate primitives.
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -13,6 +14,16 @@ from ..core.dates import FinancialDate
 from ..core.money import Money
 
 
+def _shared(value: str | None) -> str | None:
+    """
+    Intern a repeated string value (account, payee, category names and ids).
+
+    A cache holds a few hundred distinct payees and categories across
+    hundreds of thousands of transactions; interning keeps one copy of each.
+    """
+    return sys.intern(value) if value is not None else None
+
+
 @dataclass
 class YnabAccount:
     """
@@ -169,7 +180,7 @@ class YnabCategory:
         return self.name
 
 
-@dataclass
+@dataclass(slots=True)
 class YnabSubtransaction:
     """
     YNAB subtransaction (split) from API.
@@ -205,17 +216,17 @@ class YnabSubtransaction:
             transaction_id=data["transaction_id"],
             amount=Money.from_milliunits(data["amount"]),
             memo=data.get("memo"),
-            payee_id=data.get("payee_id"),
-            payee_name=data.get("payee_name"),
-            category_id=data.get("category_id"),
-            category_name=data.get("category_name"),
+            payee_id=_shared(data.get("payee_id")),
+            payee_name=_shared(data.get("payee_name")),
+            category_id=_shared(data.get("category_id")),
+            category_name=_shared(data.get("category_name")),
             transfer_account_id=data.get("transfer_account_id"),
             transfer_transaction_id=data.get("transfer_transaction_id"),
             deleted=data.get("deleted", False),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class YnabTransaction:
     """
     YNAB transaction from API.
@@ -272,14 +283,14 @@ class YnabTransaction:
             date=FinancialDate.from_string(data["date"]),
             amount=Money.from_milliunits(data["amount"]),
             memo=data.get("memo"),
-            cleared=data.get("cleared", "uncleared"),  # Default to uncleared if not present
+            cleared=sys.intern(data.get("cleared", "uncleared")),  # Default to uncleared if not present
             approved=data.get("approved", True),  # Default to approved if not present
-            account_id=data["account_id"],
-            account_name=data["account_name"].replace("\xa0", " "),
-            payee_id=data.get("payee_id"),
-            payee_name=data.get("payee_name"),
-            category_id=data.get("category_id"),
-            category_name=data.get("category_name"),
+            account_id=sys.intern(data["account_id"]),
+            account_name=sys.intern(data["account_name"].replace("\xa0", " ")),
+            payee_id=_shared(data.get("payee_id")),
+            payee_name=_shared(data.get("payee_name")),
+            category_id=_shared(data.get("category_id")),
+            category_name=_shared(data.get("category_name")),
             transfer_account_id=data.get("transfer_account_id"),
             transfer_transaction_id=data.get("transfer_transaction_id"),
             matched_transaction_id=data.get("matched_transaction_id"),
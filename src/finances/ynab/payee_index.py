@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+YNAB Payee Index
+
+Maps each normalized payee name to the transactions that use it, built once
+per transaction load. Transactions far outnumber distinct payees, so payee
+patterns are matched against the distinct names only, and the configured
+per-domain patterns (Amazon, Apple) are resolved up front: selecting a
+domain's transactions is then a dictionary lookup.
+"""
+
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from ..core.config import Config, get_config
+from .models import YnabTransaction
+
+
+@lru_cache(maxsize=4096)
+def normalize_payee(payee_name: str) -> str:
+    """Normalize a payee name for matching (case-folded, surrounding whitespace removed)."""
+    return payee_name.strip().lower()
+
+
+def _normalize_patterns(patterns: str | Iterable[str]) -> tuple[str, ...]:
+    """Normalize one pattern or a collection of patterns, dropping empty ones."""
+    if isinstance(patterns, str):
+        patterns = [patterns]
+    return tuple(dict.fromkeys(normalize_payee(p) for p in patterns if p and p.strip()))
+
+
+@lru_cache(maxsize=4096)
+def _matches_normalized(payee: str, patterns: tuple[str, ...]) -> bool:
+    return any(pattern in payee for pattern in patterns)
+
+
+def payee_matches(payee_name: str | None, patterns: str | Iterable[str]) -> bool:
+    """
+    Check whether a payee name contains any of the given patterns.
+
+    Args:
+        payee_name: Payee name from a transaction (None never matches)
+        patterns: Pattern or patterns (case-insensitive substring match)
+
+    Returns:
+        True if any pattern occurs in the payee name
+    """
+    if not payee_name:
+        return False
+    return _matches_normalized(normalize_payee(payee_name), _normalize_patterns(patterns))
+
+
+def payee_matcher(patterns: str | Iterable[str]) -> Callable[[str | None], bool]:
+    """
+    Build a payee predicate for filtering many transactions with the same patterns.
+
+    Args:
+        patterns: Pattern or patterns (case-insensitive substring match)
+
+    Returns:
+        Function returning True for payee names containing any pattern
+    """
+    normalized = _normalize_patterns(patterns)
+
+    def matches(payee_name: str | None) -> bool:
+        if not payee_name:
+            return False
+        return _matches_normalized(normalize_payee(payee_name), normalized)
+
+    return matches
+
+
+def configured_payee_patterns(config: Config | None = None) -> dict[str, tuple[str, ...]]:
+    """
+    Payee patterns per domain from the configuration.
+
+    Args:
+        config: Configuration to read (global configuration if None)
+
+    Returns:
+        Dict mapping domain name ("amazon", "apple") to its payee patterns
+    """
+    config = config or get_config()
+    return {
+        "amazon": tuple(config.amazon.payee_patterns),
+        "apple": tuple(config.apple.payee_patterns),
+    }
+
+
+@dataclass
+class PayeeIndex:
+    """
+    Transactions grouped by normalized payee name.
+
+    Positions refer to the order of the records (or transactions) the index
+    was built from, so they can select rows from models or columns built
+    from the same load.
+    """
+
+    positions_by_payee: dict[str, list[int]]
+    ids: list[str]
+    domain_patterns: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    payees_by_domain: dict[str, frozenset[str]] = field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls,
+        ids: Sequence[str],
+        payee_names: Iterable[str | None],
+        domain_patterns: Mapping[str, str | Iterable[str]] | None = None,
+    ) -> "PayeeIndex":
+        """
+        Build an index from parallel transaction ids and payee names.
+
+        Args:
+            ids: Transaction ids
+            payee_names: Payee name of each transaction (None for no payee)
+            domain_patterns: Dict mapping domain name to its payee pattern(s)
+
+        Returns:
+            PayeeIndex with per-domain payees resolved
+        """
+        positions_by_payee: dict[str, list[int]] = {}
+        for position, payee_name in enumerate(payee_names):
+            if payee_name:
+                positions_by_payee.setdefault(normalize_payee(payee_name), []).append(position)
+
+        index = cls(positions_by_payee=positions_by_payee, ids=list(ids))
+        for domain, patterns in (domain_patterns or {}).items():
+            normalized = _normalize_patterns(patterns)
+            index.domain_patterns[domain] = normalized
+            index.payees_by_domain[domain] = frozenset(index.payees_matching(normalized))
+        return index
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Sequence[dict[str, Any]],
+        domain_patterns: Mapping[str, str | Iterable[str]] | None = None,
+    ) -> "PayeeIndex":
+        """Build an index from raw transaction dicts (see read_transaction_records())."""
+        return cls.build([r["id"] for r in records], (r.get("payee_name") for r in records), domain_patterns)
+
+    @classmethod
+    def from_transactions(
+        cls,
+        transactions: Sequence[YnabTransaction],
+        domain_patterns: Mapping[str, str | Iterable[str]] | None = None,
+    ) -> "PayeeIndex":
+        """Build an index from transaction domain models."""
+        return cls.build(
+            [tx.id for tx in transactions], (tx.payee_name for tx in transactions), domain_patterns
+        )
+
+    def __len__(self) -> int:
+        """Number of distinct payees."""
+        return len(self.positions_by_payee)
+
+    def payees_matching(self, patterns: str | Iterable[str]) -> list[str]:
+        """Distinct normalized payees containing any of the patterns."""
+        normalized = _normalize_patterns(patterns)
+        return [payee for payee in self.positions_by_payee if _matches_normalized(payee, normalized)]
+
+    def positions_for_payees(self, payees: Iterable[str]) -> list[int]:
+        """Positions of transactions with any of the given normalized payees, in load order."""
+        return sorted(p for payee in payees for p in self.positions_by_payee.get(payee, ()))
+
+    def positions_for_pattern(self, patterns: str | Iterable[str]) -> list[int]:
+        """Positions of transactions whose payee contains any of the patterns, in load order."""
+        return self.positions_for_payees(self.payees_matching(patterns))
+
+    def positions_for_domain(self, domain: str) -> list[int]:
+        """
+        Positions of a domain's transactions, in load order.
+
+        Raises:
+            KeyError: If the domain was not configured when building the index
+        """
+        if domain not in self.payees_by_domain:
+            raise KeyError(f"No payee patterns configured for domain: {domain}")
+        return self.positions_for_payees(self.payees_by_domain[domain])
+
+    def ids_for_domain(self, domain: str) -> list[str]:
+        """Ids of a domain's transactions, in load order."""
+        return [self.ids[p] for p in self.positions_for_domain(domain)]
+
+    def is_domain_payee(self, domain: str, payee_name: str | None) -> bool:
+        """Check whether a payee name belongs to a domain (also for payees not in the index)."""
+        if not payee_name:
+            return False
+        payee = normalize_payee(payee_name)
+        if payee in self.payees_by_domain[domain]:
+            return True
+        return payee not in self.positions_by_payee and _matches_normalized(
+            payee, self.domain_patterns[domain]
+        )
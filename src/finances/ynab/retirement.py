@@ -10,12 +10,15 @@ import logging
 from dataclasses import dataclass
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ..core.currency import format_cents
 from ..core.json_utils import write_json
 from .loader import load_accounts
 
+if TYPE_CHECKING:
+    from .cache_service import YnabCacheService
+
 logger = logging.getLogger(__name__)
 
 
@@ -78,15 +81,17 @@ class YnabRetirementService:
     balance adjustment transactions following the standard edit workflow.
     """
 
-    def __init__(self, data_dir: Path):
+    def __init__(self, data_dir: Path, ynab_cache: "YnabCacheService | None" = None):
         """
         Initialize retirement service.
 
         Args:
             data_dir: Base data directory containing YNAB cache
+            ynab_cache: Shared YNAB cache service (accounts are read directly if None)
         """
         self.data_dir = data_dir
         self.ynab_cache_dir = data_dir / "ynab" / "cache"
+        self.ynab_cache = ynab_cache
         self.edits_dir = data_dir / "ynab" / "edits"
         self.edits_dir.mkdir(parents=True, exist_ok=True)
 
@@ -103,7 +108,7 @@ class YnabRetirementService:
             List of discovered retirement accounts
         """
         try:
-            accounts = load_accounts(self.ynab_cache_dir)
+            accounts = self.ynab_cache.accounts() if self.ynab_cache else load_accounts(self.ynab_cache_dir)
 
             # Filter for retirement accounts (off-budget assets)
             retirement_accounts = [
@@ -211,7 +216,7 @@ class YnabRetirementService:
         }
 
         # Write to file
-        write_json(output_file, edit_data)
+        write_json(output_file, edit_data, sidecar=True, record_key="mutations")
 
         logger.info(f"Created retirement edits file: {output_file}")
         logger.info(f"  Total adjustments: {len(adjustments)}")
@@ -222,32 +227,38 @@ class YnabRetirementService:
         return output_file
 
 
-def discover_retirement_accounts(data_dir: Path) -> list[RetirementAccount]:
+def discover_retirement_accounts(
+    data_dir: Path, ynab_cache: "YnabCacheService | None" = None
+) -> list[RetirementAccount]:
     """
     Convenience function to discover retirement accounts.
 
     Args:
         data_dir: Base data directory
+        ynab_cache: Shared YNAB cache service (optional)
 
     Returns:
         List of discovered retirement accounts
     """
-    service = YnabRetirementService(data_dir)
+    service = YnabRetirementService(data_dir, ynab_cache)
     return service.discover_retirement_accounts()
 
 
-def generate_retirement_edits(data_dir: Path, balance_updates: dict[str, int]) -> Path | None:
+def generate_retirement_edits(
+    data_dir: Path, balance_updates: dict[str, int], ynab_cache: "YnabCacheService | None" = None
+) -> Path | None:
     """
     Generate YNAB edits for retirement balance updates.
 
     Args:
         data_dir: Base data directory
         balance_updates: Dict mapping account IDs to new balances in cents
+        ynab_cache: Shared YNAB cache service (optional)
 
     Returns:
         Path to generated edits file, or None if no adjustments needed
     """
-    service = YnabRetirementService(data_dir)
+    service = YnabRetirementService(data_dir, ynab_cache)
 
     # Discover accounts
     accounts = service.discover_retirement_accounts()
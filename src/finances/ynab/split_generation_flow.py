@@ -25,10 +25,12 @@ class SplitGenerationOutputInfo(OutputInfo):
         if not self.edits_dir.exists():
             return False
 
-        from ..core.json_utils import read_json
+        from ..core.json_utils import read_json, summary_record_count
 
         # Check all JSON files for "edits" key
         for json_file in self.edits_dir.glob("*.json"):
+            if summary_record_count(json_file, "edits") is not None:
+                return True
             try:
                 data = read_json(json_file)
                 if isinstance(data, dict) and "edits" in data:
@@ -44,10 +46,15 @@ class SplitGenerationOutputInfo(OutputInfo):
         if not self.edits_dir.exists():
             return []
 
-        from ..core.json_utils import read_json
+        from ..core.json_utils import read_json, summary_record_count
 
         files = []
         for json_file in self.edits_dir.glob("*.json"):
+            # Sidecar summaries of split edit files record the "edits" count
+            summary_count = summary_record_count(json_file, "edits")
+            if summary_count is not None:
+                files.append(OutputFile(path=json_file, record_count=summary_count))
+                continue
             try:
                 data = read_json(json_file)
                 # Only include files with "edits" key
@@ -270,7 +277,7 @@ class SplitGenerationFlowNode(FlowNode):
                 "edits": all_edits,
             }
 
-            write_json(output_file, edit_data)
+            write_json(output_file, edit_data, sidecar=True, record_key="edits")
 
             return FlowResult(
                 success=True,
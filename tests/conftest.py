@@ -87,6 +87,26 @@ def setup_test_environment(monkeypatch):
     monkeypatch.setenv("EMAIL_PASSWORD", "test-password")
 
 
+def pytest_addoption(parser):
+    """Command line options for the benchmark suite (tests/performance/test_benchmarks.py)."""
+    group = parser.getgroup("benchmarks", "benchmark suite")
+    group.addoption(
+        "--bench-scales",
+        default="1",
+        help="Comma-separated data scales to benchmark, in multiples of one household (e.g. 1,10,100)",
+    )
+    group.addoption("--bench-json", type=Path, help="Write benchmark results to this JSON file")
+    group.addoption(
+        "--bench-baseline", type=Path, help="Fail benchmarks that regress against this results file"
+    )
+    group.addoption(
+        "--bench-tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown or memory growth against the baseline (default: 0.25 = 25%%)",
+    )
+
+
 # Test markers for categorizing tests
 def pytest_configure(config):
     """Configure custom pytest markers."""
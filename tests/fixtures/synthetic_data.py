@@ -10,8 +10,10 @@ All amounts, dates, IDs, names, and other identifiers are synthetic.
 Note: Uses standard random module for test data generation (not cryptographic use).
 """
 
+import csv
 import json
 import random
+from dataclasses import dataclass
 from datetime import date, timedelta
 from pathlib import Path
 from typing import Any
@@ -235,17 +237,12 @@ def generate_synthetic_apple_receipt_html(
 
     receipt_date = (date.today() - timedelta(days=random.randint(1, 30))).strftime("%b %d, %Y")
 
-    items_html = "\n".join(
-        [
-            f"""
+    items_html = "\n".join([f"""
         <tr>
             <td class="item-title">{item['title']}</td>
             <td class="item-price">${cents_to_dollars_str(item['price'])}</td>
         </tr>
-        """
-            for item in items
-        ]
-    )
+        """ for item in items])
 
     html = f"""
 <!DOCTYPE html>
@@ -327,8 +324,6 @@ def save_synthetic_amazon_data(output_dir: Path) -> None:
     orders = generate_synthetic_amazon_orders()
 
     # Write CSV
-    import csv
-
     csv_file = output_dir / "sample_orders.csv"
     if orders:
         with open(csv_file, "w", newline="") as f:
@@ -352,6 +347,190 @@ def save_synthetic_apple_receipt(output_dir: Path) -> None:
         f.write(html)
 
 
+# One household's history: the "1x" volume of the benchmark suite (scaled by density)
+HOUSEHOLD_YEARS = 3
+HOUSEHOLD_ACCOUNTS = 3
+HOUSEHOLD_TRANSACTIONS_PER_DAY = 4
+HOUSEHOLD_AMAZON_ACCOUNTS = ("karl", "erica")
+HOUSEHOLD_AMAZON_ORDERS_PER_MONTH = 12
+HOUSEHOLD_APPLE_RECEIPTS_PER_MONTH = 6
+
+AMAZON_ORDER_HISTORY_FIELDS = [
+    "Order ID",
+    "ASIN",
+    "Product Name",
+    "Quantity",
+    "Unit Price",
+    "Total Owed",
+    "Order Date",
+    "Ship Date",
+]
+
+
+@dataclass
+class SyntheticHousehold:
+    """
+    Cross-referenced synthetic history of one household (or a scaled-up one).
+
+    Every Amazon order and Apple receipt has a YNAB transaction for its total,
+    so matchers find real matches.
+    """
+
+    ynab: dict[str, Any]  # "accounts", "categories", "transactions" (as generate_synthetic_ynab_cache)
+    amazon_orders: dict[str, list[dict[str, Any]]]  # Amazon account -> Retail.OrderHistory rows
+    apple_receipts: list[dict[str, Any]]  # ParsedReceipt.to_dict() shape
+
+
+def generate_household_history(
+    scale: int = 1, seed: int = 0, end_date: date = date(2024, 12, 31)
+) -> SyntheticHousehold:
+    """
+    Generate a deterministic household history at a multiple of one household's volume.
+
+    Args:
+        scale: Volume multiplier (transactions, orders and receipts per period)
+        seed: Random seed (same seed and scale give identical data)
+        end_date: Last date of the history (HOUSEHOLD_YEARS years long)
+
+    Returns:
+        SyntheticHousehold with YNAB, Amazon and Apple data
+    """
+    rng = random.Random(seed)
+    start_date = end_date - timedelta(days=365 * HOUSEHOLD_YEARS)
+    days = (end_date - start_date).days
+    months = HOUSEHOLD_YEARS * 12
+
+    ynab = generate_synthetic_ynab_cache(num_accounts=HOUSEHOLD_ACCOUNTS, num_transactions=0)
+    accounts = ynab["accounts"]["accounts"]
+    categories = ynab["categories"]["category_groups"][0]["categories"]
+    transactions: list[dict[str, Any]] = []
+
+    def add_transaction(day: date, amount: int, payee: str | None, **fields: Any) -> None:
+        account = accounts[rng.randrange(len(accounts))]
+        category = categories[rng.randrange(len(categories))]
+        transactions.append(
+            {
+                "id": f"transaction-{len(transactions):07d}",
+                "date": day.isoformat(),
+                "amount": amount,
+                "account_id": account["id"],
+                "account_name": account["name"],
+                "payee_name": payee,
+                "category_id": category["id"],
+                "category_name": category["name"],
+                "memo": None,
+                "cleared": "cleared",
+                "approved": True,
+                "deleted": False,
+                **fields,
+            }
+        )
+
+    # Everyday spending, with a few transfers and deleted transactions
+    for _ in range(days * HOUSEHOLD_TRANSACTIONS_PER_DAY * scale):
+        day = start_date + timedelta(days=rng.randrange(days))
+        roll = rng.random()
+        if roll < 0.02:
+            add_transaction(
+                day, -rng.randint(10_000, 500_000), "Transfer", transfer_account_id=accounts[0]["id"]
+            )
+        else:
+            add_transaction(
+                day, -rng.randint(1_000, 50_000), rng.choice(SYNTHETIC_PAYEES), deleted=roll > 0.99
+            )
+
+    # Amazon orders, each charged as one transaction shortly after shipping
+    amazon_orders: dict[str, list[dict[str, Any]]] = {name: [] for name in HOUSEHOLD_AMAZON_ACCOUNTS}
+    for number in range(months * HOUSEHOLD_AMAZON_ORDERS_PER_MONTH * scale):
+        rows = amazon_orders[HOUSEHOLD_AMAZON_ACCOUNTS[number % len(HOUSEHOLD_AMAZON_ACCOUNTS)]]
+        order_date = start_date + timedelta(days=rng.randrange(days - 5))
+        ship_date = order_date + timedelta(days=rng.randint(0, 3))
+        order_id = f"{100 + number % 900}-{number:07d}-{rng.randrange(10_000_000):07d}"
+        total_cents = 0
+        for _ in range(rng.choice((1, 1, 1, 2, 2, 3, 5))):
+            quantity = rng.choice((1, 1, 1, 2))
+            unit_cents = rng.randint(299, 8999)
+            owed_cents = unit_cents * quantity * 108 // 100  # with tax
+            total_cents += owed_cents
+            rows.append(
+                {
+                    "Order ID": order_id,
+                    "ASIN": f"B0{rng.randrange(10**8):08d}",
+                    "Product Name": rng.choice(SYNTHETIC_AMAZON_ITEMS),
+                    "Quantity": quantity,
+                    "Unit Price": cents_to_dollars_str(unit_cents),
+                    "Total Owed": cents_to_dollars_str(owed_cents),
+                    "Order Date": order_date.isoformat(),
+                    "Ship Date": ship_date.isoformat(),
+                }
+            )
+        add_transaction(ship_date + timedelta(days=rng.randint(0, 2)), -total_cents * 10, "Amazon.com")
+
+    # Apple receipts, each charged as one transaction on or after the receipt date
+    apple_receipts = []
+    for number in range(months * HOUSEHOLD_APPLE_RECEIPTS_PER_MONTH * scale):
+        receipt_date = start_date + timedelta(days=rng.randrange(days - 3))
+        items = [
+            {"title": rng.choice(SYNTHETIC_APPLE_ITEMS), "cost": rng.choice((99, 299, 499, 999, 1499, 2999))}
+            for _ in range(rng.choice((1, 1, 1, 2, 3)))
+        ]
+        subtotal = sum(item["cost"] for item in items)
+        tax = subtotal * 8 // 100
+        apple_receipts.append(
+            {
+                "format_detected": "modern_custom",
+                "apple_id": "test@example.com",
+                "receipt_date": receipt_date.isoformat(),
+                "order_id": f"ML{number:08d}",
+                "subtotal": subtotal,
+                "tax": tax,
+                "total": subtotal + tax,
+                "items": items,
+                "base_name": f"receipt_{number:08d}",
+            }
+        )
+        add_transaction(
+            receipt_date + timedelta(days=rng.randint(0, 1)), -(subtotal + tax) * 10, "Apple.com/bill"
+        )
+
+    transactions.sort(key=lambda tx: (tx["date"], tx["id"]))
+    ynab["transactions"] = transactions
+    return SyntheticHousehold(ynab=ynab, amazon_orders=amazon_orders, apple_receipts=apple_receipts)
+
+
+def save_household_history(household: SyntheticHousehold, data_dir: Path) -> None:
+    """
+    Write a household history as the flow's data directory layout.
+
+    Writes ynab/cache/*.json, one amazon/raw/<date>_<account>_amazon_data/
+    Retail.OrderHistory.1.csv per Amazon account and one apple/exports/*.json
+    per parsed receipt.
+
+    Args:
+        household: History from generate_household_history()
+        data_dir: Data directory to populate
+    """
+    cache_dir = data_dir / "ynab" / "cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for name in ("accounts", "categories", "transactions"):
+        with open(cache_dir / f"{name}.json", "w") as f:
+            json.dump(household.ynab[name], f)
+
+    for account, rows in household.amazon_orders.items():
+        account_dir = data_dir / "amazon" / "raw" / f"2024-12-31_{account}_amazon_data"
+        account_dir.mkdir(parents=True, exist_ok=True)
+        with open(account_dir / "Retail.OrderHistory.1.csv", "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=AMAZON_ORDER_HISTORY_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+
+    apple_dir = data_dir / "apple" / "exports"
+    apple_dir.mkdir(parents=True, exist_ok=True)
+    for receipt in household.apple_receipts:
+        with open(apple_dir / f"{receipt['base_name']}.json", "w") as f:
+            json.dump(receipt, f)
+
+
 if __name__ == "__main__":
     # Generate all synthetic test data
     base_dir = Path(__file__).parent.parent / "test_data"
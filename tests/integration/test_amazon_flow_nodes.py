@@ -12,7 +12,9 @@ from pathlib import Path
 import pytest
 
 from finances.amazon.flow import AmazonMatchingFlowNode, AmazonUnzipFlowNode
-from finances.core.flow import FlowContext
+from finances.amazon.unzipper import MANIFEST_PATH
+from finances.core.flow import FlowContext, NodeExecution, NodeStatus
+from finances.core.flow_engine import FlowExecutionEngine
 from finances.core.json_utils import write_json
 
 
@@ -69,6 +71,24 @@ class TestAmazonUnzipFlowNode:
         csv_path = extracted_dirs[0] / "Retail.OrderHistory.1" / "Retail.OrderHistory.1.csv"
         assert csv_path.exists()
 
+    def test_engine_reruns_skip_extracted_zips(self, temp_dir, karl_zip):
+        """Test that the extraction manifest survives engine cleanup, so reruns extract nothing."""
+        node = AmazonUnzipFlowNode(temp_dir)
+        raw_dir = temp_dir / "amazon" / "raw"
+        raw_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copy(karl_zip, raw_dir / "amazon_orders_karl.zip")
+        engine = FlowExecutionEngine()
+
+        for expected_new in (1, 0):
+            execution = NodeExecution(node_name=node.name, status=NodeStatus.PENDING)
+            engine.run_node_with_archiving(node, execution, FlowContext(start_time=datetime.now()), {})
+
+            assert execution.result is not None
+            assert execution.result.new_items == expected_new
+            assert (raw_dir / MANIFEST_PATH).exists()
+
+        assert len(list(raw_dir.glob("*_karl_amazon_data*"))) == 1
+
     # test_execute_no_zip_files removed - covered by parameterized test_flownode_interface.py
 
 
@@ -7,12 +7,17 @@ Tests complete end-to-end extraction workflows using real ZIP fixtures.
 
 import csv
 import json
+import shutil
+import zipfile
 from pathlib import Path
 
 import pytest
 
 from finances.amazon.unzipper import AmazonUnzipper, extract_amazon_zip_files
 
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "amazon"
+ORDER_CSV = "Retail.OrderHistory.1/Retail.OrderHistory.1.csv"
+
 
 @pytest.mark.integration
 @pytest.mark.amazon
@@ -329,3 +334,146 @@ class TestAmazonUnzipperIntegration:
         output_dir = Path(extraction["output_directory"])
         assert output_dir.exists()
         assert (output_dir / "Retail.OrderHistory.1" / "Retail.OrderHistory.1.csv").exists()
+
+
+def _write_export(zip_path: Path, members: dict[str, bytes]) -> Path:
+    """Write an uncompressed export ZIP with the given members."""
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_STORED) as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    return zip_path
+
+
+@pytest.mark.integration
+@pytest.mark.amazon
+class TestResumableBatchExtraction:
+    """Integration tests for manifest-based, resumable batch extraction."""
+
+    @pytest.fixture
+    def download_dir(self, temp_dir):
+        """Download directory holding both account fixtures."""
+        download_dir = temp_dir / "downloads"
+        download_dir.mkdir()
+        for account in ("karl", "erica"):
+            shutil.copy(FIXTURES_DIR / f"amazon_orders_{account}.zip", download_dir)
+        return download_dir
+
+    @pytest.fixture
+    def unzipper(self, temp_dir):
+        """Unzipper extracting two ZIPs at a time."""
+        return AmazonUnzipper(temp_dir / "amazon" / "raw", max_workers=2)
+
+    def test_extracts_only_order_history_members(self, unzipper, download_dir):
+        """Test that batch extraction writes the order history CSVs and nothing else."""
+        result = unzipper.batch_extract(download_dir)
+
+        assert result["success"] is True
+        assert result["files_processed"] == 2
+        for extraction in result["extractions"]:
+            output_dir = Path(extraction["output_directory"])
+            assert extraction["csv_files"] == [ORDER_CSV]
+            assert (output_dir / ORDER_CSV).exists()
+            assert not (output_dir / "metadata.json").exists()
+
+    def test_skips_zips_already_extracted(self, unzipper, download_dir):
+        """Test that a second run, and renamed copies, reuse the first extraction."""
+        first = unzipper.batch_extract(download_dir)
+        shutil.copy(download_dir / "amazon_orders_karl.zip", download_dir / "karl_again.zip")
+        outputs = sorted(p.name for p in unzipper.raw_data_dir.iterdir())
+
+        second = unzipper.batch_extract(download_dir)
+
+        assert second["success"] is True
+        assert second["files_processed"] == 0
+        assert second["files_skipped"] == 3
+        assert sorted(p.name for p in unzipper.raw_data_dir.iterdir()) == outputs
+        manifest = unzipper.load_manifest()
+        assert {entry["output_directory"] for entry in manifest.values()} == {
+            Path(e["output_directory"]).name for e in first["extractions"]
+        }
+
+    def test_reextracts_when_output_was_removed(self, unzipper, download_dir):
+        """Test that a ZIP whose output directory was deleted, or member truncated, is extracted again."""
+        first = {
+            Path(e["zip_file"]).name: Path(e["output_directory"])
+            for e in unzipper.batch_extract(download_dir)["extractions"]
+        }
+        shutil.rmtree(first["amazon_orders_karl.zip"])
+        (first["amazon_orders_erica.zip"] / ORDER_CSV).write_text("Order ID\n")
+
+        second = unzipper.batch_extract(download_dir)
+
+        assert second["files_processed"] == 2
+        assert second["files_skipped"] == 0
+        redone = {Path(e["zip_file"]).name: e for e in second["extractions"]}
+        assert redone["amazon_orders_karl.zip"]["resumed"] is False
+        assert (Path(redone["amazon_orders_karl.zip"]["output_directory"]) / ORDER_CSV).exists()
+        assert redone["amazon_orders_erica.zip"]["resumed"] is True
+        assert redone["amazon_orders_erica.zip"]["files_extracted"] == 1
+        assert unzipper.batch_extract(download_dir)["files_skipped"] == 2
+
+    def test_resumes_interrupted_extraction(self, unzipper, temp_dir):
+        """Test that members verified before an interruption are not extracted again."""
+        download_dir = temp_dir / "downloads"
+        download_dir.mkdir()
+        header = b"Order ID,Total Owed\n"
+        _write_export(
+            download_dir / "amazon_orders_karl.zip",
+            {
+                "Retail.OrderHistory.1/Retail.OrderHistory.1.csv": header + b"111,1.00\n",
+                "Retail.OrderHistory.2/Retail.OrderHistory.2.csv": header + b"222,2.00\n",
+            },
+        )
+        first = unzipper.batch_extract(download_dir)["extractions"][0]
+        output_dir = Path(first["output_directory"])
+
+        # Simulate an interruption after the first member was written
+        manifest = unzipper.load_manifest()
+        (entry,) = manifest.values()
+        del entry["members"]["Retail.OrderHistory.2/Retail.OrderHistory.2.csv"]
+        entry["complete"] = False
+        unzipper.manifest_path.write_text(json.dumps({"zips": manifest}))
+        (output_dir / "Retail.OrderHistory.2" / "Retail.OrderHistory.2.csv").unlink()
+
+        resumed = unzipper.batch_extract(download_dir)["extractions"][0]
+
+        assert resumed["resumed"] is True
+        assert resumed["output_directory"] == str(output_dir)
+        assert resumed["files_extracted"] == 1
+        assert (
+            (output_dir / "Retail.OrderHistory.2" / "Retail.OrderHistory.2.csv")
+            .read_bytes()
+            .endswith(b"222,2.00\n")
+        )
+        assert unzipper.batch_extract(download_dir)["files_skipped"] == 1
+
+    def test_crc_mismatch_fails_without_recording_member(self, unzipper, temp_dir):
+        """Test that a member with corrupted data is reported and not marked extracted."""
+        download_dir = temp_dir / "downloads"
+        download_dir.mkdir()
+        zip_path = _write_export(
+            download_dir / "amazon_orders_karl.zip", {ORDER_CSV: b"Order ID\n111-CORRUPT\n"}
+        )
+        zip_path.write_bytes(zip_path.read_bytes().replace(b"111-CORRUPT", b"999-CORRUPT"))
+
+        result = unzipper.batch_extract(download_dir)
+
+        assert result["success"] is False
+        assert "Invalid ZIP file" in result["errors"][0]["error"]
+        (entry,) = unzipper.load_manifest().values()
+        assert entry["members"] == {}
+        assert entry["complete"] is False
+
+    def test_rejects_member_names_outside_output_dir(self, unzipper, temp_dir):
+        """Test that member paths cannot escape the output directory."""
+        download_dir = temp_dir / "downloads"
+        download_dir.mkdir()
+        _write_export(
+            download_dir / "amazon_orders_karl.zip", {"../Retail.OrderHistory.1.csv": b"Order ID\n"}
+        )
+
+        result = unzipper.batch_extract(download_dir)
+
+        assert result["files_failed"] == 1
+        assert "Unsafe ZIP member name" in result["errors"][0]["error"]
+        assert not (unzipper.raw_data_dir / "Retail.OrderHistory.1.csv").exists()
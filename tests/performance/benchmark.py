@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Benchmark Harness
+
+Times pipeline stages with stable, repeatable measurements:
+- Each repetition runs after a full garbage collection with the collector
+  paused, and the minimum and median of the repetitions are reported
+- Peak traced memory comes from one extra, untimed run under tracemalloc
+  (tracing slows execution, so it never overlaps a timed run)
+- Results serialize to JSON and compare against a stored baseline run
+
+Used by test_benchmarks.py through the fixtures in conftest.py.
+"""
+
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+# Results file format version
+RESULTS_VERSION = 1
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing and memory of one benchmark at one scale."""
+
+    name: str
+    scale: int
+    items: int  # Units of work per run (transactions, receipts, files, ...)
+    repeats: int
+    min_seconds: float
+    median_seconds: float
+    peak_memory_bytes: int
+
+    @property
+    def key(self) -> str:
+        """Identifier used to match results against a baseline."""
+        return f"{self.name}[{self.scale}x]"
+
+    @property
+    def items_per_second(self) -> float:
+        """Throughput of the fastest run."""
+        return self.items / self.min_seconds if self.min_seconds > 0 else float("inf")
+
+
+def run_benchmark(
+    name: str,
+    func: Callable[[Any], Any],
+    *,
+    scale: int,
+    items: int,
+    setup: Callable[[], Any] | None = None,
+    repeats: int = 5,
+    warmup: int = 1,
+    measure_memory: bool = True,
+) -> BenchmarkResult:
+    """
+    Time a function over several repetitions.
+
+    Args:
+        name: Benchmark name
+        func: Function to time; called with the value returned by setup (or None)
+        scale: Data scale multiplier the benchmark ran at
+        items: Units of work per call, for throughput
+        setup: Untimed function run before every call (e.g. fresh matcher state)
+        repeats: Timed repetitions
+        warmup: Untimed repetitions first (imports, caches)
+        measure_memory: Also run once under tracemalloc for peak memory
+
+    Returns:
+        BenchmarkResult with min/median time and peak traced memory
+    """
+
+    def prepared() -> Any:
+        return setup() if setup is not None else None
+
+    for _ in range(warmup):
+        func(prepared())
+
+    timings = []
+    gc_was_enabled = gc.isenabled()
+    try:
+        for _ in range(repeats):
+            arg = prepared()
+            gc.collect()
+            gc.disable()
+            start = time.perf_counter()
+            func(arg)
+            timings.append(time.perf_counter() - start)
+            gc.enable()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    peak = 0
+    if measure_memory:
+        arg = prepared()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func(arg)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return BenchmarkResult(
+        name=name,
+        scale=scale,
+        items=items,
+        repeats=repeats,
+        min_seconds=min(timings),
+        median_seconds=statistics.median(timings),
+        peak_memory_bytes=peak,
+    )
+
+
+def write_results(path: Path, results: list[BenchmarkResult]) -> None:
+    """
+    Write benchmark results as JSON (usable later as a baseline).
+
+    Args:
+        path: Output file
+        results: Results to write
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "version": RESULTS_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": [
+            {**asdict(result), "key": result.key, "items_per_second": result.items_per_second}
+            for result in results
+        ],
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n")
+
+
+def load_baseline(path: Path) -> dict[str, dict[str, Any]]:
+    """
+    Load a results file written by write_results() as a baseline.
+
+    Args:
+        path: Results file
+
+    Returns:
+        Dict mapping result key (e.g. "load_transactions[10x]") to the result dict
+
+    Raises:
+        ValueError: If the file is not a benchmark results file
+    """
+    document = json.loads(path.read_text())
+    if not isinstance(document, dict) or document.get("version") != RESULTS_VERSION:
+        raise ValueError(f"Not a version {RESULTS_VERSION} benchmark results file: {path}")
+    return {entry["key"]: entry for entry in document["results"]}
+
+
+def compare_to_baseline(
+    result: BenchmarkResult, baseline: dict[str, dict[str, Any]], tolerance: float
+) -> str | None:
+    """
+    Compare a result to its baseline entry.
+
+    Time is compared on the minimum (least noisy) run; memory on traced peak.
+
+    Args:
+        result: New result
+        baseline: Baseline from load_baseline()
+        tolerance: Allowed relative slowdown or memory growth (0.25 = 25%)
+
+    Returns:
+        Description of the regression, or None if within tolerance or not in the baseline
+    """
+    previous = baseline.get(result.key)
+    if previous is None:
+        return None
+
+    problems = []
+    time_ratio = result.min_seconds / previous["min_seconds"] if previous["min_seconds"] > 0 else 1.0
+    if time_ratio > 1 + tolerance:
+        problems.append(
+            f"time {previous['min_seconds'] * 1000:.1f}ms -> {result.min_seconds * 1000:.1f}ms"
+            f" ({time_ratio:.2f}x)"
+        )
+    if previous["peak_memory_bytes"] and result.peak_memory_bytes:
+        memory_ratio = result.peak_memory_bytes / previous["peak_memory_bytes"]
+        if memory_ratio > 1 + tolerance:
+            problems.append(
+                f"peak memory {previous['peak_memory_bytes'] / 1e6:.1f}MB"
+                f" -> {result.peak_memory_bytes / 1e6:.1f}MB ({memory_ratio:.2f}x)"
+            )
+
+    return f"{result.key}: " + ", ".join(problems) if problems else None
+
+
+def format_result(result: BenchmarkResult) -> str:
+    """One-line summary of a result for the terminal."""
+    return (
+        f"{result.key:<36} {result.min_seconds * 1000:>10.1f}ms min"
+        f" {result.median_seconds * 1000:>10.1f}ms median"
+        f" {result.items_per_second:>12.0f} items/s"
+        f" {result.peak_memory_bytes / 1e6:>9.1f}MB peak"
+    )
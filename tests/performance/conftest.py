@@ -0,0 +1,115 @@
+"""
+Benchmark Suite Fixtures
+
+Parametrizes benchmarks over --bench-scales, generates each scale's synthetic
+household data once per session, and collects results for --bench-json and
+--bench-baseline (options are registered in tests/conftest.py).
+"""
+
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tests.fixtures.synthetic_data import (
+    SyntheticHousehold,
+    generate_household_history,
+    save_household_history,
+)
+from tests.performance.benchmark import (
+    BenchmarkResult,
+    compare_to_baseline,
+    format_result,
+    load_baseline,
+    run_benchmark,
+    write_results,
+)
+
+# Timed repetitions per scale (larger scales run long enough to be stable)
+REPEATS_BY_SCALE = {1: 3, 10: 2}
+DEFAULT_REPEATS = 1
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Run each benchmark at every requested scale."""
+    if "bench_scale" in metafunc.fixturenames:
+        scales = [int(s) for s in metafunc.config.getoption("--bench-scales").split(",") if s.strip()]
+        metafunc.parametrize("bench_scale", scales, ids=[f"{s}x" for s in scales])
+
+
+@pytest.fixture(scope="session")
+def households(tmp_path_factory: pytest.TempPathFactory) -> Callable[[int], tuple[SyntheticHousehold, Path]]:
+    """Synthetic household data and its written data directory, per scale (generated once)."""
+    cache: dict[int, tuple[SyntheticHousehold, Path]] = {}
+
+    def get(scale: int) -> tuple[SyntheticHousehold, Path]:
+        if scale not in cache:
+            household = generate_household_history(scale=scale)
+            data_dir = tmp_path_factory.mktemp(f"household_{scale}x")
+            save_household_history(household, data_dir)
+            cache[scale] = (household, data_dir)
+        return cache[scale]
+
+    return get
+
+
+@pytest.fixture
+def household(
+    households: Callable[[int], tuple[SyntheticHousehold, Path]], bench_scale: int
+) -> SyntheticHousehold:
+    """Synthetic household history at the benchmark's scale."""
+    return households(bench_scale)[0]
+
+
+@pytest.fixture
+def household_dir(households: Callable[[int], tuple[SyntheticHousehold, Path]], bench_scale: int) -> Path:
+    """Data directory holding the household history at the benchmark's scale."""
+    return households(bench_scale)[1]
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(request: pytest.FixtureRequest) -> Iterator[list[BenchmarkResult]]:
+    """All results of the session; written to --bench-json at the end."""
+    results: list[BenchmarkResult] = []
+    yield results
+
+    output = request.config.getoption("--bench-json")
+    if output and results:
+        write_results(output, results)
+
+
+@pytest.fixture(scope="session")
+def benchmark_baseline(request: pytest.FixtureRequest) -> dict[str, dict[str, Any]]:
+    """Baseline results from --bench-baseline (empty without one)."""
+    path = request.config.getoption("--bench-baseline")
+    return load_baseline(path) if path else {}
+
+
+@pytest.fixture
+def benchmark(
+    request: pytest.FixtureRequest,
+    bench_scale: int,
+    benchmark_results: list[BenchmarkResult],
+    benchmark_baseline: dict[str, dict[str, Any]],
+) -> Callable[..., BenchmarkResult]:
+    """
+    Run, record and check one benchmark at the current scale.
+
+    Call as benchmark(name, func, items=..., setup=...); fails the test when
+    the result regresses against --bench-baseline.
+    """
+    tolerance = request.config.getoption("--bench-tolerance")
+
+    def run(name: str, func: Callable[[Any], Any], *, items: int, **kwargs: Any) -> BenchmarkResult:
+        kwargs.setdefault("repeats", REPEATS_BY_SCALE.get(bench_scale, DEFAULT_REPEATS))
+        result = run_benchmark(name, func, scale=bench_scale, items=items, **kwargs)
+        benchmark_results.append(result)
+        print(f"\n{format_result(result)}")
+
+        regression = compare_to_baseline(result, benchmark_baseline, tolerance)
+        if regression:
+            pytest.fail(f"Benchmark regression: {regression}")
+        return result
+
+    return run
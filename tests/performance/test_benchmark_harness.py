@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Tests for the benchmark harness (timing, results files and baseline comparison)."""
+
+import pytest
+
+from tests.performance.benchmark import (
+    BenchmarkResult,
+    compare_to_baseline,
+    load_baseline,
+    run_benchmark,
+    write_results,
+)
+
+
+def _result(min_seconds: float, peak: int = 1000) -> BenchmarkResult:
+    return BenchmarkResult(
+        name="stage", scale=10, items=100, repeats=3, min_seconds=min_seconds, median_seconds=min_seconds, peak_memory_bytes=peak
+    )  # fmt: skip
+
+
+class TestBenchmarkHarness:
+    """Test benchmark running and baseline comparison."""
+
+    def test_run_benchmark(self):
+        """Test setup runs before every call and results carry throughput."""
+        calls = []
+
+        result = run_benchmark("stage", lambda arg: calls.append(arg), scale=1, items=10, setup=lambda: "fresh", repeats=3)  # fmt: skip
+
+        assert calls == ["fresh"] * 5  # warmup, 3 timed, memory
+        assert result.key == "stage[1x]"
+        assert result.min_seconds <= result.median_seconds
+        assert result.items_per_second > 0
+
+    def test_baseline_round_trip(self, temp_dir):
+        """Test a results file loads back as a baseline keyed by name and scale."""
+        path = temp_dir / "bench.json"
+        write_results(path, [_result(0.5)])
+
+        baseline = load_baseline(path)
+
+        assert baseline["stage[10x]"]["min_seconds"] == 0.5
+
+    def test_load_baseline_rejects_other_files(self, temp_dir):
+        """Test a file that is not a results file is rejected."""
+        path = temp_dir / "bench.json"
+        path.write_text("[]")
+
+        with pytest.raises(ValueError):
+            load_baseline(path)
+
+    @pytest.mark.parametrize(
+        ("min_seconds", "peak", "regressed"),
+        [(0.55, 1000, False), (0.7, 1000, True), (0.5, 2000, True), (0.3, 500, False)],
+    )
+    def test_compare_to_baseline(self, temp_dir, min_seconds, peak, regressed):
+        """Test slowdowns and memory growth beyond the tolerance are reported."""
+        path = temp_dir / "bench.json"
+        write_results(path, [_result(0.5)])
+
+        regression = compare_to_baseline(_result(min_seconds, peak), load_baseline(path), tolerance=0.25)
+
+        assert (regression is not None) == regressed
+
+    def test_new_benchmark_not_compared(self):
+        """Test results missing from the baseline are not regressions."""
+        assert compare_to_baseline(_result(1.0), {}, tolerance=0.25) is None
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Pipeline Stage Benchmarks
+
+Benchmarks each pipeline stage on synthetic household data at the scales
+given by --bench-scales (multiples of one household's history; default 1).
+
+Examples:
+    uv run pytest tests/performance/test_benchmarks.py -s
+    uv run pytest tests/performance/test_benchmarks.py -s --bench-scales 1,10,100 --bench-json bench.json
+    uv run pytest tests/performance/test_benchmarks.py --bench-baseline bench.json
+"""
+
+import random
+import shutil
+from pathlib import Path
+
+import pytest
+
+from finances.amazon import SimplifiedMatcher, SplitPaymentMatcher, load_orders
+from finances.amazon.models import MatchedOrderItem
+from finances.analysis import CashFlowAnalyzer, CashFlowConfig
+from finances.apple import AppleMatcher, AppleReceiptParser
+from finances.apple.parser import ParsedReceipt
+from finances.core.archive import ArchiveManager
+from finances.core.flow_engine import FlowExecutionEngine
+from finances.core.money import Money
+from finances.ynab import calculate_amazon_splits, calculate_apple_splits, load_transactions
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+APPLE_FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "apple"
+
+# Receipts parsed per run at 1x
+RECEIPTS_TO_PARSE = 50
+
+# Large orders for split subset-sum: orders per run at 1x, items per order
+LARGE_ORDERS = 4
+LARGE_ORDER_ITEMS = 18
+
+
+def test_load_transactions(benchmark, household, household_dir):
+    """Benchmark loading the YNAB transaction cache as domain models."""
+    cache_dir = household_dir / "ynab" / "cache"
+
+    benchmark(
+        "load_transactions", lambda _: load_transactions(cache_dir), items=len(household.ynab["transactions"])
+    )
+
+
+def test_load_orders(benchmark, household, household_dir):
+    """Benchmark loading Amazon order history CSVs as domain models."""
+    raw_dir = household_dir / "amazon" / "raw"
+    rows = sum(len(rows) for rows in household.amazon_orders.values())
+
+    benchmark("load_orders", lambda _: load_orders(raw_dir), items=rows)
+
+
+def test_amazon_matching(benchmark, household_dir):
+    """Benchmark matching every Amazon transaction against all orders."""
+    matcher = SimplifiedMatcher()
+    orders = load_orders(household_dir / "amazon" / "raw")
+    transactions = [
+        tx
+        for tx in load_transactions(household_dir / "ynab" / "cache")
+        if matcher.is_amazon_transaction(tx.payee_name or "")
+    ]
+
+    def match_all(matcher: SimplifiedMatcher) -> None:
+        for tx in transactions:
+            matcher.match_transaction(tx, orders)
+
+    result = benchmark("amazon_matching", match_all, items=len(transactions), setup=SimplifiedMatcher)
+    assert result.items > 0
+
+
+def test_split_subset_sum(benchmark, bench_scale):
+    """Benchmark split-payment subset search on large orders with no single-item match."""
+    rng = random.Random(0)  # noqa: S311  (synthetic amounts)
+    searches = []
+    for _ in range(LARGE_ORDERS * bench_scale):
+        items = [{"index": i, "amount": rng.randint(500, 5000)} for i in range(LARGE_ORDER_ITEMS)]
+        target = sum(item["amount"] for item in rng.sample(items, LARGE_ORDER_ITEMS // 3))
+        searches.append((items, target))
+
+    def search_all(matcher: SplitPaymentMatcher) -> None:
+        for items, target in searches:
+            matcher.find_item_combinations(items, target)
+
+    benchmark("split_subset_sum", search_all, items=len(searches), setup=SplitPaymentMatcher)
+
+
+def test_apple_receipt_parsing(benchmark, bench_scale):
+    """Benchmark parsing Apple receipt HTML (table and modern formats)."""
+    samples = [
+        (APPLE_FIXTURES_DIR / name).read_text()
+        for name in ("table_format_receipt.html", "modern_format_receipt.html", "multi_item_receipt.html")
+    ]
+    receipts = [samples[i % len(samples)] for i in range(RECEIPTS_TO_PARSE * bench_scale)]
+    parser = AppleReceiptParser()
+
+    def parse_all(_: None) -> None:
+        for i, html in enumerate(receipts):
+            parser.parse_html_content(html, f"receipt-{i}")
+
+    benchmark("apple_receipt_parsing", parse_all, items=len(receipts))
+
+
+def test_apple_matching(benchmark, household, household_dir):
+    """Benchmark matching every Apple transaction against all receipts."""
+    receipts = [ParsedReceipt.from_dict(r) for r in household.apple_receipts]
+    transactions = [
+        tx for tx in load_transactions(household_dir / "ynab" / "cache") if tx.payee_name == "Apple.com/bill"
+    ]
+    matcher = AppleMatcher()
+
+    def match_all(_: None) -> None:
+        for tx in transactions:
+            matcher.match_single_transaction(tx, receipts)
+
+    benchmark("apple_matching", match_all, items=len(transactions))
+
+
+def test_split_generation(benchmark, household):
+    """Benchmark calculating YNAB splits for every Amazon order and Apple receipt."""
+    amazon_orders: dict[str, list[MatchedOrderItem]] = {}
+    for rows in household.amazon_orders.values():
+        for row in rows:
+            amazon_orders.setdefault(row["Order ID"], []).append(
+                MatchedOrderItem(
+                    name=row["Product Name"],
+                    amount=Money.from_dollars(row["Total Owed"]),
+                    quantity=row["Quantity"],
+                )
+            )
+    amazon = [
+        (Money.from_cents(-sum(i.amount.to_cents() for i in items)), items)
+        for items in amazon_orders.values()
+    ]
+    apple = [ParsedReceipt.from_dict(r) for r in household.apple_receipts]
+
+    def split_all(_: None) -> None:
+        for total, items in amazon:
+            calculate_amazon_splits(total, items)
+        for receipt in apple:
+            calculate_apple_splits(receipt.total * -1, receipt)  # type: ignore[operator]
+
+    benchmark("split_generation", split_all, items=len(amazon) + len(apple))
+
+
+def test_compute_directory_hash(benchmark, household_dir):
+    """Benchmark hashing a data directory for change detection."""
+    engine = FlowExecutionEngine()
+    files = sum(1 for p in household_dir.rglob("*") if p.is_file() and "archive" not in p.parts)
+
+    benchmark("compute_directory_hash", lambda _: engine.compute_directory_hash(household_dir), items=files)
+
+
+def test_archiving(benchmark, household_dir):
+    """Benchmark archiving all domains' data before a flow run."""
+
+    def clear_archives() -> ArchiveManager:
+        for archive_dir in household_dir.glob("*/archive"):
+            shutil.rmtree(archive_dir)
+        return ArchiveManager(household_dir)
+
+    manager = clear_archives()
+    files = sum(len(archiver.get_archivable_files()) for archiver in manager.domain_archivers.values())
+
+    benchmark(
+        "archiving",
+        lambda manager: manager.create_transaction_archive("benchmark"),
+        items=files,
+        setup=clear_archives,
+    )
+
+
+def test_cash_flow_load(benchmark, household, household_dir):
+    """Benchmark loading YNAB data into the cash flow analyzer."""
+    accounts = [account["name"] for account in household.ynab["accounts"]["accounts"]]
+    start_date = household.ynab["transactions"][0]["date"]
+    cache_dir = household_dir / "ynab" / "cache"
+
+    def load(_: None) -> None:
+        CashFlowAnalyzer(CashFlowConfig(cash_accounts=accounts, start_date=start_date)).load_data(cache_dir)
+
+    benchmark("cash_flow_load", load, items=len(household.ynab["transactions"]))
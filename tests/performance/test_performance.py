@@ -2,6 +2,10 @@
 """Performance tests with realistic data volumes."""
 
 import json
+import os
+import subprocess
+import sys
+from pathlib import Path
 
 import pytest
 
@@ -86,3 +90,151 @@ def test_cash_flow_performance_large_dataset(temp_dir):
     assert dashboard_file.exists()
     assert len(analyzer.df) == 730  # One row per day
     assert len(transactions_data) == 7300  # Verify test data size
+
+
+# Third-party packages and non-stdlib module count the CLI entry point may import.
+# Module counts, unlike wall-clock import time, do not depend on machine load; the
+# data science stack alone would add several hundred modules.
+CLI_THIRD_PARTY_PACKAGES = {"click", "dotenv"}
+CLI_IMPORT_MODULE_BUDGET = 40
+
+# Modules the CLI must not import until a command needs them
+HEAVY_MODULES = ("pandas", "numpy", "matplotlib", "scipy", "bs4")
+
+
+def _cli_env() -> dict[str, str]:
+    """Environment for a fresh interpreter that imports the package from src/."""
+    src_dir = Path(__file__).resolve().parents[2] / "src"
+    return {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(src_dir), os.environ.get("PYTHONPATH")])),
+    }
+
+
+def _cli_import_times() -> dict[str, int]:
+    """Cumulative import time (microseconds) per module when importing the CLI in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import finances.cli.main"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=_cli_env(),
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, module = line.split("|")
+            if cumulative.strip().isdigit():
+                times[module.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.performance
+def test_cli_import_defers_heavy_dependencies():
+    """Test importing the CLI entry point does not import the data science stack."""
+    times = _cli_import_times()
+
+    assert "finances.cli.main" in times
+    assert sorted(m for m in times if m.split(".")[0] in HEAVY_MODULES) == []
+
+
+def _cli_imported_modules() -> list[str]:
+    """Non-stdlib modules loaded by importing the CLI in a fresh interpreter."""
+    script = (
+        "import json, sys; before = set(sys.modules); import finances.cli.main; "
+        "print(json.dumps(sorted(set(sys.modules) - before)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True, env=_cli_env()
+    )
+    return [m for m in json.loads(result.stdout) if m.split(".")[0] not in sys.stdlib_module_names]
+
+
+@pytest.mark.performance
+def test_cli_import_module_budget():
+    """Test the CLI entry point imports only its own modules, click and dotenv, within a module budget."""
+    modules = _cli_imported_modules()
+    unexpected = {m.split(".")[0] for m in modules} - CLI_THIRD_PARTY_PACKAGES - {"finances"}
+
+    assert "finances.cli.main" in modules
+    assert not unexpected, f"CLI imports third-party packages {sorted(unexpected)}"
+    assert len(modules) <= CLI_IMPORT_MODULE_BUDGET, f"CLI imports {len(modules)} modules: {modules}"
+
+
+# Retained heap per loaded record (YNAB transaction or Amazon item), including
+# ids and names; about 780 bytes before Money, FinancialDate and the models
+# were slotted and dates and YNAB names interned.
+MODEL_BYTES_PER_RECORD_BUDGET = 400
+
+# Traced peak per record while loading (parsed JSON/CSV rows plus the models built
+# from them); about 780 bytes with orjson, 810 with the standard json module.
+MODEL_PEAK_BYTES_PER_RECORD_BUDGET = 1000
+
+
+def _write_model_fixtures(temp_dir: Path, transactions: int, items: int) -> tuple[Path, Path]:
+    """Write a synthetic YNAB cache and Amazon order history CSV."""
+    import csv
+    from datetime import date, timedelta
+
+    start = date(2020, 1, 1)
+    ynab_dir = temp_dir / "ynab" / "cache"
+    ynab_dir.mkdir(parents=True)
+    records = [
+        {
+            "id": f"txn-{i}",
+            "date": (start + timedelta(days=i % 1500)).isoformat(),
+            "amount": -10 * (i % 9973),
+            "account_id": f"acc-{i % 4}",
+            "account_name": f"Account {i % 4}",
+            "payee_name": f"Payee {i % 500}",
+            "category_name": f"Category {i % 40}",
+            "cleared": "cleared",
+            "approved": True,
+        }
+        for i in range(transactions)
+    ]
+    (ynab_dir / "transactions.json").write_text(json.dumps(records))
+
+    amazon_dir = temp_dir / "amazon" / "raw" / "2024-01-01_karl_amazon_data"
+    amazon_dir.mkdir(parents=True)
+    with open(amazon_dir / "Retail.OrderHistory.1.csv", "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Order ID", "ASIN", "Product Name", "Quantity", "Unit Price", "Total Owed", "Order Date", "Ship Date"])  # fmt: skip
+        for i in range(items):
+            day = start + timedelta(days=i % 1500)
+            writer.writerow([f"111-{i // 3:07d}", f"B0{i % 997:08d}", f"Product {i % 997}", 1, "12.34", "13.57", day.isoformat(), (day + timedelta(days=1)).isoformat()])  # fmt: skip
+    return ynab_dir, amazon_dir.parent
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+def test_loaded_model_memory_footprint(temp_dir):
+    """Test retained and peak memory of loading YNAB transactions and Amazon items stay within budget."""
+    import gc
+    import tracemalloc
+
+    from finances.amazon.loader import load_orders
+    from finances.ynab.loader import load_transactions
+
+    ynab_dir, amazon_dir = _write_model_fixtures(temp_dir, transactions=50_000, items=20_000)
+    import pandas  # noqa: F401  (imported before tracing, so the measurement covers only the data)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        transactions = load_transactions(ynab_dir)
+        orders = load_orders(amazon_dir)
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    records = len(transactions) + sum(len(items) for items in orders.values())
+
+    assert records == 70_000
+    assert (
+        retained / records < MODEL_BYTES_PER_RECORD_BUDGET
+    ), f"{retained / records:.0f} bytes/record retained ({retained / 1e6:.1f}MB for {records} records)"
+    assert (
+        peak / records < MODEL_PEAK_BYTES_PER_RECORD_BUDGET
+    ), f"{peak / records:.0f} bytes/record traced peak ({peak / 1e6:.1f}MB for {records} records)"
@@ -6,8 +6,7 @@ Tests grouper refactored to use list[AmazonOrderItem] input
 and OrderGroup output (no DataFrames).
 """
 
-
-from finances.amazon.grouper import GroupingLevel, group_orders
+from finances.amazon.grouper import GroupingLevel, group_all_levels, group_orders
 from finances.amazon.models import AmazonOrderItem, OrderGroup
 from finances.core import FinancialDate, Money
 
@@ -165,3 +164,68 @@ class TestGroupOrdersByOrderId:
 
         # Assert
         assert result == {}
+
+
+def _item(order_id: str, name: str, cents: int, ship_date: str | None) -> AmazonOrderItem:
+    """Build an order item placed on 2024-01-15."""
+    return AmazonOrderItem(
+        order_id=order_id,
+        asin="B01",
+        product_name=name,
+        quantity=1,
+        unit_price=Money.from_cents(cents),
+        total_owed=Money.from_cents(cents),
+        order_date=FinancialDate.from_string("2024-01-15"),
+        ship_date=FinancialDate.from_string(ship_date) if ship_date else None,
+    )
+
+
+SHIPPED_ITEMS = [
+    _item("A", "Late", 300, "2024-01-18"),
+    _item("B", "Only", 700, "2024-01-17"),
+    _item("A", "Early", 100, "2024-01-16"),
+    _item("A", "Late too", 200, "2024-01-18"),
+    _item("A", "Pending", 50, None),
+]
+
+
+class TestGroupOrdersByShipment:
+    """Tests for SHIPMENT and DAILY_SHIPMENT levels and the single-pass engine."""
+
+    def test_shipments_split_orders_by_ship_date(self):
+        """Test that each order yields one group per ship date, undated items first."""
+        result = group_orders(SHIPPED_ITEMS, level=GroupingLevel.SHIPMENT)
+
+        assert isinstance(result, list)
+        assert [(g.order_id, [i.name for i in g.items], g.total.to_cents()) for g in result] == [
+            ("A", ["Pending"], 50),
+            ("A", ["Early"], 100),
+            ("A", ["Late", "Late too"], 500),
+            ("B", ["Only"], 700),
+        ]
+        assert [g.ship_dates for g in result][:2] == [[], [FinancialDate.from_string("2024-01-16")]]
+        assert {g.grouping_level for g in result} == {"shipment"}
+
+    def test_daily_shipments_match_shipments_at_date_resolution(self):
+        """Test that daily groups hold the same items as shipment groups."""
+        shipments = group_orders(SHIPPED_ITEMS, level=GroupingLevel.SHIPMENT)
+        daily = group_orders(SHIPPED_ITEMS, level=GroupingLevel.DAILY_SHIPMENT)
+
+        assert [g.to_dict() | {"grouping_level": "shipment"} for g in daily] == [
+            g.to_dict() for g in shipments
+        ]
+        assert {g.grouping_level for g in daily} == {"daily_shipment"}
+        assert group_orders([], level=GroupingLevel.DAILY_SHIPMENT) == []
+
+    def test_all_levels_agree(self):
+        """Test that orders keep input item order and total their shipments."""
+        groupings = group_all_levels(SHIPPED_ITEMS)
+
+        assert list(groupings.orders) == ["A", "B"]
+        order = groupings.orders["A"]
+        assert [i.name for i in order.items] == ["Late", "Early", "Late too", "Pending"]
+        assert order.ship_dates == [
+            FinancialDate.from_string("2024-01-16"),
+            FinancialDate.from_string("2024-01-18"),
+        ]
+        assert order.total == sum((g.total for g in groupings.shipments_by_order()["A"]), Money.from_cents(0))
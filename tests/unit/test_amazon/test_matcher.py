@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """Tests for Amazon transaction matching module."""
 
-
 import pytest
 
 from finances.amazon import AmazonOrderItem, SimplifiedMatcher
@@ -274,6 +273,49 @@ class TestSimplifiedMatcher:
         any(m.match_method == "split_payment" for m in result.matches)
         # Note: This depends on the matcher implementation
 
+    @pytest.mark.amazon
+    def test_payee_patterns(self, matcher):
+        """Test Amazon payees are recognized by the configured patterns."""
+        assert matcher.is_amazon_transaction("AMZN Mktp US*2K3")
+        assert matcher.is_amazon_transaction("Amazon.com")
+        assert not matcher.is_amazon_transaction("Apple")
+
+        custom = SimplifiedMatcher(payee_patterns=["audible"])
+        assert custom.is_amazon_transaction("Audible Inc")
+        assert not custom.is_amazon_transaction("Amazon.com")
+
+    @pytest.mark.amazon
+    def test_match_window_limits_candidates(self, matcher):
+        """Test that only orders shipped within the window around the charge are considered."""
+        transaction = create_test_transaction(
+            id="test-txn-window",
+            date="2024-08-15",
+            amount=-100000,  # $100.00, part of each order
+            payee_name="AMZN Mktp US*WINDOW",
+            account_name="Chase Credit Card",
+        )
+        orders = [
+            {
+                "order_id": f"order-shipped-{ship_date}",
+                "order_date": "2024-05-01",
+                "ship_date": ship_date,
+                "items": [{"name": "Kept", "amount": 10000}, {"name": "Other", "amount": 4321}],
+            }
+            for ship_date in ["2024-05-02", "2024-07-17", "2024-08-10", "2024-08-18", "2024-08-20"]
+        ]
+        orders_by_account = {"test_account": convert_test_data_to_order_items(orders)}
+
+        result = matcher.match_transaction(transaction, orders_by_account)
+        assert sorted(m.amazon_orders[0].order_id for m in result.matches) == [
+            "order-shipped-2024-07-17",
+            "order-shipped-2024-08-10",
+            "order-shipped-2024-08-18",
+        ]
+
+        narrow = SimplifiedMatcher(match_window=(0, 7))
+        result = narrow.match_transaction(transaction, orders_by_account)
+        assert [m.amazon_orders[0].order_id for m in result.matches] == ["order-shipped-2024-08-10"]
+
 
 class TestEdgeCases:
     """Test edge cases and error conditions."""
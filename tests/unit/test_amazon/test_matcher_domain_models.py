@@ -7,6 +7,8 @@ Tests the new domain model-based interface for SimplifiedMatcher:
 - Returns AmazonMatchResult instead of dict
 """
 
+import dataclasses
+
 import pytest
 
 from finances.amazon import SimplifiedMatcher
@@ -116,3 +118,81 @@ class TestSimplifiedMatcherDomainModels:
         assert not result.has_matches
         assert result.best_match is None
         assert result.message == "Not an Amazon transaction"
+
+    @pytest.mark.amazon
+    def test_match_transaction_charged_per_shipment(self, matcher):
+        """Test that a charge for one shipment of an order matches that shipment directly."""
+        transaction = YnabTransaction.from_dict(
+            {
+                "id": "tx-789",
+                "date": "2024-10-18",
+                "amount": -150000,  # second shipment only
+                "payee_name": "AMZN Mktp US*TEST456",
+                "account_id": "test-account",
+                "account_name": "Test Account",
+            }
+        )
+        orders = [
+            {
+                "order_id": "111-0000000-0000001",
+                "order_date": "2024-10-14",
+                "ship_date": ship_date,
+                "items": [{"name": name, "amount": amount}],
+            }
+            for name, amount, ship_date in [
+                ("Book", 2500, "2024-10-15"),
+                ("Lamp", 10000, "2024-10-18"),
+                ("Bulbs", 5000, "2024-10-18"),
+            ]
+        ]
+
+        result = matcher.match_transaction(transaction, {"karl": convert_test_data_to_order_items(orders)})
+
+        assert result.best_match is not None
+        assert result.best_match.match_method == "complete_shipment"
+        assert result.best_match.confidence == 1.0
+        shipment = result.best_match.amazon_orders[0]
+        assert [item.name for item in shipment.items] == ["Lamp", "Bulbs"]
+        assert shipment.ship_dates == [FinancialDate.from_string("2024-10-18")]
+
+    @pytest.mark.amazon
+    def test_regroups_when_items_replaced_in_same_list(self, matcher):
+        """Test that replacing an item in the same list (same length) is not matched against stale groupings."""
+        transaction = YnabTransaction.from_dict(
+            {
+                "id": "tx-999",
+                "date": "2024-10-15",
+                "amount": -120000,
+                "payee_name": "AMZN Mktp US*TEST789",
+                "account_id": "test-account",
+                "account_name": "Test Account",
+            }
+        )
+        order_items = convert_test_data_to_order_items(
+            [
+                {
+                    "order_id": "111-0000000-0000002",
+                    "order_date": "2024-10-14",
+                    "ship_date": "2024-10-15",
+                    "items": [{"name": "Cable", "amount": 1000}],
+                }
+            ]
+        )
+        account_data = {"karl": order_items}
+
+        assert matcher.match_transaction(transaction, account_data).best_match is None
+
+        order_items[0] = dataclasses.replace(order_items[0], total_owed=Money.from_cents(12000))
+        result = matcher.match_transaction(transaction, account_data)
+
+        assert result.best_match is not None
+        assert result.best_match.amazon_orders[0].total == Money.from_cents(12000)
+
+    def test_order_items_are_immutable(self):
+        """Test that order items cannot be edited in place behind cached groupings."""
+        (item,) = convert_test_data_to_order_items(
+            [{"order_id": "1", "order_date": "2024-10-14", "items": [{"name": "Cable", "amount": 1000}]}]
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            item.total_owed = Money.from_cents(2000)  # type: ignore[misc]
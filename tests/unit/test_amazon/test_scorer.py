@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Tests for table-driven batch match scoring."""
+
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from finances.amazon.scorer import MatchScorer, MatchType
+from finances.core.dates import FinancialDate
+
+TX_DATE = date(2024, 8, 15)
+
+
+class TestScoreBatch:
+    """Test scoring arrays of candidates with the piecewise tables."""
+
+    def test_complete_order_date_table(self):
+        """Test complete-order confidence by days apart, single and multi-day."""
+        days = [0, 1, 2, 3, 4, 6, 8, 10, 20]
+
+        single = MatchScorer.score_batch([0] * len(days), days, MatchType.COMPLETE_ORDER)
+        multi = MatchScorer.score_batch(
+            [0] * len(days), days, MatchType.COMPLETE_ORDER, multi_day=[True] * len(days)
+        )
+
+        assert single.tolist() == [1.0, 0.98, 0.95, 0.9, 0.85, 0.8, 0.7, 0.5, 0.3]
+        # 0.9 * 1.05 is just above 0.945 and rounds up, as round() does
+        assert multi.tolist() == [1.0, 1.0, 1.0, 0.95, 0.89, 0.84, 0.73, 0.53, 0.32]
+
+    def test_complete_order_requires_exact_amount(self):
+        """Test that any amount difference scores zero for complete orders."""
+        scores = MatchScorer.score_batch([0, 1, -1, 5000], [0, 0, 0, 0], MatchType.COMPLETE_ORDER)
+
+        assert scores.tolist() == [1.0, 0.0, 0.0, 0.0]
+
+    def test_split_payment_tables(self):
+        """Test split-payment amount penalties (capped at 30%) and date steps."""
+        scores = MatchScorer.score_batch(
+            amount_diffs=[0, 100, 1000, 9000, 0, 0, 0],
+            date_diffs=[0, 0, 0, 0, 2, 5, 6],
+            match_type=MatchType.SPLIT_PAYMENT,
+            ynab_amounts=[10000] * 7,
+        )
+
+        assert scores.tolist() == [0.95, 0.9, 0.85, 0.66, 0.9, 0.81, 0.71]
+
+    def test_split_payment_requires_amounts(self):
+        """Test that proportional penalties need the transaction amounts."""
+        with pytest.raises(ValueError, match="ynab_amounts"):
+            MatchScorer.score_batch([0], [0], MatchType.SPLIT_PAYMENT)
+
+    def test_scalar_matches_batch(self):
+        """Test that calculate_confidence agrees with scoring the same candidate in a batch."""
+        ship_dates = [[date(2024, 8, 14 - d)] for d in range(12)]
+        batch = MatchScorer.score_batch(
+            [0] * 12,
+            MatchScorer.min_date_diffs(TX_DATE, ship_dates, MatchType.COMPLETE_ORDER),
+            MatchType.COMPLETE_ORDER,
+            multi_day=[True] * 12,
+        )
+
+        for dates, expected in zip(ship_dates, batch.tolist(), strict=True):
+            confidence = MatchScorer.calculate_confidence(
+                5000, 5000, TX_DATE, dates, MatchType.COMPLETE_ORDER, multi_day=True
+            )
+            assert confidence == expected
+
+
+class TestMinDateDiffs:
+    """Test nearest-ship-date distances for candidates."""
+
+    def test_nearest_date_per_candidate(self):
+        """Test the minimum distance over each candidate's dates, of any supported type."""
+        ship_dates = [
+            [date(2024, 8, 10), date(2024, 8, 14)],
+            [FinancialDate.from_string("2024-08-20")],
+            ["2024-08-15", datetime(2024, 8, 1, 12, 0)],
+            [pd.Timestamp("2024-08-17")],
+        ]
+
+        diffs = MatchScorer.min_date_diffs(TX_DATE, ship_dates, MatchType.COMPLETE_ORDER)
+
+        assert diffs.tolist() == [1, 5, 0, 2]
+
+    def test_candidates_without_usable_dates_get_table_default(self):
+        """Test that missing, NaT and malformed dates fall back to the match type's defaults."""
+        ship_dates = [[], [pd.NaT, "not a date"], [date(2024, 8, 15)]]
+
+        complete = MatchScorer.min_date_diffs(TX_DATE, ship_dates, MatchType.COMPLETE_ORDER)
+        split = MatchScorer.min_date_diffs(TX_DATE, ship_dates, MatchType.SPLIT_PAYMENT)
+
+        assert complete.tolist() == [7, 7, 0]
+        # Split payments assume 3 days without ship dates, but 7 when every listed date is unusable
+        assert split.tolist() == [3, 7, 0]
+        assert MatchScorer.min_date_diffs(TX_DATE, [], MatchType.COMPLETE_ORDER).dtype == np.int64
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Tests for split-payment matching on prebuilt per-order structures."""
+
+import pandas as pd
+
+from finances.amazon.models import MatchedOrderItem, OrderGroup
+from finances.amazon.split_matcher import SplitOrder, SplitPaymentMatcher
+from finances.core import FinancialDate, Money
+
+ORDER = OrderGroup(
+    order_id="111-0000000-0000001",
+    items=[
+        MatchedOrderItem(name=name, amount=Money.from_cents(cents), quantity=1)
+        for name, cents in [("Lamp", 4000), ("Book", 1500), ("Pens", 500), ("Mug", 1000)]
+    ],
+    total=Money.from_cents(7000),
+    order_date=FinancialDate.from_string("2024-08-10"),
+    ship_dates=[FinancialDate.from_string("2024-08-12"), FinancialDate.from_string("2024-08-14")],
+    grouping_level="order",
+)
+
+
+def _tx(cents: int, day: str = "2024-08-14") -> dict:
+    """YNAB transaction data for a charge of `cents`."""
+    return {"amount": -cents, "date": day}
+
+
+class TestSplitOrder:
+    """Test the typed per-order view used by the split matcher."""
+
+    def test_from_dict_matches_from_order_group(self):
+        """Test that serialized order data gives the same view as the OrderGroup."""
+        assert SplitOrder.from_dict(ORDER.to_dict()) == SplitOrder.from_order_group(ORDER)
+
+    def test_precomputes_cents_and_ordinals(self):
+        """Test that amounts and ship dates are stored ready for matching."""
+        order = SplitOrder.from_order_group(ORDER)
+
+        assert order.cents == (4000, 1500, 500, 1000)
+        assert order.ship_ordinals == tuple(d.date.toordinal() for d in ORDER.ship_dates)
+
+
+class TestMatchSplitPayment:
+    """Test matching charges against parts of an order."""
+
+    def test_prefers_single_item_then_first_subset(self):
+        """Test that a single item wins, otherwise the first subset of largest items."""
+        matcher = SplitPaymentMatcher()
+        order = SplitOrder.from_order_group(ORDER)
+
+        single = matcher.match_split_payment(_tx(1000), order, "karl")
+        combined = matcher.match_split_payment(_tx(5500), order, "karl")
+
+        assert single is not None and single.matched_item_indices == [3]
+        assert combined is not None and combined.matched_item_indices == [0, 1]
+        assert [item.name for item in combined.amazon_orders[0].items] == ["Lamp", "Book"]
+        assert combined.total_match_amount == Money.from_cents(5500)
+        assert combined.confidence == 0.95
+        assert matcher.match_split_payment(_tx(1234), order, "karl") is None
+
+    def test_unusable_ship_dates_score_below_missing_ones(self):
+        """Test that an order listing only unusable ship dates is treated as 7 days off, not 3."""
+        matcher = SplitPaymentMatcher()
+        order_data = ORDER.to_dict()
+
+        missing = matcher.match_split_payment(_tx(1000), {**order_data, "ship_dates": []}, "karl")
+        unusable = matcher.match_split_payment(
+            _tx(1000), {**order_data, "ship_dates": [pd.NaT, "not a date"]}, "karl"
+        )
+
+        assert missing is not None and missing.confidence == 0.81  # 0.85 * 0.95
+        assert unusable is not None and unusable.confidence == 0.71  # 0.75 * 0.95
+
+    def test_recorded_items_are_not_matched_again(self):
+        """Test that recorded matches leave only the remaining items as candidates."""
+        matcher = SplitPaymentMatcher()
+        order = SplitOrder.from_order_group(ORDER)
+
+        matcher.record_match("tx-1", ORDER.order_id, [0, 1])
+
+        assert matcher.matched_items == {ORDER.order_id: {0, 1}}
+        assert matcher.match_split_payment(_tx(5500), order, "karl") is None
+        remainder = matcher.match_split_payment(_tx(1500), ORDER.to_dict(), "karl")
+        assert remainder is not None and remainder.matched_item_indices == [3, 2]
+
+        matcher.record_match("tx-2", ORDER.order_id, [2, 3])
+        assert matcher.match_split_payment(_tx(500), order, "karl") is None
+
+    def test_matched_items_survive_cache_round_trip(self, tmp_path):
+        """Test that matched item state persists through the cache file."""
+        cache_file = str(tmp_path / "split_cache.json")
+        matcher = SplitPaymentMatcher(cache_file)
+        matcher.record_match("tx-1", ORDER.order_id, [3, 1])
+
+        reloaded = SplitPaymentMatcher(cache_file)
+
+        assert reloaded.matched_items == {ORDER.order_id: {1, 3}}
+        assert reloaded.transaction_matches["tx-1"]["item_indices"] == [3, 1]
+        match = reloaded.match_split_payment(_tx(4500), SplitOrder.from_order_group(ORDER), "karl")
+        assert match is not None and match.matched_item_indices == [0, 2]
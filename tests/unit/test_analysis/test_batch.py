@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Tests for multi-scenario cash flow batches."""
+
+import json
+
+import pandas as pd
+import pytest
+
+from finances.analysis import (
+    CashFlowAnalyzer,
+    CashFlowConfig,
+    CashFlowData,
+    CashFlowScenario,
+    load_scenarios,
+    run_cash_flow_scenarios,
+)
+
+
+@pytest.fixture
+def ynab_cache_dir(temp_dir):
+    """YNAB cache with a checking account, a credit card and two months of activity."""
+    cache_dir = temp_dir / "ynab" / "cache"
+    cache_dir.mkdir(parents=True)
+    accounts = [
+        {"id": "a", "name": "Checking", "type": "checking", "on_budget": True, "closed": False,
+         "balance": 4000000, "cleared_balance": 4000000, "uncleared_balance": 0},
+        {"id": "b", "name": "Card", "type": "creditCard", "on_budget": True, "closed": False,
+         "balance": -250000, "cleared_balance": -250000, "uncleared_balance": 0},
+    ]  # fmt: skip
+    transactions = []
+    for day in pd.date_range("2024-06-01", "2024-07-31", freq="D"):
+        date_str = day.strftime("%Y-%m-%d")
+        transactions.append(
+            {"id": f"chk-{date_str}", "date": date_str, "amount": -20000,
+             "account_id": "a", "account_name": "Checking"}
+        )  # fmt: skip
+        transactions.append(
+            {"id": f"card-{date_str}", "date": date_str, "amount": -7500,
+             "account_id": "b", "account_name": "Card"}
+        )  # fmt: skip
+    with open(cache_dir / "accounts.json", "w") as f:
+        json.dump({"accounts": accounts, "server_knowledge": 1}, f)
+    with open(cache_dir / "transactions.json", "w") as f:
+        json.dump(transactions, f)
+    return cache_dir
+
+
+def _scenarios() -> list[CashFlowScenario]:
+    return [
+        CashFlowScenario(
+            "Household", CashFlowConfig(cash_accounts=["Checking", "Card"], start_date="2024-06-01")
+        ),
+        CashFlowScenario(
+            "Checking since July", CashFlowConfig(cash_accounts=["Checking"], start_date="2024-07-01")
+        ),
+    ]
+
+
+class TestCashFlowScenario:
+    """Test scenario definitions."""
+
+    def test_from_dict(self):
+        """Test building a scenario from CashFlowConfig fields."""
+        scenario = CashFlowScenario.from_dict(
+            {"name": "Last Year", "cash_accounts": ["Checking"], "start_date": "2024-01-01", "dpi": 90}
+        )
+
+        assert scenario.slug == "last-year"
+        assert scenario.config.dpi == 90
+        assert scenario.config.start_date == "2024-01-01"
+
+    def test_from_dict_rejects_unknown_fields(self):
+        """Test typos in scenario fields are reported."""
+        with pytest.raises(ValueError, match="start_dat"):
+            CashFlowScenario.from_dict({"name": "x", "cash_accounts": [], "start_dat": "2024-01-01"})
+
+    def test_load_scenarios_requires_unique_names(self, temp_dir):
+        """Test duplicate scenario names (which would share an output dir) are rejected."""
+        scenarios_file = temp_dir / "scenarios.json"
+        scenario = {"name": "All", "cash_accounts": ["Checking"], "start_date": "2024-01-01"}
+        scenarios_file.write_text(json.dumps({"scenarios": [scenario, scenario]}))
+
+        with pytest.raises(ValueError, match="unique"):
+            load_scenarios(scenarios_file)
+
+
+class TestRunCashFlowScenarios:
+    """Test batch evaluation against one load of the YNAB cache."""
+
+    def test_loads_ynab_cache_once(self, ynab_cache_dir, temp_dir, monkeypatch):
+        """Test every scenario shares a single parse of the YNAB cache."""
+        from finances.analysis import cash_flow
+
+        calls = []
+        original = cash_flow.load_transaction_columns
+        monkeypatch.setattr(
+            cash_flow, "load_transaction_columns", lambda d, **kw: calls.append(d) or original(d, **kw)
+        )
+
+        results = run_cash_flow_scenarios(_scenarios(), temp_dir / "out", ynab_cache_dir=ynab_cache_dir)
+
+        assert len(calls) == 1
+        assert [r.name for r in results] == ["Household", "Checking since July"]
+        assert all(r.success for r in results)
+        assert (temp_dir / "out" / "household" / "summary.json").exists()
+        assert results[1].dashboard_file.parent == temp_dir / "out" / "checking-since-july"
+
+    def test_matches_single_analyzer(self, ynab_cache_dir, temp_dir):
+        """Test a batch scenario reports the same figures as a standalone analyzer."""
+        scenario = _scenarios()[1]
+        analyzer = CashFlowAnalyzer(scenario.config)
+        analyzer.load_data(ynab_cache_dir)
+
+        (result,) = run_cash_flow_scenarios([scenario], temp_dir / "out", ynab_cache_dir=ynab_cache_dir)
+
+        assert result.summary["current_balance"] == analyzer.get_summary_statistics()["current_balance"]
+
+    def test_parallel(self, ynab_cache_dir, temp_dir):
+        """Test scenarios evaluated in a process pool."""
+        data = CashFlowData.from_ynab_cache(ynab_cache_dir)
+
+        results = run_cash_flow_scenarios(_scenarios(), temp_dir / "out", data=data, max_workers=2)
+
+        assert [r.name for r in results] == ["Household", "Checking since July"]
+        assert all(r.success and r.dashboard_file.exists() for r in results)
+
+    def test_failed_scenario_reported(self, ynab_cache_dir, temp_dir):
+        """Test a scenario without matching transactions fails without stopping the batch."""
+        scenarios = [
+            *_scenarios(),
+            CashFlowScenario("Future", CashFlowConfig(cash_accounts=["Checking"], start_date="2030-01-01")),
+        ]
+
+        results = run_cash_flow_scenarios(scenarios, temp_dir / "out", ynab_cache_dir=ynab_cache_dir)
+
+        assert [r.success for r in results] == [True, True, False]
+        assert "No transactions found" in results[2].error_message
@@ -2,12 +2,16 @@
 """Tests for cash flow analysis module."""
 
 import json
-from datetime import date
+from datetime import date, datetime
 
 import pandas as pd
 import pytest
 
 from finances.analysis import CashFlowAnalyzer, CashFlowConfig
+from finances.analysis.cash_flow import RENDER_MANIFEST_FILENAME
+from finances.analysis.flow import CashFlowAnalysisFlowNode
+from finances.core.flow import FlowContext, NodeExecution, NodeStatus
+from finances.core.flow_engine import FlowExecutionEngine
 
 
 class TestCashFlowConfig:
@@ -194,6 +198,50 @@ class TestCashFlowAnalyzer:
             if account in ["Chase Checking", "Chase Credit Card", "Apple Card"]:
                 assert account in analyzer.df.columns
 
+    def test_load_data_daily_balance_reconstruction(self, temp_dir):
+        """Test balances walk back from current balances and carry forward over gap days."""
+        ynab_cache_dir = temp_dir / "ynab" / "cache"
+        ynab_cache_dir.mkdir(parents=True)
+        accounts = [
+            {"id": "a", "name": "Checking", "type": "checking", "on_budget": True, "closed": False,
+             "balance": 1000000, "cleared_balance": 1000000, "uncleared_balance": 0},
+            {"id": "b", "name": "Card", "type": "creditCard", "on_budget": True, "closed": False,
+             "balance": -200000, "cleared_balance": -200000, "uncleared_balance": 0},
+        ]  # fmt: skip
+        transactions = [
+            ("t1", "2024-08-01", -5000, "Checking"),
+            ("t2", "2024-08-03", 20000, "Checking"),
+            ("t3", "2024-08-03", -1000, "Card"),
+            ("t4", "2024-08-05", -3000, "Checking"),
+        ]
+        with open(ynab_cache_dir / "accounts.json", "w") as f:
+            json.dump({"accounts": accounts, "server_knowledge": 1}, f)
+        with open(ynab_cache_dir / "transactions.json", "w") as f:
+            json.dump(
+                [
+                    {"id": tx_id, "date": tx_date, "amount": amount, "account_id": name, "account_name": name}
+                    for tx_id, tx_date, amount, name in transactions
+                ],
+                f,
+            )
+
+        analyzer = CashFlowAnalyzer(
+            CashFlowConfig(cash_accounts=["Checking", "Card"], start_date="2024-08-01")
+        )
+        analyzer.load_data(ynab_cache_dir)
+
+        expected = pd.DataFrame(
+            {
+                "Total": [789.0, 789.0, 784.0, 784.0, 803.0],
+                "Checking": [988.0, 988.0, 983.0, 983.0, 1003.0],
+                "Card": [-199.0, -199.0, -199.0, -199.0, -200.0],
+            },
+            index=pd.DatetimeIndex(pd.date_range("2024-08-01", "2024-08-05").to_numpy(), name="Date").as_unit(
+                "ns"
+            ),
+        )
+        pd.testing.assert_frame_equal(analyzer.df[["Total", "Checking", "Card"]], expected)
+
     def test_load_data_missing_files(self, analyzer, temp_dir):
         """Test data loading with missing files."""
         missing_cache_dir = temp_dir / "missing"
@@ -283,6 +331,81 @@ class TestCashFlowAnalyzer:
 
         assert output_file.suffix == ".pdf"
 
+    def test_dashboard_reused_when_inputs_unchanged(self, analyzer, sample_ynab_data, temp_dir, monkeypatch):
+        """Test an unchanged input hash returns the previous image without rendering."""
+        analyzer.load_data(sample_ynab_data)
+        output_dir = temp_dir / "charts"
+        first = analyzer.generate_dashboard(output_dir)
+
+        monkeypatch.setattr(
+            CashFlowAnalyzer, "_render_dashboard", lambda *args: pytest.fail("dashboard re-rendered")
+        )
+        again = CashFlowAnalyzer(analyzer.config)
+        again.load_data(sample_ynab_data)
+
+        assert again.generate_dashboard(output_dir) == first
+
+    def test_dashboard_rerendered_when_inputs_change(self, analyzer, sample_ynab_data, temp_dir):
+        """Test a changed series produces a new input hash and a fresh render."""
+        analyzer.load_data(sample_ynab_data)
+        output_dir = temp_dir / "charts"
+        analyzer.generate_dashboard(output_dir)
+        original_hash = analyzer.compute_render_hash()
+
+        assert analyzer.df is not None
+        analyzer.df.loc[analyzer.df.index[-1], "Total"] += 1.0
+        analyzer.generate_dashboard(output_dir)
+
+        manifest = json.loads((output_dir / RENDER_MANIFEST_FILENAME).read_text())
+        assert manifest["input_hash"] == analyzer.compute_render_hash() != original_hash
+
+    def test_flow_node_reuses_dashboard_across_engine_runs(self, sample_ynab_data, temp_dir, monkeypatch):
+        """Test that the render manifest survives engine cleanup, so a rerun renders nothing."""
+        node = CashFlowAnalysisFlowNode(temp_dir)
+        engine = FlowExecutionEngine()
+        renders = []
+        render = CashFlowAnalyzer._render_dashboard
+        monkeypatch.setattr(
+            CashFlowAnalyzer,
+            "_render_dashboard",
+            lambda self, path: renders.append(path) or render(self, path),
+        )
+
+        for _ in range(2):
+            execution = NodeExecution(node_name=node.name, status=NodeStatus.PENDING)
+            engine.run_node_with_archiving(node, execution, FlowContext(start_time=datetime.now()), {})
+
+            assert execution.result is not None and execution.result.success
+            assert (temp_dir / "cash_flow" / "charts" / RENDER_MANIFEST_FILENAME).exists()
+
+        assert len(renders) == 1
+
+    def test_dashboard_multiple_formats_in_process_pool(self, analyzer, sample_ynab_data, temp_dir):
+        """Test rendering several formats with a process pool."""
+        analyzer.load_data(sample_ynab_data)
+
+        output_file = analyzer.generate_dashboard(temp_dir / "charts", formats=["png", "svg"], max_workers=2)
+
+        assert output_file.suffix == ".png"
+        assert output_file.exists()
+        assert output_file.with_suffix(".svg").exists()
+
+    def test_generate_panels(self, analyzer, sample_ynab_data, temp_dir):
+        """Test rendering selected panels as individual images."""
+        analyzer.load_data(sample_ynab_data)
+
+        panels = analyzer.generate_panels(temp_dir / "charts", panels=["main_trend", "statistics"])
+
+        assert set(panels) == {"main_trend.png", "statistics.png"}
+        assert all(path.exists() and path.stat().st_size > 0 for path in panels.values())
+
+    def test_generate_panels_unknown_panel(self, analyzer, sample_ynab_data, temp_dir):
+        """Test unknown panel names are rejected."""
+        analyzer.load_data(sample_ynab_data)
+
+        with pytest.raises(ValueError, match="Unknown dashboard panels"):
+            analyzer.generate_panels(temp_dir / "charts", panels=["pie"])
+
     def test_summary_statistics(self, analyzer, sample_ynab_data):
         """Test summary statistics generation."""
         analyzer.load_data(sample_ynab_data)
@@ -588,6 +711,171 @@ class TestCashFlowAnalyzer:
         ), f"Expected ~$5,010 (off-budget card included), got ${start_balance:.2f}"
 
 
+class TestIncrementalBalanceCache:
+    """Test incremental recomputation from the persisted daily balance table."""
+
+    @staticmethod
+    def _transactions() -> list[dict]:
+        """About four months of daily activity across two accounts."""
+        transactions = []
+        for day in pd.date_range("2024-05-01", "2024-08-31", freq="D")[::2]:
+            date_str = day.strftime("%Y-%m-%d")
+            transactions.append(
+                {"id": f"chk-{date_str}", "date": date_str, "amount": -12340 - day.day * 10,
+                 "account_id": "a", "account_name": "Checking"}
+            )  # fmt: skip
+            if day.day % 5 == 0:
+                transactions.append(
+                    {"id": f"card-{date_str}", "date": date_str, "amount": -55500,
+                     "account_id": "b", "account_name": "Card"}
+                )  # fmt: skip
+        return transactions
+
+    @staticmethod
+    def _write_cache(cache_dir, transactions, balances=None):
+        """Write YNAB accounts and transactions JSON files."""
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        accounts = [
+            {"id": name, "name": name, "type": "checking", "on_budget": True, "closed": False,
+             "balance": balance, "cleared_balance": balance, "uncleared_balance": 0}
+            for name, balance in (balances or {"Checking": 5000000, "Card": -300000}).items()
+        ]  # fmt: skip
+        with open(cache_dir / "accounts.json", "w") as f:
+            json.dump({"accounts": accounts, "server_knowledge": 1}, f)
+        with open(cache_dir / "transactions.json", "w") as f:
+            json.dump(transactions, f)
+
+    @staticmethod
+    def _analyzer(short_ma_window: int = 7) -> CashFlowAnalyzer:
+        return CashFlowAnalyzer(
+            CashFlowConfig(
+                cash_accounts=["Checking", "Card"], start_date="2024-05-01", short_ma_window=short_ma_window
+            )
+        )
+
+    def _assert_matches_full_rebuild(self, analyzer, ynab_cache_dir):
+        """Compare an incrementally updated analyzer against a from-scratch run."""
+        full = self._analyzer()
+        full.load_data(ynab_cache_dir)
+
+        pd.testing.assert_frame_equal(analyzer.df, full.df, check_freq=False)
+        pd.testing.assert_frame_equal(analyzer.monthly_df, full.monthly_df, check_freq=False)
+        assert analyzer.trend_stats["slope"] == pytest.approx(full.trend_stats["slope"])
+
+    def test_cache_file_written(self, temp_dir):
+        """Test the first run persists the balance table."""
+        ynab_cache_dir = temp_dir / "ynab" / "cache"
+        cache_file = temp_dir / "cash_flow" / "cache" / "daily_balances.npz"
+        self._write_cache(ynab_cache_dir, self._transactions())
+
+        self._analyzer().load_data(ynab_cache_dir, balance_cache_file=cache_file)
+
+        assert cache_file.exists()
+
+    def test_added_transaction_recomputes_tail(self, temp_dir, monkeypatch):
+        """Test a new mid-history transaction only recomputes from its date."""
+        ynab_cache_dir = temp_dir / "ynab" / "cache"
+        cache_file = temp_dir / "daily_balances.npz"
+        transactions = self._transactions()
+        self._write_cache(ynab_cache_dir, transactions)
+        self._analyzer().load_data(ynab_cache_dir, balance_cache_file=cache_file)
+
+        transactions.append(
+            {
+                "id": "late-entry",
+                "date": "2024-07-14",
+                "amount": 250000,
+                "account_id": "a",
+                "account_name": "Checking",
+            }
+        )
+        self._write_cache(ynab_cache_dir, transactions, {"Checking": 5250000, "Card": -300000})
+
+        rebuilt_from = []
+        original = CashFlowAnalyzer._update_from
+        monkeypatch.setattr(
+            CashFlowAnalyzer,
+            "_update_from",
+            lambda self, cache, *args: rebuilt_from.append(args[-1]) or original(self, cache, *args),
+        )
+        analyzer = self._analyzer()
+        analyzer.load_data(ynab_cache_dir, balance_cache_file=cache_file)
+
+        assert rebuilt_from == [pd.Timestamp("2024-07-14")]
+        self._assert_matches_full_rebuild(analyzer, ynab_cache_dir)
+
+    def test_changed_and_deleted_transactions(self, temp_dir):
+        """Test modified, moved and removed transactions match a full rebuild."""
+        ynab_cache_dir = temp_dir / "ynab" / "cache"
+        cache_file = temp_dir / "daily_balances.npz"
+        transactions = self._transactions()
+        self._write_cache(ynab_cache_dir, transactions)
+        self._analyzer().load_data(ynab_cache_dir, balance_cache_file=cache_file)
+
+        by_id = {t["id"]: t for t in transactions}
+        by_id["chk-2024-06-20"]["amount"] -= 100000
+        by_id["card-2024-07-20"]["date"] = "2024-07-23"
+        removed = by_id.pop("chk-2024-08-01")
+        balances = {"Checking": 5000000 - 100000 - removed["amount"], "Card": -300000}
+        self._write_cache(ynab_cache_dir, list(by_id.values()), balances)
+
+        analyzer = self._analyzer()
+        analyzer.load_data(ynab_cache_dir, balance_cache_file=cache_file)
+
+        self._assert_matches_full_rebuild(analyzer, ynab_cache_dir)
+
+    def test_appended_days(self, temp_dir):
+        """Test transactions after the cached end date extend the series."""
+        ynab_cache_dir = temp_dir / "ynab" / "cache"
+        cache_file = temp_dir / "daily_balances.npz"
+        transactions = self._transactions()
+        self._write_cache(ynab_cache_dir, transactions)
+        self._analyzer().load_data(ynab_cache_dir, balance_cache_file=cache_file)
+
+        transactions.append(
+            {"id": "sept", "date": "2024-09-12", "amount": -40000, "account_id": "b", "account_name": "Card"}
+        )
+        self._write_cache(ynab_cache_dir, transactions, {"Checking": 5000000, "Card": -340000})
+
+        analyzer = self._analyzer()
+        analyzer.load_data(ynab_cache_dir, balance_cache_file=cache_file)
+
+        assert analyzer.df.index[-1] == pd.Timestamp("2024-09-12")
+        self._assert_matches_full_rebuild(analyzer, ynab_cache_dir)
+
+    def test_unchanged_data_reuses_cache(self, temp_dir, monkeypatch):
+        """Test an unchanged YNAB cache skips balance reconstruction entirely."""
+        ynab_cache_dir = temp_dir / "ynab" / "cache"
+        cache_file = temp_dir / "daily_balances.npz"
+        self._write_cache(ynab_cache_dir, self._transactions())
+        first = self._analyzer()
+        first.load_data(ynab_cache_dir, balance_cache_file=cache_file)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("balances should not be reconstructed")
+
+        monkeypatch.setattr(CashFlowAnalyzer, "_reconstruct_balances", staticmethod(fail))
+        analyzer = self._analyzer()
+        analyzer.load_data(ynab_cache_dir, balance_cache_file=cache_file)
+
+        pd.testing.assert_frame_equal(analyzer.df, first.df, check_freq=False)
+        pd.testing.assert_frame_equal(analyzer.monthly_df, first.monthly_df, check_freq=False)
+
+    def test_config_change_forces_full_rebuild(self, temp_dir, monkeypatch):
+        """Test a different moving average window ignores the cached series."""
+        ynab_cache_dir = temp_dir / "ynab" / "cache"
+        cache_file = temp_dir / "daily_balances.npz"
+        self._write_cache(ynab_cache_dir, self._transactions())
+        self._analyzer().load_data(ynab_cache_dir, balance_cache_file=cache_file)
+
+        monkeypatch.setattr(CashFlowAnalyzer, "_update_from", lambda *args: pytest.fail("unexpected update"))
+        analyzer = self._analyzer(short_ma_window=14)
+        analyzer.load_data(ynab_cache_dir, balance_cache_file=cache_file)
+
+        expected = analyzer.df["Total"].rolling(window=14, min_periods=1).mean()
+        pd.testing.assert_series_equal(analyzer.df["MA_7"], expected, check_names=False)
+
+
 class TestCashFlowEdgeCases:
     """Test edge cases and error conditions."""
 
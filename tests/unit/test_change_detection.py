@@ -43,9 +43,14 @@ def flow_context():
 class TestChangeDetectorBase:
     """Tests for ChangeDetector base class."""
 
+    def test_is_abstract(self, temp_data_dir):
+        """Test detectors must implement check_changes()."""
+        with pytest.raises(TypeError):
+            ChangeDetector(temp_data_dir)  # type: ignore[abstract]
+
     def test_save_and_load_last_check_state(self, temp_data_dir):
         """Test saving and loading check state."""
-        detector = ChangeDetector(temp_data_dir)
+        detector = RetirementUpdateChangeDetector(temp_data_dir)
 
         test_state = {"last_run": "2024-01-01T00:00:00", "file_count": 5}
         detector.save_last_check_state("test_node", test_state)
@@ -155,6 +160,34 @@ class TestYnabSyncChangeDetector:
         assert has_changes is True
         assert any("24-hour refresh interval reached" in r for r in reasons)
 
+    def test_commit_records_post_sync_server_knowledge(self, temp_data_dir, flow_context):
+        """Test committed state reflects the cache written by the sync, not the pre-sync cache."""
+        ynab_cache_dir = temp_data_dir / "ynab" / "cache"
+        ynab_cache_dir.mkdir(parents=True)
+
+        write_json(ynab_cache_dir / "accounts.json", {"accounts": [], "server_knowledge": 90})
+        write_json(ynab_cache_dir / "categories.json", {"category_groups": [], "server_knowledge": 50})
+        write_json(ynab_cache_dir / "transactions.json", [])
+
+        detector = YnabSyncChangeDetector(temp_data_dir)
+        detector.check_changes(flow_context)
+        detector.commit_check_state("ynab_sync")
+
+        write_json(ynab_cache_dir / "accounts.json", {"accounts": [], "server_knowledge": 100})
+
+        has_changes, _ = detector.check_changes(flow_context)
+        assert has_changes is True
+
+        # ynab_sync rewrites the cache before the engine commits the staged state
+        write_json(ynab_cache_dir / "accounts.json", {"accounts": [], "server_knowledge": 120})
+        write_json(ynab_cache_dir / "categories.json", {"category_groups": [], "server_knowledge": 60})
+        detector.commit_check_state("ynab_sync")
+
+        has_changes, reasons = detector.check_changes(flow_context)
+
+        assert has_changes is False
+        assert "No changes detected" in reasons[0]
+
 
 class TestAmazonUnzipChangeDetector:
     """Tests for Amazon unzip change detection."""
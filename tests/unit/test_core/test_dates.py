@@ -93,3 +93,34 @@ class TestFinancialDateImmutability:
         fd = FinancialDate(date=date(2024, 1, 15))
         with pytest.raises(AttributeError):
             fd.date = date(2024, 1, 16)  # type: ignore
+
+    def test_slotted(self):
+        """Test FinancialDate instances have no per-instance attribute dict."""
+        assert not hasattr(FinancialDate(date=date(2024, 1, 15)), "__dict__")
+
+
+class TestFinancialDateInterning:
+    """Test shared FinancialDate instances for repeated dates."""
+
+    def test_from_string_interned(self):
+        """Test parsing the same date twice returns the same object."""
+        first = FinancialDate.from_string("2024-01-15")
+
+        assert FinancialDate.from_string("2024-01-15") is first
+        assert FinancialDate.from_string("2024-01-15T03:27:55Z") is first
+        assert FinancialDate.from_string("01/15/2024", "%m/%d/%Y") is first
+
+    def test_from_date_truncates_datetimes(self):
+        """Test from_date shares instances between dates and datetimes of the same day."""
+        fd = FinancialDate.from_date(datetime(2024, 1, 15, 10, 30))
+
+        assert fd.date == date(2024, 1, 15)
+        assert type(fd.date) is date
+        assert FinancialDate.from_date(date(2024, 1, 15)) is fd
+
+    def test_interned_equals_constructed(self):
+        """Test interned and directly constructed instances compare and hash equal."""
+        fd = FinancialDate.from_date(date(2024, 1, 15))
+
+        assert fd == FinancialDate(date=date(2024, 1, 15))
+        assert hash(fd) == hash(FinancialDate(date=date(2024, 1, 15)))
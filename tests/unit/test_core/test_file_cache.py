@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Tests for the per-run file load cache."""
+
+import os
+
+from finances.core.file_cache import FileLoadCache
+
+
+def _write(path, text, mtime_ns):
+    path.write_text(text)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestFileLoadCache:
+    """Test memoized file views."""
+
+    def test_loads_once(self, temp_dir):
+        """Test an unchanged file is parsed on first access only."""
+        data_file = temp_dir / "data.json"
+        _write(data_file, "[1, 2]", 1_000_000_000)
+        cache = FileLoadCache()
+        calls = []
+
+        def load():
+            calls.append(1)
+            return data_file.read_text()
+
+        assert cache.get(data_file, "raw", load) == "[1, 2]"
+        assert cache.get(data_file, "raw", load) == "[1, 2]"
+        assert len(calls) == 1
+        assert (cache.loads, cache.hits) == (1, 1)
+
+    def test_views_cached_separately(self, temp_dir):
+        """Test one file backs independent views."""
+        data_file = temp_dir / "data.json"
+        _write(data_file, "[1, 2]", 1_000_000_000)
+        cache = FileLoadCache()
+
+        assert cache.get(data_file, "raw", lambda: "raw") == "raw"
+        assert cache.get(data_file, "models", lambda: "models") == "models"
+
+    def test_reloads_rewritten_file(self, temp_dir):
+        """Test a change in mtime or size triggers a reload."""
+        data_file = temp_dir / "data.json"
+        _write(data_file, "[1, 2]", 1_000_000_000)
+        cache = FileLoadCache()
+        cache.get(data_file, "raw", data_file.read_text)
+
+        _write(data_file, "[1, 2, 3]", 1_000_000_000)
+        assert cache.get(data_file, "raw", data_file.read_text) == "[1, 2, 3]"
+
+        _write(data_file, "[4, 5, 6]", 2_000_000_000)
+        assert cache.get(data_file, "raw", data_file.read_text) == "[4, 5, 6]"
+        assert cache.loads == 3
+
+    def test_missing_file_not_cached(self, temp_dir):
+        """Test results for a missing file are not retained."""
+        data_file = temp_dir / "missing.json"
+        cache = FileLoadCache()
+
+        assert cache.get(data_file, "raw", lambda: None) is None
+        assert cache.get(data_file, "raw", lambda: "created") == "created"
+        assert cache.loads == 2
+
+    def test_invalidate_directory(self, temp_dir):
+        """Test invalidating a directory drops views of files beneath it only."""
+        (temp_dir / "ynab").mkdir()
+        inside = temp_dir / "ynab" / "accounts.json"
+        outside = temp_dir / "other.json"
+        _write(inside, "{}", 1_000_000_000)
+        _write(outside, "{}", 1_000_000_000)
+        cache = FileLoadCache()
+        cache.get(inside, "raw", lambda: "a")
+        cache.get(inside, "models", lambda: "b")
+        cache.get(outside, "raw", lambda: "c")
+
+        assert cache.invalidate(temp_dir / "ynab") == 2
+        assert cache.get(outside, "raw", lambda: "reloaded") == "c"
+        assert cache.get(inside, "raw", lambda: "reloaded") == "reloaded"
+        assert cache.invalidate() == 2
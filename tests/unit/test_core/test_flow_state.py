@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the flow state store.
+
+Tests staging/commit semantics and persistence of change-detection state.
+"""
+
+import json
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from finances.core.flow_state import FlowStateStore
+
+
+@pytest.fixture
+def temp_data_dir():
+    """Create temporary data directory for testing."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+
+class TestFlowStateStore:
+    """Tests for FlowStateStore."""
+
+    def test_uses_wal_journal(self, temp_data_dir):
+        """Test the database is created at the standard location in WAL mode."""
+        store = FlowStateStore.for_data_dir(temp_data_dir)
+        store.load_all()
+        store.close()
+
+        db_path = temp_data_dir / "cache" / "flow" / "state.db"
+        assert db_path.exists()
+        with sqlite3.connect(db_path) as conn:
+            (mode,) = conn.execute("PRAGMA journal_mode").fetchone()
+        assert mode == "wal"
+
+    def test_staged_state_visible_but_not_persisted(self, temp_data_dir):
+        """Test staged state is readable from the same store but lost if never committed."""
+        store = FlowStateStore.for_data_dir(temp_data_dir)
+        store.stage("node_a", {"count": 1})
+
+        assert store.get("node_a") == {"count": 1}
+        assert store.has_pending("node_a")
+        store.close()
+
+        reopened = FlowStateStore.for_data_dir(temp_data_dir)
+        assert reopened.get("node_a") == {}
+        reopened.close()
+
+    def test_commit_persists_state(self, temp_data_dir):
+        """Test committed state survives reopening the store."""
+        store = FlowStateStore.for_data_dir(temp_data_dir)
+        store.stage("node_a", {"count": 1})
+
+        assert store.commit("node_a") is True
+        assert store.commit("node_a") is False  # Nothing left to commit
+        store.close()
+
+        reopened = FlowStateStore.for_data_dir(temp_data_dir)
+        assert reopened.load_all() == {"node_a": {"count": 1}}
+        reopened.close()
+
+    def test_discard_keeps_previous_commit(self, temp_data_dir):
+        """Test discarding staged state falls back to the last committed state."""
+        store = FlowStateStore.for_data_dir(temp_data_dir)
+        store.stage("node_a", {"count": 1})
+        store.commit("node_a")
+
+        store.stage("node_a", {"count": 2})
+        store.discard("node_a")
+
+        assert store.get("node_a") == {"count": 1}
+        store.close()
+
+    def test_imports_legacy_json_state(self, temp_data_dir):
+        """Test per-node JSON state files are imported on first open."""
+        flow_cache = temp_data_dir / "cache" / "flow"
+        flow_cache.mkdir(parents=True)
+        (flow_cache / "ynab_sync_last_check.json").write_text(json.dumps({"last_sync_time": "2024-01-01"}))
+
+        store = FlowStateStore.for_data_dir(temp_data_dir)
+
+        assert store.load_all() == {"ynab_sync": {"last_sync_time": "2024-01-01"}}
+        store.close()
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""Tests for the JSON utilities and their optional orjson backend."""
+
+import hashlib
+import json
+import math
+from datetime import datetime
+from typing import ClassVar
+
+import pytest
+
+from finances.core import json_utils
+from finances.core.json_utils import (
+    FsyncPolicy,
+    batched_writes,
+    count_json_records,
+    count_lines,
+    default_fsync_policy,
+    format_json,
+    iter_json_array,
+    parse_json,
+    read_json,
+    read_json_as,
+    read_json_models,
+    read_json_summary,
+    summary_path,
+    summary_record_count,
+    write_file_summary,
+    write_json,
+    write_json_with_defaults,
+)
+from finances.ynab.models import YnabAccount
+
+SAMPLE = {
+    "name": "Café ☕",
+    "amounts": [1, -2500, 3.25, 1e-05],
+    "nested": {"empty_list": [], "empty_dict": {}, "flag": True, "missing": None},
+    7: "int key",
+}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run a test with each available JSON backend."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(json_utils, "_orjson", None)
+    elif json_utils._orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+class TestJsonBackends:
+    """Test both backends read and write the same documents."""
+
+    def test_backend_name(self, backend):
+        """Test the active backend is reported."""
+        assert json_utils.json_backend() == backend
+
+    def test_round_trip(self, backend, temp_dir):
+        """Test pretty-printed files round-trip (non-string keys become strings)."""
+        json_file = temp_dir / "data.json"
+        write_json(json_file, SAMPLE)
+
+        assert read_json(json_file) == {**{k: v for k, v in SAMPLE.items() if k != 7}, "7": "int key"}
+        assert json_file.read_text(encoding="utf-8").startswith('{\n  "name": "Café ☕",')
+
+    def test_same_output_as_stdlib(self, backend, temp_dir, monkeypatch):
+        """Test files are formatted identically regardless of backend."""
+        data = {k: v for k, v in SAMPLE.items() if k != 7 and k != "amounts"}
+        write_json(temp_dir / "a.json", data, sort_keys=True)
+        monkeypatch.setattr(json_utils, "_orjson", None)
+        write_json(temp_dir / "b.json", data, sort_keys=True)
+
+        assert (temp_dir / "a.json").read_bytes() == (temp_dir / "b.json").read_bytes()
+
+    def test_compact(self, backend, temp_dir):
+        """Test compact mode writes no indentation or separator spaces."""
+        json_file = temp_dir / "data.json"
+        write_json(json_file, {"a": [1, 2], "b": {"c": None}}, compact=True)
+
+        assert json_file.read_text() == '{"a":[1,2],"b":{"c":null}}'
+
+    def test_default_serializer(self, backend, temp_dir):
+        """Test non-JSON types go through the default function, as with the stdlib."""
+        json_file = temp_dir / "data.json"
+        write_json_with_defaults(json_file, {"when": datetime(2024, 5, 1, 12, 30)})
+
+        assert read_json(json_file) == {"when": "2024-05-01 12:30:00"}
+        with pytest.raises(TypeError):
+            write_json(json_file, {"when": datetime(2024, 5, 1)})
+
+    def test_ensure_ascii(self, backend):
+        """Test ASCII escaping is honoured."""
+        assert format_json({"name": "Café"}, ensure_ascii=True) == '{\n  "name": "Caf\\u00e9"\n}'
+
+    def test_large_integers(self, backend, temp_dir):
+        """Test integers beyond 64 bits are written through the stdlib fallback."""
+        json_file = temp_dir / "data.json"
+        write_json(json_file, {"big": 2**70})
+
+        assert read_json(json_file) == {"big": 2**70}
+
+    def test_non_standard_input(self, backend):
+        """Test NaN literals written by older stdlib-based files are still readable."""
+        assert math.isnan(parse_json('{"value": NaN}')["value"])
+        assert parse_json(b"[1, 2]") == [1, 2]
+
+
+class TestTypedDecoding:
+    """Test decoding straight into domain models."""
+
+    def test_read_json_models(self, temp_dir):
+        """Test an array nested under a key is hydrated with from_dict."""
+        json_file = temp_dir / "accounts.json"
+        account = {"id": "a", "name": "Checking", "type": "checking", "on_budget": True, "closed": False,
+                   "balance": 100000, "cleared_balance": 100000, "uncleared_balance": 0}  # fmt: skip
+        write_json(json_file, {"accounts": [account], "server_knowledge": 1})
+
+        accounts = read_json_models(json_file, YnabAccount.from_dict, key="accounts")
+
+        assert accounts == [YnabAccount.from_dict(account)]
+
+    def test_read_json_as(self, temp_dir):
+        """Test a single object is hydrated with from_dict."""
+        json_file = temp_dir / "data.json"
+        write_json(json_file, {"a": 1})
+
+        assert read_json_as(json_file, lambda d: sorted(d)) == ["a"]
+
+    def test_gc_restored_after_large_document(self, backend, monkeypatch):
+        """Test the garbage collector is re-enabled after decoding, even on errors."""
+        import gc
+
+        monkeypatch.setattr(json_utils, "_GC_PAUSE_THRESHOLD_BYTES", 1)
+
+        assert parse_json("[1, 2]") == [1, 2]
+        with pytest.raises(ValueError):
+            parse_json("[1, 2")
+        assert gc.isenabled()
+
+
+@pytest.fixture
+def fsync_calls(monkeypatch):
+    """Record fsync calls instead of flushing to disk."""
+    calls = []
+    monkeypatch.setattr(json_utils.os, "fsync", lambda fd: calls.append(fd))
+    return calls
+
+
+class TestAtomicWrites:
+    """Test atomic replacement and the fsync policy."""
+
+    def test_failed_write_keeps_original(self, temp_dir, monkeypatch):
+        """Test an interrupted write leaves the previous file and no temp file."""
+        json_file = temp_dir / "transactions.json"
+        write_json(json_file, [1, 2, 3])
+
+        def interrupted(src, dst):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(json_utils.os, "replace", interrupted)
+        with pytest.raises(KeyboardInterrupt):
+            write_json(json_file, [4])
+
+        assert read_json(json_file) == [1, 2, 3]
+        assert [p.name for p in temp_dir.iterdir()] == ["transactions.json"]
+
+    def test_permissions_follow_umask(self, temp_dir):
+        """Test files get regular permissions rather than the temp file's private mode."""
+        json_file = temp_dir / "data.json"
+        write_json(json_file, {})
+
+        umask = json_utils.os.umask(0)
+        json_utils.os.umask(umask)
+        assert json_file.stat().st_mode & 0o777 == 0o666 & ~umask
+
+    @pytest.mark.parametrize(
+        "policy,expected_calls",
+        [(FsyncPolicy.NONE, 0), (FsyncPolicy.FILE, 1), (FsyncPolicy.FILE_AND_DIR, 2)],
+    )
+    def test_fsync_policy(self, temp_dir, fsync_calls, policy, expected_calls):
+        """Test each policy flushes the file and/or its directory."""
+        write_json(temp_dir / "data.json", {}, fsync=policy)
+
+        assert len(fsync_calls) == expected_calls
+
+    def test_policy_from_environment(self, monkeypatch):
+        """Test FINANCES_FSYNC selects the default policy."""
+        monkeypatch.setenv("FINANCES_FSYNC", "file+dir")
+        assert default_fsync_policy() == FsyncPolicy.FILE_AND_DIR
+
+        monkeypatch.setenv("FINANCES_FSYNC", "always")
+        with pytest.raises(ValueError):
+            default_fsync_policy()
+
+    def test_batched_writes(self, temp_dir, fsync_calls):
+        """Test a batch flushes all files and their directory once, at the end."""
+        with batched_writes(FsyncPolicy.FILE_AND_DIR) as batch:
+            for i in range(3):
+                write_json(temp_dir / f"receipt-{i}.json", {"i": i})
+                assert read_json(temp_dir / f"receipt-{i}.json") == {"i": i}
+            assert fsync_calls == []
+            assert len(batch.files) == 3
+
+        assert len(fsync_calls) == 4
+
+    def test_batch_flushes_after_error(self, temp_dir, fsync_calls):
+        """Test files written before an exception are still flushed."""
+        with pytest.raises(RuntimeError), batched_writes(FsyncPolicy.FILE):
+            write_json(temp_dir / "a.json", {})
+            raise RuntimeError("parse failed")
+
+        assert len(fsync_calls) == 1
+        assert json_utils._active_batch.get() is None
+
+
+class TestStreaming:
+    """Test incremental array iteration."""
+
+    # fmt: off
+    ELEMENTS: ClassVar[list] = [
+        12345678901234, -0.5, "text with ] and , and \" inside", None, True,
+        {"nested": [1, [2, {"deep": "é"}]]}, [], {}, "ünïcödé ☕", 1e-7, 2.5e+30, 7,
+    ]
+    # fmt: on
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+    def test_top_level_array(self, temp_dir, chunk_size):
+        """Test elements split across any chunk boundary decode exactly."""
+        json_file = temp_dir / "data.json"
+        write_json(json_file, self.ELEMENTS)
+
+        assert list(iter_json_array(json_file, chunk_size=chunk_size)) == self.ELEMENTS
+
+    @pytest.mark.parametrize("chunk_size", [3, 1 << 16])
+    def test_keyed_array(self, temp_dir, chunk_size):
+        """Test the array is found after skipping other members."""
+        json_file = temp_dir / "data.json"
+        data = {"metadata": {"matches": "not this"}, "summary": [1, 2], "matches": self.ELEMENTS, "tail": 1}
+        write_json(json_file, data, compact=True)
+
+        assert list(iter_json_array(json_file, key="matches", chunk_size=chunk_size)) == self.ELEMENTS
+        assert list(iter_json_array(json_file, key="missing", chunk_size=chunk_size)) == []
+
+    def test_empty_array(self, temp_dir):
+        """Test empty arrays yield nothing."""
+        json_file = temp_dir / "data.json"
+        write_json(json_file, {"matches": []})
+
+        assert list(iter_json_array(json_file, key="matches")) == []
+
+    @pytest.mark.parametrize("content", ["[1, 2", '{"matches": 5}', "[1 2]", '{"a": 1 "matches": []}'])
+    def test_malformed(self, temp_dir, content):
+        """Test malformed documents raise JSONDecodeError."""
+        json_file = temp_dir / "data.json"
+        json_file.write_text(content)
+
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_array(json_file, key="matches" if content.startswith("{") else None))
+
+
+class TestSidecarSummaries:
+    """Test sidecar summaries written alongside data files."""
+
+    def test_sidecar_written(self, temp_dir):
+        """Test the sidecar records count, size and hash of the written bytes."""
+        json_file = temp_dir / "results.json"
+        write_json(json_file, {"metadata": {}, "matches": [1, 2, 3]}, sidecar=True, record_key="matches")
+
+        summary = read_json_summary(json_file)
+
+        assert summary_path(json_file) == temp_dir / ".meta" / "results.json.meta.json"
+        assert summary.record_count == 3
+        assert summary.size_bytes == json_file.stat().st_size
+        assert summary.sha256 == hashlib.sha256(json_file.read_bytes()).hexdigest()
+        assert [p.name for p in temp_dir.glob("*.json")] == ["results.json"]
+
+    def test_count_uses_sidecar(self, temp_dir, monkeypatch):
+        """Test counting reads the sidecar rather than the file."""
+        json_file = temp_dir / "results.json"
+        write_json(json_file, {"matches": [1, 2, 3]}, sidecar=True, record_key="matches")
+        monkeypatch.setattr(json_utils, "iter_json_array", None)
+
+        assert count_json_records(json_file, key="matches") == 3
+
+    def test_stale_sidecar_ignored(self, temp_dir):
+        """Test a file rewritten without a sidecar is counted from its contents."""
+        json_file = temp_dir / "results.json"
+        write_json(json_file, {"matches": [1, 2, 3]}, sidecar=True, record_key="matches")
+        write_json(json_file, {"matches": [1, 2, 3, 4, 5]})
+
+        assert read_json_summary(json_file) is None
+        assert count_json_records(json_file, key="matches") == 5
+
+    def test_record_count_of_single_object(self, temp_dir):
+        """Test a file holding one object counts as one record."""
+        json_file = temp_dir / "receipt.json"
+        write_json_with_defaults(json_file, {"order_id": "A1"}, sidecar=True)
+
+        assert read_json_summary(json_file).record_count == 1
+
+    def test_summary_record_count_requires_key(self, temp_dir):
+        """Test a sidecar only answers for the record key it was counted from."""
+        json_file = temp_dir / "edits.json"
+        write_json(json_file, {"edits": [1, 2]}, sidecar=True, record_key="edits")
+
+        assert summary_record_count(json_file, "edits") == 2
+        assert summary_record_count(json_file, "mutations") is None
+
+    def test_file_summary_of_csv(self, temp_dir):
+        """Test summaries of non-JSON files count lines after the header."""
+        csv_file = temp_dir / "orders.csv"
+        csv_file.write_text("id,total\n1,10\n2,20\n3,30")
+
+        summary = write_file_summary(csv_file, header_lines=1)
+
+        assert count_lines(csv_file) == 4
+        assert summary.record_count == 3
+        assert summary_record_count(csv_file) == 3
+        assert [p.name for p in temp_dir.glob("*.csv")] == ["orders.csv"]
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Unit tests for node output memoization.
+
+Tests input fingerprints and FlowResult serialization for the memo store.
+"""
+
+from pathlib import Path
+
+from finances.core import config as config_module
+from finances.core.config import Config
+from finances.core.flow import FlowContext, FlowNode, FlowResult, NoOutputInfo, OutputInfo
+from finances.core.memoization import (
+    compute_code_version,
+    compute_input_fingerprint,
+    flow_result_from_dict,
+    flow_result_to_dict,
+)
+
+
+class ConfigurableNode(FlowNode):
+    """Minimal node with a tunable setting."""
+
+    def __init__(self, window_days: int = 3):
+        super().__init__("configurable")
+        self.window_days = window_days
+
+    def execute(self, context: FlowContext) -> FlowResult:
+        return FlowResult(success=True)
+
+    def get_output_info(self) -> OutputInfo:
+        return NoOutputInfo()
+
+    def get_output_dir(self) -> Path | None:
+        return None
+
+
+class TestInputFingerprint:
+    """Tests for compute_input_fingerprint()."""
+
+    def test_stable_for_same_inputs(self):
+        """Test identical inputs produce identical fingerprints."""
+        node = ConfigurableNode()
+
+        assert compute_input_fingerprint(node, {"a": "1"}) == compute_input_fingerprint(node, {"a": "1"})
+
+    def test_changes_with_upstream_hash(self):
+        """Test a different upstream output hash changes the fingerprint."""
+        node = ConfigurableNode()
+
+        assert compute_input_fingerprint(node, {"a": "1"}) != compute_input_fingerprint(node, {"a": "2"})
+
+    def test_changes_with_config(self):
+        """Test node configuration is part of the fingerprint."""
+        assert compute_input_fingerprint(ConfigurableNode(3), {}) != compute_input_fingerprint(
+            ConfigurableNode(7), {}
+        )
+
+    def test_default_fingerprint_config(self):
+        """Test the default config includes simple public attributes only."""
+        config = ConfigurableNode(5).get_fingerprint_config()
+
+        assert config == {"name": "configurable", "window_days": 5}
+
+    def test_code_version_is_stable(self):
+        """Test the code version is a deterministic digest."""
+        node = ConfigurableNode()
+
+        assert compute_code_version(node) == compute_code_version(node)
+        assert len(compute_code_version(node)) == 64
+
+    def test_code_version_covers_whole_package(self):
+        """Test nodes share one code version, so shared modules (core/, ynab/) are covered."""
+        from finances.amazon.flow import AmazonMatchingFlowNode
+
+        assert compute_code_version(ConfigurableNode()) == compute_code_version(
+            AmazonMatchingFlowNode(Path("data"))
+        )
+
+    def test_amazon_matching_fingerprint_includes_config(self, monkeypatch):
+        """Test payee patterns and the ship date window change the matching fingerprint."""
+        from finances.amazon.flow import AmazonMatchingFlowNode
+
+        def fingerprint(**env: str) -> str:
+            for key, value in env.items():
+                monkeypatch.setenv(key, value)
+            monkeypatch.setattr(config_module, "_config", Config.from_environment())
+            return compute_input_fingerprint(AmazonMatchingFlowNode(Path("data")), {})
+
+        baseline = fingerprint()
+
+        assert fingerprint(AMAZON_MATCH_DAYS_AFTER_SHIP="45") != baseline
+        assert fingerprint(AMAZON_PAYEE_PATTERNS="amazon,audible") != fingerprint(
+            AMAZON_PAYEE_PATTERNS="amazon"
+        )
+
+
+class TestFlowResultSerialization:
+    """Tests for FlowResult round-tripping through the memo store."""
+
+    def test_round_trip(self):
+        """Test all fields survive serialization."""
+        result = FlowResult(
+            success=True,
+            items_processed=10,
+            new_items=2,
+            outputs=[Path("data/out.json")],
+            requires_review=True,
+            review_instructions="Check it",
+            execution_time_seconds=1.5,
+            metadata={"matches": 3},
+        )
+
+        assert flow_result_from_dict(flow_result_to_dict(result)) == result
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Unit tests for execution metrics.
+
+Tests resource measurement and the run-metrics JSONL log.
+"""
+
+import json
+
+from finances.core.metrics import ResourceUsage, append_run_metrics, measure_resources
+
+
+class TestMeasureResources:
+    """Tests for measure_resources()."""
+
+    def test_measures_wall_and_cpu_time(self):
+        """Test the usage record is filled in when the block exits."""
+        with measure_resources() as usage:
+            sum(i * i for i in range(200_000))
+
+        assert usage.wall_seconds > 0
+        assert usage.cpu_seconds >= 0
+        assert usage.peak_rss_delta_bytes >= 0
+        assert usage.read_bytes >= 0
+        assert usage.write_bytes >= 0
+
+    def test_filled_in_on_exception(self):
+        """Test usage is recorded even when the block raises."""
+        usage = None
+        try:
+            with measure_resources() as usage:
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+        assert usage is not None
+        assert usage.wall_seconds > 0
+
+
+class TestResourceUsage:
+    """Tests for ResourceUsage."""
+
+    def test_addition_sums_fields(self):
+        """Test phase usages combine into a node total."""
+        total = ResourceUsage(1.0, 0.5, 100, 10, 20) + ResourceUsage(2.0, 1.5, 50, 5, 0)
+
+        assert total == ResourceUsage(3.0, 2.0, 150, 15, 20)
+
+    def test_format(self):
+        """Test human-readable formatting."""
+        text = ResourceUsage(1.5, 0.25, 2 * 1024 * 1024, 512, 0).format()
+
+        assert "1.50s wall" in text
+        assert "0.25s cpu" in text
+        assert "+2.0MB peak RSS" in text
+        assert "512B read" in text
+
+
+class TestAppendRunMetrics:
+    """Tests for append_run_metrics()."""
+
+    def test_appends_json_lines(self, tmp_path):
+        """Test each run is appended as its own JSON line."""
+        log_path = tmp_path / "metrics" / "run_metrics.jsonl"
+
+        append_run_metrics(log_path, {"run": 1})
+        append_run_metrics(log_path, {"run": 2})
+
+        lines = log_path.read_text().splitlines()
+        assert [json.loads(line) for line in lines] == [{"run": 1}, {"run": 2}]
@@ -99,6 +99,19 @@ class TestMoneyImmutability:
         with pytest.raises(AttributeError):
             m.cents = 200  # type: ignore
 
+    @pytest.mark.currency
+    def test_slotted(self):
+        """Test Money instances have no per-instance attribute dict."""
+        assert not hasattr(Money.from_cents(100), "__dict__")
+
+    @pytest.mark.currency
+    def test_pickle_round_trip(self):
+        """Test slotted Money survives pickling (used by process pools)."""
+        import pickle
+
+        m = Money.from_cents(-4599)
+        assert pickle.loads(pickle.dumps(m)) == m  # noqa: S301
+
 
 class TestMoneyNegativeAmounts:
     """Test Money handling of negative amounts (expenses)."""
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Unit tests for tracing spans.
+
+Tests span recording, the traced decorator and Chrome trace export.
+"""
+
+import json
+
+import pytest
+
+from finances.core.tracing import is_tracing, record_span, span, start_tracing, stop_tracing, traced
+
+
+@pytest.fixture
+def tracer():
+    """Start tracing for the duration of a test."""
+    active = start_tracing()
+    yield active
+    stop_tracing()
+
+
+@traced("test.square")
+def square(value: int) -> int:
+    return value * value
+
+
+class TestSpans:
+    """Tests for span recording."""
+
+    def test_noop_when_inactive(self):
+        """Test spans and traced functions work without an active tracer."""
+        assert not is_tracing()
+
+        with span("ignored"):
+            result = square(3)
+
+        assert result == 9
+
+    def test_nested_spans_recorded(self, tracer):
+        """Test nested spans are recorded as complete events contained in their parent."""
+        with span("outer", category="node", node="n1"):
+            square(4)
+
+        events = {e["name"]: e for e in tracer.events}
+        assert set(events) == {"outer", "test.square"}
+        outer, inner = events["outer"], events["test.square"]
+        assert outer["ph"] == "X"
+        assert outer["cat"] == "node"
+        assert outer["args"] == {"node": "n1"}
+        assert outer["ts"] <= inner["ts"]
+        assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+    def test_span_recorded_on_exception(self, tracer):
+        """Test a span is still recorded when its block raises."""
+        with pytest.raises(ValueError), span("failing"):
+            raise ValueError("boom")
+
+        assert [e["name"] for e in tracer.events] == ["failing"]
+
+    def test_record_span(self, tracer):
+        """Test recording a pre-timed span."""
+        record_span("node1", "node", 0, 5_000, status="completed")
+
+        assert tracer.events[0]["dur"] == 5.0
+        assert tracer.events[0]["args"] == {"status": "completed"}
+
+
+class TestChromeTraceExport:
+    """Tests for Chrome trace-event export."""
+
+    def test_write_chrome_trace(self, tracer, tmp_path):
+        """Test the exported file is valid trace-event JSON."""
+        with span("a"):
+            pass
+
+        output_file = tracer.write_chrome_trace(tmp_path / "profiles" / "trace.json")
+
+        data = json.loads(output_file.read_text())
+        assert [e["name"] for e in data["traceEvents"]] == ["a"]
+        assert data["displayTimeUnit"] == "ms"
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Tests for the synthetic dataset generator and its CLI command."""
+
+import csv
+import zipfile
+from collections import Counter
+from datetime import date
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from finances.amazon import SimplifiedMatcher, load_orders
+from finances.apple import AppleMatcher, AppleReceiptParser
+from finances.cli.main import main
+from finances.core.json_utils import read_json, summary_record_count
+from finances.dev import DatasetSpec, DatasetSummary, generate_dataset
+from finances.dev.dataset import AMAZON_ACCOUNTS, AMAZON_CSV_NAME
+from finances.ynab import load_transactions
+
+SMALL_SPEC = DatasetSpec(years=1, accounts=3, scale=0.5, seed=7, end_date=date(2024, 6, 30))
+
+
+@pytest.fixture(scope="module")
+def dataset(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, DatasetSummary]:
+    """A small generated dataset and its summary."""
+    data_dir = tmp_path_factory.mktemp("dataset")
+    return data_dir, generate_dataset(data_dir, SMALL_SPEC)
+
+
+def _data_files(data_dir: Path) -> dict[str, bytes]:
+    """Contents of every generated file except sidecar summaries (which record mtimes)."""
+    return {
+        str(path.relative_to(data_dir)): path.read_bytes()
+        for path in sorted(data_dir.rglob("*"))
+        if path.is_file() and ".meta" not in path.parts
+    }
+
+
+class TestGenerateDataset:
+    """Test the layout and content of generated datasets."""
+
+    def test_writes_complete_data_tree(self, dataset):
+        """Test that YNAB, Amazon and Apple data land where the flow reads them."""
+        data_dir, summary = dataset
+
+        for name in ("accounts", "categories", "transactions"):
+            assert (data_dir / "ynab" / "cache" / f"{name}.json").exists()
+        for account in AMAZON_ACCOUNTS:
+            assert (data_dir / "amazon" / "raw" / f"amazon_orders_{account}.zip").exists()
+        emails_dir = data_dir / "apple" / "emails"
+        assert len(list(emails_dir.glob("*-formatted-simple.html"))) == summary.apple_receipts
+        assert len(list(emails_dir.glob("*.eml"))) == summary.apple_receipts
+        assert summary.files == sum(1 for p in data_dir.rglob("*") if p.is_file() and ".meta" not in p.parts)
+
+    def test_transactions_are_date_ordered_with_all_kinds(self, dataset):
+        """Test that transactions stream out in date order and include splits, transfers and deletions."""
+        data_dir, summary = dataset
+        records = read_json(data_dir / "ynab" / "cache" / "transactions.json")
+
+        assert len(records) == summary.transactions
+        assert [r["date"] for r in records] == sorted(r["date"] for r in records)
+        assert summary_record_count(data_dir / "ynab" / "cache" / "transactions.json") == len(records)
+
+        splits = [r for r in records if r["subtransactions"]]
+        assert len(splits) == summary.split_transactions > 0
+        assert all(sum(s["amount"] for s in r["subtransactions"]) == r["amount"] for r in splits)
+        assert sum(r["deleted"] for r in records) == summary.deleted_transactions > 0
+
+        by_id = {r["id"]: r for r in records}
+        transfers = [r for r in records if r["transfer_account_id"]]
+        assert len(transfers) == 2 * summary.transfers > 0
+        for record in transfers:
+            other = by_id[record["transfer_transaction_id"]]
+            assert other["transfer_transaction_id"] == record["id"]
+            assert other["amount"] == -record["amount"]
+
+    def test_order_history_zip_matches_extracted_csv(self, dataset):
+        """Test that each account's ZIP holds the extracted order history CSV."""
+        data_dir, summary = dataset
+        items = 0
+        for account in AMAZON_ACCOUNTS:
+            csv_file = data_dir / "amazon" / "raw" / f"2024-06-30_{account}_amazon_data" / AMAZON_CSV_NAME
+            with zipfile.ZipFile(data_dir / "amazon" / "raw" / f"amazon_orders_{account}.zip") as archive:
+                assert archive.read(AMAZON_CSV_NAME) == csv_file.read_bytes()
+                assert "metadata.json" in archive.namelist()
+            with open(csv_file, newline="") as f:
+                rows = list(csv.DictReader(f))
+            assert summary_record_count(csv_file) == len(rows)
+            items += len(rows)
+
+        assert items == summary.amazon_items
+
+    def test_amazon_charges_match_orders(self, dataset):
+        """Test that the Amazon matcher finds orders for the generated charges."""
+        data_dir, summary = dataset
+        orders = load_orders(data_dir / "amazon" / "raw")
+        matcher = SimplifiedMatcher()
+        transactions = load_transactions(data_dir / "ynab" / "cache")
+        charges = [tx for tx in transactions if matcher.is_amazon_transaction(tx.payee_name or "")]
+
+        assert sum(len(items) for items in orders.values()) == summary.amazon_items
+        assert len(charges) >= summary.amazon_orders
+        matched = sum(1 for tx in charges if matcher.match_transaction(tx, orders).best_match is not None)
+        assert matched >= len(charges) * 0.8
+
+    def test_apple_receipts_parse_in_both_formats_and_match(self, dataset):
+        """Test that receipts parse completely in both formats and match their charges."""
+        data_dir, summary = dataset
+        parser = AppleReceiptParser()
+        receipts = [
+            parser.parse_html_content(path.read_text(), path.stem)
+            for path in sorted((data_dir / "apple" / "emails").glob("*.html"))
+        ]
+
+        assert Counter(r.format_detected for r in receipts).keys() == {"table_format", "modern_format"}
+        for receipt in receipts:
+            assert receipt.order_id and receipt.receipt_date and receipt.items
+            assert receipt.subtotal + receipt.tax == receipt.total
+
+        matcher = AppleMatcher()
+        charges = [
+            tx for tx in load_transactions(data_dir / "ynab" / "cache") if tx.payee_name == "Apple.com/bill"
+        ]
+        assert len(charges) == summary.apple_receipts
+        assert all(matcher.match_single_transaction(tx, receipts).receipts for tx in charges)
+
+    def test_same_seed_gives_identical_files(self, dataset, tmp_path):
+        """Test that generation is deterministic by seed."""
+        data_dir, _ = dataset
+        generate_dataset(tmp_path / "again", SMALL_SPEC)
+        generate_dataset(
+            tmp_path / "other", DatasetSpec(years=1, scale=0.5, seed=8, end_date=date(2024, 6, 30))
+        )
+
+        assert _data_files(tmp_path / "again") == _data_files(data_dir)
+        assert _data_files(tmp_path / "other") != _data_files(data_dir)
+
+    def test_volume_follows_scale(self, tmp_path):
+        """Test that doubling the scale roughly doubles the volume."""
+        small = generate_dataset(tmp_path / "small", DatasetSpec(years=1, scale=0.5))
+        large = generate_dataset(tmp_path / "large", DatasetSpec(years=1, scale=1.0))
+
+        assert 1.6 < large.transactions / small.transactions < 2.4
+        assert 1.6 < large.amazon_orders / small.amazon_orders < 2.4
+
+    def test_rejects_non_positive_spec(self, tmp_path):
+        """Test that empty specs are rejected."""
+        with pytest.raises(ValueError, match="must be positive"):
+            generate_dataset(tmp_path, DatasetSpec(scale=0))
+
+
+class TestGenerateDatasetCommand:
+    """Test the `finances dev generate-dataset` command."""
+
+    def test_generates_into_output_dir(self, tmp_path):
+        """Test that the command writes a dataset and reports its size."""
+        output_dir = tmp_path / "data"
+        result = CliRunner().invoke(
+            main,
+            ["dev", "generate-dataset", "--years", "1", "--scale", "0.2", "--output-dir", str(output_dir)],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "YNAB transactions" in result.output
+        assert (output_dir / "ynab" / "cache" / "transactions.json").exists()
+
+    def test_refuses_non_empty_output_dir_without_force(self, tmp_path):
+        """Test that existing data is not written into by accident."""
+        (tmp_path / "existing.txt").write_text("keep me")
+        args = ["dev", "generate-dataset", "--years", "1", "--scale", "0.2", "--output-dir", str(tmp_path)]
+
+        result = CliRunner().invoke(main, args)
+        assert result.exit_code != 0
+        assert "not empty" in result.output
+
+        result = CliRunner().invoke(main, [*args, "--force"])
+        assert result.exit_code == 0, result.output
+        assert (tmp_path / "existing.txt").read_text() == "keep me"
@@ -9,6 +9,7 @@ from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
 
+from finances.core.change_detection import ChangeDetector
 from finances.core.flow import (
     FlowContext,
     FlowNode,
@@ -20,6 +21,7 @@ from finances.core.flow import (
     OutputInfo,
 )
 from finances.core.flow_engine import DependencyGraph, FlowExecutionEngine
+from finances.core.flow_state import FlowStateStore
 
 
 class MockFlowNode(FlowNode):
@@ -57,6 +59,53 @@ class MockFlowNode(FlowNode):
         return None
 
 
+class StagingChangeDetector(ChangeDetector):
+    """Change detector that always reports changes and stages a run counter."""
+
+    def __init__(self, data_dir: Path, node_name: str):
+        super().__init__(data_dir)
+        self.node_name = node_name
+
+    def check_changes(self, context: FlowContext) -> tuple[bool, list[str]]:
+        runs = self.load_last_check_state(self.node_name).get("runs", 0)
+        self.save_last_check_state(self.node_name, {"runs": runs + 1})
+        return True, ["Staged"]
+
+
+class OutputFlowNode(MockFlowNode):
+    """Mock flow node that writes a file into its own output directory."""
+
+    def __init__(self, name: str, output_dir: Path, content: str = "data", **kwargs):
+        super().__init__(name, **kwargs)
+        self.output_dir = output_dir
+        self.content = content
+
+    def execute(self, context: FlowContext) -> FlowResult:
+        super().execute(context)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        output_file = self.output_dir / "output.txt"
+        output_file.write_text(self.content)
+        return FlowResult(success=True, items_processed=1, outputs=[output_file])
+
+    def get_output_dir(self) -> Path | None:
+        return self.output_dir
+
+
+class FixedChangeDetector(ChangeDetector):
+    """Change detector returning a fixed result and staging a marker when changed."""
+
+    def __init__(self, data_dir: Path, node_name: str, has_changes: bool):
+        super().__init__(data_dir)
+        self.node_name = node_name
+        self.has_changes = has_changes
+
+    def check_changes(self, context: FlowContext) -> tuple[bool, list[str]]:
+        if self.has_changes:
+            self.save_last_check_state(self.node_name, {"seen": True})
+            return True, ["Changed"]
+        return False, ["No changes"]
+
+
 class TestDependencyGraph:
     """Test DependencyGraph functionality."""
 
@@ -336,3 +385,232 @@ class TestFlowExecutionEngine:
         assert summary["success_rate"] == 1 / 3
         assert summary["total_items_processed"] == 10
         assert summary["total_execution_time_seconds"] == 1.5
+
+    @patch("builtins.input", return_value="y")
+    def test_execute_flow_commits_state_on_success(self, mock_input, tmp_path):
+        """Test detector state is committed once the node succeeds."""
+        registry = FlowNodeRegistry()
+        registry.register_node(MockFlowNode("node1"))
+        detector = StagingChangeDetector(tmp_path, "node1")
+
+        FlowExecutionEngine(registry, change_detectors={"node1": detector}).execute_flow()
+        detector.state_store.close()
+
+        assert FlowStateStore.for_data_dir(tmp_path).get("node1") == {"runs": 1}
+
+    @patch("builtins.input", return_value="y")
+    def test_execute_flow_discards_state_on_failure(self, mock_input, tmp_path):
+        """Test detector state is not committed when the node fails."""
+        import pytest
+
+        registry = FlowNodeRegistry()
+        registry.register_node(
+            MockFlowNode("node1", execute_result=FlowResult(success=False, error_message="Failed"))
+        )
+        detector = StagingChangeDetector(tmp_path, "node1")
+
+        with pytest.raises(SystemExit):
+            FlowExecutionEngine(registry, change_detectors={"node1": detector}).execute_flow()
+        detector.state_store.close()
+
+        assert FlowStateStore.for_data_dir(tmp_path).get("node1") == {}
+
+    def test_execute_node_records_execution_time(self):
+        """Test execute_node populates execution time and metrics."""
+        registry = FlowNodeRegistry()
+        registry.register_node(MockFlowNode("test_node"))
+
+        engine = FlowExecutionEngine(registry)
+        execution = engine.execute_node("test_node", FlowContext(start_time=datetime.now()))
+
+        assert execution.result.execution_time_seconds is not None
+        assert execution.result.execution_time_seconds >= 0
+        assert "execute" in execution.phase_metrics
+        assert execution.metrics is not None
+
+    @patch("builtins.input", return_value="y")
+    def test_execute_flow_records_phase_metrics(self, mock_input, tmp_path):
+        """Test execute_flow records per-phase metrics and appends them to the metrics log."""
+        import json
+
+        registry = FlowNodeRegistry()
+        registry.register_node(MockFlowNode("node1"))
+        metrics_log = tmp_path / "run_metrics.jsonl"
+
+        result = FlowExecutionEngine(registry, metrics_log=metrics_log).execute_flow()
+
+        execution = result["executions"]["node1"]
+        assert execution.status == NodeStatus.COMPLETED
+        assert set(execution.phase_metrics) == {"pre_archive", "execute", "post_archive", "cleanup"}
+        assert execution.metrics.wall_seconds >= execution.phase_metrics["execute"].wall_seconds
+
+        records = [json.loads(line) for line in metrics_log.read_text().splitlines()]
+        assert len(records) == 1
+        assert records[0]["status"] == "completed"
+        assert set(records[0]["nodes"]["node1"]["phases"]) == set(execution.phase_metrics)
+
+    @patch("builtins.input", return_value="y")
+    def test_execute_flow_profiling(self, mock_input, tmp_path):
+        """Test profiling records node and phase spans and per-node pstats dumps."""
+        import pstats
+
+        from finances.core.tracing import start_tracing, stop_tracing
+
+        registry = FlowNodeRegistry()
+        registry.register_node(MockFlowNode("node1"))
+
+        tracer = start_tracing()
+        try:
+            FlowExecutionEngine(registry, profile_dir=tmp_path).execute_flow()
+        finally:
+            stop_tracing()
+
+        spans = {(e["cat"], e["name"]) for e in tracer.events}
+        assert ("node", "node1") in spans
+        assert ("phase", "execute") in spans
+        assert pstats.Stats(str(tmp_path / "node1.pstats")).total_calls > 0
+
+
+class TestExecuteFlowAuto:
+    """Test unattended, change-driven flow execution."""
+
+    @patch("builtins.input", side_effect=AssertionError("auto mode must not prompt"))
+    def test_no_changes_does_nothing(self, mock_input, tmp_path):
+        """Test nothing executes when no detector reports changes."""
+        registry = FlowNodeRegistry()
+        node1 = MockFlowNode("node1")
+        registry.register_node(node1)
+
+        engine = FlowExecutionEngine(
+            registry, change_detectors={"node1": FixedChangeDetector(tmp_path, "node1", False)}
+        )
+        result = engine.execute_flow_auto()
+
+        assert result["executed_nodes"] == []
+        assert result["changed_nodes"] == []
+        assert node1.execution_count == 0
+
+    @patch("builtins.input", side_effect=AssertionError("auto mode must not prompt"))
+    def test_executes_changed_subgraph(self, mock_input, tmp_path):
+        """Test changed nodes and their dependents execute, unrelated nodes do not."""
+        registry = FlowNodeRegistry()
+        node1 = MockFlowNode("node1")
+        node2 = MockFlowNode("node2", dependencies=["node1"])
+        node3 = MockFlowNode("node3")
+        for node in (node1, node2, node3):
+            registry.register_node(node)
+
+        engine = FlowExecutionEngine(
+            registry,
+            change_detectors={
+                "node1": FixedChangeDetector(tmp_path, "node1", True),
+                "node3": FixedChangeDetector(tmp_path, "node3", False),
+            },
+        )
+        result = engine.execute_flow_auto()
+
+        assert result["changed_nodes"] == ["node1"]
+        assert result["executed_nodes"] == ["node1", "node2"]
+        assert node3.execution_count == 0
+
+    @patch("builtins.input", side_effect=AssertionError("auto mode must not prompt"))
+    def test_skips_manual_nodes(self, mock_input, tmp_path):
+        """Test nodes requiring user interaction are skipped and their state is not committed."""
+        registry = FlowNodeRegistry()
+        upstream = MockFlowNode("upstream")
+        manual = MockFlowNode("manual", dependencies=["upstream"])
+        manual.requires_user_interaction = True
+        registry.register_node(upstream)
+        registry.register_node(manual)
+        detector = FixedChangeDetector(tmp_path, "manual", True)
+
+        result = FlowExecutionEngine(
+            registry,
+            change_detectors={
+                "upstream": FixedChangeDetector(tmp_path, "upstream", True),
+                "manual": detector,
+            },
+        ).execute_flow_auto()
+        detector.state_store.close()
+
+        assert result["executed_nodes"] == ["upstream"]
+        assert result["skipped_nodes"] == ["manual"]
+        assert manual.execution_count == 0
+        assert FlowStateStore.for_data_dir(tmp_path).get("manual") == {}
+
+    @patch("builtins.input", side_effect=AssertionError("auto mode must not prompt"))
+    def test_manual_node_changes_alone_do_nothing(self, mock_input, tmp_path):
+        """Test a change reported only for an interactive node does not trigger a run."""
+        registry = FlowNodeRegistry()
+        node1 = MockFlowNode("node1")
+        manual = MockFlowNode("manual")
+        manual.requires_user_interaction = True
+        registry.register_node(node1)
+        registry.register_node(manual)
+
+        engine = FlowExecutionEngine(
+            registry,
+            change_detectors={
+                "node1": FixedChangeDetector(tmp_path, "node1", False),
+                "manual": FixedChangeDetector(tmp_path, "manual", True),
+            },
+        )
+        result = engine.execute_flow_auto()
+
+        assert result["changed_nodes"] == []
+        assert result["executed_nodes"] == []
+        assert result["skipped_nodes"] == []
+        assert node1.execution_count == 0
+        assert manual.execution_count == 0
+
+
+class TestNodeMemoization:
+    """Test skipping derived nodes whose input fingerprint is unchanged."""
+
+    @staticmethod
+    def _run(tmp_path, upstream_content: str, force_rerun: bool = False):
+        from finances.core.flow_state import FlowStateStore
+
+        registry = FlowNodeRegistry()
+        upstream = OutputFlowNode("upstream", tmp_path / "upstream", content=upstream_content)
+        downstream = OutputFlowNode("downstream", tmp_path / "downstream", dependencies=["upstream"])
+        registry.register_node(upstream)
+        registry.register_node(downstream)
+
+        store = FlowStateStore.for_data_dir(tmp_path)
+        try:
+            with patch("builtins.input", return_value="y"):
+                result = FlowExecutionEngine(
+                    registry, memo_store=store, force_rerun=force_rerun
+                ).execute_flow()
+        finally:
+            store.close()
+        return result, upstream, downstream
+
+    def test_unchanged_inputs_reuse_cached_result(self, tmp_path):
+        """Test the downstream node is skipped with its cached result on the second run."""
+        self._run(tmp_path, "v1")
+        result, upstream, downstream = self._run(tmp_path, "v1")
+
+        assert upstream.execution_count == 1  # Source nodes always run
+        assert downstream.execution_count == 0
+        assert result["cached_nodes"] == ["downstream"]
+        cached = result["executions"]["downstream"].result
+        assert cached.items_processed == 1
+        assert cached.metadata["memoized"] is True
+
+    def test_changed_upstream_output_reruns(self, tmp_path):
+        """Test the downstream node re-executes when upstream output changes."""
+        self._run(tmp_path, "v1")
+        result, _, downstream = self._run(tmp_path, "v2")
+
+        assert downstream.execution_count == 1
+        assert result["cached_nodes"] == []
+
+    def test_force_rerun(self, tmp_path):
+        """Test force_rerun executes nodes despite an unchanged fingerprint."""
+        self._run(tmp_path, "v1")
+        result, _, downstream = self._run(tmp_path, "v1", force_rerun=True)
+
+        assert downstream.execution_count == 1
+        assert result["cached_nodes"] == []
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Tests for the shared YNAB cache service."""
+
+import json
+import os
+
+import pytest
+
+from finances.core.file_cache import FileLoadCache
+from finances.ynab import YnabCacheService, load_transactions
+
+
+@pytest.fixture
+def ynab_cache_dir(tmp_path):
+    """YNAB cache directory with accounts and transactions."""
+    accounts = [
+        {"id": "a", "name": "Checking", "type": "checking", "on_budget": True, "closed": False,
+         "balance": 100000, "cleared_balance": 100000, "uncleared_balance": 0},
+    ]  # fmt: skip
+    transactions = [
+        {"id": "t1", "date": "2025-01-01", "amount": -1000, "account_id": "a", "account_name": "Checking",
+         "payee_name": "Apple"},
+        {"id": "t2", "date": "2025-01-05", "amount": -2500, "account_id": "a", "account_name": "Checking",
+         "payee_name": "Amazon.com"},
+    ]  # fmt: skip
+    (tmp_path / "accounts.json").write_text(json.dumps({"accounts": accounts, "server_knowledge": 1}))
+    (tmp_path / "transactions.json").write_text(json.dumps(transactions))
+    return tmp_path
+
+
+class TestYnabCacheService:
+    """Test memoized YNAB cache access."""
+
+    @pytest.mark.ynab
+    def test_parses_transactions_once(self, ynab_cache_dir):
+        """Test models and columnar views share one parse of transactions.json."""
+        file_cache = FileLoadCache()
+        service = YnabCacheService(ynab_cache_dir, file_cache)
+
+        assert service.transactions() == load_transactions(ynab_cache_dir)
+        assert list(service.transaction_columns(fields=("id",), payee="Amazon")["id"]) == ["t2"]
+        assert len(YnabCacheService(ynab_cache_dir, file_cache).transactions()) == 2
+
+        # One load for the raw records, one for the models
+        assert file_cache.loads == 2
+
+    @pytest.mark.ynab
+    def test_returned_lists_are_copies(self, ynab_cache_dir):
+        """Test callers can reorder returned lists without affecting other nodes."""
+        service = YnabCacheService(ynab_cache_dir)
+
+        service.transactions().clear()
+        service.accounts().clear()
+
+        assert len(service.transactions()) == 2
+        assert [account.name for account in service.accounts()] == ["Checking"]
+
+    @pytest.mark.ynab
+    def test_reloads_after_sync(self, ynab_cache_dir):
+        """Test a rewritten cache file (e.g. by ynab_sync) is picked up."""
+        service = YnabCacheService(ynab_cache_dir)
+        assert len(service.transactions()) == 2
+
+        transactions_file = ynab_cache_dir / "transactions.json"
+        records = json.loads(transactions_file.read_text())[:1]
+        transactions_file.write_text(json.dumps(records))
+        os.utime(transactions_file, ns=(1_000_000_000, 1_000_000_000))
+
+        assert [tx.id for tx in service.transactions()] == ["t1"]
+
+    @pytest.mark.ynab
+    def test_domain_transaction_columns(self, ynab_cache_dir):
+        """Test per-domain selection uses the configured payee patterns."""
+        service = YnabCacheService(ynab_cache_dir, payee_patterns={"amazon": ["amzn", "amazon"]})
+
+        assert list(service.domain_transaction_columns("amazon", fields=("id",))["id"]) == ["t2"]
+        assert service.payee_index() is service.payee_index()
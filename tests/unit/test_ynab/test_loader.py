@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 """Tests for YNAB loader module."""
 
+import json
+from datetime import date
+
+import numpy as np
 import pytest
 
 from finances.core import FinancialDate, Money
-from finances.ynab import filter_transactions_by_payee
+from finances.ynab import filter_transactions_by_payee, load_transaction_columns, load_transactions
 from finances.ynab.models import YnabTransaction
 
 
@@ -129,3 +133,82 @@ class TestFilterTransactions:
 
         assert len(filtered) == 2
         assert filtered == transactions
+
+
+@pytest.fixture
+def transactions_cache(tmp_path):
+    """YNAB cache directory with a few raw transactions."""
+    records = [
+        {"id": "t1", "date": "2025-01-01", "amount": -1000, "account_id": "a", "account_name": "Checking",
+         "payee_name": "Apple"},
+        {"id": "t2", "date": "2025-01-05", "amount": -2500, "account_id": "a", "account_name": "Checking",
+         "payee_name": "Amazon.com", "deleted": True},
+        {"id": "t3", "date": "2025-02-10", "amount": 4000, "account_id": "b", "account_name": "Apple\xa0Card",
+         "payee_name": None},
+        {"id": "t4", "date": "2025-03-01", "amount": -750, "account_id": "a", "account_name": "Checking",
+         "payee_name": "AMAZON MKTPL"},
+    ]  # fmt: skip
+    (tmp_path / "transactions.json").write_text(json.dumps(records))
+    return tmp_path
+
+
+class TestLoadTransactionColumns:
+    """Test the columnar transaction loader."""
+
+    @pytest.mark.ynab
+    def test_default_columns(self, transactions_cache):
+        """Test default fields are typed NumPy columns in file order."""
+        columns = load_transaction_columns(transactions_cache)
+
+        assert len(columns) == 4
+        assert list(columns["id"]) == ["t1", "t2", "t3", "t4"]
+        assert columns["amount"].dtype == np.int64
+        assert list(columns["amount"]) == [-1000, -2500, 4000, -750]
+        assert columns["date_ordinal"][0] == date(2025, 1, 1).toordinal()
+        assert columns.dates[2] == np.datetime64("2025-02-10")
+        assert list(columns["deleted"]) == [False, True, False, False]
+        assert columns["account_name"][2] == "Apple Card"
+
+    @pytest.mark.ynab
+    def test_selected_fields_only(self, transactions_cache):
+        """Test only requested columns are built."""
+        columns = load_transaction_columns(transactions_cache, fields=("id", "amount"))
+
+        assert set(columns.columns) == {"id", "amount"}
+
+    @pytest.mark.ynab
+    def test_unknown_field(self, transactions_cache):
+        """Test unknown column names are rejected."""
+        with pytest.raises(ValueError, match="payee"):
+            load_transaction_columns(transactions_cache, fields=("id", "payee"))
+
+    @pytest.mark.ynab
+    def test_payee_and_date_pushdown(self, transactions_cache):
+        """Test payee substring and inclusive date range filters."""
+        columns = load_transaction_columns(
+            transactions_cache,
+            payee="amazon",
+            start_date=FinancialDate.from_string("2025-01-05"),
+            end_date="2025-03-01",
+        )
+
+        assert list(columns["id"]) == ["t2", "t4"]
+
+    @pytest.mark.ynab
+    def test_exclude_deleted(self, transactions_cache):
+        """Test deleted transactions can be dropped while loading."""
+        columns = load_transaction_columns(transactions_cache, include_deleted=False)
+
+        assert "t2" not in list(columns["id"])
+
+    @pytest.mark.ynab
+    def test_lazy_materialization_matches_full_loader(self, transactions_cache):
+        """Test materialized rows equal the domain models from load_transactions()."""
+        columns = load_transaction_columns(transactions_cache)
+        selected = columns.select(columns["amount"] < 0)
+
+        assert selected.to_transactions() == [
+            tx for tx in load_transactions(transactions_cache) if tx.amount.to_milliunits() < 0
+        ]
+        assert selected.transaction(0).id == "t1"
+        assert list(selected.to_frame()["id"]) == ["t1", "t2", "t4"]
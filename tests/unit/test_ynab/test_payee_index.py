@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Tests for the YNAB payee index."""
+
+import pytest
+
+from finances.ynab import PayeeIndex, filter_transactions_by_payee
+from finances.ynab.payee_index import configured_payee_patterns, payee_matches
+
+from .test_loader import create_test_transaction
+
+PATTERNS = {"amazon": ("amazon", "AMZN"), "apple": ("apple",)}
+
+
+@pytest.fixture
+def records():
+    """Raw transaction dicts with assorted payee spellings."""
+    return [
+        {"id": "t1", "payee_name": "Amazon.com"},
+        {"id": "t2", "payee_name": "Apple"},
+        {"id": "t3", "payee_name": "AMZN Mktp US"},
+        {"id": "t4", "payee_name": None},
+        {"id": "t5", "payee_name": " amazon.com "},
+        {"id": "t6", "payee_name": "Grocery Store"},
+    ]
+
+
+class TestPayeeIndex:
+    """Test payee index construction and lookups."""
+
+    @pytest.mark.ynab
+    def test_groups_normalized_payees(self, records):
+        """Test payees differing only in case and whitespace share an entry."""
+        index = PayeeIndex.from_records(records)
+
+        assert len(index) == 4
+        assert index.positions_by_payee["amazon.com"] == [0, 4]
+
+    @pytest.mark.ynab
+    def test_domain_lookup_with_multiple_patterns(self, records):
+        """Test every configured pattern contributes to a domain, in load order."""
+        index = PayeeIndex.from_records(records, PATTERNS)
+
+        assert index.ids_for_domain("amazon") == ["t1", "t3", "t5"]
+        assert index.ids_for_domain("apple") == ["t2"]
+
+    @pytest.mark.ynab
+    def test_unconfigured_domain(self, records):
+        """Test looking up a domain without patterns is an error."""
+        with pytest.raises(KeyError, match="costco"):
+            PayeeIndex.from_records(records, PATTERNS).positions_for_domain("costco")
+
+    @pytest.mark.ynab
+    def test_is_domain_payee(self, records):
+        """Test payee classification for indexed and unseen payee names."""
+        index = PayeeIndex.from_records(records, PATTERNS)
+
+        assert index.is_domain_payee("amazon", "AMAZON.COM")
+        assert index.is_domain_payee("amazon", "Amazon Prime")
+        assert not index.is_domain_payee("amazon", "Grocery Store")
+        assert not index.is_domain_payee("apple", None)
+
+    @pytest.mark.ynab
+    def test_matches_filter_function(self, records):
+        """Test index lookups agree with filter_transactions_by_payee()."""
+        transactions = [
+            create_test_transaction(r["id"], "2025-01-01", -1000, r["payee_name"]) for r in records
+        ]
+        index = PayeeIndex.from_transactions(transactions, PATTERNS)
+
+        expected = filter_transactions_by_payee(transactions, payee=["amazon", "amzn"])
+        assert index.ids_for_domain("amazon") == [tx.id for tx in expected]
+
+
+class TestPayeePatterns:
+    """Test pattern helpers."""
+
+    @pytest.mark.ynab
+    def test_payee_matches(self):
+        """Test single and multiple patterns are case-insensitive substring matches."""
+        assert payee_matches("AMZN Mktp US", ["amazon", "amzn"])
+        assert payee_matches("Apple Store", "APPLE")
+        assert not payee_matches(None, "apple")
+        assert not payee_matches("Apple", [])
+
+    @pytest.mark.ynab
+    def test_configured_patterns(self, monkeypatch):
+        """Test domain patterns come from the environment-driven configuration."""
+        from finances.core.config import Config
+
+        monkeypatch.setenv("AMAZON_PAYEE_PATTERNS", "amazon, amzn ,audible")
+
+        patterns = configured_payee_patterns(Config.from_environment())
+
+        assert patterns == {"amazon": ("amazon", "amzn", "audible"), "apple": ("apple",)}
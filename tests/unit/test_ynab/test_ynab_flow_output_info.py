@@ -67,7 +67,7 @@ def test_retirement_update_output_info_is_data_ready_returns_true_with_edits():
         edits_dir = data_dir / "ynab" / "edits"
         edits_dir.mkdir(parents=True)
 
-        # Create retirement edit file (glob pattern: *retirement*.json)
+        # Create retirement edit file (glob patterns: *retirement*.yaml, *retirement*.json)
         (edits_dir / "2024-10-19_retirement_updates.json").write_text("[]")
 
         node = RetirementUpdateFlowNode(data_dir)
@@ -76,6 +76,34 @@ def test_retirement_update_output_info_is_data_ready_returns_true_with_edits():
         assert info.is_data_ready() is True
 
 
+def test_retirement_update_output_info_counts_mutations_from_sidecar(monkeypatch):
+    """Verify written retirement edit files are found and counted from their sidecar summary."""
+    from finances.core import json_utils
+    from finances.ynab.retirement import YnabRetirementService
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_dir = Path(tmpdir)
+        adjustments = [
+            {"account_id": f"acc{i}", "amount_milliunits": 1000, "metadata": {"adjustment_cents": 100}}
+            for i in range(3)
+        ]
+        edit_file = YnabRetirementService(data_dir).create_retirement_edits(adjustments)
+
+        read_json = json_utils.read_json
+
+        def read_sidecars_only(filepath, *args, **kwargs):
+            assert Path(filepath) != edit_file, "edit file parsed instead of its sidecar"
+            return read_json(filepath, *args, **kwargs)
+
+        monkeypatch.setattr(json_utils, "read_json", read_sidecars_only)
+
+        info = RetirementUpdateFlowNode(data_dir).get_output_info()
+        files = info.get_output_files()
+
+        assert info.is_data_ready() is True
+        assert [(f.path, f.record_count) for f in files] == [(edit_file, 3)]
+
+
 def test_split_generation_output_info_is_data_ready_returns_true_with_splits():
     """Verify is_data_ready returns True when split edit files with 'edits' key exist."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -90,3 +118,27 @@ def test_split_generation_output_info_is_data_ready_returns_true_with_splits():
         info = node.get_output_info()
 
         assert info.is_data_ready() is True
+
+
+def test_ynab_sync_output_info_get_output_files_reads_sidecars(monkeypatch):
+    """Verify record counts come from sidecar summaries without parsing the cache files."""
+    from finances.core import json_utils
+    from finances.ynab.datastore import YnabCacheStore
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_dir = Path(tmpdir)
+        store = YnabCacheStore(data_dir / "ynab" / "cache")
+        store.save(
+            {
+                "transactions": [{"id": "1"}, {"id": "2"}],
+                "accounts": {"accounts": [{"id": "a"}]},
+                "categories": {"category_groups": [{"id": "c"}, {"id": "d"}, {"id": "e"}]},
+            }
+        )
+        monkeypatch.setattr(json_utils, "iter_json_array", None)
+
+        files = YnabSyncFlowNode(data_dir).get_output_info().get_output_files()
+
+        counts = {f.path.name: f.record_count for f in files}
+        assert counts == {"transactions.json": 2, "accounts.json": 1, "categories.json": 3}
+        assert store.item_count() == 2